@@ -11,7 +11,8 @@ class AirflowConfig(Config):
     _conf__task_family = "airflow"
 
     optimize_airflow_db_access = parameter(
-        description="Enable all Airflow DB access optimizations"
+        description="Enable disable_db_ping_on_connect and disable_dag_concurrency_rules "
+        "(the scheduler loop always uses bulk task instance state queries)"
     )[bool]
 
     # enabled by optimize_airflow_db_access
@@ -60,6 +61,15 @@ class AirflowConfig(Config):
     webserver_url = parameter(
         default=None, description="URL of airflow webserver used by local runs"
     )[str]
+    webserver_versioned_dags_cache_size = parameter(
+        default=50,
+        description="Max number of unpickled versioned dags kept in memory by the webserver "
+        "(0 disables the cache)",
+    )[int]
+    webserver_versioned_dags_cache_max_bytes = parameter(
+        default=512 * 1024 ** 2,
+        description="Max total (pickled) size of the versioned dags kept in memory by the webserver",
+    )[int]
 
     use_connections = parameter(
         description="use the airflow connection to connect to a cloud environment",
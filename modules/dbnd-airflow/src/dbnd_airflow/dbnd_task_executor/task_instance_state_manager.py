@@ -1,12 +1,39 @@
 from collections import Counter, defaultdict
-from typing import List
+from typing import Dict, List
 
 from airflow.models import TaskInstance
+from airflow.utils import timezone
+
+
+# max number of task ids in one "IN" clause
+_BULK_CHUNK_SIZE = 500
+
+
+def _chunks(items, size=_BULK_CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def copy_task_instance_state(ti, db_ti):
+    # type: (TaskInstance, TaskInstance) -> None
+    """the same fields as TaskInstance.refresh_from_db copies"""
+    ti.state = db_ti.state
+    ti.start_date = db_ti.start_date
+    ti.end_date = db_ti.end_date
+    # raw value of try_number column, the accessor returns it incremented by one
+    ti.try_number = db_ti._try_number
+    ti.max_tries = db_ti.max_tries
+    ti.hostname = db_ti.hostname
+    ti.operator = db_ti.operator
+    ti.queued_dttm = db_ti.queued_dttm
+    ti.pid = db_ti.pid
 
 
 class AirflowTaskInstanceStateManager(object):
     """
     AirflowTaskInstanceStateManager holds latest state info for all relevant task_instances
+    All the queries are set based: states of the whole dag run are fetched with one SELECT,
+    state transitions are written with one UPDATE per target state.
     """
 
     def __init__(self):
@@ -16,18 +43,32 @@ class AirflowTaskInstanceStateManager(object):
         return self.status[(dag_id, execution_date)]
 
     def refresh_from_db(self, dag_id, execution_date, session):
+        """
+        Fetches the states of all task instances of the dag run,
+        returns {task_id: state} of the task instances that changed since the last refresh
+        """
         TI = TaskInstance
-        updated_status = (
+        updated_status = dict(
             session.query(TI.task_id, TI.state)
             .filter(TI.dag_id == dag_id, TI.execution_date == execution_date)
             .all()
         )
 
-        self.status[(dag_id, execution_date)] = dict(updated_status)
+        previous_status = self._get_dag_run(dag_id, execution_date)
+        self.status[(dag_id, execution_date)] = updated_status
+        return {
+            task_id: state
+            for task_id, state in updated_status.items()
+            if previous_status.get(task_id) != state
+        }
 
     def get_state(self, dag_id, execution_date, task_id):
         return self._get_dag_run(dag_id, execution_date).get(task_id)
 
+    def get_task_ids_by_state(self, dag_id, execution_date, state):
+        status = self._get_dag_run(dag_id, execution_date)
+        return [task_id for task_id, s in status.items() if s == state]
+
     def get_aggregated_state_status(self, dag_id, execution_date, task_ids):
         status = self._get_dag_run(dag_id, execution_date)
         return Counter(status.get(task_id) for task_id in task_ids)
@@ -41,5 +82,67 @@ class AirflowTaskInstanceStateManager(object):
     def refresh_task_instances_state(
         self, task_instances, dag_id, execution_date, session
     ):
-        self.refresh_from_db(dag_id, execution_date, session)
+        changed = self.refresh_from_db(dag_id, execution_date, session)
         self.sync_to_object(task_instances)
+        return changed
+
+    def refresh_for_update(self, task_instances, session):
+        # type: (List[TaskInstance], ...) -> None
+        """
+        Bulk version of `ti.refresh_from_db(lock_for_update=True)`:
+        locks the rows of the task instances (until the commit) and refreshes the objects
+        """
+        TI = TaskInstance
+        for chunk in _chunks(task_instances):
+            ti = chunk[0]
+            db_tis = (
+                session.query(TI)
+                .filter(
+                    TI.dag_id == ti.dag_id,
+                    TI.execution_date == ti.execution_date,
+                    TI.task_id.in_([t.task_id for t in chunk]),
+                )
+                .with_for_update()
+                .populate_existing()
+                .all()
+            )
+            by_task_id = {db_ti.task_id: db_ti for db_ti in db_tis}  # type: Dict
+            # the rows stay locked till the commit, we work with our (detached) objects
+            for db_ti in db_tis:
+                session.expunge(db_ti)
+            status = self._get_dag_run(ti.dag_id, ti.execution_date)
+            for t in chunk:
+                db_ti = by_task_id.get(t.task_id)
+                if db_ti is None:
+                    t.state = None
+                else:
+                    copy_task_instance_state(t, db_ti)
+                status[t.task_id] = t.state
+
+    def set_state(self, task_instances, state, session, update_dates=False):
+        # type: (List[TaskInstance], str, ..., bool) -> None
+        """
+        Bulk version of `ti.set_state(state)`, one UPDATE for all the task instances
+        (of the same dag run). The caller commits the session.
+        """
+        if not task_instances:
+            return
+        TI = TaskInstance
+        values = {TI.state: state}
+        if update_dates:
+            # as TaskInstance.set_state does
+            values[TI.start_date] = values[TI.end_date] = timezone.utcnow()
+
+        for chunk in _chunks(task_instances):
+            ti = chunk[0]
+            session.query(TI).filter(
+                TI.dag_id == ti.dag_id,
+                TI.execution_date == ti.execution_date,
+                TI.task_id.in_([t.task_id for t in chunk]),
+            ).update(values, synchronize_session="fetch")
+
+            status = self._get_dag_run(ti.dag_id, ti.execution_date)
+            for t in chunk:
+                for column, value in values.items():
+                    setattr(t, column.key, value)
+                status[t.task_id] = state
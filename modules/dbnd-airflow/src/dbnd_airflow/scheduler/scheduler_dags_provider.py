@@ -1,11 +1,14 @@
 import logging
 import os
 import sys
+import time
 
+from collections import defaultdict
 from typing import List, Union
 
 from airflow import DAG
 from airflow.models import BaseOperator, DagModel
+from airflow.utils.db import provide_session
 
 from dbnd import new_dbnd_context, override, task
 from dbnd._core.configuration.dbnd_config import config
@@ -32,10 +35,49 @@ from dbnd.tasks.basics.shell import bash_cmd
 logger = logging.getLogger(__name__)
 
 
+# fields of the scheduled job used by `job_to_dag`, the dag is rebuilt only if one of them changes
+_JOB_DAG_FIELDS = (
+    "uid",
+    "name",
+    "cmd",
+    "schedule_interval",
+    "start_date",
+    "end_date",
+    "catchup",
+    "depends_on_past",
+    "retries",
+    "create_user",
+)
+
+# max number of dag ids in one "IN" clause
+_BULK_CHUNK_SIZE = 500
+
+
+def _chunks(items, size=_BULK_CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def job_dag_id(job):
+    return "dbnd_launcher__%s" % clean_job_name(job["name"])
+
+
+def job_fingerprint(job):
+    return tuple(job.get(field) for field in _JOB_DAG_FIELDS)
+
+
+def is_job_paused(job):
+    return not job["active"] or bool(job.get("validation_errors"))
+
+
 class DbndSchedulerDBDagsProvider(object):
     # by default only run the file sync if we are in the scheduler (and not the webserver)
     def __init__(self):
         self.scheduled_jobs = []
+        self.scheduled_jobs_refresh_time = None
+
+        # dag_id -> (job fingerprint, dag), dags are kept between the parses of dags folder
+        self._dags_cache = {}
 
         if (
             config.getboolean("scheduler", "always_file_sync")
@@ -48,31 +90,81 @@ class DbndSchedulerDBDagsProvider(object):
             logger.debug("scheduler file syncing disabled")
 
         self.default_retries = config.getint("scheduler", "default_retries")
+        self.refresh_interval = config.getint("scheduler", "refresh_interval")
 
     def get_dags(self):  # type: () -> List[DAG]
         if not config.get("core", "databand_url"):
             self.scheduled_jobs = []
+            self._dags_cache = {}
             return []
         logger.debug("about to get scheduler job dags from dbnd db")
         self.refresh_scheduled_jobs()
+
         dags = []
+        changed_dag_ids = set()
+        is_paused = {}
+        dags_cache = {}
         for job in self.scheduled_jobs:
             if "schedule_interval" not in job:
                 continue
 
-            dag = self.job_to_dag(job)
-            dag.sync_to_db()
-            DagModel.get_dagmodel(dag.dag_id).set_is_paused(
-                is_paused=not job["active"]
-                or (
-                    job.get("validation_errors", None) is not None
-                    and len(job.get("validation_errors", None)) > 0
-                ),
-                including_subdags=False,
-            )
+            dag_id = job_dag_id(job)
+            fingerprint = job_fingerprint(job)
+            cached = self._dags_cache.get(dag_id)
+            if cached and cached[0] == fingerprint:
+                dag = cached[1]
+            else:
+                dag = self.job_to_dag(job)
+                if cached:
+                    changed_dag_ids.add(dag_id)
+
+            dags_cache[dag_id] = (fingerprint, dag)
+            is_paused[dag_id] = is_job_paused(job)
             dags.append(dag)
+
+        # dags of the deleted jobs are dropped as well
+        self._dags_cache = dags_cache
+        self.sync_dags_to_db(dags, changed_dag_ids, is_paused)
         return dags
 
+    @provide_session
+    def sync_dags_to_db(self, dags, changed_dag_ids, is_paused, session=None):
+        """
+        Syncs only new and changed dags (airflow scheduler syncs all parsed dags by itself),
+        paused state is updated with one UPDATE per value, only for the dags where it differs
+        """
+        db_is_paused = {}
+        for chunk in _chunks([dag.dag_id for dag in dags]):
+            db_is_paused.update(
+                session.query(DagModel.dag_id, DagModel.is_paused)
+                .filter(DagModel.dag_id.in_(chunk))
+                .all()
+            )
+
+        synced = 0
+        for dag in dags:
+            if dag.dag_id in changed_dag_ids or dag.dag_id not in db_is_paused:
+                dag.sync_to_db(session=session)
+                synced += 1
+
+        dag_ids_by_paused = defaultdict(list)
+        for dag_id, paused in is_paused.items():
+            if db_is_paused.get(dag_id) != paused:
+                dag_ids_by_paused[paused].append(dag_id)
+        for paused, dag_ids in dag_ids_by_paused.items():
+            for chunk in _chunks(dag_ids):
+                session.query(DagModel).filter(DagModel.dag_id.in_(chunk)).update(
+                    {DagModel.is_paused: paused}, synchronize_session=False
+                )
+        session.commit()
+
+        logger.debug(
+            "synced %s of %s scheduled job dags, updated paused state of %s",
+            synced,
+            len(dags),
+            sum(len(ids) for ids in dag_ids_by_paused.values()),
+        )
+
     def refresh_scheduled_jobs(self):
         changes = self.file_config_loader.sync() if self.file_config_loader else None
         if changes:
@@ -80,8 +172,15 @@ class DbndSchedulerDBDagsProvider(object):
                 "[databand scheduler] changes in scheduler config file synced: %s"
                 % ", ".join(("%s: %s" % (key, changes[key]) for key in changes))
             )
+        elif (
+            self.scheduled_jobs_refresh_time is not None
+            and time.time() - self.scheduled_jobs_refresh_time < self.refresh_interval
+        ):
+            # the list we have is fresh enough
+            return
 
         self.scheduled_jobs = self.get_scheduled_jobs()
+        self.scheduled_jobs_refresh_time = time.time()
 
     def get_scheduled_jobs(self):  # type: () -> List[dict]
         return [
@@ -103,7 +202,7 @@ class DbndSchedulerDBDagsProvider(object):
 
         job_name = clean_job_name(job["name"])
         dag = DAG(
-            "dbnd_launcher__%s" % job_name,
+            job_dag_id(job),
             start_date=start_day,
             default_args=default_args,
             schedule_interval=job.get("schedule_interval", None),
@@ -180,7 +279,13 @@ def launcher(scheduled_cmd, shell):
     return bash_cmd.func(cmd=scheduled_cmd, env=env, dbnd_env=False, shell=shell)
 
 
+# the provider is shared between the parses of the dags folder done by the same process
+_dags_provider = None
+
+
 def get_dags():
+    global _dags_provider
+
     if environ_enabled(ENV_DBND_DISABLE_SCHEDULED_DAGS_LOAD):
         return None
     from dbnd._core.errors.base import DatabandConnectionException, DatabandApiError
@@ -188,7 +293,9 @@ def get_dags():
     try:
         # let be sure that we are loaded
         config.load_system_configs()
-        dags = DbndSchedulerDBDagsProvider().get_dags()
+        if _dags_provider is None:
+            _dags_provider = DbndSchedulerDBDagsProvider()
+        dags = _dags_provider.get_dags()
 
         if not in_quiet_mode():
             logger.info("providing %s dags from scheduled jobs" % len(dags))
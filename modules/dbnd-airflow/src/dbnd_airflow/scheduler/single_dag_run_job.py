@@ -83,10 +83,6 @@ class SingleDagRunJob(BaseJob, SingletonContext):
         self.airflow_config = airflow_config  # type: AirflowConfig
         super(SingleDagRunJob, self).__init__(*args, **kwargs)
 
-    @property
-    def _optimize(self):
-        return self.airflow_config.optimize_airflow_db_access
-
     def _update_counters(self, ti_status, waiting_for_executor_result):
         """
         Updates the counters per state of the tasks that were running. Can re-add
@@ -94,11 +90,9 @@ class SingleDagRunJob(BaseJob, SingletonContext):
         :param ti_status: the internal status of the backfill job tasks
         :type ti_status: DagRunJob._DagRunTaskStatus
         """
+        reset_to_scheduled = []
         for key, ti in list(ti_status.running.items()):
             # updated by StateManager
-            if not self._optimize:
-                ti.refresh_from_db()
-
             if ti.state == State.SUCCESS:
                 ti_status.succeeded.add(key)
                 self.log.debug("Task instance %s succeeded. Don't rerun.", ti)
@@ -140,11 +134,25 @@ class SingleDagRunJob(BaseJob, SingletonContext):
                     "reaching concurrency limits. Re-adding task to queue.",
                     ti,
                 )
-                ti.set_state(State.SCHEDULED)
+                reset_to_scheduled.append(ti)
                 ti_status.running.pop(key)
                 ti_status.to_run[key] = ti
 
-    def _manage_executor_state(self, running, waiting_for_executor_result):
+        if reset_to_scheduled:
+            self._set_state(reset_to_scheduled, State.SCHEDULED)
+
+    @provide_session
+    def _set_state(self, task_instances, state, session=None):
+        # one UPDATE for all the task instances
+        self.ti_state_manager.set_state(
+            task_instances, state, session=session, update_dates=True
+        )
+        session.commit()
+
+    @provide_session
+    def _manage_executor_state(
+        self, running, waiting_for_executor_result, session=None
+    ):
         """
         Checks if the executor agrees with the state of task instances
         that are running
@@ -152,6 +160,7 @@ class SingleDagRunJob(BaseJob, SingletonContext):
         """
         executor = self.executor
 
+        events = []
         for key, state in list(executor.get_event_buffer().items()):
             # the fourth slot in the key is the try number (defined in TaskInstance.key). The keys in the scheduler maps are
             # determined at the start of the run and never updated - so the try number is stuck on 1. The executor however
@@ -180,16 +189,27 @@ class SingleDagRunJob(BaseJob, SingletonContext):
                 continue
 
             waiting_for_executor_result.pop(key)
+            events.append((key, state))
 
-            ti = running[key]
-            # updated by StateManager
-            if not self._optimize or ti.state in [State.RUNNING, State.QUEUED]:
-                # we refresh if we are not optimized
-                # or we have ti in running state, there could be a racing between
-                # our state manager sync and executor.get_event_buffer()
-                # task could be Running, but while running get_event_buffer it can become SUCCESS
-                ti.refresh_from_db()
+        if not events:
+            return
+
+        # states are updated by StateManager, but there could be a racing between
+        # our state manager sync and executor.get_event_buffer()
+        # task could be Running, but while running get_event_buffer it can become SUCCESS
+        # we refresh all the states with one query if we have such ti
+        if any(
+            running[key].state in [State.RUNNING, State.QUEUED] for key, _ in events
+        ):
+            self.ti_state_manager.refresh_task_instances_state(
+                [running[key] for key, _ in events],
+                self.dag.dag_id,
+                self.execution_date,
+                session=session,
+            )
 
+        for key, state in events:
+            ti = running[key]
             self.log.debug("Executor state: %s task %s", state, ti)
 
             if state == State.FAILED or state == State.SUCCESS:
@@ -272,25 +292,17 @@ class SingleDagRunJob(BaseJob, SingletonContext):
                 TI.end_date: timezone.utcnow(),
             }
         )
-        # TODO(edgarRd): AIRFLOW-1464 change to batch query to improve perf
-        #
-        task_instances = dag_run.get_task_instances()
+        session.commit()
 
+        # all tasks part of the backfill are scheduled to run (by the batch update)
+        # we load them in a separate session, so our changes of the (detached) objects
+        # are never flushed into the DB by our session
+        task_instances = dag_run.get_task_instances()
         for ti in task_instances:
-            # all tasks part of the backfill are scheduled to run
-            if ti.state == State.NONE:
-                # no waiting for the airflow - batch upate
-                # ti.set_state(State.SCHEDULED, session=session)
-
-                ti.state = State.SCHEDULED
-                ti.start_date = timezone.utcnow()
-                ti.end_date = timezone.utcnow()
-                session.merge(ti)
             if ti.state != State.REMOVED:
                 ti._log = logging.getLogger("airflow.task")
                 tasks_to_run[ti.key] = ti
 
-        session.commit()
         return tasks_to_run
 
     def _log_progress(self, ti_status):
@@ -370,6 +382,22 @@ class SingleDagRunJob(BaseJob, SingletonContext):
                 all_ti, self.dag.dag_id, self.execution_date, session=session
             )
 
+            # guard against externally modified tasks instances or
+            # in case max concurrency has been reached at task runtime
+            reset_to_scheduled = [
+                ti for ti in ti_status.to_run.values() if ti.state == State.NONE
+            ]
+            if reset_to_scheduled:
+                self.log.warning(
+                    "FIXME: task instances %s state was set to None "
+                    "externally. This should not happen",
+                    reset_to_scheduled,
+                )
+                self._set_state(reset_to_scheduled, State.SCHEDULED, session=session)
+
+            # task instances with met dependencies, sent to the executor in bulk
+            runnable = []
+
             # we need to execute the tasks bottom to top
             # or leaf to root, as otherwise tasks might be
             # determined deadlocked while they are actually
@@ -382,9 +410,6 @@ class SingleDagRunJob(BaseJob, SingletonContext):
                     if task.task_id != ti.task_id:
                         continue
 
-                    if not self._optimize:
-                        ti.refresh_from_db()
-
                     task = self.dag.get_task(ti.task_id)
                     ti.task = task
 
@@ -395,15 +420,6 @@ class SingleDagRunJob(BaseJob, SingletonContext):
                     ignore_depends_on_past = False
                     self.log.debug("Task instance to run %s state %s", ti, ti.state)
 
-                    # guard against externally modified tasks instances or
-                    # in case max concurrency has been reached at task runtime
-                    if ti.state == State.NONE:
-                        self.log.warning(
-                            "FIXME: task instance {} state was set to None "
-                            "externally. This should not happen"
-                        )
-                        ti.set_state(State.SCHEDULED, session=session)
-
                     # The task was already marked successful or skipped by a
                     # different Job. Don't rerun it.
                     if ti.state == State.SUCCESS:
@@ -469,46 +485,19 @@ class SingleDagRunJob(BaseJob, SingletonContext):
                         session=session,
                         verbose=self.verbose,
                     ):
-                        ti.refresh_from_db(lock_for_update=True, session=session)
-                        if (
-                            ti.state == State.SCHEDULED
-                            or ti.state == State.UP_FOR_RETRY
-                        ):
-                            if executor.has_task(ti):
-                                self.log.debug(
-                                    "Task Instance %s already in executor "
-                                    "waiting for queue to clear",
-                                    ti,
-                                )
-                            else:
-                                self.log.debug("Sending %s to executor", ti)
-                                # if ti.state == State.UP_FOR_RETRY:
-                                #     ti._try_number += 1
-                                # Skip scheduled state, we are executing immediately
-                                ti.state = State.QUEUED
-                                session.merge(ti)
-
-                                cfg_path = None
-                                if executor.__class__ in (
-                                    executors.LocalExecutor,
-                                    executors.SequentialExecutor,
-                                ):
-                                    cfg_path = tmp_configuration_copy()
-
-                                executor.queue_task_instance(
-                                    ti,
-                                    mark_success=self.mark_success,
-                                    pickle_id=pickle_id,
-                                    ignore_task_deps=self.ignore_task_deps,
-                                    ignore_depends_on_past=ignore_depends_on_past,
-                                    pool=self.pool,
-                                    cfg_path=cfg_path,
-                                )
-
-                                ti_status.to_run.pop(key)
-                                ti_status.running[key] = ti
-                                waiting_for_executor_result[key] = ti
-                        session.commit()
+                        runnable.append((key, ti, ignore_depends_on_past))
+                        if not self.airflow_config.disable_dag_concurrency_rules:
+                            # pool and concurrency deps count the queued task instances,
+                            # the next task instance should see this one as queued
+                            self._queue_task_instances(
+                                ti_status=ti_status,
+                                executor=executor,
+                                pickle_id=pickle_id,
+                                runnable=runnable,
+                                waiting_for_executor_result=waiting_for_executor_result,
+                                session=session,
+                            )
+                            runnable = []
                         continue
 
                     if ti.state == State.UPSTREAM_FAILED:
@@ -532,6 +521,16 @@ class SingleDagRunJob(BaseJob, SingletonContext):
                     # all remaining tasks
                     self.log.debug("Adding %s to not_ready", ti)
                     ti_status.not_ready.add(key)
+
+            self._queue_task_instances(
+                ti_status=ti_status,
+                executor=executor,
+                pickle_id=pickle_id,
+                runnable=runnable,
+                waiting_for_executor_result=waiting_for_executor_result,
+                session=session,
+            )
+
             # execute the tasks in the queue
             self.heartbeat()
             executor.heartbeat()
@@ -556,7 +555,9 @@ class SingleDagRunJob(BaseJob, SingletonContext):
             )
 
             # check executor state
-            self._manage_executor_state(ti_status.running, waiting_for_executor_result)
+            self._manage_executor_state(
+                ti_status.running, waiting_for_executor_result, session=session
+            )
 
             # update the task counters
             self._update_counters(ti_status, waiting_for_executor_result)
@@ -566,7 +567,7 @@ class SingleDagRunJob(BaseJob, SingletonContext):
             for run in _dag_runs:
                 run.update_state(session=session)
 
-                self._update_databand_task_run_states(run)
+                self._update_databand_task_run_states(run, session=session)
 
                 if run.state in State.finished():
                     ti_status.finished_runs += 1
@@ -587,17 +588,84 @@ class SingleDagRunJob(BaseJob, SingletonContext):
         # return updated status
         return executed_run_dates
 
-    def _update_databand_task_run_states(self, run):
+    def _queue_task_instances(
+        self,
+        ti_status,
+        executor,
+        pickle_id,
+        runnable,
+        waiting_for_executor_result,
+        session,
+    ):
+        """
+        Sends task instances with met dependencies to the executor.
+        The rows are locked and refreshed with one query, and moved to QUEUED with one update
+        (one task instance at a time if the dag concurrency rules are enabled).
+        `runnable` is a list of (key, ti, ignore_depends_on_past)
+        """
+        if not runnable:
+            return
+
+        self.ti_state_manager.refresh_for_update(
+            [ti for _, ti, _ in runnable], session=session
+        )
+        to_queue = []
+        for key, ti, ignore_depends_on_past in runnable:
+            if ti.state != State.SCHEDULED and ti.state != State.UP_FOR_RETRY:
+                continue
+            if executor.has_task(ti):
+                self.log.debug(
+                    "Task Instance %s already in executor waiting for queue to clear",
+                    ti,
+                )
+                continue
+            to_queue.append((key, ti, ignore_depends_on_past))
+
+        # Skip scheduled state, we are executing immediately
+        self.ti_state_manager.set_state(
+            [ti for _, ti, _ in to_queue], State.QUEUED, session=session
+        )
+        session.commit()
+
+        for key, ti, ignore_depends_on_past in to_queue:
+            self.log.debug("Sending %s to executor", ti)
+            cfg_path = None
+            if executor.__class__ in (
+                executors.LocalExecutor,
+                executors.SequentialExecutor,
+            ):
+                cfg_path = tmp_configuration_copy()
+
+            executor.queue_task_instance(
+                ti,
+                mark_success=self.mark_success,
+                pickle_id=pickle_id,
+                ignore_task_deps=self.ignore_task_deps,
+                ignore_depends_on_past=ignore_depends_on_past,
+                pool=self.pool,
+                cfg_path=cfg_path,
+            )
+
+            ti_status.to_run.pop(key)
+            ti_status.running[key] = ti
+            waiting_for_executor_result[key] = ti
+
+    def _update_databand_task_run_states(self, run, session):
         # we are going to update UPSTREAM_FAILED only
         # this is the only state we want to propogate into Databand
         # all other state changes are managed by databand itself by it's own state machine
         dr = get_databand_run()
 
         task_runs = []
-        for ti in run.get_task_instances():
-            if ti.state != State.UPSTREAM_FAILED:
-                continue
-            task_run = dr.get_task_run_by_af_id(ti.task_id)  # type: TaskRun
+        # dag run update_state can flag upstream failed tasks, one query for all the states
+        self.ti_state_manager.refresh_from_db(
+            run.dag_id, run.execution_date, session=session
+        )
+        upstream_failed = self.ti_state_manager.get_task_ids_by_state(
+            run.dag_id, run.execution_date, State.UPSTREAM_FAILED
+        )
+        for task_id in upstream_failed:
+            task_run = dr.get_task_run_by_af_id(task_id)  # type: TaskRun
             if not task_run:
                 continue
             if task_run.task_run_state != State.UPSTREAM_FAILED:
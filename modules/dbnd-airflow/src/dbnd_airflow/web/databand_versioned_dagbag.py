@@ -4,8 +4,10 @@ import logging
 
 from airflow.models import DagBag, DagModel, DagPickle, TaskInstance
 from airflow.utils.db import provide_session
+from sqlalchemy import func
 
 from dbnd._vendor import pendulum
+from dbnd_airflow.web.versioned_dags_cache import get_versioned_dags_cache
 
 
 logger = logging.getLogger(__name__)
@@ -92,7 +94,29 @@ class DbndAirflowDagBag(DagBag):
 
     @provide_session
     def _get_pickled_dag_from_dagrun(self, dag_id, execution_date, session=None):
+        cache = get_versioned_dags_cache()
 
+        pickled_dag_id = cache.get_pickle_id(dag_id, execution_date)
+        if pickled_dag_id is None:
+            pickled_dag_id = self._get_dag_pickle_id(
+                dag_id=dag_id, execution_date=execution_date, session=session
+            )
+            if not pickled_dag_id:
+                return None
+            cache.set_pickle_id(dag_id, execution_date, pickled_dag_id)
+
+        dag = cache.get_dag(pickled_dag_id)
+        if dag is None:
+            dag = self._load_pickled_dag(pickled_dag_id, session=session)
+            if dag is None:
+                return None
+        logger.debug("Versioned dags cache: %s", cache.stats())
+
+        # let's add this dag into dags, there is a check that validates if this dag exists..
+        self.dags[dag_id] = dag
+        return dag
+
+    def _get_dag_pickle_id(self, dag_id, execution_date, session):
         ti = (
             session.query(TaskInstance.task_id, TaskInstance.executor_config)
             .filter(
@@ -116,10 +140,13 @@ class DbndAirflowDagBag(DagBag):
                 ti.task_id,
             )
             return None
+        return pickled_dag_id
 
+    def _load_pickled_dag(self, pickled_dag_id, session):
         try:
-            pickled_dag = (
-                session.query(DagPickle)
+            # the size of the blob is used to limit the memory of the cache
+            row = (
+                session.query(DagPickle, func.length(DagPickle.pickle))
                 .filter(DagPickle.id == pickled_dag_id)
                 .one_or_none()
             )
@@ -127,12 +154,13 @@ class DbndAirflowDagBag(DagBag):
             logger.error("Error ocured during DAG retrieval from DB, %s", ex)
             return None
 
+        pickled_dag, pickle_size = row if row else (None, 0)
         if pickled_dag and pickled_dag.pickle:
             # we found pickled dag
             dag = pickled_dag.pickle
-            dag.dag_version_execution_date = execution_date
-            # let's add this dag into dags, there is a check that validates if this dag exists..
-            self.dags[dag_id] = dag
+            get_versioned_dags_cache().set_dag(
+                pickled_dag_id, dag, pickle_size=pickle_size
+            )
             return dag
         else:
             logger.debug(
@@ -0,0 +1,80 @@
+"""
+Process wide cache of the versioned (pickled) dags used by the webserver.
+
+DagBag is created in many places of the webserver (it's patched with DbndAirflowDagBag),
+so the cache is not bound to DagBag instance.
+    dags:       dag_pickle_id -> unpickled DAG, limited by the pickled size of the dags
+    pickle_ids: (dag_id, execution_date) -> dag_pickle_id
+"""
+import logging
+
+from targets.caching import LruCache
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DAGS = 50
+DEFAULT_MAX_DAGS_BYTES = 512 * 1024 ** 2
+DEFAULT_MAX_PICKLE_IDS = 10000
+DEFAULT_MAX_PICKLE_IDS_BYTES = 16 * 1024 ** 2
+
+
+class VersionedDagsCache(object):
+    def __init__(
+        self,
+        max_dags=DEFAULT_MAX_DAGS,
+        max_dags_bytes=DEFAULT_MAX_DAGS_BYTES,
+        max_pickle_ids=DEFAULT_MAX_PICKLE_IDS,
+        max_pickle_ids_bytes=DEFAULT_MAX_PICKLE_IDS_BYTES,
+    ):
+        self.dags = LruCache(max_items=max_dags, max_bytes=max_dags_bytes)
+        self.pickle_ids = LruCache(
+            max_items=max_pickle_ids, max_bytes=max_pickle_ids_bytes
+        )
+
+    def get_pickle_id(self, dag_id, execution_date):
+        return self.pickle_ids.get((dag_id, execution_date))
+
+    def set_pickle_id(self, dag_id, execution_date, dag_pickle_id):
+        self.pickle_ids.put((dag_id, execution_date), dag_pickle_id)
+
+    def get_dag(self, dag_pickle_id):
+        return self.dags.get(dag_pickle_id)
+
+    def set_dag(self, dag_pickle_id, dag, pickle_size):
+        self.dags.put(dag_pickle_id, dag, size=pickle_size)
+
+    def clear(self):
+        self.dags.clear()
+        self.pickle_ids.clear()
+
+    def stats(self):
+        return {"dags": self.dags.stats(), "pickle_ids": self.pickle_ids.stats()}
+
+
+_VERSIONED_DAGS_CACHE = None
+
+
+def _get_config_int(key, default):
+    from dbnd._core.configuration.dbnd_config import config
+
+    try:
+        return config.getint("airflow", key, default=default)
+    except Exception as ex:
+        logger.warning("Failed to read airflow.%s: %s", key, ex)
+        return default
+
+
+def get_versioned_dags_cache():
+    # type: () -> VersionedDagsCache
+    global _VERSIONED_DAGS_CACHE
+    if _VERSIONED_DAGS_CACHE is None:
+        _VERSIONED_DAGS_CACHE = VersionedDagsCache(
+            max_dags=_get_config_int(
+                "webserver_versioned_dags_cache_size", DEFAULT_MAX_DAGS
+            ),
+            max_dags_bytes=_get_config_int(
+                "webserver_versioned_dags_cache_max_bytes", DEFAULT_MAX_DAGS_BYTES
+            ),
+        )
+    return _VERSIONED_DAGS_CACHE
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import pytest
+
+from airflow import DAG
+from airflow.models import TaskInstance
+from airflow.operators.dummy_operator import DummyOperator
+from airflow.utils import timezone
+from airflow.utils.state import State
+
+from dbnd_airflow.dbnd_task_executor.task_instance_state_manager import (
+    AirflowTaskInstanceStateManager,
+)
+
+
+TI = TaskInstance
+
+
+@pytest.fixture
+def dag_run_tis(af_session):
+    execution_date = timezone.utcnow().replace(microsecond=0)
+    dag = DAG("test_ti_state_manager", start_date=execution_date - timedelta(days=1))
+    tis = [
+        TaskInstance(DummyOperator(task_id="t_%s" % i, dag=dag), execution_date)
+        for i in range(5)
+    ]
+    af_session.add_all(tis)
+    af_session.commit()
+    af_session.expunge_all()
+
+    yield tis
+
+    af_session.query(TI).filter(TI.dag_id == dag.dag_id).delete()
+    af_session.commit()
+
+
+def _update_in_db(session, ti, **values):
+    session.query(TI).filter(
+        TI.dag_id == ti.dag_id,
+        TI.execution_date == ti.execution_date,
+        TI.task_id == ti.task_id,
+    ).update(values, synchronize_session=False)
+    session.commit()
+
+
+class TestAirflowTaskInstanceStateManager(object):
+    def test_set_state_and_refresh(self, af_session, dag_run_tis):
+        ti = dag_run_tis[0]
+        manager = AirflowTaskInstanceStateManager()
+
+        manager.set_state(
+            dag_run_tis[:2], State.SCHEDULED, session=af_session, update_dates=True
+        )
+        af_session.commit()
+        assert [t.state for t in dag_run_tis[:3]] == [
+            State.SCHEDULED,
+            State.SCHEDULED,
+            None,
+        ]
+        assert dag_run_tis[0].start_date is not None
+
+        other = AirflowTaskInstanceStateManager()
+        changed = other.refresh_task_instances_state(
+            dag_run_tis, ti.dag_id, ti.execution_date, session=af_session
+        )
+        assert changed == {"t_0": State.SCHEDULED, "t_1": State.SCHEDULED}
+        assert (
+            other.refresh_from_db(ti.dag_id, ti.execution_date, session=af_session)
+            == {}
+        )
+
+        _update_in_db(af_session, dag_run_tis[2], state=State.SUCCESS)
+        changed = other.refresh_task_instances_state(
+            dag_run_tis, ti.dag_id, ti.execution_date, session=af_session
+        )
+        assert changed == {"t_2": State.SUCCESS}
+        assert dag_run_tis[2].state == State.SUCCESS
+        scheduled = other.get_task_ids_by_state(
+            ti.dag_id, ti.execution_date, State.SCHEDULED
+        )
+        assert sorted(scheduled) == ["t_0", "t_1"]
+
+    def test_refresh_for_update(self, af_session, dag_run_tis):
+        ti = dag_run_tis[0]
+        _update_in_db(af_session, ti, state=State.UP_FOR_RETRY, _try_number=3)
+
+        manager = AirflowTaskInstanceStateManager()
+        manager.refresh_for_update(dag_run_tis[:2], session=af_session)
+        af_session.commit()
+
+        assert ti.state == State.UP_FOR_RETRY
+        assert ti._try_number == 3
+        assert manager.get_state(ti.dag_id, ti.execution_date, ti.task_id) == (
+            State.UP_FOR_RETRY
+        )
+        # our objects are not attached to the session
+        assert ti not in af_session
@@ -0,0 +1,106 @@
+"""
+Latency of the DB access of one SingleDagRunJob loop iteration by the number of task instances:
+per row (refresh every ti, merge every transition) vs set based (AirflowTaskInstanceStateManager).
+
+    python -m test_dbnd_airflow.scenarios.scheduler_loop_benchmark 100 1000 5000
+"""
+import sys
+import time
+
+from datetime import timedelta
+
+
+def _create_dag_run_tis(session, num_of_tis):
+    from airflow import DAG
+    from airflow.models import TaskInstance
+    from airflow.operators.dummy_operator import DummyOperator
+    from airflow.utils import timezone
+
+    execution_date = timezone.utcnow().replace(microsecond=0)
+    dag = DAG(
+        "scheduler_loop_benchmark_%s" % num_of_tis,
+        start_date=execution_date - timedelta(days=1),
+    )
+    tis = [
+        TaskInstance(DummyOperator(task_id="t_%s" % i, dag=dag), execution_date)
+        for i in range(num_of_tis)
+    ]
+    session.add_all(tis)
+    session.commit()
+    session.expunge_all()
+    return dag, execution_date, tis
+
+
+def _per_row_iteration(session, tis):
+    from airflow.utils.state import State
+
+    for ti in tis:
+        ti.refresh_from_db(session=session)
+    for ti in tis:
+        ti.state = State.QUEUED
+        session.merge(ti)
+    session.commit()
+
+
+def _set_based_iteration(session, state_manager, dag, execution_date, tis):
+    from airflow.utils.state import State
+
+    state_manager.refresh_task_instances_state(
+        tis, dag.dag_id, execution_date, session=session
+    )
+    state_manager.set_state(tis, State.QUEUED, session=session)
+    session.commit()
+
+
+def _timeit(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        took = time.time() - start
+        best = took if best is None else min(best, took)
+    return best
+
+
+def benchmark(num_of_tis):
+    from airflow.models import TaskInstance
+    from airflow.utils.db import create_session
+
+    from dbnd_airflow.dbnd_task_executor.task_instance_state_manager import (
+        AirflowTaskInstanceStateManager,
+    )
+
+    with create_session() as session:
+        dag, execution_date, tis = _create_dag_run_tis(session, num_of_tis)
+        try:
+            state_manager = AirflowTaskInstanceStateManager()
+            per_row = _timeit(lambda: _per_row_iteration(session, tis))
+            set_based = _timeit(
+                lambda: _set_based_iteration(
+                    session, state_manager, dag, execution_date, tis
+                )
+            )
+        finally:
+            session.query(TaskInstance).filter(
+                TaskInstance.dag_id == dag.dag_id
+            ).delete()
+            session.commit()
+    return per_row, set_based
+
+
+def main(argv):
+    from dbnd import dbnd_bootstrap
+    from dbnd_airflow.airflow_extensions.airflow_config import reinit_airflow_sql_conn
+
+    dbnd_bootstrap()
+    reinit_airflow_sql_conn()
+
+    sizes = [int(n) for n in argv] or [100, 1000, 5000]
+    print("%10s %15s %15s" % ("tis", "per row (s)", "set based (s)"))
+    for num_of_tis in sizes:
+        per_row, set_based = benchmark(num_of_tis)
+        print("%10s %15.3f %15.3f" % (num_of_tis, per_row, set_based))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,74 @@
+from datetime import datetime
+
+import mock
+import pytest
+
+from airflow import DAG
+from airflow.models import DagModel
+
+from dbnd import config
+from dbnd_airflow.scheduler.scheduler_dags_provider import (
+    DbndSchedulerDBDagsProvider,
+    job_dag_id,
+)
+
+
+def _job(name, **kwargs):
+    job = dict(
+        name=name,
+        cmd="echo hi",
+        schedule_interval="@daily",
+        start_date=datetime(2020, 1, 1),
+        active=True,
+    )
+    job.update(kwargs)
+    return job
+
+
+@pytest.fixture
+def scheduled_jobs(af_session):
+    jobs = [_job("test_provider_a"), _job("test_provider_b", active=False)]
+    yield jobs
+
+    af_session.query(DagModel).filter(
+        DagModel.dag_id.in_([job_dag_id(job) for job in jobs])
+    ).delete(synchronize_session=False)
+    af_session.commit()
+
+
+def _is_paused(af_session, job):
+    af_session.expire_all()
+    return DagModel.get_dagmodel(job_dag_id(job), session=af_session).is_paused
+
+
+class TestDbndSchedulerDBDagsProvider(object):
+    def test_incremental_sync(self, af_session, scheduled_jobs):
+        job_a, job_b = scheduled_jobs
+        with config({"core": {"databand_url": "http://localhost:8080"}}):
+            provider = DbndSchedulerDBDagsProvider()
+            provider.refresh_interval = 0
+            provider.get_scheduled_jobs = lambda: list(scheduled_jobs)
+
+            with mock.patch.object(
+                DAG, "sync_to_db", autospec=True, side_effect=DAG.sync_to_db
+            ) as sync_to_db:
+                dags = provider.get_dags()
+                assert sync_to_db.call_count == 2
+                assert not _is_paused(af_session, job_a)
+                assert _is_paused(af_session, job_b)
+
+                # nothing changed, the same dags and no writes
+                sync_to_db.reset_mock()
+                assert provider.get_dags() == dags
+                assert sync_to_db.call_count == 0
+
+                job_a["cmd"] = "echo bye"
+                job_b["active"] = True
+                new_dags = provider.get_dags()
+                assert sync_to_db.call_count == 1
+                assert new_dags[0] is not dags[0]
+                assert new_dags[1] is dags[1]
+                assert not _is_paused(af_session, job_b)
+
+                scheduled_jobs.pop()
+                assert [d.dag_id for d in provider.get_dags()] == [job_dag_id(job_a)]
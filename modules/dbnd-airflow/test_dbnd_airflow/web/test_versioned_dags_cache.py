@@ -0,0 +1,21 @@
+from dbnd_airflow.web.versioned_dags_cache import VersionedDagsCache
+
+
+class TestVersionedDagsCache(object):
+    def test_dags_and_pickle_ids(self):
+        cache = VersionedDagsCache(max_dags=1)
+        dag_1, dag_2 = object(), object()
+
+        cache.set_pickle_id("dag", "2020-01-01", 1)
+        cache.set_dag(1, dag_1, pickle_size=10)
+        assert cache.get_pickle_id("dag", "2020-01-01") == 1
+        assert cache.get_pickle_id("dag", "2020-01-02") is None
+        assert cache.get_dag(1) is dag_1
+
+        cache.set_dag(2, dag_2, pickle_size=10)
+        assert cache.get_dag(1) is None
+        assert cache.get_dag(2) is dag_2
+
+        stats = cache.stats()
+        assert stats["dags"]["evictions"] == 1
+        assert stats["pickle_ids"]["hit_rate"] == 0.5
@@ -4,59 +4,80 @@ from dbnd._core.context.dbnd_project_env import DBND_IS_INITIALIZED
 
 str(DBND_IS_INITIALIZED)
 
-from dbnd._core.configuration.config_store import ConfigMergeSettings
-from dbnd._core.context.bootstrap import dbnd_bootstrap
-from dbnd._core.task_build import task_namespace
-from dbnd._core.task_build.task_registry import register_config_cls, register_task
-from dbnd._core.cli.main import main as dbnd_main, dbnd_cmd, dbnd_run_cmd
-from dbnd._core.commands import log_metric, log_dataframe
-from dbnd._core.configuration.config_readers import override
-from dbnd._core.configuration.dbnd_config import config, config_deco
-from dbnd._core.context.databand_context import new_dbnd_context
-from dbnd._core.current import (
-    dbnd_context,
-    get_databand_context,
-    current_task,
-    current_task_run,
-    get_databand_run,
-)
-from dbnd._core.decorator.func_task_decorator import band, pipeline, task
-from dbnd._core.failures import dbnd_handle_errors
-from dbnd._core.parameter.parameter_builder import data, output, parameter
-from dbnd._core.parameter.parameter_definition import (
-    ParameterScope,
-    ParameterDefinition,
-)
-from dbnd._core.plugin.dbnd_plugins import hookimpl
-from dbnd._core.inplace_run.inplace_run_manager import dbnd_run_start, dbnd_run_stop
-from dbnd._core.task.config import Config
-from dbnd._core.configuration.config_path import ConfigPath
-from dbnd._core.task.data_source_task import DataSourceTask
-from dbnd._core.task.pipeline_task import PipelineTask
-from dbnd._core.task.python_task import PythonTask
-from dbnd._core.task.task import Task
-from dbnd._core.task_build.task_context import current
-from dbnd._core.task_build.task_namespace import auto_namespace, namespace
-from dbnd._core.task_ctrl.task_relations import as_task
-from dbnd._core.utils.project.project_fs import (
-    project_path,
-    databand_system_path,
-    relative_path,
-    databand_lib_path,
-)
-from dbnd._core.inplace_run.airflow_utils import (
-    dbnd_tracking_env,
-    dbnd_wrap_spark_environment,
-    get_dbnd_tracking_spark_conf,
-    get_dbnd_tracking_spark_conf_dict,
-    spark_submit_with_dbnd_tracking,
+from dbnd._core.utils.basics.lazy_module import on_module_import, set_lazy_attrs
+
+
+# the public api is imported on the first access,
+# so short living processes (tracking, `dbnd execute`) don't pay for what they don't use
+set_lazy_attrs(
+    __name__,
+    {
+        "ConfigMergeSettings": "dbnd._core.configuration.config_store:ConfigMergeSettings",
+        "dbnd_bootstrap": "dbnd._core.context.bootstrap:dbnd_bootstrap",
+        "task_namespace": "dbnd._core.task_build.task_namespace",
+        "register_config_cls": "dbnd._core.task_build.task_registry:register_config_cls",
+        "register_task": "dbnd._core.task_build.task_registry:register_task",
+        "dbnd_main": "dbnd._core.cli.main:main",
+        "dbnd_cmd": "dbnd._core.cli.main:dbnd_cmd",
+        "dbnd_run_cmd": "dbnd._core.cli.main:dbnd_run_cmd",
+        "log_metric": "dbnd._core.commands:log_metric",
+        "log_metrics": "dbnd._core.commands:log_metrics",
+        "log_dataframe": "dbnd._core.commands:log_dataframe",
+        "override": "dbnd._core.configuration.config_readers:override",
+        "config": "dbnd._core.configuration.dbnd_config:config",
+        "dbnd_config": "dbnd._core.configuration.dbnd_config:config",
+        "config_deco": "dbnd._core.configuration.dbnd_config:config_deco",
+        "new_dbnd_context": "dbnd._core.context.databand_context:new_dbnd_context",
+        "dbnd_context": "dbnd._core.current:dbnd_context",
+        "get_databand_context": "dbnd._core.current:get_databand_context",
+        "current_task": "dbnd._core.current:current_task",
+        "current_task_run": "dbnd._core.current:current_task_run",
+        "get_databand_run": "dbnd._core.current:get_databand_run",
+        "band": "dbnd._core.decorator.func_task_decorator:band",
+        "pipeline": "dbnd._core.decorator.func_task_decorator:pipeline",
+        "task": "dbnd._core.decorator.func_task_decorator:task",
+        "dbnd_handle_errors": "dbnd._core.failures:dbnd_handle_errors",
+        "data": "dbnd._core.parameter.parameter_builder:data",
+        "output": "dbnd._core.parameter.parameter_builder:output",
+        "parameter": "dbnd._core.parameter.parameter_builder:parameter",
+        "ParameterScope": "dbnd._core.parameter.parameter_definition:ParameterScope",
+        "ParameterDefinition": "dbnd._core.parameter.parameter_definition:ParameterDefinition",
+        "hookimpl": "dbnd._core.plugin.dbnd_plugins:hookimpl",
+        "dbnd_run_start": "dbnd._core.inplace_run.inplace_run_manager:dbnd_run_start",
+        "dbnd_run_stop": "dbnd._core.inplace_run.inplace_run_manager:dbnd_run_stop",
+        "Config": "dbnd._core.task.config:Config",
+        "ConfigPath": "dbnd._core.configuration.config_path:ConfigPath",
+        "DataSourceTask": "dbnd._core.task.data_source_task:DataSourceTask",
+        "PipelineTask": "dbnd._core.task.pipeline_task:PipelineTask",
+        "PythonTask": "dbnd._core.task.python_task:PythonTask",
+        "Task": "dbnd._core.task.task:Task",
+        "current": "dbnd._core.task_build.task_context:current",
+        "auto_namespace": "dbnd._core.task_build.task_namespace:auto_namespace",
+        "namespace": "dbnd._core.task_build.task_namespace:namespace",
+        "as_task": "dbnd._core.task_ctrl.task_relations:as_task",
+        "project_path": "dbnd._core.utils.project.project_fs:project_path",
+        "databand_system_path": "dbnd._core.utils.project.project_fs:databand_system_path",
+        "relative_path": "dbnd._core.utils.project.project_fs:relative_path",
+        "databand_lib_path": "dbnd._core.utils.project.project_fs:databand_lib_path",
+        "dbnd_tracking_env": "dbnd._core.inplace_run.airflow_utils:dbnd_tracking_env",
+        "dbnd_wrap_spark_environment": "dbnd._core.inplace_run.airflow_utils:dbnd_wrap_spark_environment",
+        "get_dbnd_tracking_spark_conf": "dbnd._core.inplace_run.airflow_utils:get_dbnd_tracking_spark_conf",
+        "get_dbnd_tracking_spark_conf_dict": "dbnd._core.inplace_run.airflow_utils:get_dbnd_tracking_spark_conf_dict",
+        "spark_submit_with_dbnd_tracking": "dbnd._core.inplace_run.airflow_utils:spark_submit_with_dbnd_tracking",
+        "tasks": "dbnd.tasks",
+        "basics": "dbnd.tasks.basics",
+        "_set_patches": "targets._set_patches",
+    },
 )
 
-from dbnd.tasks import basics
-from targets import _set_patches
 
+def _set_pandas_patches(pandas):
+    # DataFrame.to_target
+    import targets._set_patches  # noqa: F401
+
+
+on_module_import("pandas", _set_pandas_patches)
 
-dbnd_config = config
 __all__ = [
     "hookimpl",
     # context management
@@ -105,6 +126,7 @@ __all__ = [
     # metrics
     "log_dataframe",
     "log_metric",
+    "log_metrics",
     # project paths
     "project_path",
     "relative_path",
@@ -120,8 +142,6 @@ __all__ = [
 # imported_vars = set(k for k in locals().keys() if not k.startswith("__"))
 # print(list(imported_vars.difference(set(__all__))))
 
-# shortcuts for useful objects
-str(_set_patches)  # NOQA
 __version__ = "0.26.4"
 
 __title__ = "databand"
@@ -6,7 +6,7 @@ from targets.value_meta import ValueMetaConf
 
 
 if typing.TYPE_CHECKING:
-    from typing import Optional, Union
+    from typing import Any, Dict, Optional, Union
     import pandas as pd
     import pyspark.sql as spark
 
@@ -52,6 +52,11 @@ def log_dataframe(
 
 
 def log_metric(key, value, source="user"):
+    """
+    Logs the metric of the current task run.
+    With features.log_metrics_aggregation numeric values are sent on the next flush
+    of the aggregated metrics (or at the task end), not immediately.
+    """
     tracker = _get_tracker()
     if tracker:
         tracker.log_metric(key, value, source=source)
@@ -60,6 +65,18 @@ def log_metric(key, value, source="user"):
     logger.info("Log {} Metric '{}'='{}'".format(source.capitalize(), key, value))
 
 
+def log_metrics(metrics_dict, source="user"):
+    # type: (Dict[str, Any], str) -> None
+    """Logs all the metrics with the same timestamp, prefer it to log_metric in loops"""
+    tracker = _get_tracker()
+    if tracker:
+        tracker.log_metrics(metrics_dict, source=source)
+        return
+
+    for key, value in metrics_dict.items():
+        logger.info("Log {} Metric '{}'='{}'".format(source.capitalize(), key, value))
+
+
 def log_artifact(key, artifact):
     tracker = _get_tracker()
     if tracker:
@@ -0,0 +1,97 @@
+import threading
+import typing
+
+from collections import OrderedDict
+
+import six
+
+from dbnd._core.configuration.config_store import _lower_config_name
+
+
+if typing.TYPE_CHECKING:
+    from typing import Dict, Optional, Sequence
+
+    from dbnd._core.configuration.config_value import ConfigValue
+    from dbnd._core.configuration.dbnd_config import _ConfigLayer
+
+
+def flatten_config_sections(config_store, sections):
+    # type: (...) -> Dict[str, ConfigValue]
+    """
+    key -> ConfigValue of all the keys at `sections`:
+    the first override wins, otherwise the value of the first section that has the key
+    """
+    values = {}
+    for section in sections:
+        section_values = config_store.get(_lower_config_name(section))
+        if not section_values:
+            continue
+        for key, config_value in six.iteritems(section_values):
+            current = values.get(key)
+            if current is None or (config_value.override and not current.override):
+                values[key] = config_value
+    return values
+
+
+class ConfigResolutionIndex(object):
+    """
+    Memoized flattened config of section lists (i.e. task config sections), per config layer.
+    Config layers are not changed after creation, any change of the config creates
+    a new layer, so entries of old layers are never used again and are evicted by LRU.
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # (id(layer), sections) -> (layer, values)
+        self._entries = OrderedDict()
+
+    def get_config_values(self, config_layer, sections):
+        # type: (_ConfigLayer, Sequence[str]) -> Dict[str, ConfigValue]
+        key = (id(config_layer), tuple(sections))
+        with self._lock:
+            entry = self._entries.get(key)
+            # the layer is referenced by the entry, so its id can't be reused
+            if entry is not None and entry[0] is config_layer:
+                self.hits += 1
+                self._entries[key] = self._entries.pop(key)
+                return entry[1]
+            self.misses += 1
+
+        values = flatten_config_sections(config_layer.config, sections)
+        with self._lock:
+            self._entries[key] = (config_layer, values)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return values
+
+    def get_config_value(self, config_layer, sections, key):
+        # type: (_ConfigLayer, Sequence[str], str) -> Optional[ConfigValue]
+        return self.get_config_values(config_layer, sections).get(
+            _lower_config_name(key)
+        )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": float(self.hits) / total if total else 0.0,
+            "size": len(self._entries),
+        }
+
+
+_config_resolution_index = ConfigResolutionIndex()
+
+
+def get_config_resolution_index():
+    # type: () -> ConfigResolutionIndex
+    return _config_resolution_index
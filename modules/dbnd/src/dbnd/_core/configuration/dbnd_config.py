@@ -4,7 +4,7 @@ import logging
 import os
 import typing
 
-from typing import Any, Mapping, Optional, Union
+from typing import Any, List, Mapping, Optional, Union
 
 import attr
 
@@ -14,6 +14,7 @@ from dbnd._core.configuration.config_readers import (
     read_environ_config,
     read_from_config_files,
 )
+from dbnd._core.configuration.config_resolver import get_config_resolution_index
 from dbnd._core.configuration.config_store import (
     _ConfigMergeSettings,
     _ConfigStore,
@@ -187,6 +188,17 @@ class DbndConfig(object):
         """
         return self.config_layer.config.get_config_value(section, key)
 
+    def get_sections_config_value(self, sections, key):
+        # type: (List[str], str)->Optional[ConfigValue]
+        """
+        Gets the value of the key from the first of `sections` that has it,
+        an override value at any of the sections wins.
+        Resolved once per sections list per config layer.
+        """
+        return get_config_resolution_index().get_config_value(
+            self.config_layer, sections, key
+        )
+
     def get(self, section, key, default=None, expand_env=True):
 
         config_value = self.get_config_value(section=section, key=key)
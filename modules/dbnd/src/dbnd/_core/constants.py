@@ -30,6 +30,11 @@ class CloudType(object):
 
 class TaskExecutorType(object):
     local = "local"
+    local_parallel = "local_parallel"
+
+    @staticmethod
+    def all():
+        return [TaskExecutorType.local, TaskExecutorType.local_parallel]
 
 
 class OutputMode(object):
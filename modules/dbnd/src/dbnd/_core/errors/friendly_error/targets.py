@@ -21,6 +21,14 @@ def dump_generator_to_file(target):
     )
 
 
+def chunked_read_not_supported(marshaller, target):
+    return DatabandRuntimeError(
+        "Can't read %s by chunks: %s doesn't support chunked read"
+        % (target, marshaller.__class__.__name__),
+        help_msg="Load the value without `chunksize`, or use csv or parquet format",
+    )
+
+
 def no_marshaller(target, config, value_type, options_message):
     return DatabandRuntimeError(
         "There is no defined way to read/write value of type '{type}' with file format '{format}'. ".format(
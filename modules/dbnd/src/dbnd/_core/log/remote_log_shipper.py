@@ -0,0 +1,119 @@
+import logging
+import os
+import threading
+import typing
+
+
+if typing.TYPE_CHECKING:
+    from targets import FileTarget
+
+logger = logging.getLogger(__name__)
+
+# bytes read from the local log and sent at once
+SHIP_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def read_file_preview(path, max_size):
+    # type: (str, int) -> str
+    """
+    Returns the tail of the file limited by max_size bytes
+    (the head for negative max_size), without reading the whole file.
+    The preview has the same format as `safe_short_string`.
+    """
+    size = os.path.getsize(path)
+    is_tail = max_size > 0
+    max_size = abs(max_size)
+    with open(path, "rb") as f:
+        if size <= max_size:
+            return f.read().decode("utf-8", "replace")
+
+        # reserve the place for the "(N of M) ..." marker
+        actual_len = max(max_size - len("(%s of %s) ..." % (size, size)), 0)
+        if is_tail:
+            f.seek(size - actual_len)
+        data = f.read(actual_len)
+
+    # the edges can split multibyte characters
+    preview = data.decode("utf-8", "ignore")
+    if is_tail:
+        return "(%s of %s) ...%s" % (actual_len, size, preview)
+    return "%s... (%s of %s)" % (preview, actual_len, size)
+
+
+class RemoteLogShipper(object):
+    """
+    Ships the local log file to the remote log while it's written.
+    New data is appended to the remote log every `interval` seconds if the remote
+    file system supports append, otherwise the whole file is uploaded at the stop.
+    """
+
+    def __init__(self, local_path, remote_log_file, interval):
+        # type: (str, FileTarget, float) -> None
+        self.local_path = local_path
+        self.remote_log_file = remote_log_file
+        self.interval = interval
+
+        self.offset = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def is_incremental(self):
+        return self.remote_log_file.fs.support_append
+
+    def start(self):
+        if not self.is_incremental:
+            return self
+        if self.remote_log_file.exists():
+            # the log of the previous try, we are starting from the scratch
+            self.remote_log_file.remove()
+        if self.interval > 0:
+            self._thread = threading.Thread(
+                target=self._run, name="dbnd-remote-log-shipper"
+            )
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.ship()
+            except Exception as ex:
+                logger.warning("Failed to ship log to %s: %s", self.remote_log_file, ex)
+
+    def ship(self):
+        """Appends everything written to the local log since the last call"""
+        with self._lock:
+            if not os.path.exists(self.local_path):
+                return
+            with open(self.local_path, "rb") as f:
+                f.seek(self.offset)
+                while True:
+                    data = f.read(SHIP_CHUNK_SIZE)
+                    if not data:
+                        break
+                    self.remote_log_file.fs.append_bytes(
+                        self.remote_log_file.path, data
+                    )
+                    self.offset += len(data)
+
+    def stop(self):
+        """Stops the shipping and sends the rest of the log"""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+        if self.is_incremental:
+            self.ship()
+            return
+        try:
+            # streamed from the local file
+            self.remote_log_file.fs.copy_from_local(
+                self.local_path, self.remote_log_file.path
+            )
+        except NotImplementedError:
+            with open(self.local_path, "rb") as f:
+                self.remote_log_file.write(f.read().decode("utf-8", "replace"))
@@ -1,6 +1,8 @@
 import importlib
 import logging
 
+from collections import OrderedDict
+
 from dbnd._core.configuration import environ_config
 from dbnd._core.errors import friendly_error
 from dbnd._core.plugin import dbnd_plugin_spec
@@ -12,7 +14,70 @@ logger = logging.getLogger(__name__)
 
 
 hookimpl = pluggy.HookimplMarker("dbnd")
-pm = pluggy.PluginManager("dbnd")
+
+
+class DbndPluginManager(pluggy.PluginManager):
+    """
+    Entry point plugins are registered by name first,
+    their modules are imported on the first hook call (or the first access to the plugins).
+    Lazy plugins are loaded before any plugin registered with `register`,
+    so the order of the hook calls is the same as with eager registration.
+    """
+
+    def __init__(self, project_name, implprefix=None):
+        super(DbndPluginManager, self).__init__(project_name, implprefix=implprefix)
+        self._lazy_plugins = OrderedDict()  # name -> plugin loader
+
+    def register_lazy(self, name, load_plugin):
+        if self.is_blocked(name) or self.has_plugin(name):
+            return
+        self._lazy_plugins[name] = load_plugin
+
+    def load_lazy_plugins(self):
+        if not self._lazy_plugins:
+            return False
+        while self._lazy_plugins:
+            name, load_plugin = self._lazy_plugins.popitem(last=False)
+            if self.is_blocked(name):
+                continue
+            super(DbndPluginManager, self).register(load_plugin(), name=name)
+        self.check_pending()
+        return True
+
+    def register(self, plugin, name=None):
+        self.load_lazy_plugins()
+        return super(DbndPluginManager, self).register(plugin, name=name)
+
+    def _hookexec(self, hook, methods, kwargs):
+        if self._lazy_plugins and self.load_lazy_plugins():
+            methods = hook.get_hookimpls()
+        return super(DbndPluginManager, self)._hookexec(hook, methods, kwargs)
+
+    def get_plugin(self, name):
+        if name in self._lazy_plugins:
+            self.load_lazy_plugins()
+        return super(DbndPluginManager, self).get_plugin(name)
+
+    def get_plugins(self):
+        self.load_lazy_plugins()
+        return super(DbndPluginManager, self).get_plugins()
+
+    def list_name_plugin(self):
+        self.load_lazy_plugins()
+        return super(DbndPluginManager, self).list_name_plugin()
+
+    def has_plugin(self, name):
+        # doesn't import the plugin
+        return name in self._lazy_plugins or super(DbndPluginManager, self).has_plugin(
+            name
+        )
+
+    def set_blocked(self, name):
+        self._lazy_plugins.pop(name, None)
+        super(DbndPluginManager, self).set_blocked(name)
+
+
+pm = DbndPluginManager("dbnd")
 pm.add_hookspecs(dbnd_plugin_spec)
 
 _AIRFLOW_PACKAGE_INSTALLED = None  # apache airflow is installed
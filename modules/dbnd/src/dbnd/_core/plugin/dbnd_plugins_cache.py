@@ -0,0 +1,122 @@
+"""
+Persisted index of dbnd plugins entry points.
+
+Entry points discovery reads the metadata of all installed distributions,
+the index is valid while sys.path and mtimes of its directories are the same
+(pip install/uninstall changes site-packages mtime).
+"""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sys
+
+from dbnd._core.configuration.environ_config import ENV_DBND_SYSTEM, environ_enabled
+
+
+logger = logging.getLogger(__name__)
+
+ENV_DBND__NO_PLUGINS_CACHE = "DBND__NO_PLUGINS_CACHE"
+_CACHE_FILE_NAME = "plugins_entry_points.json"
+
+
+@contextlib.contextmanager
+def _importlib_metadata():
+    if sys.version_info >= (3, 8):
+        from importlib import metadata as importlib_metadata
+
+        yield importlib_metadata
+        return
+
+    from dbnd._vendor import importlib_metadata
+
+    importlib_metadata.install(importlib_metadata.MetadataPathFinder)
+    try:
+        yield importlib_metadata
+    finally:
+        # remove our metadata installer from metapath
+        sys.meta_path = [
+            m
+            for m in sys.meta_path
+            if not isinstance(m, importlib_metadata.MetadataPathFinder)
+        ]
+
+
+def entry_points_cache_key():
+    h = hashlib.md5()
+    h.update(sys.executable.encode("utf-8"))
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or os.curdir).st_mtime
+        except OSError:
+            mtime = None
+        h.update(repr((path, mtime)).encode("utf-8"))
+    return h.hexdigest()
+
+
+def scan_entry_points(group):
+    """[(name, value)] of all installed distributions"""
+    with _importlib_metadata() as importlib_metadata:
+        return [
+            (ep.name, ep.value)
+            for dist in importlib_metadata.distributions()
+            for ep in dist.entry_points
+            if ep.group == group
+        ]
+
+
+def load_entry_point(name, value, group):
+    if sys.version_info >= (3, 8):
+        from importlib.metadata import EntryPoint
+    else:
+        from dbnd._vendor.importlib_metadata import EntryPoint
+
+    return EntryPoint(name, value, group).load()
+
+
+def _get_cache_file():
+    dbnd_system = os.environ.get(ENV_DBND_SYSTEM)
+    if not dbnd_system:
+        return None
+    return os.path.join(dbnd_system, _CACHE_FILE_NAME)
+
+
+def _read_cache(cache_file, group, key):
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if cache.get("key") != key or cache.get("group") != group:
+        return None
+    return [tuple(ep) for ep in cache["entry_points"]]
+
+
+def _write_cache(cache_file, group, key, entry_points):
+    tmp_file = "%s.%s.tmp" % (cache_file, os.getpid())
+    try:
+        if not os.path.exists(os.path.dirname(cache_file)):
+            os.makedirs(os.path.dirname(cache_file))
+        with open(tmp_file, "w") as f:
+            json.dump({"key": key, "group": group, "entry_points": entry_points}, f)
+        # atomic, concurrent processes read either the old or the new index
+        os.rename(tmp_file, cache_file)
+    except (IOError, OSError) as ex:
+        logger.debug("Failed to write plugins cache %s: %s", cache_file, ex)
+
+
+def get_entry_points(group):
+    """
+    [(name, value)] of `group` entry points, from the persisted index if it's valid
+    """
+    cache_file = _get_cache_file()
+    if not cache_file or environ_enabled(ENV_DBND__NO_PLUGINS_CACHE):
+        return scan_entry_points(group)
+
+    key = entry_points_cache_key()
+    entry_points = _read_cache(cache_file, group, key)
+    if entry_points is None:
+        entry_points = scan_entry_points(group)
+        _write_cache(cache_file, group, key, entry_points)
+    return entry_points
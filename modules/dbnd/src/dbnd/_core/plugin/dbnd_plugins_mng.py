@@ -1,9 +1,11 @@
+import functools
 import sys
 
 import six
 
 from dbnd._core.configuration import environ_config
 from dbnd._core.plugin.dbnd_plugins import pm
+from dbnd._core.plugin.dbnd_plugins_cache import get_entry_points, load_entry_point
 from dbnd._core.utils.basics.load_python_module import _load_module
 
 
@@ -22,8 +24,8 @@ def register_dbnd_plugins():
     if six.PY2:
         # fix path from "non" str values, otherwise we fail on py2
         sys.path = [str(p) if type(p) != str else p for p in sys.path]
-    pm.load_setuptools_entrypoints("dbnd")
-    pm.check_pending()
+    for name, value in get_entry_points("dbnd"):
+        pm.register_lazy(name, functools.partial(load_entry_point, name, value, "dbnd"))
 
 
 def register_dbnd_user_plugins(user_plugin_modules):
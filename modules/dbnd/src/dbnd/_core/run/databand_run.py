@@ -37,8 +37,16 @@ from dbnd._core.errors.base import (
 from dbnd._core.parameter.parameter_builder import output, parameter
 from dbnd._core.plugin.dbnd_plugins import is_airflow_enabled
 from dbnd._core.run.describe_run import DescribeRun
+from dbnd._core.run.run_snapshot import (
+    RunSnapshotLoader,
+    UnexpectedSnapshotReference,
+    load_run_snapshot,
+    remove_stale_slices,
+    save_run_snapshot,
+)
 from dbnd._core.run.run_tracker import RunTracker
 from dbnd._core.run.target_identity_source_map import TargetIdentitySourceMap
+from dbnd._core.run.task_completeness import TaskCompletenessChecker
 from dbnd._core.run.task_runs_builder import TaskRunsBuilder
 from dbnd._core.settings import DatabandSettings, EngineConfig, RunConfig
 from dbnd._core.task import Task
@@ -198,6 +206,10 @@ class DatabandRun(SingletonContext):
         self.run_config = self.context.settings.run  # type: RunConfig
         self.env = env = self.context.env
 
+        self.task_completeness = TaskCompletenessChecker(
+            parallelism=self.run_config.task_complete_parallelism
+        )
+
         self.local_engine = self._get_engine_config(env.local_engine)
         self.remote_engine = self._get_engine_config(
             env.remote_engine or env.local_engine
@@ -221,6 +233,9 @@ class DatabandRun(SingletonContext):
 
         self.dynamic_af_tasks_count = dict()
 
+        # set if the run is loaded from a sharded snapshot, loads task runs on demand
+        self._snapshot = None  # type: Optional[RunSnapshotLoader]
+
     def _get_engine_config(self, name):
         # type: ( Union[str, EngineConfig]) -> EngineConfig
         return build_task_from_config(name, EngineConfig)
@@ -266,11 +281,17 @@ class DatabandRun(SingletonContext):
 
     def get_task_run_by_id(self, task_id):
         # type: (str) -> TaskRun
-        return self.task_runs_by_id.get(task_id)
+        task_run = self.task_runs_by_id.get(task_id)
+        if task_run is None and self._snapshot:
+            task_run = self._snapshot.load_task_run(task_id)
+        return task_run
 
     def get_task_run_by_af_id(self, task_id):
         # type: (str) -> TaskRun
-        return self.task_runs_by_af_id.get(task_id)
+        task_run = self.task_runs_by_af_id.get(task_id)
+        if task_run is None and self._snapshot:
+            task_run = self._snapshot.load_task_run_by_af_id(task_id)
+        return task_run
 
     def get_af_task_ids(self, task_ids):
         return [self.get_task_run(task_id).task_af_id for task_id in task_ids]
@@ -412,6 +433,8 @@ class DatabandRun(SingletonContext):
         Runs the main driver!
         """
         # with captures_log_into_file_as_task_file(log_file=self.local_driver_log.path):
+        if self._snapshot:
+            self._snapshot.load_all()
         try:
             self.driver_task_run.runner.execute()
         except DatabandRunError as ex:
@@ -436,14 +459,27 @@ class DatabandRun(SingletonContext):
 
         return task
 
-    def save_run(self, target_file=None):
+    def save_run(self, target_file=None, sharded=None):
         """
-        dumps current run and context to file
+        dumps current run and context to file,
+        sharded dump is the file with task slices next to it (at <file>.snapshot)
         """
         t = target_file or self.driver_dump
+        if sharded is None:
+            sharded = self.context.settings.core.sharded_run_snapshot
         logger.info("Saving current run into %s", t)
+        if sharded:
+            try:
+                save_run_snapshot(self, t)
+                return
+            except UnexpectedSnapshotReference as ex:
+                logger.warning(
+                    "Failed to split the run into task slices, saving it as a whole: %s",
+                    ex,
+                )
         with t.open("wb") as fp:
             cloudpickle.dump(obj=self, file=fp)
+        remove_stale_slices(t)
 
     @contextlib.contextmanager
     def run_context(self):
@@ -458,11 +494,11 @@ class DatabandRun(SingletonContext):
     def load_run(self, dump_file, disable_tracking_api):
         # type: (FileTarget, bool) -> DatabandRun
         logger.info("Loading dbnd run from %s", dump_file)
-        with dump_file.open("rb") as fp:
-            databand_run = cloudpickle.load(file=fp)
-            if disable_tracking_api:
-                databand_run.context.tracking_store.disable_tracking_api()
-                logger.info("Tracking has been disabled")
+        # task runs of sharded snapshots are loaded on demand
+        databand_run = load_run_snapshot(dump_file)
+        if disable_tracking_api:
+            databand_run.context.tracking_store.disable_tracking_api()
+            logger.info("Tracking has been disabled")
         try:
             if databand_run.context.settings.core.pickle_handler:
                 pickle_handler = load_python_callable(
@@ -684,7 +720,8 @@ class _DbndDriverTask(Task):
         if self.target_engine.require_submit:
             return True
 
-        if self.task_executor_type == TaskExecutorType.local:
+        if self.task_executor_type in TaskExecutorType.all():
+            # local executors don't load the run from the dump
             return False
 
         if is_airflow_enabled():
@@ -721,6 +758,8 @@ class _DbndDriverTask(Task):
     def run(self):
         driver_task_run = current_task_run()
         run = driver_task_run.run  # type: DatabandRun
+        # the cache is shared by all the runs of the process
+        target_cache_stats = TARGET_CACHE.stats()
         if self.is_submitter:
             run.set_run_state(RunState.RUNNING)
 
@@ -774,6 +813,7 @@ class _DbndDriverTask(Task):
             task_executor.do_run()
 
         if self.is_driver:
+            _log_target_cache_stats(driver_task_run, since=target_cache_stats)
             # This is great success!
             run.set_run_state(RunState.SUCCESS)
             logger.info(run.describe.run_banner_for_finished())
@@ -782,6 +822,14 @@ class _DbndDriverTask(Task):
             logger.info(run.describe.run_banner_for_submitted())
 
 
+def _log_target_cache_stats(task_run, since):
+    stats = TARGET_CACHE.stats(since=since)
+    if not (stats["hits"] or stats["misses"]):
+        return
+    for name, value in sorted(stats.items()):
+        task_run.tracker.log_metric("target_cache.%s" % name, value, source="system")
+
+
 def new_databand_run(context, task_or_task_name, run_uid=None, **kwargs):
     # type: (DatabandContext, Union[Task, str], UUID, **Any)-> ContextManager[DatabandRun]
 
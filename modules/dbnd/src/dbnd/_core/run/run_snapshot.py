@@ -0,0 +1,374 @@
+"""
+Sharded snapshot of DatabandRun, remote/submitted tasks load only the task they run.
+
+Layout:
+    <driver_dump>                          header: the run and the context without task runs,
+                                           objects shared by the tasks, the manifest of the slices
+    <driver_dump>.snapshot/<md5>.pickle    content addressed task slices: a task with its task run
+
+Slices reference the objects of the header and other slices by persistent ids,
+so the loader materializes only the task runs that are requested.
+The header is written as two pickles of the same pickler (they share the memo):
+the run itself and the manifest with the list of objects referenced by the slices.
+"""
+import hashlib
+import io
+import logging
+import os
+import pickle
+import typing
+
+import six
+
+from dbnd._core.configuration.dbnd_config import _ConfigLayer
+from dbnd._core.errors import DatabandRuntimeError
+from dbnd._core.parameter.parameter_definition import ParameterDefinition
+from dbnd._core.task.base_task import _BaseTask
+from dbnd._core.task_build.task_definition import TaskDefinition
+from dbnd._core.task_build.task_instance_cache import TaskInstanceCache
+from dbnd._core.task_run.task_run import TaskRun
+from dbnd._vendor.cloudpickle import cloudpickle
+from targets import target
+
+
+if typing.TYPE_CHECKING:
+    from typing import Any, Dict, Optional
+
+    from dbnd._core.run.databand_run import DatabandRun
+    from dbnd._core.task.task import Task
+    from targets import FileTarget
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+_TASK = "task"
+_TASK_RUN = "task_run"
+_SHARED = "shared"
+
+# values without identity, always saved inline
+_ATOMIC_TYPES = six.string_types + six.integer_types + (bytes, float, type(None))
+# objects used by many tasks, saved once at the header even if the run doesn't reference them
+_SHARED_TYPES = (_BaseTask, _ConfigLayer, ParameterDefinition, TaskDefinition)
+
+
+class UnexpectedSnapshotReference(DatabandRuntimeError):
+    pass
+
+
+def get_snapshot_root(dump_file):
+    # type: (FileTarget) -> str
+    return "%s.snapshot" % dump_file.path
+
+
+def _slice_target(snapshot_root, slice_hash):
+    return target(snapshot_root, "%s.pickle" % slice_hash)
+
+
+def remove_stale_slices(dump_file, keep=()):
+    """
+    Removes the slices of the previous snapshots saved to the same dump file,
+    so they live no longer than the dump (and the run folder) they belong to
+    """
+    fs = dump_file.fs
+    snapshot_root = get_snapshot_root(dump_file)
+    try:
+        if not fs.exists(snapshot_root):
+            return
+        keep = {"%s.pickle" % slice_hash for slice_hash in keep}
+        for path in list(fs.listdir(snapshot_root)):
+            if os.path.basename(path.rstrip("/")) not in keep:
+                fs.remove(path, recursive=False)
+    except Exception as ex:
+        logger.warning("Failed to remove old task slices at %s: %s", snapshot_root, ex)
+
+
+class _SnapshotPickler(cloudpickle.CloudPickler):
+    def __init__(self, file, persistent_id):
+        cloudpickle.CloudPickler.__init__(self, file)
+        self._persistent_id = persistent_id
+
+    def persistent_id(self, obj):
+        return self._persistent_id(obj)
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, persistent_load):
+        pickle.Unpickler.__init__(self, file)
+        self._persistent_load = persistent_load
+
+    def persistent_load(self, pid):
+        return self._persistent_load(pid)
+
+
+class RunSnapshotWriter(object):
+    def __init__(self, run, dump_file):
+        # type: (DatabandRun, FileTarget) -> None
+        self.run = run
+        self.dump_file = dump_file
+        self.snapshot_root = get_snapshot_root(dump_file)
+        self.task_runs = list(run.task_runs)
+
+        # id(task or task run) -> task run of the slice
+        self._slices = {}  # type: Dict[int, TaskRun]
+        for tr in self.task_runs:
+            self._slices[id(tr)] = tr
+            self._slices[id(tr.task)] = tr
+
+        # id(obj) -> obj of all objects at the header,
+        # objects are kept alive, so their ids are not reused
+        self._header_objects = {}  # type: Dict[int, Any]
+        # objects referenced by the slices, the index is the reference
+        self._shared = []
+        self._shared_index = {}  # type: Dict[int, int]
+        self._written = set()
+
+    def _header_persistent_id(self, obj):
+        if isinstance(obj, _ATOMIC_TYPES):
+            return None
+        if id(obj) in self._slices:
+            raise UnexpectedSnapshotReference(
+                "The run references the task %s outside of its task runs"
+                % self._slices[id(obj)].task.task_id
+            )
+        self._header_objects[id(obj)] = obj
+        return None
+
+    def _slice_persistent_id(self, task_run, obj):
+        if obj is task_run or obj is task_run.task or isinstance(obj, _ATOMIC_TYPES):
+            return None
+
+        tr = self._slices.get(id(obj))
+        if tr is not None:
+            return (_TASK_RUN if obj is tr else _TASK), tr.task.task_id
+
+        if not (
+            id(obj) in self._header_objects
+            or isinstance(obj, _SHARED_TYPES)
+            # task classes can be pickled by value (i.e. defined at __main__)
+            or (isinstance(obj, type) and issubclass(obj, _BaseTask))
+        ):
+            return None
+
+        index = self._shared_index.get(id(obj))
+        if index is None:
+            index = self._shared_index[id(obj)] = len(self._shared)
+            self._shared.append(obj)
+        return _SHARED, index
+
+    def dump_slice(self, task_run):
+        # type: (TaskRun) -> str
+        f = io.BytesIO()
+        _SnapshotPickler(f, lambda obj: self._slice_persistent_id(task_run, obj)).dump(
+            task_run
+        )
+        data = f.getvalue()
+
+        slice_hash = hashlib.md5(data).hexdigest()
+        if slice_hash not in self._written:
+            with _slice_target(self.snapshot_root, slice_hash).open("wb") as fp:
+                fp.write(data)
+            self._written.add(slice_hash)
+        return slice_hash
+
+    def write(self):
+        run = self.run
+        manifest = dict(
+            task_ids=[tr.task.task_id for tr in self.task_runs],
+            af_ids={tr.task_af_id: tr.task.task_id for tr in self.task_runs},
+            root_task_id=run.root_task.task_id if run.root_task else None,
+            driver_task_id=run.driver_task_run.task.task_id,
+        )
+
+        f = io.BytesIO()
+        header_pickler = _SnapshotPickler(f, self._header_persistent_id)
+        with _detached_task_runs(run, self._slices):
+            header_pickler.dump(dict(snapshot_version=SNAPSHOT_VERSION, run=run))
+
+            manifest["slices"] = {
+                tr.task.task_id: self.dump_slice(tr) for tr in self.task_runs
+            }
+            # objects of the run are saved as references to the memo
+            manifest["shared"] = self._shared
+            header_pickler.dump(manifest)
+        data = f.getvalue()
+
+        with self.dump_file.open("wb") as fp:
+            fp.write(data)
+        remove_stale_slices(self.dump_file, keep=self._written)
+        logger.info(
+            "Run snapshot: header of %s bytes, %s task slices",
+            len(data),
+            len(self._written),
+        )
+        return manifest
+
+
+class _detached_task_runs(object):
+    """
+    Temporary removes the task runs from the run (and their tasks from the context),
+    so the header doesn't include them.
+    """
+
+    _run_attrs = (
+        "task_runs",
+        "task_runs_by_id",
+        "task_runs_by_af_id",
+        "root_task",
+        "root_task_run",
+        "driver_task_run",
+        "_snapshot",
+    )
+
+    def __init__(self, run, slices):
+        self.run = run
+        self.slices = slices
+        self._saved_attrs = None
+        self._saved_task_instance_cache = None
+
+    def __enter__(self):
+        run = self.run
+        self._saved_attrs = {name: getattr(run, name) for name in self._run_attrs}
+        run.task_runs = []
+        run.task_runs_by_id = {}
+        run.task_runs_by_af_id = {}
+        run.root_task = run.root_task_run = run.driver_task_run = None
+        run._snapshot = None
+
+        tic = self._saved_task_instance_cache = run.context.task_instance_cache
+        detached = TaskInstanceCache()
+        detached.task_instances = {
+            k: t for k, t in tic.task_instances.items() if id(t) not in self.slices
+        }
+        detached.task_obj_instances = {
+            k: t for k, t in tic.task_obj_instances.items() if id(t) not in self.slices
+        }
+        run.context.task_instance_cache = detached
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for name, value in self._saved_attrs.items():
+            setattr(self.run, name, value)
+        self.run.context.task_instance_cache = self._saved_task_instance_cache
+
+
+class RunSnapshotLoader(object):
+    def __init__(self, dump_file):
+        # type: (FileTarget) -> None
+        self.dump_file = dump_file
+        self.snapshot_root = get_snapshot_root(dump_file)
+        self.run = None  # type: Optional[DatabandRun]
+        self.manifest = None
+        self._loading = set()
+
+    def _header_persistent_load(self, pid):
+        raise DatabandRuntimeError(
+            "Run snapshot %s is broken: the header references %s"
+            % (self.dump_file, pid)
+        )
+
+    def _slice_persistent_load(self, pid):
+        kind, key = pid
+        if kind == _SHARED:
+            return self.manifest["shared"][key]
+        if kind in (_TASK, _TASK_RUN):
+            task_run = self.load_task_run(key)
+            return task_run if kind == _TASK_RUN else task_run.task
+        raise DatabandRuntimeError(
+            "Run snapshot %s is broken: unknown reference %s" % (self.dump_file, pid)
+        )
+
+    def load(self):
+        # type: () -> DatabandRun
+        """
+        Loads the header, the driver and the root task runs, other task runs are
+        loaded on demand. Dumps of the whole run are returned as is.
+        """
+        with self.dump_file.open("rb") as fp:
+            unpickler = _SnapshotUnpickler(fp, self._header_persistent_load)
+            header = unpickler.load()
+            if not isinstance(header, dict):
+                return header
+
+            if header.get("snapshot_version") != SNAPSHOT_VERSION:
+                raise DatabandRuntimeError(
+                    "Run snapshot %s has unsupported version %s"
+                    % (self.dump_file, header.get("snapshot_version"))
+                )
+            self.manifest = unpickler.load()
+
+        self.run = run = header["run"]
+        run._snapshot = self
+        run.context.task_instance_cache.lazy_task_loader = self.load_task
+
+        run.driver_task_run = self.load_task_run(self.manifest["driver_task_id"])
+        if self.manifest["root_task_id"]:
+            run.root_task_run = self.load_task_run(self.manifest["root_task_id"])
+            run.root_task = run.root_task_run.task
+        return run
+
+    def load_task_run(self, task_id):
+        # type: (str) -> Optional[TaskRun]
+        task_run = self.run.task_runs_by_id.get(task_id)
+        if task_run is not None:
+            return task_run
+
+        slice_hash = self.manifest["slices"].get(task_id)
+        if slice_hash is None:
+            return None
+        if task_id in self._loading:
+            raise DatabandRuntimeError(
+                "Run snapshot %s is broken: circular reference to %s"
+                % (self.dump_file, task_id)
+            )
+
+        logger.debug("Loading task run %s from the run snapshot", task_id)
+        self._loading.add(task_id)
+        try:
+            with _slice_target(self.snapshot_root, slice_hash).open("rb") as fp:
+                task_run = _SnapshotUnpickler(fp, self._slice_persistent_load).load()
+        finally:
+            self._loading.discard(task_id)
+
+        self.run._add_task_run(task_run)
+        task = task_run.task
+        tic = self.run.context.task_instance_cache
+        tic.task_obj_instances[task.task_meta.obj_key.id] = task
+        tic.register_task_object(task)
+        return task_run
+
+    def load_task_run_by_af_id(self, task_af_id):
+        # type: (str) -> Optional[TaskRun]
+        task_id = self.manifest["af_ids"].get(task_af_id)
+        if task_id is None:
+            return None
+        return self.load_task_run(task_id)
+
+    def load_task(self, task_id):
+        # type: (str) -> Optional[Task]
+        task_run = self.load_task_run(task_id)
+        return task_run.task if task_run else None
+
+    def load_all(self):
+        for task_id in self.manifest["task_ids"]:
+            self.load_task_run(task_id)
+        # keep the original order of the task runs
+        order = {task_id: i for i, task_id in enumerate(self.manifest["task_ids"])}
+        self.run.task_runs.sort(key=lambda tr: order.get(tr.task.task_id, len(order)))
+
+    @property
+    def loaded_task_ids(self):
+        return [tr.task.task_id for tr in self.run.task_runs]
+
+
+def save_run_snapshot(run, dump_file):
+    # type: (DatabandRun, FileTarget) -> None
+    if run._snapshot:
+        # the run is partially loaded from a snapshot
+        run._snapshot.load_all()
+    RunSnapshotWriter(run, dump_file).write()
+
+
+def load_run_snapshot(dump_file):
+    # type: (FileTarget) -> DatabandRun
+    return RunSnapshotLoader(dump_file).load()
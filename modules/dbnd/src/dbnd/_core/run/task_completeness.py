@@ -0,0 +1,136 @@
+import logging
+import typing
+
+from multiprocessing.pool import ThreadPool
+
+from dbnd._core.task.task import Task
+from dbnd._core.utils.traversing import flatten
+from targets.dir_target import DirTarget
+from targets.file_target import FileTarget
+
+
+if typing.TYPE_CHECKING:
+    from typing import Dict, List
+
+    from targets import Target
+
+logger = logging.getLogger(__name__)
+
+
+def _is_default_complete(task):
+    task_complete = type(task)._complete
+    return getattr(task_complete, "__func__", task_complete) is getattr(
+        Task._complete, "__func__", Task._complete
+    )
+
+
+class TaskCompletenessChecker(object):
+    """
+    Checks if tasks are completed, all output targets of the checked tasks
+    are resolved together (grouped by file system) in a bounded thread pool.
+    Results are memoized, so the check at task execution doesn't repeat the work.
+    """
+
+    def __init__(self, parallelism=10):
+        self.parallelism = parallelism
+        self._completed = {}  # type: Dict[str, bool]
+
+    def __getstate__(self):
+        # results are valid only for the current process
+        d = self.__dict__.copy()
+        d["_completed"] = {}
+        return d
+
+    def check_tasks(self, tasks):
+        # type: (List[Task]) -> Dict[str, bool]
+        tasks_to_check = {
+            t.task_id: t for t in tasks if t.task_id not in self._completed
+        }
+        if tasks_to_check:
+            self._completed.update(self._check_tasks(list(tasks_to_check.values())))
+        return {t.task_id: self._completed[t.task_id] for t in tasks}
+
+    def is_complete(self, task):
+        """
+        Returns the result calculated by check_tasks (only once),
+        following calls check the task again, as it could be executed meanwhile
+        """
+        completed = self._completed.pop(task.task_id, None)
+        if completed is None:
+            completed = task._complete()
+        return completed
+
+    def _check_tasks(self, tasks):
+        # tasks with custom _complete() or without outputs go through _complete(),
+        # we don't know if user code is thread safe, so it runs in the current thread
+        outputs_by_task = {}
+        custom_tasks = []
+        for task in tasks:
+            outputs = flatten(task.task_outputs) if _is_default_complete(task) else []
+            if outputs:
+                outputs_by_task[task.task_id] = outputs
+            else:
+                custom_tasks.append(task)
+
+        targets = {}
+        for outputs in outputs_by_task.values():
+            for t in outputs:
+                targets[id(t)] = t
+
+        exists = {}
+        if targets:
+            pool = ThreadPool(processes=max(1, min(self.parallelism, len(targets))))
+            try:
+                exists = self._targets_exist(pool, list(targets.values()))
+            finally:
+                pool.close()
+                pool.join()
+
+        results = {
+            task_id: all(exists[id(t)] for t in outputs)
+            for task_id, outputs in outputs_by_task.items()
+        }
+        for task in custom_tasks:
+            results[task.task_id] = task._complete()
+        return results
+
+    def _targets_exist(self, pool, targets):
+        # type: (ThreadPool, List[Target]) -> Dict[int, bool]
+        """
+        Plain file targets of the same file system are checked with one
+        fs.exists_many call, everything else goes through target.exists()
+        """
+        by_fs = {}
+        other_targets = []
+        for t in targets:
+            path = _bulk_exists_path(t)
+            if path is None:
+                other_targets.append(t)
+            else:
+                by_fs.setdefault(id(t.fs), (t.fs, []))[1].append((t, path))
+
+        exists = {}
+        for fs, fs_targets in by_fs.values():
+            paths_exist = fs.exists_many(list({path for _, path in fs_targets}))
+            for t, path in fs_targets:
+                exists[id(t)] = paths_exist[path]
+
+        for t, t_exists in zip(
+            other_targets, pool.map(lambda target: target.exists(), other_targets)
+        ):
+            exists[id(t)] = t_exists
+        return exists
+
+
+def _bulk_exists_path(target):
+    """
+    The path to check for the target existence, None if target.exists() should be used
+    """
+    if type(target) is DirTarget and target.flag_target:
+        target = target.flag_target
+    if type(target) not in (FileTarget, DirTarget):
+        return None
+    path = target.path
+    if any(c in path for c in "*?[{"):
+        return None
+    return path
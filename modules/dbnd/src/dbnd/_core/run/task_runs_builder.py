@@ -3,6 +3,9 @@ import typing
 
 from typing import List
 
+import six
+
+from dbnd._core.run.task_completeness import TaskCompletenessChecker
 from dbnd._core.settings import EngineConfig, RunConfig
 from dbnd._core.task_build.task_context import TaskContextPhase
 from dbnd._core.task_build.task_registry import build_task_from_config
@@ -16,28 +19,36 @@ from dbnd._core.utils.task_utils import (
 
 
 if typing.TYPE_CHECKING:
+    from typing import Optional, Set, Tuple
+
     from dbnd._core.run.databand_run import DatabandRun
     from dbnd._core.task.task import Task
 
 logger = logging.getLogger(__name__)
 
 
-def find_tasks_to_skip_complete(root_tasks, all_tasks):
+def find_tasks_to_skip_complete(root_tasks, all_tasks, completeness_checker=None):
+    # type: (List[Task], Set[Task], Optional[TaskCompletenessChecker]) -> Tuple[Set[Task], Set[Task]]
     completed_status = {}  # if True = should run, if False or None - should not
+    completeness_checker = completeness_checker or TaskCompletenessChecker()
 
     logger.info("Looking for completed tasks..")
 
-    def check_if_completed(task):
-        task_id = task.task_id
-        if task_id in completed_status:
-            return
-        completed_status[task_id] = completed = task._complete()
-        if not completed:
-            for c in task.ctrl.task_dag.upstream:
-                check_if_completed(c)
-
-    for t in root_tasks:
-        check_if_completed(t)
+    # we go level by level, upstreams are checked only for not completed tasks
+    # all tasks of the same level are checked together
+    tasks_to_check = list(root_tasks)
+    while tasks_to_check:
+        level = {}
+        for task in tasks_to_check:
+            if task.task_id not in completed_status:
+                level[task.task_id] = task
+        level_status = completeness_checker.check_tasks(list(level.values()))
+        completed_status.update(level_status)
+
+        tasks_to_check = []
+        for task_id, completed in six.iteritems(level_status):
+            if not completed:
+                tasks_to_check.extend(level[task_id].ctrl.task_dag.upstream)
 
     # only if completed_status is False task is not skipped
     # otherwise - it wasn't discovered or it's completed
@@ -102,7 +113,7 @@ class TaskRunsBuilder(object):
         task_skipped_as_not_required = set()
         if run_config.skip_completed:
             tasks_completed, task_skipped_as_not_required = find_tasks_to_skip_complete(
-                roots, enabled_tasks
+                roots, enabled_tasks, completeness_checker=run.task_completeness
             )
 
         # # if any of the tasks is spark add policy
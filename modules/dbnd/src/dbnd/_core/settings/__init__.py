@@ -12,6 +12,7 @@ from dbnd._core.settings.describe import DescribeConfig
 from dbnd._core.settings.engine import EngineConfig
 from dbnd._core.settings.env import EnvConfig, LocalEnvConfig
 from dbnd._core.settings.git import GitConfig
+from dbnd._core.settings.http_client import HttpClientConfig
 from dbnd._core.settings.log import LoggingConfig
 from dbnd._core.settings.output import OutputConfig
 from dbnd._core.settings.run import RunConfig
@@ -34,6 +35,7 @@ class DatabandSettings(object):
 
         self.run = RunConfig()
         self.git = GitConfig()
+        self.http_client = HttpClientConfig()
 
         self.describe = DescribeConfig()
 
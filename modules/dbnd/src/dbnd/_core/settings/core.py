@@ -109,6 +109,59 @@ class CoreConfig(Config):
         default=True, description="Raise error when failed to track data"
     )[bool]
     tracker_api = parameter(default="db", description="Tracking Stores to be used")[str]
+    tracker_api_async = parameter(
+        default=False,
+        description="Send tracking api requests from a background thread, "
+        "coalescing same endpoint calls into bulk requests",
+    )[bool]
+    tracker_api_async_queue_size = parameter(
+        default=10000,
+        description="Max number of tracking requests waiting to be sent (async mode)",
+    )[int]
+    tracker_api_async_batch_size = parameter(
+        default=500, description="Send queued tracking requests at this size"
+    )[int]
+    tracker_api_async_flush_interval = parameter(
+        default=2.0,
+        description="Send queued tracking requests after this number of seconds",
+    )[float]
+    tracker_api_async_put_timeout = parameter(
+        default=5.0,
+        description="Seconds to wait for a free slot in a full tracking queue, "
+        "the request is dropped afterwards",
+    )[float]
+    tracker_api_async_flush_timeout = parameter(
+        default=60.0,
+        description="Seconds to wait for the queued tracking requests at the end of the run",
+    )[float]
+    tracker_fan_out = parameter(
+        default=False,
+        description="Call every tracking store from its own worker thread, "
+        "waiting only for the stores from core.tracker_critical",
+    )[bool]
+    tracker_critical = parameter(
+        default=["api"],
+        description="Tracking stores the caller waits for (fan-out mode)",
+    )[List[str]]
+    tracker_store_timeout = parameter(
+        default=30.0,
+        description="Seconds to wait for a call to a tracking store (fan-out mode)",
+    )[float]
+    tracker_store_timeouts = parameter(
+        empty_default=True,
+        description="Per store override of core.tracker_store_timeout, "
+        "i.e. {'api': 60}",
+    )[Dict[str, float]]
+    tracker_store_failure_threshold = parameter(
+        default=5,
+        description="Consecutive failures of a tracking store before its calls are "
+        "skipped (fan-out mode)",
+    )[int]
+    tracker_store_circuit_reset = parameter(
+        default=60.0,
+        description="Seconds to skip the calls of a failing tracking store "
+        "before trying it again (fan-out mode)",
+    )[float]
     auto_create_local_db = parameter(
         default=True,
         description="Automatically create local SQLite db if it's not present",
@@ -120,6 +173,10 @@ class CoreConfig(Config):
     disable_save_pipeline = parameter(
         description="Boolean for disabling pipeline pickling"
     ).value(False)
+    sharded_run_snapshot = parameter(
+        description="Save the pipeline as a header and per task slices, "
+        "so remote tasks load only the task they run"
+    ).value(True)
 
     recheck_circle_dependencies = parameter(
         description="Re check circle dependencies on every task creation,"
@@ -229,6 +286,22 @@ class CoreConfig(Config):
             channel = DirectDbChannel()
         else:
             raise friendly_error.config.wrong_tracking_api_name(tracker_api)
+
+        if self.tracker_api_async:
+            from dbnd._core.tracking.channels.tracking_async_channel import (
+                TrackingAsyncChannel,
+                get_async_tracking_worker,
+            )
+
+            worker = get_async_tracking_worker(
+                max_queue_size=self.tracker_api_async_queue_size,
+                batch_size=self.tracker_api_async_batch_size,
+                flush_interval=self.tracker_api_async_flush_interval,
+                put_timeout=self.tracker_api_async_put_timeout,
+                flush_timeout=self.tracker_api_async_flush_timeout,
+                raise_on_error=self.tracker_raise_on_error,
+            )
+            channel = TrackingAsyncChannel(channel=channel, worker=worker)
         return TrackingStoreApi(channel=channel)
 
     def get_tracking_store(self):
@@ -236,20 +309,39 @@ class CoreConfig(Config):
         from dbnd._core.tracking.tracking_store import CompositeTrackingStore
 
         store_names = self.tracker
-        if len(store_names) == 1 and self.tracker_raise_on_error:
+        if (
+            len(store_names) == 1
+            and self.tracker_raise_on_error
+            and not self.tracker_fan_out
+        ):
             # only composite store supports tracker_raise_on_error=False
             return self._build_store(store_names[0])
         if not store_names:
             logger.warning("You are running without any tracking store configured.")
 
         stores = []
+        workers = {}
         for name in store_names:
             store = self._build_store(name)
             if store:
                 stores.append(store)
+                if self.tracker_fan_out:
+                    workers[store] = self._get_tracking_store_worker(name)
 
         return CompositeTrackingStore(
-            stores=stores, raise_on_error=self.tracker_raise_on_error
+            stores=stores, raise_on_error=self.tracker_raise_on_error, workers=workers
+        )
+
+    def _get_tracking_store_worker(self, name):
+        from dbnd._core.tracking.tracking_store_worker import get_tracking_store_worker
+
+        timeouts = self.tracker_store_timeouts or {}
+        return get_tracking_store_worker(
+            name,
+            timeout=float(timeouts.get(name, self.tracker_store_timeout)),
+            critical=name in self.tracker_critical,
+            failure_threshold=self.tracker_store_failure_threshold,
+            reset_timeout=self.tracker_store_circuit_reset,
         )
 
     def get_scheduled_job_service(self):
@@ -281,6 +373,11 @@ class FeaturesConfig(Config):
     in_memory_cache_target_value = parameter(
         default=True, description="Cache targets values in memory during execution"
     )[bool]
+    in_memory_cache_target_max_bytes = parameter(
+        default=2 * 1024 ** 3,
+        description="Max size of target values cached in memory, "
+        "least recently used values are evicted (0 - unlimited)",
+    )[int]
 
     log_value_size = parameter(
         default=True,
@@ -294,10 +391,32 @@ class FeaturesConfig(Config):
         default=True,
         description="Calculate and log value stats(expensive to calculate, better use log_stats on parameter level)",
     )[bool]
+    log_value_stats_max_rows = parameter(
+        default=100000,
+        description="Calculate value stats by a sample of this number of rows "
+        "for bigger data frames (0 - always use all the rows)",
+    )[int]
+    log_value_stats_histogram_bins = parameter(
+        default=20, description="Number of histogram bins in value stats"
+    )[int]
     log_value_preview = parameter(
         default=True, description="Calculate and log value preview "
     )[bool]
 
+    log_value_hash_mode = (
+        parameter.choices(["full", "fingerprint", "auto"])
+        .help(
+            "How to calculate data hash of logged values: "
+            "full - all the data, fingerprint - shape, types and sampled blocks of rows, "
+            "auto - fingerprint for values above log_value_hash_fingerprint_above_bytes"
+        )
+        .value("auto")
+    )
+    log_value_hash_fingerprint_above_bytes = parameter(
+        default=256 * 1024 ** 2,
+        description="Use fingerprint as data hash of values above this size (auto mode)",
+    )[int]
+
     log_value_preview_max_len = parameter(
         description="Max size of value preview to be saved at DB, max value=50000"
     ).value(_DEFAULT_VALUE_PREVIEW_MAX_LEN)
@@ -306,6 +425,29 @@ class FeaturesConfig(Config):
         default=True, description="Calculate and log value meta "
     )[bool]
 
+    log_metrics_aggregation = parameter(
+        default=True,
+        description="Aggregate numeric metrics on the client: "
+        "a sample of the logged values is sent every log_metrics_flush_interval seconds, "
+        "downsampled metrics get their count/min/max/mean at the task end. "
+        "Numeric values are not sent immediately, even a single value waits "
+        "for the next flush (or the task end)",
+    )[bool]
+    log_metrics_flush_interval = parameter(
+        default=10.0,
+        description="Seconds between sending of the aggregated metrics (0 - send every value)",
+    )[float]
+    log_metrics_flush_stride = parameter(
+        default=0,
+        description="Send the aggregated metric after this number of values of the same key "
+        "(0 - by log_metrics_flush_interval only)",
+    )[int]
+    log_metrics_sample_size = parameter(
+        default=20,
+        description="Max number of values of the aggregated metric sent per flush "
+        "(the last value is always sent)",
+    )[int]
+
     auto_disable_slow_size = parameter(
         default=True,
         description="Auto disable slow preview for Spark DF with text formats",
@@ -0,0 +1,27 @@
+from dbnd._core.parameter.parameter_builder import parameter
+from dbnd._core.task import config
+
+
+class HttpClientConfig(config.Config):
+    """Http client of the remote engines (Livy)"""
+
+    _conf__task_family = "http_client"
+
+    pool_maxsize = parameter(
+        description="Max number of connections kept open to the same server"
+    ).value(10)
+
+    keep_alive = parameter(
+        description="Reuse connections between requests, otherwise every request opens a new one"
+    ).value(True)
+
+    compress_requests = parameter(
+        description="Gzip request bodies, the server should support 'Content-Encoding: gzip'"
+    ).value(False)
+
+    def get_client_kwargs(self):
+        return dict(
+            pool_maxsize=self.pool_maxsize,
+            keep_alive=self.keep_alive,
+            compress_requests=self.compress_requests,
+        )
@@ -95,6 +95,11 @@ class LoggingConfig(config.Config):
     remote_logging_disabled = parameter.help(
         "for tasks using a cloud environment, don't copy the task log to cloud storage"
     ).value(False)
+    remote_logging_sync_interval = parameter(
+        default=30.0,
+        description="Seconds between the uploads of the new task log lines to cloud "
+        "storage (if it supports append), use 0 to upload the log at the task end only",
+    )[float]
 
     sqlalchemy_print = parameter(description="enable sqlalchemy logger").value(False)
     sqlalchemy_trace = parameter(description="trace sqlalchemy queries").value(False)
@@ -26,7 +26,7 @@ class RunConfig(config.Config):
     task_executor_type = parameter(
         default=None,
         description="Alternate executor type: "
-        " local/airflow_inprocess/airflow_multiprocess_local/airflow_kubernetes,"
+        " local/local_parallel/airflow_inprocess/airflow_multiprocess_local/airflow_kubernetes,"
         "  see docs for more options",
     )[str]
 
@@ -73,6 +73,15 @@ class RunConfig(config.Config):
     skip_completed = parameter(
         description="Mark jobs as succeeded without running them"
     ).value(True)
+    task_complete_parallelism = parameter(
+        default=10,
+        description="Number of threads used to check tasks outputs existence (skip_completed)",
+    )[int]
+    local_parallel_max_workers = parameter(
+        default=None,
+        description="Max number of tasks executed at once by local_parallel executor "
+        "(number of cpus by default)",
+    )[int]
     fail_fast = parameter(
         description="Skip all remaining tasks if a task has failed"
     ).value(True)
@@ -85,8 +94,17 @@ class RunConfig(config.Config):
     heartbeat_timeout_s = parameter(
         description="How old can a run's last heartbeat be before we consider it failed. Set -1 to disable"
     )[int]
+    heartbeat_sender_mode = (
+        parameter.choices(["thread", "subprocess"])
+        .help(
+            "Send heartbeats from a thread of the run process (shared by all runs), "
+            "or from a dedicated process per run"
+        )
+        .value("thread")
+    )
     heartbeat_sender_log_to_file = parameter(
-        description="create a separate log file for the heartbeat sender and don't log the run process stdout"
+        description="create a separate log file for the heartbeat sender and don't log the run process stdout "
+        "(subprocess mode only)"
     )[bool]
 
     enable_concurent_sqlite = parameter(
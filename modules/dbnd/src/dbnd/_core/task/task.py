@@ -262,11 +262,17 @@ class Task(_BaseTask, _TaskParamContainer):
     def log_metric(self, key, value, source=None):
         """
         Logs the passed-in parameter under the current run, creating a run if necessary.
+        Numeric values are aggregated (features.log_metrics_aggregation),
+        they are sent on the next flush of the metrics or at the task end.
         :param key: Parameter name (string)
         :param value: Parameter value (string)
         """
         return self.metrics.log_metric(key, value, source=source)
 
+    def log_metrics(self, metrics_dict, source=None):
+        """Logs all the metrics with the same timestamp (key -> value dict)"""
+        return self.metrics.log_metrics(metrics_dict, source=source)
+
     def log_system_metric(self, key, value):
         """Shortcut for log_metric(..., source="system") """
         return self.log_metric(key, value, source="system")
@@ -423,16 +423,7 @@ class TaskFactory(object):
         in case we have value in better section, but override in low priority section
         override wins!
         """
-        best_config_value = None
-        for section in self.task_config_sections:
-            config_value = self.config.get_config_value(section, key)
-            # first override win!
-            if config_value:
-                if config_value.override:
-                    return config_value
-                if best_config_value is None:
-                    best_config_value = config_value
-        return best_config_value
+        return self.config.get_sections_config_value(self.task_config_sections, key)
 
     def _update_param_def_target_config(self, param_def):
         """calculates parameter.target_config based on extra config at parameter__target value"""
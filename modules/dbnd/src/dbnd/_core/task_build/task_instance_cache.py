@@ -2,6 +2,8 @@ import typing
 
 
 if typing.TYPE_CHECKING:
+    from typing import Callable, Optional
+
     from dbnd._core.task.task import Task
 
 
@@ -9,6 +11,8 @@ class TaskInstanceCache(object):
     def __init__(self):
         self.task_instances = {}
         self.task_obj_instances = {}
+        # materializes tasks of the run loaded from a sharded snapshot
+        self.lazy_task_loader = None  # type: Optional[Callable[[str], Optional[Task]]]
 
     # this is global values for now - we need to understand if it's really required
     # but if task has been created - it's something global, regardless current databand run
@@ -18,7 +22,10 @@ class TaskInstanceCache(object):
 
     def get_task_by_id(self, task_id):
         # type: (str) -> Task
-        return self.task_instances.get(task_id, None)
+        task = self.task_instances.get(task_id, None)
+        if task is None and self.lazy_task_loader:
+            task = self.lazy_task_loader(task_id)
+        return task
 
     def register_task_object(self, task):
         # type: (Task) -> Task
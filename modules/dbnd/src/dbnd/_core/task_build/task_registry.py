@@ -1,4 +1,5 @@
 import copy
+import importlib
 import logging
 import sys
 import typing
@@ -46,6 +47,8 @@ class DbndTaskRegistry(SingletonContext):
         # airflow support
         self._dag_bag = None
 
+        self._builtin_tasks_loaded = False
+
     def register_task(self, task_cls):
         td = task_cls.task_definition  # type: TaskDefinition
 
@@ -65,6 +68,14 @@ class DbndTaskRegistry(SingletonContext):
 
         return self._task_family_to_task_cls.get(name)
 
+    def _load_builtin_tasks(self):
+        """`import dbnd` doesn't import builtin tasks (dbnd_sanity_check, ...)"""
+        if self._builtin_tasks_loaded:
+            return False
+        self._builtin_tasks_loaded = True
+        importlib.import_module("dbnd.tasks.basics")
+        return True
+
     # used for both tasks and configurations
     def _get_task_cls(self, task_name):
         from dbnd._core.utils.basics.load_python_module import load_python_module
@@ -73,6 +84,11 @@ class DbndTaskRegistry(SingletonContext):
         if task_cls:
             return task_cls
 
+        if self._load_builtin_tasks():
+            task_cls = self._get_registered_task_cls(task_name)
+            if task_cls:
+                return task_cls
+
         # we are going to check if we have override/definition in config
         config_task_type = config.get(task_name, "_type", None)
         if config_task_type:
@@ -147,6 +163,7 @@ class DbndTaskRegistry(SingletonContext):
         )
 
     def list_dbnd_task_classes(self):
+        self._load_builtin_tasks()
         task_classes = []
         for task_name, task_cls in six.iteritems(self._task_family_to_task_cls):
             if task_cls == self.AMBIGUOUS_CLASS:
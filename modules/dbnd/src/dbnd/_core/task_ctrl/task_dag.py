@@ -2,6 +2,8 @@ import logging
 import re
 import typing
 
+from collections import deque
+
 from dbnd._core.errors import DatabandError, friendly_error
 from dbnd._core.task.task import Task
 from dbnd._core.task_ctrl.task_ctrl import TaskSubCtrl
@@ -10,7 +12,7 @@ from dbnd._core.utils.traversing import flatten
 
 
 if typing.TYPE_CHECKING:
-    from typing import Collection, Set
+    from typing import Collection, Iterable, List, Set
 
 logger = logging.getLogger(__name__)
 
@@ -128,23 +130,9 @@ class _TaskDagNode(TaskSubCtrl):
         return self._get_all_tasks(upstream=True, should_run_only=should_run_only)
 
     def _get_all_tasks(self, upstream=False, should_run_only=False):
-        seen = set()
-        result = []
-        to_process = [self.task]
-        # should be iterative, we don't like recursive as we can have huge nesting
-        while to_process:
-            current = to_process.pop(0)
-            seen.add(current.task_id)
-            if should_run_only and not current.ctrl.should_run():
-                continue
-            t_dag = current.ctrl.task_dag
-            result.append(current)
-            for t_connected_task_id in t_dag._direction(upstream):
-                if t_connected_task_id in seen:
-                    continue
-                to_process.append(self.get_task_by_task_id(t_connected_task_id))
-
-        return set(result)
+        return _traverse(
+            [self.task], upstream=upstream, should_run_only=should_run_only
+        )
 
     def set_relatives(self, task_or_task_list, upstream=False):
         task_list = _task_list(task_or_task_list)
@@ -171,9 +159,6 @@ class _TaskDagNode(TaskSubCtrl):
         Sorts tasks in topographical order, such that a task comes after any of its
         upstream dependencies.
 
-        Heavily inspired by:
-        http://blog.jupo.org/2012/04/06/topological-sorting-acyclic-directed-graphs/
-
         :return: list of tasks in topological order
         """
 
@@ -199,49 +184,112 @@ class _TaskDagNode(TaskSubCtrl):
         return selected
 
 
+class _TaskDagIndex(object):
+    """
+    Compact representation of the DAG of the given tasks:
+    tasks get integer ids, edges are kept as adjacency lists of ids.
+    Only edges between the given tasks are indexed.
+    """
+
+    def __init__(self, tasks):
+        # type: (Iterable[Task]) -> None
+        self.tasks = list(tasks)  # type: List[Task]
+        node_by_task_id = {t.task_id: i for i, t in enumerate(self.tasks)}
+
+        self.upstream = [[] for _ in self.tasks]  # type: List[List[int]]
+        self.downstream = [[] for _ in self.tasks]  # type: List[List[int]]
+        for node, task in enumerate(self.tasks):
+            for upstream_task_id in task.ctrl.task_dag.upstream_task_ids:
+                upstream_node = node_by_task_id.get(upstream_task_id)
+                if upstream_node is None:
+                    continue
+                self.upstream[node].append(upstream_node)
+                self.downstream[upstream_node].append(node)
+
+    def topological_order(self):
+        # type: () -> List[int]
+        """
+        Kahn's algorithm, returns partial order if the graph has a cycle
+        """
+        in_degree = [len(upstream) for upstream in self.upstream]
+        ready = deque(node for node, degree in enumerate(in_degree) if not degree)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for downstream_node in self.downstream[node]:
+                in_degree[downstream_node] -= 1
+                if not in_degree[downstream_node]:
+                    ready.append(downstream_node)
+        return order
+
+    def find_cycle(self, nodes):
+        # type: (Collection[int]) -> List[int]
+        """
+        Walks upstream from any of the (unsortable) nodes till we get back to the
+        trail, every node left by Kahn's algorithm has an upstream node among them.
+        """
+        nodes = set(nodes)
+        trail = []
+        position = {}
+        node = next(iter(nodes))
+        while node not in position:
+            position[node] = len(trail)
+            trail.append(node)
+            node = next(n for n in self.upstream[node] if n in nodes)
+        return trail[position[node] :]
+
+
 def topological_sort(tasks, root_task=None):
+    """
+    Sorts tasks in topological order, such that a task comes after any of its
+    upstream dependencies (upstream tasks out of ``tasks`` are ignored).
+    """
     # special case
     if len(tasks) == 0:
         return tuple()
 
-    graph_unsorted = set(tasks)
-
-    graph_sorted = []
-
-    # Run until the unsorted graph is empty.
-    while graph_unsorted:
-        # Go through each of the node/edges pairs in the unsorted
-        # graph. If a set of edges doesn't contain any nodes that
-        # haven't been resolved, that is, that are still in the
-        # unsorted graph, remove the pair from the unsorted graph,
-        # and append it to the sorted graph. Note here that by using
-        # using the items() method for iterating, a copy of the
-        # unsorted graph is used, allowing us to modify the unsorted
-        # graph as we move through it. We also keep a flag for
-        # checking that that graph is acyclic, which is true if any
-        # nodes are resolved during each pass through the graph. If
-        # not, we need to bail out as the graph therefore can't be
-        # sorted.
-        acyclic = False
-        for node in list(graph_unsorted):
-            for edge in node.ctrl.task_dag.upstream:
-                if edge in graph_unsorted:
-                    break
-            # no edges in upstream tasks
-            else:
-                # we found at least one node in graph
-                acyclic = True
-                graph_unsorted.remove(node)
-                graph_sorted.append(node)
-
-        if not acyclic:
-            raise friendly_error.graph.cyclic_graph_detected(root_task, graph_unsorted)
+    index = _TaskDagIndex(tasks)
+    order = index.topological_order()
+    if len(order) < len(index.tasks):
+        sorted_nodes = set(order)
+        unsorted_nodes = [
+            node for node in range(len(index.tasks)) if node not in sorted_nodes
+        ]
+        cycle = [index.tasks[node] for node in index.find_cycle(unsorted_nodes)]
+        raise friendly_error.graph.cyclic_graph_detected(root_task, cycle)
+
+    return tuple(index.tasks[node] for node in order)
+
+
+def _traverse(tasks, upstream=False, should_run_only=False):
+    # type: (Iterable[Task], bool, bool) -> Set[Task]
+    """
+    All tasks connected to the given tasks (including them) in the given direction.
+    It's iterative, we don't like recursive as we can have huge nesting.
+    """
+    result = set()
+    to_process = deque()
+    seen = set()
+    for task in tasks:
+        if task.task_id not in seen:
+            seen.add(task.task_id)
+            to_process.append(task)
+
+    while to_process:
+        current = to_process.popleft()
+        if should_run_only and not current.ctrl.should_run():
+            continue
+        result.add(current)
+        t_dag = current.ctrl.task_dag
+        for t_connected_task_id in t_dag._direction(upstream):
+            if t_connected_task_id in seen:
+                continue
+            seen.add(t_connected_task_id)
+            to_process.append(t_dag.get_task_by_task_id(t_connected_task_id))
 
-    return tuple(graph_sorted)
+    return result
 
 
 def all_subdags(tasks):
-    result = set()
-    for sub_root in tasks:
-        result = result.union(set(sub_root.task_dag.subdag_tasks()))
-    return result
+    return _traverse(tasks, upstream=True)
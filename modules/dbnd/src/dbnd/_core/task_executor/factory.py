@@ -4,6 +4,9 @@ import typing
 from dbnd._core.constants import TaskExecutorType
 from dbnd._core.errors import DatabandConfigError, friendly_error
 from dbnd._core.plugin.dbnd_plugins import is_airflow_enabled, is_plugin_enabled
+from dbnd._core.task_executor.local_parallel_task_executor import (
+    LocalParallelTaskExecutor,
+)
 from dbnd._core.task_executor.local_task_executor import LocalTaskExecutor
 
 
@@ -80,10 +83,14 @@ def calculate_task_executor_type(submit_tasks, remote_engine, settings):
                     task_executor_type = AirflowTaskExecutorType.airflow_kubernetes
                     parallel = True
     else:
-        if parallel:
-            logger.warning("Airflow is not installed, parallel mode is not supported")
+        if parallel and task_executor_type == TaskExecutorType.local:
+            logger.warning(
+                "Auto switching to engine type '%s' due to parallel mode.",
+                TaskExecutorType.local_parallel,
+            )
+            task_executor_type = TaskExecutorType.local_parallel
 
-    all_executor_types = [TaskExecutorType.local]
+    all_executor_types = TaskExecutorType.all()
     if is_airflow_enabled():
         from dbnd_airflow.executors import AirflowTaskExecutorType
 
@@ -106,6 +113,14 @@ def get_task_executor(run, task_executor_type, host_engine, target_engine, task_
             target_engine=target_engine,
             task_runs=task_runs,
         )
+    elif task_executor_type == TaskExecutorType.local_parallel:
+        return LocalParallelTaskExecutor(
+            run,
+            task_executor_type=task_executor_type,
+            host_engine=host_engine,
+            target_engine=target_engine,
+            task_runs=task_runs,
+        )
     else:
         from dbnd_airflow.dbnd_task_executor.dbnd_task_executor_via_airflow import (
             AirflowTaskExecutor,
@@ -4,12 +4,14 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 
 from time import sleep, time
 
 from dbnd._core.constants import RunState
 from dbnd._core.tracking.tracking_store import TrackingStore
 from dbnd._core.utils.basics.format_exception import format_exception_as_str
+from dbnd._core.utils.daemon_worker import DaemonWorker
 from dbnd._vendor.psutil.vendorized_psutil import pid_exists
 
 
@@ -18,6 +20,11 @@ logger = logging.getLogger(__name__)
 TERMINATE_WAIT_TIMEOUT = 5
 
 
+class HeartbeatSenderMode(object):
+    thread = "thread"
+    subprocess = "subprocess"
+
+
 @contextlib.contextmanager
 def start_heartbeat_sender(task_run):
     run = task_run.run
@@ -25,7 +32,21 @@ def start_heartbeat_sender(task_run):
     core = settings.core
     heartbeat_interval_s = settings.run.heartbeat_interval_s
 
-    if heartbeat_interval_s > 0:
+    if (
+        heartbeat_interval_s > 0
+        and settings.run.heartbeat_sender_mode == HeartbeatSenderMode.thread
+    ):
+        service = get_heartbeat_service()
+        service.register(
+            run_uid=run.run_uid,
+            tracking_store=run.tracker.tracking_store,
+            heartbeat_interval_s=heartbeat_interval_s,
+        )
+        try:
+            yield
+        finally:
+            service.unregister(run.run_uid)
+    elif heartbeat_interval_s > 0:
         sp = None
         heartbeat_log_fp = None
         try:
@@ -93,6 +114,28 @@ def start_heartbeat_sender(task_run):
         yield
 
 
+def _send_heartbeat(run_uid, tracking_store, driver_pid, check_driver=True):
+    """
+    Returns False if the driver process is not alive anymore
+    """
+    if check_driver and not pid_exists(driver_pid):
+        # failsafe, in case the driver process died violently
+        logger.info(
+            "[heartbeat sender] driver process %s stopped, stopping heartbeat sender",
+            driver_pid,
+        )
+        return False
+
+    run_state = tracking_store.heartbeat(run_uid=run_uid)
+    logger.debug("[heartbeat sender] sent heartbeat")
+    if run_state == RunState.SHUTDOWN.value:
+        logger.info(
+            "[heartbeat sender] received run state SHUTDOWN: killing driver process"
+        )
+        os.kill(driver_pid, signal.SIGTERM)
+    return True
+
+
 def send_heartbeat_continuously(
     run_uid, tracking_store, heartbeat_interval_s, driver_pid
 ):  # type: (str, TrackingStore, int, int) -> None
@@ -105,22 +148,8 @@ def send_heartbeat_continuously(
         while True:
             loop_start = time()
             try:
-                if not pid_exists(
-                    driver_pid
-                ):  # failsafe, in case the driver process died violently
-                    logger.info(
-                        "[heartbeat sender] driver process %s stopped, stopping heartbeat sender",
-                        driver_pid,
-                    )
+                if not _send_heartbeat(run_uid, tracking_store, driver_pid):
                     return
-
-                run_state = tracking_store.heartbeat(run_uid=run_uid)
-                logger.debug("[heartbeat sender] sent heartbeat")
-                if run_state == RunState.SHUTDOWN.value:
-                    logger.info(
-                        "[heartbeat sender] received run state SHUTDOWN: killing driver process"
-                    )
-                    os.kill(driver_pid, signal.SIGTERM)
             except KeyboardInterrupt:
                 logger.info(
                     "[heartbeat sender] stopping heartbeat sender process due to interrupt"
@@ -132,7 +161,7 @@ def send_heartbeat_continuously(
                     format_exception_as_str(),
                 )
 
-            time_to_sleep_s = max(0, time() + heartbeat_interval_s - loop_start)
+            time_to_sleep_s = max(0, loop_start + heartbeat_interval_s - time())
             if time_to_sleep_s > 0:
                 sleep(time_to_sleep_s)
     except KeyboardInterrupt:
@@ -142,3 +171,91 @@ def send_heartbeat_continuously(
     finally:
         logger.info("[heartbeat sender] stopping heartbeat sender")
         sys.exit(0)
+
+
+class _ActiveRun(object):
+    def __init__(self, run_uid, tracking_store, heartbeat_interval_s):
+        self.run_uid = run_uid
+        self.tracking_store = tracking_store
+        self.heartbeat_interval_s = heartbeat_interval_s
+        self.next_heartbeat = time()
+
+
+class HeartbeatService(DaemonWorker):
+    """
+    Sends heartbeats of all active runs of the current process from one daemon thread,
+    so we don't need a heartbeat sender process (and its connection) per run.
+    The thread doesn't outlive the driver, so there is no driver liveness check here.
+    """
+
+    def __init__(self):
+        super(HeartbeatService, self).__init__(thread_name="dbnd-heartbeat-sender")
+        self._runs = {}  # run_uid -> _ActiveRun
+        self._condition = threading.Condition()
+
+    def register(self, run_uid, tracking_store, heartbeat_interval_s):
+        logger.info(
+            "Sending heartbeats of run %s every %s seconds",
+            run_uid,
+            heartbeat_interval_s,
+        )
+        with self._condition:
+            self._ensure_started()
+            self._runs[run_uid] = _ActiveRun(
+                run_uid=run_uid,
+                tracking_store=tracking_store,
+                heartbeat_interval_s=heartbeat_interval_s,
+            )
+            self._condition.notify()
+
+    def unregister(self, run_uid):
+        with self._condition:
+            self._runs.pop(run_uid, None)
+            self._condition.notify()
+
+    def _on_start(self):
+        # runs registered by the parent process are sent by the parent
+        self._runs = {}
+
+    @property
+    def active_runs(self):
+        with self._condition:
+            return list(self._runs)
+
+    def _due_runs(self):
+        with self._condition:
+            while True:
+                now = time()
+                due = [r for r in self._runs.values() if r.next_heartbeat <= now]
+                if due:
+                    for r in due:
+                        r.next_heartbeat = now + r.heartbeat_interval_s
+                    return due
+                wait = None
+                if self._runs:
+                    wait = min(r.next_heartbeat for r in self._runs.values()) - now
+                self._condition.wait(wait)
+
+    def _run(self):
+        while True:
+            for r in self._due_runs():
+                try:
+                    _send_heartbeat(
+                        r.run_uid, r.tracking_store, os.getpid(), check_driver=False
+                    )
+                except Exception:
+                    logger.error(
+                        "[heartbeat sender] failed to send heartbeat: %s",
+                        format_exception_as_str(),
+                    )
+
+
+_heartbeat_service = None
+
+
+def get_heartbeat_service():
+    """returns the heartbeat service shared by all the runs of the process"""
+    global _heartbeat_service
+    if _heartbeat_service is None:
+        _heartbeat_service = HeartbeatService()
+    return _heartbeat_service
@@ -0,0 +1,238 @@
+import logging
+import multiprocessing
+import os
+
+from collections import deque
+
+import six
+
+from six.moves import queue
+
+from dbnd._core.constants import TaskRunState
+from dbnd._core.errors.base import DatabandRunError
+from dbnd._core.task_ctrl.task_dag import _TaskDagIndex
+from dbnd._core.task_executor.local_task_executor import (
+    LocalTaskExecutor,
+    _collect_errors,
+)
+from dbnd._core.tracking.channels.tracking_async_channel import flush_async_tracking
+from dbnd._core.tracking.tracking_store_worker import flush_tracking_store_workers
+
+
+logger = logging.getLogger(__name__)
+
+# how often (seconds) we check for killed run and crashed task processes
+_POLL_INTERVAL = 1
+# how many not tracked state updates we keep before sending them to the tracker
+_STATE_UPDATES_BATCH_SIZE = 50
+
+
+def _get_fork_context():
+    if six.PY2:
+        return multiprocessing
+    return multiprocessing.get_context("fork")
+
+
+def _execute_task_run(task_run, results):
+    """
+    Runs at forked process, reports final state of the task run to the driver
+    """
+    try:
+        task_run.runner.execute()
+    except BaseException as ex:
+        logger.error("Failed to execute task '%s': %s", task_run.task.task_id, str(ex))
+    finally:
+        flush_tracking_store_workers()
+        flush_async_tracking()
+        state = task_run.task_run_state
+        if state not in TaskRunState.finished_states():
+            state = TaskRunState.FAILED
+        results.put((task_run.task.task_id, state))
+
+
+class LocalParallelTaskExecutor(LocalTaskExecutor):
+    """
+    Executes every task at a forked process, as soon as all its upstream tasks succeed.
+    At most `run.local_parallel_max_workers` tasks are executed at once.
+    """
+
+    def do_run(self):
+        if not hasattr(os, "fork"):
+            logger.warning(
+                "Parallel local execution requires fork(), running tasks sequentially"
+            )
+            return super(LocalParallelTaskExecutor, self).do_run()
+
+        run_config = self.settings.run
+        self.max_workers = run_config.local_parallel_max_workers or (
+            multiprocessing.cpu_count()
+        )
+        self.fail_fast = run_config.fail_fast
+
+        self._ctx = _get_fork_context()
+        self._results = self._ctx.Queue()
+        self._running = {}  # node -> process
+        self._task_runs_to_update_state = []
+        self._task_failed = False
+
+        self._dag = _TaskDagIndex([tr.task for tr in self.task_runs])
+        self._nodes = {task.task_id: node for node, task in enumerate(self._dag.tasks)}
+        self._pending_upstreams = [len(upstream) for upstream in self._dag.upstream]
+        self._finished = set()
+        self._ready = deque(
+            node for node, count in enumerate(self._pending_upstreams) if not count
+        )
+
+        try:
+            self._schedule()
+        finally:
+            self._terminate_running()
+            self._flush_state_updates()
+
+        if len(self._finished) < len(self._dag.tasks):
+            self._task_failed = True
+            for node in range(len(self._dag.tasks)):
+                if node not in self._finished:
+                    self._set_state(node, TaskRunState.UPSTREAM_FAILED)
+            self._flush_state_updates()
+
+        if self._task_failed:
+            err = _collect_errors(self.run.task_runs)
+            if err:
+                raise DatabandRunError(err)
+
+    def _task_run(self, node):
+        return self.run.get_task_run_by_id(self._dag.tasks[node].task_id)
+
+    def _schedule(self):
+        while self._ready or self._running:
+            while self._ready and len(self._running) < self.max_workers:
+                self._start(self._ready.popleft())
+
+            if not self._running:
+                continue
+
+            if not self._wait_for_result():
+                self._check_killed()
+                self._check_crashed()
+
+    def _wait_for_result(self):
+        try:
+            task_id, state = self._results.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            return False
+
+        node = self._nodes[task_id]
+        process = self._running.pop(node, None)
+        if process is None:
+            # terminated already
+            return True
+        process.join()
+        # the state is already tracked by the task process
+        self._task_run(node).set_task_run_state(state, track=False)
+        self._on_finished(node, state)
+        return True
+
+    def _start(self, node):
+        tr = self._task_run(node)
+        task = tr.task
+        if tr.is_reused:
+            self._on_finished(node, TaskRunState.SUCCESS)
+            return
+
+        if self.fail_fast and self._task_failed:
+            self._set_state(node, TaskRunState.UPSTREAM_FAILED)
+            self._on_finished(node, TaskRunState.UPSTREAM_FAILED)
+            return
+
+        if self.run.is_killed():
+            logger.info(
+                "Databand Context is killed! Stopping %s to %s",
+                task.task_id,
+                TaskRunState.FAILED,
+            )
+            self._set_state(node, TaskRunState.FAILED)
+            self._on_finished(node, TaskRunState.FAILED)
+            return
+
+        # send all pending updates before the fork, so it's not duplicated by the task process
+        self._flush_state_updates()
+        logger.debug("Executing task: %s", task.task_id)
+        process = self._ctx.Process(
+            target=_execute_task_run,
+            args=(tr, self._results),
+            name="dbnd-task-%s" % task.task_id,
+        )
+        process.start()
+        self._running[node] = process
+
+    def _on_finished(self, node, state):
+        self._finished.add(node)
+        if state != TaskRunState.SUCCESS:
+            if state in TaskRunState.direct_fail_states():
+                self._task_failed = True
+                logger.error(
+                    "Failed to execute task '%s'", self._dag.tasks[node].task_id
+                )
+            self._fail_downstream(node)
+            return
+
+        for downstream_node in self._dag.downstream[node]:
+            self._pending_upstreams[downstream_node] -= 1
+            if not self._pending_upstreams[downstream_node]:
+                self._ready.append(downstream_node)
+
+    def _fail_downstream(self, node):
+        to_process = deque(self._dag.downstream[node])
+        while to_process:
+            downstream_node = to_process.popleft()
+            if downstream_node in self._finished:
+                continue
+            self._finished.add(downstream_node)
+            self._set_state(downstream_node, TaskRunState.UPSTREAM_FAILED)
+            to_process.extend(self._dag.downstream[downstream_node])
+
+    def _set_state(self, node, state):
+        tr = self._task_run(node)
+        logger.info("Setting %s to %s", tr.task.task_id, state)
+        tr.set_task_run_state(state, track=False)
+        self._task_runs_to_update_state.append(tr)
+        if len(self._task_runs_to_update_state) >= _STATE_UPDATES_BATCH_SIZE:
+            self._flush_state_updates()
+
+    def _flush_state_updates(self):
+        if self._task_runs_to_update_state:
+            self.run.tracker.set_task_run_states(self._task_runs_to_update_state)
+            self._task_runs_to_update_state = []
+
+    def _check_killed(self):
+        if self.run.is_killed() and self._running:
+            logger.info("Databand Context is killed! Stopping running tasks")
+            self._terminate_running()
+
+    def _check_crashed(self):
+        for node, process in list(self._running.items()):
+            if process.is_alive():
+                continue
+            # the process is dead, but its result could be still on the way
+            if self._wait_for_result():
+                return
+            logger.error(
+                "Task process of '%s' has exited unexpectedly with code %s",
+                self._dag.tasks[node].task_id,
+                process.exitcode,
+            )
+            self._running.pop(node)
+            self._set_state(node, TaskRunState.FAILED)
+            self._on_finished(node, TaskRunState.FAILED)
+
+    def _terminate_running(self):
+        # SIGTERM is translated into task.on_kill() by the task process
+        for process in self._running.values():
+            process.terminate()
+        for node, process in list(self._running.items()):
+            process.join()
+            self._running.pop(node)
+            self._set_state(node, TaskRunState.CANCELLED)
+            self._finished.add(node)
+            self._task_failed = True
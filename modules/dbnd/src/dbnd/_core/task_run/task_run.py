@@ -8,6 +8,7 @@ from dbnd._core.task_run.task_run_meta_files import TaskRunMetaFiles
 from dbnd._core.task_run.task_run_runner import TaskRunRunner
 from dbnd._core.task_run.task_run_tracker import TaskRunTracker
 from dbnd._core.task_run.task_sync_ctrl import TaskSyncCtrl
+from dbnd._core.tracking.metrics_aggregator import MetricsAggregator
 from dbnd._core.tracking.tracking_store_console import ConsoleStore
 from dbnd._core.utils.string_utils import clean_job_name, clean_job_name_dns1123
 from dbnd._core.utils.timezone import utcnow
@@ -92,7 +93,11 @@ class TaskRun(object):
             tracking_store = ConsoleStore()
 
         self.tracking_store = tracking_store
-        self.tracker = TaskRunTracker(task_run=self, tracking_store=tracking_store)
+        self.tracker = TaskRunTracker(
+            task_run=self,
+            tracking_store=tracking_store,
+            metrics_aggregator=self._build_metrics_aggregator(),
+        )
         self.runner = TaskRunRunner(task_run=self)
         self.deploy = TaskSyncCtrl(task_run=self)
         self.task_tracker_url = self.tracker.task_run_url()
@@ -155,11 +160,24 @@ class TaskRun(object):
 
         self._task_run_state = state
         if track:
+            if state in TaskRunState.finished_states():
+                # aggregated metrics should be delivered before the final state
+                self.tracker.flush_metrics()
             self.tracking_store.set_task_run_state(
                 task_run=self, state=state, error=error
             )
         return True
 
+    def _build_metrics_aggregator(self):
+        features = self.task.settings.features
+        if not features.log_metrics_aggregation:
+            return None
+        return MetricsAggregator(
+            flush_interval=features.log_metrics_flush_interval,
+            flush_stride=features.log_metrics_flush_stride,
+            sample_size=features.log_metrics_sample_size,
+        )
+
     def set_task_reused(self):
         self._task_run_state = TaskRunState.SUCCESS
         self.tracking_store.set_task_reused(task_run=self)
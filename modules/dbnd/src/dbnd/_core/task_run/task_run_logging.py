@@ -6,10 +6,10 @@ from contextlib import contextmanager
 import six
 
 from dbnd._core.log.logging_utils import find_handler, redirect_stderr, redirect_stdout
+from dbnd._core.log.remote_log_shipper import RemoteLogShipper, read_file_preview
 from dbnd._core.settings import LocalEnvConfig
 from dbnd._core.settings.log import _safe_is_typeof
 from dbnd._core.task_run.task_run_ctrl import TaskRunCtrl
-from dbnd._core.utils.string_utils import safe_short_string
 
 
 if typing.TYPE_CHECKING:
@@ -38,6 +38,7 @@ class TaskRunLogManager(TaskRunCtrl):
         # file handler for task log
         # if set -> we are in the context of capturing
         self._log_task_run_into_file_active = False
+        self._remote_log_shipper = None
 
     @contextmanager
     def capture_stderr_stdout(self, logging_target=None):
@@ -86,6 +87,7 @@ class TaskRunLogManager(TaskRunCtrl):
             target_logger.addHandler(handler)
             self._log_task_run_into_file_active = True
             CURRENT_TASK_HANDLER_LOG = handler
+            self._start_remote_log_shipper()
 
             with self.capture_stderr_stdout():
                 yield handler
@@ -101,11 +103,23 @@ class TaskRunLogManager(TaskRunCtrl):
             self._log_task_run_into_file_active = False
             self._upload_task_log_preview()
 
+    def _start_remote_log_shipper(self):
+        log_settings = self.task.settings.log
+        if log_settings.remote_logging_disabled or not self.remote_log_file:
+            return
+        try:
+            self._remote_log_shipper = RemoteLogShipper(
+                local_path=self.local_log_file.path,
+                remote_log_file=self.remote_log_file,
+                interval=log_settings.remote_logging_sync_interval,
+            ).start()
+        except Exception as ex:
+            logger.warning("Failed to start remote log for %s: %s", self.task, ex)
+
     def _upload_task_log_preview(self):
+        self.write_remote_log()
         try:
-            log_body = self.read_log_body()
-            self.write_remote_log(log_body)
-            self.save_log_preview(log_body)
+            self.save_log_preview(self.read_log_preview())
         except Exception as save_log_ex:
             logger.error("failed to save log preview for %s:%s", self, save_log_ex)
 
@@ -124,31 +138,47 @@ class TaskRunLogManager(TaskRunCtrl):
             )
             return None
 
-    def write_remote_log(self, log_body):
+    def write_remote_log(self):
+        """
+        Sends the rest of the local log to the remote log
+        """
         if self.task.settings.log.remote_logging_disabled or not self.remote_log_file:
             return
 
+        shipper, self._remote_log_shipper = self._remote_log_shipper, None
         try:
-            self.remote_log_file.write(log_body)
+            if shipper is None:
+                shipper = RemoteLogShipper(
+                    local_path=self.local_log_file.path,
+                    remote_log_file=self.remote_log_file,
+                    interval=0,
+                ).start()
+            shipper.stop()
         except Exception as ex:
             # todo add remote log path to error
             logger.warning("Failed to write remote log for %s: %s", self.task, ex)
 
-    def save_log_preview(self, log_body):
+    def read_log_preview(self):
+        """
+        Reads the part of the local log to be sent to the server, the file is not
+        loaded into memory (unless the size is unlimited)
+        """
         max_size = self.task.settings.log.send_body_to_server_max_size
+        if max_size == -1:  # use -1 to disable
+            return None
         if max_size == 0:  # use 0 for unlimited
-            log_preview = log_body
-        elif max_size == -1:  # use -1 to disable
-            log_preview = None
-        else:
-            log_preview = self._extract_log_preivew(
-                log_body=log_body, max_size=max_size
+            return self.read_log_body()
+        try:
+            return read_file_preview(self.local_log_file.path, max_size=max_size)
+        except Exception as ex:
+            logger.error(
+                "Failed to read log (%s) for %s: %s",
+                self.local_log_file.path,
+                self.task,
+                ex,
             )
+            return None
+
+    def save_log_preview(self, log_preview):
         if log_preview:
             self.task_run.tracker.save_task_run_log(log_preview)
-
-    def _extract_log_preivew(self, log_body=None, max_size=1000):
-        is_tail_preview = (
-            max_size > 0
-        )  # pass negative to get log's 'head' instead of 'tail'
-        return safe_short_string(log_body, abs(max_size), tail=is_tail_preview)
@@ -1,28 +1,40 @@
 import logging
 import typing
 
+from collections import OrderedDict
+
 from typing import Any
 
 from dbnd._core.constants import DbndTargetOperationStatus, DbndTargetOperationType
 from dbnd._core.errors.errors_utils import log_exception
 from dbnd._core.task_run.task_run_ctrl import TaskRunCtrl
 from dbnd._core.tracking.metrics import Metric
+from dbnd._core.tracking.metrics_aggregator import (
+    get_metrics_flusher,
+    is_aggregated_value,
+)
 from dbnd._core.tracking.tracking_store import TrackingStore
 from dbnd._core.utils.timezone import utcnow
 from targets.values import get_value_type_of_obj
 
 
 if typing.TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Dict, Optional
+
     from targets import Target
+    from dbnd._core.tracking.metrics_aggregator import MetricsAggregator
     from dbnd._core.parameter.parameter_definition import ParameterDefinition
 
 logger = logging.getLogger(__name__)
 
 
 class TaskRunTracker(TaskRunCtrl):
-    def __init__(self, task_run, tracking_store):
+    def __init__(self, task_run, tracking_store, metrics_aggregator=None):
         super(TaskRunTracker, self).__init__(task_run=task_run)
         self.tracking_store = tracking_store  # type: TrackingStore
+        # numeric metrics are sent in samples if set
+        self._metrics_aggregator = metrics_aggregator  # type: MetricsAggregator
 
     def task_run_url(self):
         run_tracker = self.run.tracker
@@ -98,7 +110,7 @@ class TaskRunTracker(TaskRunCtrl):
 
     def log_metric(self, key, value, timestamp=None, source=None):
         try:
-            self._log_metric(key, value, timestamp=timestamp, source=source)
+            self._log_metrics({key: value}, timestamp=timestamp, source=source)
         except Exception as ex:
             log_exception(
                 "Error occurred during log_metric for %s" % (key,),
@@ -106,6 +118,62 @@ class TaskRunTracker(TaskRunCtrl):
                 non_critical=True,
             )
 
+    def log_metrics(self, metrics, timestamp=None, source=None):
+        # type: (Dict[str, Any], Optional[datetime], Optional[str]) -> None
+        """Logs all the metrics with the same timestamp, sent as one bulk request"""
+        try:
+            self._log_metrics(metrics, timestamp=timestamp, source=source)
+        except Exception as ex:
+            log_exception(
+                "Error occurred during log_metrics for %s" % (", ".join(metrics),),
+                ex,
+                non_critical=True,
+            )
+
+    def _log_metrics(self, metrics, timestamp=None, source=None):
+        timestamp = timestamp or utcnow()
+        aggregator = self._metrics_aggregator
+
+        to_send = []
+        aggregated = False
+        for key, value in metrics.items():
+            if aggregator and is_aggregated_value(value):
+                to_send.extend(aggregator.add(key, value, timestamp, source=source))
+                aggregated = True
+            else:
+                to_send.append(
+                    (source, Metric(key=key, timestamp=timestamp, value=value))
+                )
+        self._send_metrics(to_send)
+        if aggregated and aggregator.flush_interval > 0:
+            # pending values are sent on time even if nothing else is logged
+            get_metrics_flusher().register(aggregator, self._send_metrics)
+
+    def flush_metrics(self):
+        """Sends the metrics aggregated so far, called at the end of the task run"""
+        if not self._metrics_aggregator:
+            return
+        get_metrics_flusher().unregister(self._metrics_aggregator)
+        try:
+            self._send_metrics(self._metrics_aggregator.flush(final=True))
+        except Exception as ex:
+            log_exception("Error occurred during metrics flush", ex, non_critical=True)
+
+    def _send_metrics(self, to_send):
+        by_source = OrderedDict()
+        for source, metric in to_send:
+            by_source.setdefault(source, []).append(metric)
+
+        for source, metrics in by_source.items():
+            if len(metrics) == 1:
+                self.tracking_store.log_metric(
+                    task_run=self.task_run, metric=metrics[0], source=source
+                )
+            else:
+                self.tracking_store.log_metrics(
+                    task_run=self.task_run, metrics=metrics, source=source
+                )
+
     def log_dataframe(self, key, df, meta_conf):
         try:
             value_meta = get_value_meta_for_metric(key, df, meta_conf=meta_conf)
@@ -116,7 +184,7 @@ class TaskRunTracker(TaskRunCtrl):
                 self._log_metric("%s.shape" % key, value_meta.data_dimensions)
                 for dim, size in enumerate(value_meta.data_dimensions):
                     self._log_metric("%s.shape[%s]" % (key, dim), size)
-            if meta_conf.log_schema:
+            if meta_conf.log_schema or meta_conf.log_stats:
                 self._log_metric("%s.schema" % key, value_meta.data_schema)
             if meta_conf.log_preview:
                 self._log_metric("%s.preview" % key, value_meta.value_preview)
@@ -0,0 +1,291 @@
+import atexit
+import logging
+import threading
+import time
+
+from six.moves.queue import Empty, Full, Queue
+
+from dbnd._core.utils.daemon_worker import DaemonWorker
+from dbnd.api.tracking_api import TrackingAPI
+
+
+logger = logging.getLogger(__name__)
+
+# calls that return a value to the caller, we have to run them in place
+_SYNC_CALLS = {
+    TrackingAPI.init_scheduled_job.__name__,
+    TrackingAPI.init_run.__name__,
+    TrackingAPI.heartbeat.__name__,
+}
+
+# calls that mark the end of the run, everything queued before should be delivered
+_BARRIER_CALLS = {
+    TrackingAPI.set_run_state.__name__,
+    TrackingAPI.set_unfinished_tasks_state.__name__,
+}
+
+# endpoint -> (bulk endpoint, list field of the bulk request)
+# for endpoints that already accept lists, the items are merged into one request
+_COALESCED_CALLS = {
+    TrackingAPI.log_targets.__name__: (
+        TrackingAPI.log_targets.__name__,
+        "targets_info",
+    ),
+    TrackingAPI.update_task_run_attempts.__name__: (
+        TrackingAPI.update_task_run_attempts.__name__,
+        "task_run_attempt_updates",
+    ),
+    TrackingAPI.log_metric.__name__: (TrackingAPI.log_metrics.__name__, "metrics_info"),
+    TrackingAPI.log_metrics.__name__: (
+        TrackingAPI.log_metrics.__name__,
+        "metrics_info",
+    ),
+}
+
+
+class _FlushRequest(object):
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class AsyncTrackingWorker(DaemonWorker):
+    """
+    Delivers marshalled tracking requests on a background thread.
+    Consecutive calls to the same endpoint are coalesced into one bulk request.
+    The queue is bounded: producers block for `put_timeout` seconds when it's full,
+    after that the request is dropped (tracking should never stall or OOM the task).
+    With `raise_on_error` the first failure is kept and raised by the next call of the channel.
+    """
+
+    def __init__(
+        self,
+        max_queue_size=10000,
+        batch_size=500,
+        flush_interval=2.0,
+        put_timeout=5.0,
+        flush_timeout=60.0,
+        raise_on_error=False,
+    ):
+        super(AsyncTrackingWorker, self).__init__(
+            thread_name="dbnd-tracking-async-worker"
+        )
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.flush_timeout = flush_timeout
+        self.raise_on_error = raise_on_error
+
+        self.sent_requests = 0
+        self.sent_calls = 0
+        self.dropped_calls = 0
+        self.failed_calls = 0
+
+        # bulk endpoints the server doesn't know, we fallback to single calls
+        self._no_bulk_support = set()
+        self._error = None
+        self._queue = None
+
+    def _on_start(self):
+        # requests queued by the parent process are delivered by the parent
+        self._queue = Queue(maxsize=self.max_queue_size)
+
+    def configure(self, **kwargs):
+        """Applies the current settings to the running worker"""
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        queue = self._queue
+        if queue is not None and "max_queue_size" in kwargs:
+            with queue.mutex:
+                queue.maxsize = self.max_queue_size
+
+    def pop_error(self):
+        """Returns (and forgets) the first failure since the previous call"""
+        error, self._error = self._error, None
+        return error
+
+    def _on_error(self, calls_count, ex):
+        self.failed_calls += calls_count
+        if self.raise_on_error and self._error is None:
+            self._error = ex
+
+    def enqueue(self, channel, name, data):
+        self._ensure_started()
+        try:
+            self._queue.put((channel, name, data), timeout=self.put_timeout)
+        except Full:
+            self.dropped_calls += 1
+            if self.dropped_calls == 1 or self.dropped_calls % 1000 == 0:
+                logger.warning(
+                    "Tracking queue is full (%s), dropping tracking request %s. "
+                    "Dropped so far: %s",
+                    self.max_queue_size,
+                    name,
+                    self.dropped_calls,
+                )
+
+    def flush(self, timeout=None):
+        """Waits till everything queued so far is delivered"""
+        if timeout is None:
+            timeout = self.flush_timeout
+        if not self.is_started:
+            return True
+        request = _FlushRequest()
+        try:
+            self._queue.put(request, timeout=timeout)
+        except Full:
+            return False
+        if not request.done.wait(timeout):
+            logger.warning("Failed to flush tracking queue in %s seconds", timeout)
+            return False
+        return True
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            wait = None
+            if batch:
+                wait = max(0, deadline - time.time())
+            try:
+                item = self._queue.get(timeout=wait)
+            except Empty:
+                batch = self._send_batch(batch)
+                continue
+
+            if isinstance(item, _FlushRequest):
+                batch = self._send_batch(batch)
+                item.done.set()
+                continue
+
+            if not batch:
+                deadline = time.time() + self.flush_interval
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                batch = self._send_batch(batch)
+
+    def _send_batch(self, batch):
+        for channel, name, items in _coalesce(batch):
+            self._send(channel, name, items)
+        return []
+
+    def _send(self, channel, name, items):
+        bulk_name, field = _COALESCED_CALLS.get(name, (name, None))
+        if len(items) > 1 and bulk_name not in self._no_bulk_support:
+            if bulk_name == name:
+                merged = []
+                for data in items:
+                    merged.extend(data[field])
+                data = dict(items[0])
+                data[field] = merged
+            else:
+                data = {field: items}
+            try:
+                getattr(channel, bulk_name)(data)
+                self.sent_requests += 1
+                self.sent_calls += len(items)
+                return
+            except Exception as ex:
+                if not _is_not_supported_error(ex):
+                    self._on_error(len(items), ex)
+                    logger.error(
+                        "Failed to send %s tracking requests to %s: %s",
+                        len(items),
+                        bulk_name,
+                        ex,
+                    )
+                    return
+                logger.info(
+                    "Tracking channel doesn't support %s, sending %s one by one",
+                    bulk_name,
+                    name,
+                )
+                self._no_bulk_support.add(bulk_name)
+
+        for data in items:
+            try:
+                getattr(channel, name)(data)
+                self.sent_requests += 1
+                self.sent_calls += 1
+            except Exception as ex:
+                self._on_error(1, ex)
+                logger.error("Failed to send tracking request %s: %s", name, ex)
+
+
+def _is_not_supported_error(ex):
+    # the channel doesn't implement the bulk call,
+    # servers without the bulk endpoint are handled by TrackingAPI itself
+    return isinstance(ex, (AttributeError, NotImplementedError))
+
+
+def _coalesce(batch):
+    """
+    Groups consecutive calls to the same channel and endpoint.
+    Only consecutive calls are merged, so the order of the calls is preserved.
+    """
+    groups = []
+    for channel, name, data in batch:
+        if groups and name in _COALESCED_CALLS:
+            last_channel, last_name, last_items = groups[-1]
+            if last_channel is channel and last_name == name:
+                last_items.append(data)
+                continue
+        groups.append((channel, name, [data]))
+    return groups
+
+
+class TrackingAsyncChannel(TrackingAPI):
+    """
+    Wraps another tracking channel and sends fire-and-forget requests
+    through AsyncTrackingWorker.
+    """
+
+    def __init__(self, channel, worker):
+        super(TrackingAsyncChannel, self).__init__()
+        self.channel = channel
+        self.worker = worker
+
+    def _handle(self, name, data):
+        self._raise_worker_error()
+        if name in _SYNC_CALLS:
+            self.flush()
+            return getattr(self.channel, name)(data)
+
+        self.worker.enqueue(self.channel, name, data)
+        if name in _BARRIER_CALLS:
+            self.flush()
+
+    def flush(self):
+        flushed = self.worker.flush()
+        self._raise_worker_error()
+        return flushed
+
+    def _raise_worker_error(self):
+        # failures of the background requests (worker.raise_on_error only)
+        error = self.worker.pop_error()
+        if error is not None:
+            raise error
+
+    def is_ready(self):
+        return self.channel.is_ready()
+
+
+_async_tracking_worker = None
+
+
+def get_async_tracking_worker(**kwargs):
+    """returns the worker shared by all the async channels of the process"""
+    global _async_tracking_worker
+    if _async_tracking_worker is None:
+        _async_tracking_worker = AsyncTrackingWorker(**kwargs)
+        atexit.register(_async_tracking_worker.flush)
+    else:
+        # settings could be changed by the current config
+        _async_tracking_worker.configure(**kwargs)
+    return _async_tracking_worker
+
+
+def flush_async_tracking():
+    """Delivers tracking requests queued by the current process"""
+    if _async_tracking_worker is not None:
+        _async_tracking_worker.flush()
@@ -0,0 +1,247 @@
+"""
+Client side aggregation of numeric metrics logged in hot loops (per batch, per step).
+
+Every metric key keeps a streaming summary (count, min, max, mean, last) and
+a reservoir sample of the values logged since the last flush.
+A flush sends the sample with the original timestamps instead of every value,
+so the series keeps its shape while the number of tracking calls is bounded.
+Keys that had values dropped get their summary (`<key>.count`, `<key>.min`, ...)
+at the final flush of the task run.
+"""
+import logging
+import numbers
+import random
+import threading
+import time
+import typing
+
+from dbnd._core.tracking.metrics import Metric
+from dbnd._core.utils.basics.format_exception import format_exception_as_str
+from dbnd._core.utils.daemon_worker import DaemonWorker
+
+
+if typing.TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Any, Dict, List, Optional, Tuple
+
+    MetricsToSend = List[Tuple[Optional[str], Metric]]
+
+logger = logging.getLogger(__name__)
+
+
+def is_aggregated_value(value):
+    # bool is int, but it's a flag, not a series
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+class MetricSummary(object):
+    def __init__(self, key, source, sample_size, rnd):
+        self.key = key
+        self.source = source
+        self.sample_size = sample_size
+        self._random = rnd
+
+        self.count = 0
+        self.sent = 0
+        self.min = None
+        self.max = None
+        self.sum = 0.0
+        self.last_timestamp = None
+
+        # values of the current window: a reservoir sample and the last value,
+        # the last value is always sent
+        self.window_count = 0
+        self._sample = []  # type: List[Tuple[int, datetime, Any]]
+        self._last = None  # type: Optional[Tuple[int, datetime, Any]]
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    def add(self, value, timestamp):
+        as_float = float(value)
+        self.count += 1
+        self.sum += as_float
+        self.min = as_float if self.min is None else min(self.min, as_float)
+        self.max = as_float if self.max is None else max(self.max, as_float)
+        self.last_timestamp = timestamp
+
+        if self._last is not None:
+            self._add_to_sample(self._last)
+        self._last = (self.window_count, timestamp, value)
+        self.window_count += 1
+
+    def _add_to_sample(self, item):
+        # Algorithm R over the values of the window except the last one
+        seen = item[0] + 1
+        sample_size = self.sample_size - 1
+        if len(self._sample) < sample_size:
+            self._sample.append(item)
+            return
+        idx = self._random.randint(0, seen - 1)
+        if idx < sample_size:
+            self._sample[idx] = item
+
+    def pop_window(self):
+        # type: () -> List[Metric]
+        if self._last is None:
+            return []
+        items = sorted(self._sample, key=lambda item: item[0]) + [self._last]
+        self._sample = []
+        self._last = None
+        self.window_count = 0
+
+        self.sent += len(items)
+        return [
+            Metric(key=self.key, timestamp=ts, value=value) for _, ts, value in items
+        ]
+
+    def summary_metrics(self):
+        # type: () -> List[Metric]
+        return [
+            Metric(
+                key="%s.%s" % (self.key, name),
+                timestamp=self.last_timestamp,
+                value=value,
+            )
+            for name, value in (
+                ("count", self.count),
+                ("min", self.min),
+                ("max", self.max),
+                ("mean", self.mean),
+            )
+        ]
+
+
+class MetricsAggregator(object):
+    """
+    Aggregates numeric metrics of one task run.
+    Windows are flushed every `flush_interval` seconds (on the next logged value
+    or by MetricsFlusher), after `flush_stride` values of the same key,
+    and at the end of the task run.
+    """
+
+    def __init__(self, flush_interval, flush_stride=0, sample_size=20):
+        # type: (float, int, int) -> None
+        self.flush_interval = flush_interval
+        self.flush_stride = flush_stride
+        self.sample_size = max(sample_size, 1)
+
+        self._summaries = {}  # type: Dict[Tuple[str, Optional[str]], MetricSummary]
+        self._last_flush = time.time()
+        self._random = random.Random(0)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, key, value, timestamp, source=None):
+        # type: (str, Any, datetime, Optional[str]) -> MetricsToSend
+        """Adds the value, returns the metrics that should be sent now"""
+        with self._lock:
+            summary = self._summaries.get((key, source))
+            if summary is None:
+                summary = self._summaries[(key, source)] = MetricSummary(
+                    key, source, self.sample_size, self._random
+                )
+            summary.add(value, timestamp)
+
+            if time.time() - self._last_flush >= self.flush_interval:
+                return self._flush()
+            if self.flush_stride and summary.window_count >= self.flush_stride:
+                return [(source, m) for m in summary.pop_window()]
+            return []
+
+    def flush_due(self):
+        # type: () -> MetricsToSend
+        """Returns the pending metrics if the flush interval has passed"""
+        with self._lock:
+            if time.time() - self._last_flush < self.flush_interval:
+                return []
+            return self._flush()
+
+    def flush(self, final=False):
+        # type: (bool) -> MetricsToSend
+        """
+        Returns the pending metrics,
+        the final flush adds the summaries of the downsampled keys and resets the state.
+        """
+        with self._lock:
+            to_send = self._flush()
+            if final:
+                for summary in self._summaries.values():
+                    if summary.sent < summary.count:
+                        to_send.extend(
+                            (summary.source, m) for m in summary.summary_metrics()
+                        )
+                self._summaries = {}
+            return to_send
+
+    def _flush(self):
+        self._last_flush = time.time()
+        return [
+            (summary.source, m)
+            for summary in self._summaries.values()
+            for m in summary.pop_window()
+        ]
+
+
+class MetricsFlusher(DaemonWorker):
+    """
+    Flushes the registered aggregators once their flush interval has passed,
+    so the values logged before a pause don't wait for the next logged value.
+    """
+
+    def __init__(self, tick_s=1.0):
+        super(MetricsFlusher, self).__init__(thread_name="dbnd-metrics-flusher")
+        self.tick_s = tick_s
+        self._lock = threading.Lock()
+        self._aggregators = {}  # aggregator -> send(to_send)
+
+    def _on_start(self):
+        # aggregators of the parent process are flushed by the parent
+        self._aggregators = {}
+
+    def register(self, aggregator, send):
+        self._ensure_started()
+        with self._lock:
+            self._aggregators[aggregator] = send
+
+    def unregister(self, aggregator):
+        with self._lock:
+            self._aggregators.pop(aggregator, None)
+
+    def _run(self):
+        while True:
+            time.sleep(self.tick_s)
+            self.flush_due()
+
+    def flush_due(self):
+        with self._lock:
+            registered = list(self._aggregators.items())
+        for aggregator, send in registered:
+            try:
+                to_send = aggregator.flush_due()
+                if to_send:
+                    send(to_send)
+            except Exception:
+                logger.error(
+                    "Failed to send aggregated metrics: %s", format_exception_as_str()
+                )
+
+
+_metrics_flusher = None
+
+
+def get_metrics_flusher():
+    """returns the flusher shared by all the task runs of the process"""
+    global _metrics_flusher
+    if _metrics_flusher is None:
+        _metrics_flusher = MetricsFlusher()
+    return _metrics_flusher
@@ -19,10 +19,14 @@ if typing.TYPE_CHECKING:
         UpdateSource,
     )
     from dbnd._core.task_run.task_run import TaskRun
+    from dbnd._core.tracking.metrics import Metric
     from dbnd._core.run.databand_run import DatabandRun
 
 logger = logging.getLogger(__name__)
 
+# calls that mark the end of the run, everything queued before should be delivered
+_FAN_OUT_BARRIER_CALLS = {"set_run_state", "set_unfinished_tasks_state"}
+
 
 class TrackingStore(object):
     @staticmethod
@@ -68,6 +72,11 @@ class TrackingStore(object):
     def log_metric(self, task_run, metric, source=None):
         pass
 
+    def log_metrics(self, task_run, metrics, source=None):
+        # type: (TaskRun, List[Metric], str) -> None
+        for metric in metrics:
+            self.log_metric(task_run=task_run, metric=metric, source=source)
+
     def log_artifact(self, task_run, name, artifact, artifact_target):
         pass
 
@@ -106,11 +115,21 @@ class TrackingStore(object):
 
 
 class CompositeTrackingStore(TrackingStore):
-    def __init__(self, stores, raise_on_error=True):
+    """
+    Calls all the stores one after another on the caller's thread.
+    With `workers` (store -> TrackingStoreWorker) every store is called from its own
+    worker thread (fan-out), the caller waits only for the critical stores.
+    """
+
+    def __init__(self, stores, raise_on_error=True, workers=None):
         self._stores = stores
         self._raise_on_error = raise_on_error
+        self._workers = workers or {}
 
     def _invoke(self, name, kwargs):
+        if self._workers:
+            return self._invoke_fan_out(name, kwargs)
+
         res = None
         for store in self._stores:
             try:
@@ -134,6 +153,60 @@ class CompositeTrackingStore(TrackingStore):
                     raise
         return res
 
+    def _invoke_fan_out(self, name, kwargs):
+        res = None
+        critical_calls = []
+        for store in self._stores:
+            worker = self._workers.get(store)
+            if worker is None:
+                # no worker - the store is called in place
+                try:
+                    handler_res = getattr(store, name)(**kwargs)
+                    if handler_res:
+                        res = handler_res
+                except Exception as ex:
+                    self._log_error(name, store, ex)
+                    if self._raise_on_error:
+                        raise
+                continue
+
+            call = worker.submit(store, name, kwargs)
+            if call is not None and worker.critical:
+                critical_calls.append((store, worker, call))
+
+        for store, worker, call in critical_calls:
+            try:
+                handler_res = worker.wait(call)
+                if handler_res:
+                    res = handler_res
+            except Exception as ex:
+                self._log_error(name, store, ex)
+                if self._raise_on_error:
+                    raise
+
+        if name in _FAN_OUT_BARRIER_CALLS:
+            self.flush()
+        return res
+
+    def _log_error(self, name, store, ex):
+        if isinstance(ex, DatabandConnectionException):
+            logger.error(
+                "Failed to store tracking information from %s at %s : %s"
+                % (name, store.__class__.__name__, ex)
+            )
+        else:
+            logger.exception(
+                "Failed to store tracking information from %s at %s"
+                % (name, store.__class__.__name__)
+            )
+
+    def flush(self):
+        """Waits for the calls queued at non critical stores (fan-out mode)"""
+        for store in self._stores:
+            worker = self._workers.get(store)
+            if worker is not None:
+                worker.flush()
+
     # this is a function that used for disabling Tracking api on spark inline tasks.
     def disable_tracking_api(self):
         filtered_stores = []
@@ -186,6 +259,9 @@ class CompositeTrackingStore(TrackingStore):
     def log_metric(self, **kwargs):
         return self._invoke(CompositeTrackingStore.log_metric.__name__, kwargs)
 
+    def log_metrics(self, **kwargs):
+        return self._invoke(CompositeTrackingStore.log_metrics.__name__, kwargs)
+
     def log_artifact(self, **kwargs):
         return self._invoke(CompositeTrackingStore.log_artifact.__name__, kwargs)
 
@@ -14,6 +14,7 @@ from dbnd.api.tracking_api import (
     init_run_schema,
     log_artifact_schema,
     log_metric_schema,
+    log_metrics_schema,
     log_targets_schema,
     scheduled_job_args_schema,
     set_run_state_schema,
@@ -202,6 +203,20 @@ class TrackingStoreApi(TrackingStore):
             source=source,
         )
 
+    def log_metrics(self, task_run, metrics, source=None):
+        return self._m(
+            self.channel.log_metrics,
+            log_metrics_schema,
+            metrics_info=[
+                dict(
+                    task_run_attempt_uid=task_run.task_run_attempt_uid,
+                    metric=metric,
+                    source=source,
+                )
+                for metric in metrics
+            ],
+        )
+
     def log_artifact(self, task_run, name, artifact, artifact_target):
         return self._m(
             self.channel.log_artifact,
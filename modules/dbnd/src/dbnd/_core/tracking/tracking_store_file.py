@@ -1,10 +1,13 @@
 # ORIGIN: https://github.com/databricks/mlflow : mlflow/store/tracking_store_file.py
 from __future__ import print_function
 
+import atexit
 import logging
 import os
 import re
+import threading
 import time
+import weakref
 
 from datetime import datetime
 
@@ -43,11 +46,115 @@ def _parse_metric(value):
 
 _METRICS_RE = re.compile(r"(\d+)\s+(.+)")
 
+# remote metric files are rewritten on every flush, so we keep them in memory for a while
+METRICS_REMOTE_FLUSH_INTERVAL = 10
+# max number of local metric files we keep open per task run
+METRICS_MAX_OPEN_FILES = 64
+
+_active_metrics_writers = weakref.WeakSet()
+
+
+@atexit.register
+def _close_metrics_writers():
+    # task runs that didn't get to the final state still have to write their metrics
+    for writer in list(_active_metrics_writers):
+        try:
+            writer.close()
+        except Exception:
+            logger.exception("Failed to write metrics")
+
+
+class TaskRunMetricsFileWriter(object):
+    """
+    Appends metric values to the metric files of the task run.
+    Local files are appended through an open handle (every value is visible right away),
+    remote files (s3/gcs/...) don't support append, so values are buffered in memory
+    and the file is rewritten every `flush_interval` seconds and on close.
+    Every flush uploads the whole file of a changed metric, so the traffic grows
+    with the history of the metric: long series should be aggregated
+    (features.log_metrics_aggregation) or tracked with the api tracker.
+    """
+
+    def __init__(
+        self,
+        flush_interval=METRICS_REMOTE_FLUSH_INTERVAL,
+        max_open_files=METRICS_MAX_OPEN_FILES,
+    ):
+        self.flush_interval = flush_interval
+        self.max_open_files = max_open_files
+
+        self._lock = threading.Lock()
+        self._local_files = {}
+        # path -> [metric target, all lines, has unflushed lines]
+        self._remote_buffers = {}
+        self._last_flush = time.time()
+
+    def write(self, metric_target, line):
+        with self._lock:
+            if metric_target.fs.support_direct_access:
+                self._append_local(metric_target, line)
+                return
+
+            buffer = self._remote_buffers.get(metric_target.path)
+            if buffer is None:
+                lines = []
+                # we read existing data only once, when the file is touched first time
+                if metric_target.exists():
+                    lines.append(metric_target.read())
+                buffer = self._remote_buffers[metric_target.path] = [
+                    metric_target,
+                    lines,
+                    False,
+                ]
+            buffer[1].append(line)
+            buffer[2] = True
+
+            if time.time() - self._last_flush >= self.flush_interval:
+                self._flush_remote()
+
+    def _append_local(self, metric_target, line):
+        fp = self._local_files.get(metric_target.path)
+        if fp is None:
+            if len(self._local_files) >= self.max_open_files:
+                self._close_local()
+            metric_target.mkdir_parent()
+            fp = self._local_files[metric_target.path] = open(metric_target.path, "a")
+        fp.write(line)
+        fp.flush()
+
+    def _close_local(self):
+        for fp in self._local_files.values():
+            fp.close()
+        self._local_files = {}
+
+    def _flush_remote(self):
+        for buffer in self._remote_buffers.values():
+            metric_target, lines, dirty = buffer
+            if dirty:
+                metric_target.write("".join(lines))
+                buffer[2] = False
+        self._last_flush = time.time()
+
+    def flush(self):
+        with self._lock:
+            self._flush_remote()
+
+    def close(self):
+        with self._lock:
+            self._flush_remote()
+            self._remote_buffers = {}
+            self._close_local()
+
 
 class FileTrackingStore(TrackingStore):
+    def __init__(self):
+        self._metrics_writers = {}
+
     def set_task_run_state(self, task_run, state, error=None, timestamp=None):
         if state == TaskRunState.RUNNING:
             self.dump_task_run_info(task_run)
+        elif state in TaskRunState.finished_states():
+            self.close_metrics_writer(task_run)
 
     def dump_task_run_info(self, task_run):
 
@@ -68,15 +175,26 @@ class FileTrackingStore(TrackingStore):
         with meta_data_file.open("w") as yaml_file:
             yaml.dump(info, yaml_file, default_flow_style=False)
 
+    def _get_metrics_writer(self, task_run):
+        writer = self._metrics_writers.get(task_run.task_run_attempt_uid)
+        if writer is None:
+            writer = self._metrics_writers[
+                task_run.task_run_attempt_uid
+            ] = TaskRunMetricsFileWriter()
+            _active_metrics_writers.add(writer)
+        return writer
+
+    def close_metrics_writer(self, task_run):
+        writer = self._metrics_writers.pop(task_run.task_run_attempt_uid, None)
+        if writer:
+            writer.close()
+
     def log_metric(self, task_run, metric, source=None):
         metric_path = task_run.meta_files.get_metric_target(metric.key, source=source)
         timestamp = int(time.mktime(metric.timestamp.timetuple()))
         value = "%s %s\n" % (timestamp, metric.value)
 
-        data = value
-        if metric_path.exists():
-            data = metric_path.read() + value
-        metric_path.write(data)
+        self._get_metrics_writer(task_run).write(metric_path, value)
 
     def log_artifact(self, task_run, name, artifact, artifact_target):
         artifact_target.mkdir_parent()
@@ -119,16 +237,19 @@ class TaskRunMetricsFileStoreReader(object):
         all_files = [os.path.basename(str(p)) for p in metrics_root.list_partitions()]
         return all_files
 
-    def get_metric_history(self, key, source=None):
+    def iter_metric_history(self, key, source=None):
         metric_target = self.meta.get_metric_target(key, source=source)
         if not metric_target.exists():
             raise DatabandError("Metric '%s' not found" % key)
-        metric_data = metric_target.readlines()
-        rsl = []
-        for pair in metric_data:
-            ts, val = pair.strip().split(" ")
-            rsl.append(Metric(key, float(val), datetime.fromtimestamp(int(ts))))
-        return rsl
+        with metric_target.open("r") as fp:
+            for pair in fp:
+                ts, val = pair.strip().split(" ")
+                yield Metric(
+                    key=key, value=float(val), timestamp=datetime.fromtimestamp(int(ts))
+                )
+
+    def get_metric_history(self, key, source=None):
+        return list(self.iter_metric_history(key, source=source))
 
     def get_all_metrics_values(self, source=None):
         metrics = []
@@ -153,16 +274,38 @@ class TaskRunMetricsFileStoreReader(object):
         metric_target = self.meta.get_metric_target(key, source=source)
         if not metric_target.exists():
             raise DatabandRuntimeError("Metric '%s' not found" % key)
-        metric_data = metric_target.readlines()
-        if len(metric_data) == 0:
+        with metric_target.open("r") as fp:
+            first_line = fp.readline()
+        return self._parse_metric_line(key, first_line)
+
+    def get_last_metric(self, key, source=None):
+        """
+        Returns the last logged value of the metric (expects single line values),
+        local files are read from the end, without reading the whole history
+        """
+        metric_target = self.meta.get_metric_target(key, source=source)
+        if not metric_target.exists():
+            raise DatabandRuntimeError("Metric '%s' not found" % key)
+
+        if metric_target.fs.support_direct_access:
+            last_line = _read_last_line(metric_target.path)
+        else:
+            last_line = ""
+            with metric_target.open("r") as fp:
+                for line in fp:
+                    if line.strip():
+                        last_line = line
+        return self._parse_metric_line(key, last_line)
+
+    def _parse_metric_line(self, key, line):
+        if not line:
             raise DatabandRuntimeError("Metric '%s' is malformed. No data found." % key)
-        first_line = metric_data[0]
 
-        metric_parsed = _METRICS_RE.match(first_line)
+        metric_parsed = _METRICS_RE.match(line)
         if not metric_parsed:
             raise DatabandRuntimeError(
                 "Metric '%s' is malformed. Expected format: 'TS VALUE', got='%s'"
-                % (key, first_line)
+                % (key, line)
             )
 
         timestamp, val = metric_parsed.groups()
@@ -180,6 +323,25 @@ class TaskRunMetricsFileStoreReader(object):
         return Artifact(artifact_target.path)
 
 
+def _read_last_line(path, block_size=4096):
+    with open(path, "rb") as fp:
+        fp.seek(0, os.SEEK_END)
+        end = position = fp.tell()
+        data = b""
+        # read blocks from the end till we have a full line
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            fp.seek(position)
+            data = fp.read(read_size) + data
+            if data.rstrip(b"\n").count(b"\n") >= 1:
+                break
+    lines = data.rstrip(b"\n").split(b"\n")
+    if end == 0 or not lines:
+        return ""
+    return lines[-1].decode("utf-8")
+
+
 def read_task_metrics(attempt_folder, source=None):
     return TaskRunMetricsFileStoreReader(
         attempt_folder=target(attempt_folder)
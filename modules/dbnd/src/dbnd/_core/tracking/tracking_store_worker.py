@@ -0,0 +1,209 @@
+import atexit
+import logging
+import threading
+import time
+
+from six.moves.queue import Full, Queue
+
+from dbnd._core.errors.base import DatabandConnectionException
+from dbnd._core.utils.daemon_worker import DaemonWorker
+
+
+logger = logging.getLogger(__name__)
+
+
+class _StoreCall(object):
+    def __init__(self, store, name, kwargs):
+        self.store = store
+        self.name = name
+        self.kwargs = kwargs
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class TrackingStoreWorker(DaemonWorker):
+    """
+    Calls one tracking store from its own thread (fan-out mode of CompositeTrackingStore).
+    Every call is limited by `timeout` seconds. After `failure_threshold` consecutive
+    failures the circuit is open: calls to the store are dropped for `reset_timeout` seconds,
+    then the next call checks whether the store is back.
+    """
+
+    def __init__(
+        self,
+        name,
+        timeout=30.0,
+        critical=False,
+        failure_threshold=5,
+        reset_timeout=60.0,
+        max_queue_size=10000,
+    ):
+        super(TrackingStoreWorker, self).__init__(
+            thread_name="dbnd-tracking-store-%s" % name
+        )
+        self.name = name
+        self.timeout = timeout
+        self.critical = critical
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_queue_size = max_queue_size
+
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.skipped_calls = 0
+        self.consecutive_failures = 0
+        self._open_until = None
+
+        self._lock = threading.Lock()
+        self._queue = None
+
+    def _on_start(self):
+        self._queue = Queue(maxsize=self.max_queue_size)
+
+    @property
+    def is_circuit_open(self):
+        return self._open_until is not None and time.time() < self._open_until
+
+    def submit(self, store, name, kwargs):
+        """
+        Queues the call, returns None if the call is dropped
+        """
+        if self.is_circuit_open:
+            self.skipped_calls += 1
+            return None
+
+        self._ensure_started()
+        call = _StoreCall(store, name, kwargs)
+        try:
+            self._queue.put(call, timeout=self.timeout)
+        except Full:
+            self.skipped_calls += 1
+            logger.warning(
+                "Tracking store %s queue is full, dropping %s", self.name, name
+            )
+            return None
+        return call
+
+    def wait(self, call):
+        """
+        Waits for the call to finish, returns its result or raises its error
+        """
+        if not call.done.wait(self.timeout):
+            self.timeouts += 1
+            self._on_failure()
+            raise DatabandConnectionException(
+                "Tracking store %s didn't finish %s in %s seconds"
+                % (self.name, call.name, self.timeout)
+            )
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def flush(self, timeout=None):
+        """Waits till everything queued so far is handled"""
+        if not self.is_started:
+            return True
+        call = _StoreCall(None, None, None)
+        try:
+            self._queue.put(call, timeout=timeout or self.timeout)
+        except Full:
+            return False
+        return call.done.wait(timeout or self.timeout)
+
+    def _run(self):
+        while True:
+            call = self._queue.get()
+            try:
+                if call.store is not None:
+                    self._execute(call)
+            finally:
+                call.done.set()
+
+    def _execute(self, call):
+        if self.is_circuit_open:
+            # the circuit was opened after the call was queued
+            self.skipped_calls += 1
+            return
+
+        self.calls += 1
+        start = time.time()
+        try:
+            call.result = getattr(call.store, call.name)(**call.kwargs)
+        except Exception as ex:
+            call.error = ex
+            self._on_failure()
+            if not self.critical:
+                # nobody waits for the result, report it here
+                logger.error(
+                    "Failed to store tracking information from %s at %s : %s",
+                    call.name,
+                    self.name,
+                    ex,
+                )
+            return
+
+        if time.time() - start > self.timeout:
+            # the waiting caller has already counted it as a failure
+            if not self.critical:
+                self.timeouts += 1
+                self._on_failure()
+            return
+        self._on_success()
+
+    def _on_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.consecutive_failures < self.failure_threshold:
+                return
+            if not self.is_circuit_open:
+                logger.warning(
+                    "Tracking store %s has failed %s times in a row, "
+                    "skipping its calls for %s seconds",
+                    self.name,
+                    self.consecutive_failures,
+                    self.reset_timeout,
+                )
+            self._open_until = time.time() + self.reset_timeout
+
+    def _on_success(self):
+        with self._lock:
+            if self._open_until is not None:
+                logger.info("Tracking store %s is back", self.name)
+            self.consecutive_failures = 0
+            self._open_until = None
+
+    def stats(self):
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "skipped_calls": self.skipped_calls,
+            "circuit_open": self.is_circuit_open,
+        }
+
+
+_tracking_store_workers = {}
+
+
+def get_tracking_store_worker(name, **kwargs):
+    """returns the worker of the store `name`, shared by all the composite stores"""
+    worker = _tracking_store_workers.get(name)
+    if worker is None:
+        worker = _tracking_store_workers[name] = TrackingStoreWorker(name, **kwargs)
+    else:
+        # settings could be changed by the current config
+        for key, value in kwargs.items():
+            setattr(worker, key, value)
+    return worker
+
+
+def flush_tracking_store_workers():
+    """Waits for the calls queued to all the store workers of the current process"""
+    for worker in list(_tracking_store_workers.values()):
+        worker.flush()
+
+
+atexit.register(flush_tracking_store_workers)
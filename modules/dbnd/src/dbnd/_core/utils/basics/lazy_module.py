@@ -0,0 +1,127 @@
+import importlib
+import logging
+import sys
+import threading
+import types
+
+import six
+
+
+logger = logging.getLogger(__name__)
+
+
+def _import_attr(path):
+    # "module.path:attr" or "module.path" for the module itself
+    module_name, _, attr = path.partition(":")
+    module = importlib.import_module(module_name)
+    if not attr:
+        return module
+    return getattr(module, attr)
+
+
+class _LazyModule(types.ModuleType):
+    def __getattr__(self, name):
+        # called only if the attribute is not found at the module itself
+        lazy_attrs = self.__dict__.get("_lazy_attrs", {})
+        path = lazy_attrs.get(name)
+        if path is None:
+            raise AttributeError(
+                "module '%s' has no attribute '%s'" % (self.__name__, name)
+            )
+        value = _import_attr(path)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self.__dict__.get("_lazy_attrs", {})))
+
+
+def set_lazy_attrs(module_name, lazy_attrs):
+    """
+    Module attributes {name: "module.path:attr"} are imported on the first access.
+    Python 2 doesn't support module class change, the attributes are imported at once.
+    """
+    module = sys.modules[module_name]
+    if six.PY2:
+        for name, path in six.iteritems(lazy_attrs):
+            setattr(module, name, _import_attr(path))
+        return
+
+    module._lazy_attrs = lazy_attrs
+    module.__class__ = _LazyModule
+
+
+class _PostImportFinder(object):
+    """
+    Meta path finder that doesn't find anything by itself,
+    it wraps the loader of the watched modules so callbacks run right after the import.
+    """
+
+    def __init__(self):
+        self.callbacks = {}  # module name -> [callback(module)]
+        self._lock = threading.RLock()
+        self._in_progress = set()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in self.callbacks or fullname in self._in_progress:
+            return None
+        from importlib.util import find_spec
+
+        # the real spec, found by the rest of the finders
+        self._in_progress.add(fullname)
+        try:
+            spec = find_spec(fullname)
+        finally:
+            self._in_progress.discard(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+
+        loader = spec.loader
+        exec_module = loader.exec_module
+
+        def _exec_module(module):
+            exec_module(module)
+            if loader.__dict__.get("exec_module") is _exec_module:
+                del loader.exec_module
+            self.run_callbacks(module)
+
+        loader.exec_module = _exec_module
+        return spec
+
+    def run_callbacks(self, module):
+        with self._lock:
+            callbacks = self.callbacks.pop(module.__name__, [])
+        for callback in callbacks:
+            try:
+                callback(module)
+            except Exception:
+                logger.exception(
+                    "Failed to run %s after import of %s", callback, module.__name__
+                )
+
+
+_post_import_finder = None
+
+
+def on_module_import(module_name, callback):
+    """
+    Calls callback(module) once the module is imported (now if it's imported already).
+    Python 2 doesn't have the finder api we use, the module is imported at once if it exists.
+    """
+    global _post_import_finder
+
+    module = sys.modules.get(module_name)
+    if module is None and six.PY2:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            return
+    if module is not None:
+        callback(module)
+        return
+
+    if _post_import_finder is None:
+        _post_import_finder = _PostImportFinder()
+        sys.meta_path.insert(0, _post_import_finder)
+    with _post_import_finder._lock:
+        _post_import_finder.callbacks.setdefault(module_name, []).append(callback)
@@ -0,0 +1,46 @@
+import os
+import threading
+
+
+class DaemonWorker(object):
+    """
+    Base class of the process wide background services (tracking, heartbeats, pollers).
+
+    `_run` is executed by a daemon thread that is started on the first use.
+    A forked process doesn't have the threads of its parent: the worker is started
+    again in the child on its first use there, `_on_start` resets the state it shouldn't share.
+    """
+
+    def __init__(self, thread_name):
+        self.thread_name = thread_name
+
+        self._worker_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    @property
+    def is_started(self):
+        """The thread is running in the current process"""
+        return (
+            self._thread is not None
+            and self._pid == os.getpid()
+            and self._thread.is_alive()
+        )
+
+    def _ensure_started(self):
+        if self.is_started:
+            return
+        with self._worker_lock:
+            if self.is_started:
+                return
+            self._pid = os.getpid()
+            self._on_start()
+            self._thread = threading.Thread(target=self._run, name=self.thread_name)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _on_start(self):
+        pass
+
+    def _run(self):
+        raise NotImplementedError()
@@ -1,9 +1,14 @@
-﻿import json
+﻿import gzip
+import io
+import json
 import logging
+
 from time import sleep
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
 from dbnd._core.errors import DatabandError, DatabandConfigError
 from dbnd._core.utils.http import constants
 
@@ -21,12 +26,23 @@ class HttpClientException(DatabandError):
 
 
 class ReliableHttpClient(object):
-    """Http client that is reliable in its requests. Uses requests library."""
-
-    def __init__(self, endpoint, headers, retry_policy, ignore_ssl_errors=False):
+    """Http client that is reliable in its requests. Uses requests library.
+    All requests go through one pooled keep-alive session."""
+
+    def __init__(
+        self,
+        endpoint,
+        headers,
+        retry_policy,
+        ignore_ssl_errors=False,
+        pool_maxsize=10,
+        keep_alive=True,
+        compress_requests=False,
+    ):
         self._endpoint = endpoint
         self._headers = headers
         self._retry_policy = retry_policy
+        self._auth = None
         if self._endpoint.auth == constants.AUTH_KERBEROS:
             from requests_kerberos import HTTPKerberosAuth, REQUIRED
 
@@ -45,6 +61,37 @@ class ReliableHttpClient(object):
             )
             requests.packages.urllib3.disable_warnings()
 
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.compress_requests = compress_requests
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self):
+        session = requests.Session()
+        # retries are handled by retry policy
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=0
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.verify = self.verify_ssl
+        if self._auth is not None:
+            session.auth = self._auth
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def get_headers(self):
         return self._headers
 
@@ -54,54 +101,41 @@ class ReliableHttpClient(object):
 
     def get(self, relative_url, accepted_status_codes):
         """Sends a get request. Returns a response."""
-        return self._send_request(relative_url, accepted_status_codes, requests.get)
+        return self._send_request(relative_url, accepted_status_codes, "GET")
 
     def post(self, relative_url, accepted_status_codes, data):
         """Sends a post request. Returns a response."""
-        return self._send_request(
-            relative_url, accepted_status_codes, requests.post, data
-        )
+        return self._send_request(relative_url, accepted_status_codes, "POST", data)
 
     def delete(self, relative_url, accepted_status_codes):
         """Sends a delete request. Returns a response."""
-        return self._send_request(relative_url, accepted_status_codes, requests.delete)
-
-    def _send_request(self, relative_url, accepted_status_codes, function, data=None):
+        return self._send_request(relative_url, accepted_status_codes, "DELETE")
+
+    def _send_request(self, relative_url, accepted_status_codes, method, data=None):
+        # body is serialized once, retries reuse it
+        headers = self._headers
+        body = None
+        if data is not None:
+            body = json.dumps(data).encode("utf-8")
+            if self.compress_requests:
+                body = gzip_bytes(body)
+                headers = dict(headers or {})
+                headers["Content-Encoding"] = "gzip"
         return self._send_request_helper(
-            self.compose_url(relative_url), accepted_status_codes, function, data, 0
+            self.compose_url(relative_url),
+            accepted_status_codes,
+            method,
+            body,
+            headers,
+            0,
         )
 
     def _send_request_helper(
-        self, url, accepted_status_codes, function, data, retry_count
+        self, url, accepted_status_codes, method, body, headers, retry_count
     ):
         while True:
             try:
-                if self._endpoint.auth == constants.NO_AUTH:
-                    if data is None:
-                        r = function(url, headers=self._headers, verify=self.verify_ssl)
-                    else:
-                        r = function(
-                            url,
-                            headers=self._headers,
-                            data=json.dumps(data),
-                            verify=self.verify_ssl,
-                        )
-                else:
-                    if data is None:
-                        r = function(
-                            url,
-                            headers=self._headers,
-                            auth=self._auth,
-                            verify=self.verify_ssl,
-                        )
-                    else:
-                        r = function(
-                            url,
-                            headers=self._headers,
-                            auth=self._auth,
-                            data=json.dumps(data),
-                            verify=self.verify_ssl,
-                        )
+                r = self.session.request(method, url, headers=headers, data=body)
             except requests.exceptions.RequestException as e:
                 error = True
                 r = None
@@ -131,3 +165,10 @@ class ReliableHttpClient(object):
                         )
                     )
             return r
+
+
+def gzip_bytes(data):
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+        f.write(data)
+    return buf.getvalue()
@@ -1,6 +1,7 @@
 # originally from sparkmagic package
 # Copyright (c) 2015  aggftw@gmail.com
 # Distributed under the terms of the Modified BSD License.s
+import random
 
 from dbnd._core.errors import DatabandConfigError
 from dbnd._core.utils.http.constants import CONFIGURABLE_RETRY, LINEAR_RETRY
@@ -10,6 +11,8 @@ from dbnd._core.utils.http.constants import CONFIGURABLE_RETRY, LINEAR_RETRY
 # implement configuration per name
 conf_retry_seconds_to_sleep_list = [0.2, 0.5, 1, 3, 5]
 conf_retry_policy_max_retries = 5
+# spread retries of many clients failing at the same time (+-50%)
+conf_retry_jitter = 0.5
 
 
 def get_retry_policy(name):
@@ -17,11 +20,14 @@ def get_retry_policy(name):
     policy = LINEAR_RETRY
 
     if policy == LINEAR_RETRY:
-        return LinearRetryPolicy(seconds_to_sleep=5, max_retries=5)
+        return LinearRetryPolicy(
+            seconds_to_sleep=5, max_retries=5, jitter=conf_retry_jitter
+        )
     elif policy == CONFIGURABLE_RETRY:
         return ConfigurableRetryPolicy(
             retry_seconds_to_sleep_list=conf_retry_seconds_to_sleep_list,
             max_retries=conf_retry_policy_max_retries,
+            jitter=conf_retry_jitter,
         )
     else:
         raise DatabandConfigError(u"Retry policy '{}' not supported".format(policy))
@@ -29,11 +35,17 @@ def get_retry_policy(name):
 
 class LinearRetryPolicy(object):
     """Retry policy that always returns the same number of seconds to sleep between calls,
-    takes all status codes 500 or above to be retriable, and retries a given maximum number of times."""
+    takes all status codes 500 or above to be retriable, and retries a given maximum number of times.
+    With jitter, the sleep time is randomized in +-jitter ratio of the configured value."""
 
-    def __init__(self, seconds_to_sleep, max_retries):
+    def __init__(self, seconds_to_sleep, max_retries, jitter=0):
         self._seconds_to_sleep = seconds_to_sleep
         self.max_retries = max_retries
+        if not 0 <= jitter <= 1:
+            raise DatabandConfigError(
+                u"Retry jitter should be between 0 and 1, got {}".format(jitter)
+            )
+        self.jitter = jitter
 
     def should_retry(self, status_code, error, retry_count):
         if None in (status_code, retry_count):
@@ -41,7 +53,12 @@ class LinearRetryPolicy(object):
         return (status_code >= 500 and retry_count <= self.max_retries) or error
 
     def seconds_to_sleep(self, retry_count):
-        return self._seconds_to_sleep
+        return self._with_jitter(self._seconds_to_sleep)
+
+    def _with_jitter(self, seconds):
+        if not self.jitter:
+            return seconds
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
 
 
 class ConfigurableRetryPolicy(LinearRetryPolicy):
@@ -49,8 +66,8 @@ class ConfigurableRetryPolicy(LinearRetryPolicy):
     takes all status codes 500 or above to be retriable, and retries a given maximum number of times.
     If the retry count exceeds the number of items in the list, last item in the list is always returned."""
 
-    def __init__(self, retry_seconds_to_sleep_list, max_retries):
-        super(ConfigurableRetryPolicy, self).__init__(-1, max_retries)
+    def __init__(self, retry_seconds_to_sleep_list, max_retries, jitter=0):
+        super(ConfigurableRetryPolicy, self).__init__(-1, max_retries, jitter=jitter)
 
         # If user configured to an empty list, let's make this behave as
         # a Linear Retry Policy by assigning a list of 1 element.
@@ -69,4 +86,4 @@ class ConfigurableRetryPolicy(LinearRetryPolicy):
         if index > self._max_index:
             index = self._max_index
 
-        return self.retry_seconds_to_sleep_list[index]
+        return self._with_jitter(self.retry_seconds_to_sleep_list[index])
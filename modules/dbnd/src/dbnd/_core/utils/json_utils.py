@@ -2,13 +2,12 @@ import datetime
 import functools
 import json
 import operator
+import sys
 
 from collections import OrderedDict
 from typing import Mapping
 from uuid import UUID
 
-from numpy import int32, int64
-
 import dbnd._vendor.hjson as hjson
 
 from dbnd._core.utils.platform import windows_compatible_mode
@@ -71,7 +70,8 @@ def json_default(obj, safe=False):
         return obj.strftime("%Y-%m-%dT%H:%M:%SZ")
     elif isinstance(obj, datetime.date):
         return obj.strftime("%Y-%m-%d")
-    if isinstance(obj, int64) or isinstance(obj, int32):
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(obj, (np.int64, np.int32)):
         return str(obj)
 
     if isinstance(obj, UUID):
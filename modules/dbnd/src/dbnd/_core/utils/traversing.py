@@ -1,6 +1,7 @@
+import sys
+
 from collections import Mapping
 
-import pandas as pd
 import six
 
 
@@ -97,7 +98,7 @@ def traverse(
         list_obj_constructor = None
         if isinstance(obj, (list, tuple, set)):
             list_obj_constructor = obj.__class__
-        elif isinstance(obj, pd.DataFrame):
+        elif _is_data_frame(obj):
             pass
         else:
             try:
@@ -122,6 +123,12 @@ def traverse(
     return t(struct)
 
 
+def _is_data_frame(obj):
+    # there are no data frames if pandas is not imported yet
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
 def _frozen_set(struct):
     if isinstance(struct, set):
         from dbnd._core.utils import json_utils
@@ -208,6 +208,13 @@ class LogMetricSchema(_ApiCallSchema):
 log_metric_schema = LogMetricSchema()
 
 
+class LogMetricsSchema(_ApiCallSchema):
+    metrics_info = fields.Nested(LogMetricSchema, many=True)
+
+
+log_metrics_schema = LogMetricsSchema()
+
+
 class LogArtifactSchema(_ApiCallSchema):
     task_run_attempt_uid = fields.UUID(required=True)
     name = fields.String()
@@ -297,6 +304,9 @@ logger = logging.getLogger(__name__)
 
 @six.add_metaclass(ABCMeta)
 class TrackingAPI(object):
+    # older servers don't have the bulk endpoint
+    _log_metrics_supported = True
+
     def _handle(self, name, data):
         logger.info("Tracking %s.%s is not implemented", self.__class__.__name__, name)
 
@@ -336,6 +346,21 @@ class TrackingAPI(object):
     def log_metric(self, data):
         return self._handle(TrackingAPI.log_metric.__name__, data)
 
+    def log_metrics(self, data):
+        if self._log_metrics_supported:
+            try:
+                return self._handle(TrackingAPI.log_metrics.__name__, data)
+            except DatabandApiError as ex:
+                if ex.resp_code not in (404, 405):
+                    raise
+                logger.info(
+                    "Tracking server doesn't support log_metrics, sending metrics one by one"
+                )
+                self._log_metrics_supported = False
+
+        for metric_info in data["metrics_info"]:
+            self.log_metric(metric_info)
+
     def log_artifact(self, data):
         return self._handle(TrackingAPI.log_artifact.__name__, data)
 
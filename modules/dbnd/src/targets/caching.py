@@ -1,8 +1,20 @@
+import logging
+import sys
+import threading
+
+from collections import OrderedDict
 from typing import Any, Dict
 
 import attr
+import six
+
+from targets.config import (
+    get_in_memory_cache_target_max_bytes,
+    is_in_memory_cache_target_value,
+)
 
-from targets.config import is_in_memory_cache_target_value
+
+logger = logging.getLogger(__name__)
 
 
 @attr.s(frozen=True)
@@ -11,35 +23,190 @@ class TargetCacheKey(object):
     value_type = attr.ib(converter=str)
 
 
-class TargetCache(object):
-    def __init__(self, cache=None):
-        self._cache = cache if cache is not None else {}
+def estimate_value_size(value):
+    # type: (Any) -> int
+    """
+    Size of the value in memory (bytes), deep for pandas objects
+    """
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):  # pandas DataFrame/Series
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except Exception:
+            pass
+    nbytes = getattr(value, "nbytes", None)  # numpy arrays
+    if isinstance(nbytes, six.integer_types):
+        return nbytes
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_value_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_value_size(k) + estimate_value_size(v)
+            for k, v in six.iteritems(value)
+        )
+    try:
+        return sys.getsizeof(value)
+    except Exception:
+        return 0
+
+
+class LruCache(object):
+    """
+    Thread safe cache, least recently used items are evicted when there are more
+    than `max_items` items (None means unlimited, 0 disables the cache)
+    or their total size is bigger than `max_bytes` (0 or None means unlimited).
+    """
+
+    def __init__(self, max_items=None, max_bytes=None):
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+
+        self._cache = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+
+    @property
+    def max_items(self):
+        return self._max_items
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._cache:
+                self.misses += 1
+                return default
+            # mark as the most recently used
+            value = self._cache.pop(key)
+            self._cache[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value, size=None):
+        max_items = self.max_items
+        if max_items == 0:
+            return
+        if size is None:
+            size = estimate_value_size(value)
+        max_bytes = self.max_bytes
+        if max_bytes and size > max_bytes:
+            logger.debug("%s is too big to be cached (%s bytes)", key, size)
+            return
+
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+            self._add(key, value, size)
+
+            while (max_items is not None and len(self._cache) > max_items) or (
+                max_bytes and self.size_bytes > max_bytes
+            ):
+                self._remove(next(iter(self._cache)))
+                self.evictions += 1
+
+    def _add(self, key, value, size):
+        self._cache[key] = value
+        self._sizes[key] = size
+        self.size_bytes += size
+
+    def _remove(self, key):
+        del self._cache[key]
+        self.size_bytes -= self._sizes.pop(key, 0)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._sizes.clear()
+            self.size_bytes = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return float(self.hits) / total if total else 0.0
+
+    def stats(self, since=None):
+        """
+        Counters are cumulative, or relative to `since` (the result of a previous call),
+        size_bytes and items are the current ones
+        """
+        with self._lock:
+            hits, misses, evictions = self.hits, self.misses, self.evictions
+            size_bytes, items = self.size_bytes, len(self._cache)
+        if since:
+            hits -= since["hits"]
+            misses -= since["misses"]
+            evictions -= since["evictions"]
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": float(hits) / (hits + misses) if hits + misses else 0.0,
+            "evictions": evictions,
+            "size_bytes": size_bytes,
+            "items": items,
+        }
+
+
+class TargetCache(LruCache):
+    """
+    In memory cache of target values, limited by the total size of the values
+    (`features.in_memory_cache_target_max_bytes` by default, 0 means unlimited).
+    """
+
+    def __init__(self, cache=None, max_bytes=None):
+        super(TargetCache, self).__init__(max_bytes=max_bytes)
+        self._keys_by_target = {}  # type: Dict[str, set]
+        for key, value in six.iteritems(cache or {}):
+            self._add(key, value, estimate_value_size(value))
+
+    @property
+    def max_bytes(self):
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return get_in_memory_cache_target_max_bytes()
 
     def get_cache_group(self):
         # type: () -> Dict[TargetCacheKey, Any]
         return self._cache
 
-    def set(self, value, key):
-        if not self.enabled:
-            return
+    def _add(self, key, value, size):
+        super(TargetCache, self)._add(key, value, size)
+        self._keys_by_target.setdefault(key.target, set()).add(key)
 
-        cache = self.get_cache_group()
-        if cache is not None:
-            cache[key] = value
+    def _remove(self, key):
+        super(TargetCache, self)._remove(key)
+        keys = self._keys_by_target.get(key.target)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_target[key.target]
 
-    def get(self, key):
+    def set(self, value, key):
         if not self.enabled:
             return
+        self.put(key, value)
 
-        cache = self.get_cache_group()
-        if cache is not None:
-            return cache.get(key)
+    def get(self, key, default=None):
+        if not self.enabled:
+            return default
+        return super(TargetCache, self).get(key, default)
 
     def has(self, key):
-        cache = self.get_cache_group()
-        if cache is not None:
-            return key in cache
-        return False
+        with self._lock:
+            found = key in self._cache
+            if not found and self.enabled:
+                self.misses += 1
+            return found
 
     def __getitem__(self, item):
         return self.get(key=item)
@@ -54,22 +221,18 @@ class TargetCache(object):
         if not targets_to_clear:
             return
 
-        cache = self.get_cache_group()
-        if not cache:
-            return
-
-        targets_to_clear = set(targets_to_clear)
-        for key in list(cache.keys()):
-            if key.target in targets_to_clear and key in cache:
-                del cache[key]
+        with self._lock:
+            for target in targets_to_clear:
+                for key in list(self._keys_by_target.get(str(target), ())):
+                    self._remove(key)
 
     def clear(self):
-        cache = self.get_cache_group()
-        if cache:
-            cache.clear()
+        with self._lock:
+            super(TargetCache, self).clear()
+            self._keys_by_target.clear()
 
     def clear_all(self):
-        self._cache.clear()
+        self.clear()
 
     @property
     def enabled(self):
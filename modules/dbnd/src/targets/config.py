@@ -56,3 +56,38 @@ def is_in_memory_cache_target_value():
     if dc:
         return dc.settings.features.in_memory_cache_target_value
     return False
+
+
+def get_in_memory_cache_target_max_bytes():
+    dc = try_get_databand_context()
+    if dc:
+        return dc.settings.features.in_memory_cache_target_max_bytes
+    return 0
+
+
+def get_value_stats_config():
+    """
+    (max rows, histogram bins) for value stats calculation
+    """
+    dc = try_get_databand_context()
+    if dc:
+        features = dc.settings.features
+        return (
+            features.log_value_stats_max_rows,
+            features.log_value_stats_histogram_bins,
+        )
+    return 100000, 20
+
+
+def get_value_hash_config():
+    """
+    (mode, size threshold of fingerprint) for data_hash of values
+    """
+    dc = try_get_databand_context()
+    if dc:
+        features = dc.settings.features
+        return (
+            features.log_value_hash_mode,
+            features.log_value_hash_fingerprint_above_bytes,
+        )
+    return "auto", 256 * 1024 ** 2
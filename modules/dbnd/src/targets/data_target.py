@@ -1,5 +1,6 @@
 import abc
 import logging
+import types
 
 from dbnd._core.errors import friendly_error
 from dbnd._core.utils.basics.nothing import NOTHING, is_not_defined
@@ -120,10 +121,17 @@ class DataTarget(Target):
             raise friendly_error.failed_to_write_task_output(
                 ex, self, value_type=value_type
             )
+        if isinstance(value, types.GeneratorType):
+            # the value is consumed already
+            return
         cache_key = TargetCacheKey(target=self, value_type=value_type)
         TARGET_CACHE[cache_key] = value
 
     def load(self, value_type, **kwargs):
+        if kwargs.get("chunksize"):
+            # lazy iterator over chunks, we don't cache it
+            return get_marshaller_ctrl(self, value_type).load(**kwargs)
+
         cache_key = TargetCacheKey(target=self, value_type=value_type)
         if cache_key in TARGET_CACHE:
             logger.info("Using cached data value for target='%s'", self)
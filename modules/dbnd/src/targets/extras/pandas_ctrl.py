@@ -2,8 +2,6 @@ import logging
 
 from typing import Any
 
-from pandas import DataFrame
-
 from targets.extras import DataTargetCtrl
 from targets.marshalling import get_marshaller_ctrl
 from targets.target_config import FileFormat, file
@@ -18,20 +16,22 @@ class PandasMarshallingCtrl(DataTargetCtrl):
     def __init__(self, target):
         super(PandasMarshallingCtrl, self).__init__(target)
 
+    def _get_marshaller_ctrl(self, config):
+        from pandas import DataFrame
+
+        return get_marshaller_ctrl(self.target, value_type=DataFrame, config=config)
+
     def read(self, config=None, **kwargs):
         # type: (file, **Any) -> 'DataFrame'
-        pd_m = get_marshaller_ctrl(self.target, DataFrame, config=config)
-        return pd_m.load(**kwargs)
+        return self._get_marshaller_ctrl(config).load(**kwargs)
 
     def read_partitioned(self, config=None, **kwargs):
-        pd_m = get_marshaller_ctrl(self.target, DataFrame, config=config)
-        for t in pd_m.load_partitioned(**kwargs):
+        for t in self._get_marshaller_ctrl(config).load_partitioned(**kwargs):
             yield t
 
     @target_timeit
     def to(self, df, config=None, **kwargs):
-        pd_m = get_marshaller_ctrl(self.target, value_type=DataFrame, config=config)
-        return pd_m.dump(df, **kwargs)
+        return self._get_marshaller_ctrl(config).dump(df, **kwargs)
 
     def read_csv(self, **kwargs):
         return self.read(config=file.csv, **kwargs)
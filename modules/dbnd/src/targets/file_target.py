@@ -2,13 +2,12 @@ import os
 
 import six
 
-from targets import pipes
 from targets.base_target import logger
 from targets.data_target import DataTarget
 from targets.errors import TargetError
 from targets.fs import get_file_system, get_file_system_name
 from targets.pipes import Nop, Text
-from targets.target_config import FileCompressions, TargetConfig
+from targets.target_config import TargetConfig, get_compression_pipeline
 
 
 class FileTarget(DataTarget):
@@ -65,10 +64,9 @@ class FileTarget(DataTarget):
         if not self.config:
             return pipe
 
-        if self.config.compression == FileCompressions.gzip:
-            pipe = pipe >> pipes.Gzip
-        elif self.config.compression == FileCompressions.bzip:
-            pipe = pipe >> pipes.Bzip2
+        compression_pipe = get_compression_pipeline(self.config.compression)
+        if compression_pipe:
+            pipe = pipe >> compression_pipe
         return pipe
 
     def open(self, mode="r"):
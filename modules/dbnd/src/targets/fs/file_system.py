@@ -1,13 +1,30 @@
 import abc
 import os
+import typing
 import warnings
 
+from multiprocessing.pool import ThreadPool
+
+import attr
 import six
 
 from targets.errors import FileAlreadyExists
 from targets.utils.atomic import AtomicLocalFile
 
 
+if typing.TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Optional
+
+
+@attr.s(frozen=True)
+class FileStat(object):
+    path = attr.ib()  # type: str
+    is_dir = attr.ib(default=False)  # type: bool
+    size = attr.ib(default=None)  # type: Optional[int]
+    modification_time = attr.ib(default=None)  # type: Optional[datetime]
+
+
 @six.add_metaclass(abc.ABCMeta)
 class FileSystem(object):
     """
@@ -23,8 +40,13 @@ class FileSystem(object):
 
     name = None
     support_direct_access = False
+    # append_bytes() is supported (without rewriting of the existing data)
+    support_append = False
     _exist_after_write_consistent = True
 
+    # number of threads used by default implementation of exists_many/stat_many
+    bulk_parallelism = 10
+
     @classmethod
     def exist_after_write_consistent(cls):
         return cls._exist_after_write_consistent
@@ -38,6 +60,41 @@ class FileSystem(object):
         """
         pass
 
+    def exists_many(self, paths):
+        """
+        Return a dict ``path -> exists`` for all ``paths``.
+
+        Default implementation calls :py:meth:`exists` in a thread pool,
+        remote file systems can answer it from one prefix listing.
+        """
+        return dict(zip(paths, self._map_in_threads(self.exists, paths)))
+
+    def stat_many(self, paths):
+        """
+        Return a dict ``path -> FileStat`` for all ``paths``, ``None`` if path doesn't exist.
+
+        Default implementation knows only about existence of the path.
+        """
+        return self._stat_many_in_threads(paths)
+
+    def _stat_many_in_threads(self, paths):
+        paths = list(paths)
+        return {
+            path: FileStat(path=path) if exists else None
+            for path, exists in zip(paths, self._map_in_threads(self.exists, paths))
+        }
+
+    def _map_in_threads(self, func, items):
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        pool = ThreadPool(processes=min(self.bulk_parallelism, len(items)))
+        try:
+            return pool.map(func, items)
+        finally:
+            pool.close()
+            pool.join()
+
     @abc.abstractmethod
     def remove(self, path, recursive=True, skip_trash=True):
         """ Remove file or directory at location ``path``
@@ -154,6 +211,14 @@ class FileSystem(object):
     def open_write(self, path, mode="w"):
         return AtomicLocalFile(path, self, mode=mode)
 
+    def append_bytes(self, path, data):
+        """
+        Appends data to the end of the file at ``path``, creates the file if it doesn't exist.
+        """
+        raise NotImplementedError(
+            "append_bytes() not implemented on {0}".format(self.__class__.__name__)
+        )
+
     def download(self, path, location):
         raise NotImplementedError(
             "download() not implemented on {0}".format(self.__class__.__name__)
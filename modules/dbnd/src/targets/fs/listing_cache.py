@@ -0,0 +1,203 @@
+import bisect
+import logging
+import os
+import threading
+import time
+import weakref
+
+import six
+
+from targets.fs.file_system import FileStat
+
+
+logger = logging.getLogger(__name__)
+
+# hadoop/s3n style directory markers
+DIRECTORY_MARKER_SUFFIXES = ("_$folder$",)
+DEFAULT_LISTING_CACHE_TTL = 10
+# paths without a common directory this deep are checked one by one,
+# listing of a bucket root (or a top level "directory") can be huge
+MIN_LISTING_PREFIX_DEPTH = 1
+
+
+class PrefixListing(object):
+    """
+    All objects of one bucket (container) under the prefix, sorted by key.
+    Answers exists/stat/list queries for any key under the prefix.
+    """
+
+    def __init__(self, prefix, objects):
+        # objects: key -> (size, modification_time)
+        self.prefix = prefix
+        self.objects = objects
+        self.keys = sorted(objects)
+        self.created = time.time()
+
+    def covers(self, key):
+        return key.startswith(self.prefix)
+
+    def _has_prefix(self, prefix):
+        i = bisect.bisect_left(self.keys, prefix)
+        return i < len(self.keys) and self.keys[i].startswith(prefix)
+
+    def iter_keys(self, prefix):
+        for i in six.moves.range(bisect.bisect_left(self.keys, prefix), len(self.keys)):
+            key = self.keys[i]
+            if not key.startswith(prefix):
+                break
+            yield key
+
+    def is_dir(self, key):
+        dir_key = key if key.endswith("/") else key + "/"
+        if self._has_prefix(dir_key):
+            return True
+        return any(
+            key.rstrip("/") + suffix in self.objects
+            for suffix in DIRECTORY_MARKER_SUFFIXES
+        )
+
+    def stat(self, path, key):
+        if not key.strip("/"):
+            # root of the bucket
+            return FileStat(path=path, is_dir=True)
+        if key in self.objects and not key.endswith("/"):
+            size, modification_time = self.objects[key]
+            return FileStat(path=path, size=size, modification_time=modification_time)
+        if self.is_dir(key):
+            return FileStat(path=path, is_dir=True)
+        return None
+
+
+class PrefixListingCache(object):
+    """
+    Short living cache of prefix listings,
+    repeated queries under the same prefix are answered without remote calls.
+    Writes done through the file system invalidate affected listings.
+    """
+
+    def __init__(self, ttl=DEFAULT_LISTING_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._listings = {}  # bucket -> {prefix: PrefixListing}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # listings are valid only for the current process
+        return {"ttl": self.ttl}
+
+    def __setstate__(self, state):
+        self.__init__(ttl=state["ttl"])
+
+    def get(self, bucket, key):
+        if not self.ttl:
+            return None
+        now = time.time()
+        with self._lock:
+            found = None
+            for listing in list(self._listings.get(bucket, {}).values()):
+                if now - listing.created > self.ttl:
+                    del self._listings[bucket][listing.prefix]
+                    continue
+                if listing.covers(key) and (
+                    found is None or len(listing.prefix) > len(found.prefix)
+                ):
+                    found = listing
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return found
+
+    def put(self, bucket, listing):
+        if not self.ttl:
+            return
+        with self._lock:
+            self._listings.setdefault(bucket, {})[listing.prefix] = listing
+
+    def invalidate(self, bucket, key):
+        with self._lock:
+            listings = self._listings.get(bucket)
+            if not listings:
+                return
+            for prefix in list(listings):
+                # key is under the prefix, or key is a directory containing the prefix
+                if key.startswith(prefix) or prefix.startswith(key):
+                    del listings[prefix]
+
+    def clear(self):
+        with self._lock:
+            self._listings = {}
+
+
+# run -> {file system name -> PrefixListingCache}, released together with the run
+_run_listing_caches = weakref.WeakKeyDictionary()
+# used outside of a run
+_process_listing_caches = {}
+_listing_caches_lock = threading.Lock()
+
+
+def get_run_listing_cache(fs_name, ttl=DEFAULT_LISTING_CACHE_TTL):
+    # type: (str, float) -> PrefixListingCache
+    """
+    Listing cache of the file system for the current run,
+    listings are not shared between runs.
+    """
+    from dbnd._core.current import try_get_databand_run
+
+    run = try_get_databand_run()
+    with _listing_caches_lock:
+        if run is None:
+            caches = _process_listing_caches
+        else:
+            caches = _run_listing_caches.setdefault(run, {})
+        cache = caches.get(fs_name)
+        if cache is None:
+            cache = caches[fs_name] = PrefixListingCache(ttl=ttl)
+        return cache
+
+
+def common_dir_prefix(keys):
+    prefix = os.path.commonprefix(list(keys))
+    # we list by "directory", a partial file name is not a good prefix
+    return prefix[: prefix.rfind("/") + 1]
+
+
+def stat_many_by_listing(paths, path_to_bucket_and_key, list_prefix, cache, fallback):
+    """
+    Answers stat_many from one prefix listing per bucket.
+
+    :param path_to_bucket_and_key: path -> (bucket, key)
+    :param list_prefix: (bucket, prefix) -> PrefixListing, or None if there are too many objects
+    :param fallback: paths -> stat_many result, used when listing is not possible
+    """
+    result = {}
+    by_bucket = {}
+    for path in paths:
+        bucket, key = path_to_bucket_and_key(path)
+        by_bucket.setdefault(bucket, []).append((path, key))
+
+    for bucket, bucket_paths in six.iteritems(by_bucket):
+        not_listed = []
+        keys = [key for _, key in bucket_paths]
+        prefix = common_dir_prefix(keys)
+
+        listing = cache.get(bucket, prefix)
+        if (
+            listing is None
+            and len(bucket_paths) > 1
+            and prefix.count("/") >= MIN_LISTING_PREFIX_DEPTH
+        ):
+            listing = list_prefix(bucket, prefix)
+            if listing is not None:
+                cache.put(bucket, listing)
+
+        for path, key in bucket_paths:
+            if listing is not None and listing.covers(key):
+                result[path] = listing.stat(path, key)
+            else:
+                not_listed.append(path)
+        if not_listed:
+            result.update(fallback(not_listed))
+    return result
@@ -4,9 +4,12 @@ import logging
 import os
 import random
 import shutil
+import stat
+
+from datetime import datetime
 
 from targets.errors import FileAlreadyExists, MissingParentDirectory, NotADirectory
-from targets.fs.file_system import FileSystem
+from targets.fs.file_system import FileStat, FileSystem
 from targets.pipes.base import FileWrapper
 from targets.utils.atomic import AtomicLocalFile
 
@@ -23,6 +26,7 @@ class LocalFileSystem(FileSystem):
 
     name = "local"
     support_direct_access = True
+    support_append = True
 
     def copy(self, old_path, new_path, raise_if_exists=False):
         if raise_if_exists and os.path.exists(new_path):
@@ -38,6 +42,25 @@ class LocalFileSystem(FileSystem):
     def exists(self, path):
         return os.path.exists(path)
 
+    def exists_many(self, paths):
+        return {path: os.path.exists(path) for path in paths}
+
+    def stat_many(self, paths):
+        result = {}
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                result[path] = None
+                continue
+            result[path] = FileStat(
+                path=path,
+                is_dir=stat.S_ISDIR(st.st_mode),
+                size=st.st_size,
+                modification_time=datetime.fromtimestamp(st.st_mtime),
+            )
+        return result
+
     def mkdir(self, path, parents=True, raise_if_exists=False):
         if self.exists(path):
             if raise_if_exists:
@@ -125,3 +148,8 @@ class LocalFileSystem(FileSystem):
 
     def open_write(self, path, mode="w"):
         return AtomicLocalFile(path, fs=self, mode=mode)
+
+    def append_bytes(self, path, data):
+        self.mkdir_parent(path)
+        with open(path, "ab") as f:
+            f.write(data)
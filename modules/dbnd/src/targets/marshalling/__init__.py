@@ -1,13 +1,15 @@
 from __future__ import absolute_import
 
 import logging
+import sys
 import typing
 
-import numpy as np
-import pandas as pd
+from collections import OrderedDict
+
 import six
 
 from dbnd._core.errors import friendly_error
+from dbnd._core.utils.basics.lazy_module import set_lazy_attrs
 from targets.marshalling.file import (
     ObjJsonMarshaller,
     ObjPickleMarshaller,
@@ -16,19 +18,6 @@ from targets.marshalling.file import (
     StrMarshaller,
 )
 from targets.marshalling.marshaller_ctrl import MarshallerCtrl
-from targets.marshalling.numpy import NumpyArrayMarshaller, NumpyArrayPickleMarshaler
-from targets.marshalling.pandas import (
-    DataFrameDictToHdf5,
-    DataFrameToCsv,
-    DataFrameToFeather,
-    DataFrameToHdf5,
-    DataFrameToJson,
-    DataFrameToParquet,
-    DataFrameToPickle,
-    DataFrameToTable,
-    DataFrameToTsv,
-    DataFrameToExcel,
-)
 from targets.target_config import FileFormat
 from targets.types import DataList
 from targets.values import get_value_type_of_type
@@ -38,6 +27,25 @@ logger = logging.getLogger(__name__)
 
 MARSHALERS = {}
 
+# pandas/numpy marshallers are imported with their library
+set_lazy_attrs(
+    __name__,
+    {
+        "DataFrameDictToHdf5": "targets.marshalling.pandas:DataFrameDictToHdf5",
+        "DataFrameToCsv": "targets.marshalling.pandas:DataFrameToCsv",
+        "DataFrameToFeather": "targets.marshalling.pandas:DataFrameToFeather",
+        "DataFrameToHdf5": "targets.marshalling.pandas:DataFrameToHdf5",
+        "DataFrameToJson": "targets.marshalling.pandas:DataFrameToJson",
+        "DataFrameToParquet": "targets.marshalling.pandas:DataFrameToParquet",
+        "DataFrameToPickle": "targets.marshalling.pandas:DataFrameToPickle",
+        "DataFrameToTable": "targets.marshalling.pandas:DataFrameToTable",
+        "DataFrameToTsv": "targets.marshalling.pandas:DataFrameToTsv",
+        "DataFrameToExcel": "targets.marshalling.pandas:DataFrameToExcel",
+        "NumpyArrayMarshaller": "targets.marshalling.numpy:NumpyArrayMarshaller",
+        "NumpyArrayPickleMarshaler": "targets.marshalling.numpy:NumpyArrayPickleMarshaler",
+    },
+)
+
 
 def register_basic_data_marshallers():
     register_marshallers(
@@ -75,61 +83,106 @@ def register_basic_data_marshallers():
     for t in [typing.List[object], typing.List[str], DataList, DataList[str]]:
         MARSHALERS[t] = list_marshalers
 
-    try:
-        register_marshallers(
-            pd.DataFrame,
-            {
-                FileFormat.txt: DataFrameToCsv(),
-                FileFormat.csv: DataFrameToCsv(),
-                FileFormat.table: DataFrameToTable(),
-                FileFormat.parquet: DataFrameToParquet(),
-                FileFormat.feather: DataFrameToFeather(),
-                FileFormat.hdf5: DataFrameToHdf5(),
-                FileFormat.pickle: DataFrameToPickle(),
-                FileFormat.json: DataFrameToJson(),
-                FileFormat.tsv: DataFrameToTsv(),
-                FileFormat.excel: DataFrameToExcel(),
-            },
-        )
-        register_marshallers(
-            pd.Series,
-            {
-                FileFormat.csv: DataFrameToCsv(series=True),
-                FileFormat.table: DataFrameToTable(),
-                FileFormat.parquet: DataFrameToParquet(),
-                FileFormat.feather: DataFrameToFeather(),
-                FileFormat.hdf5: DataFrameToHdf5(),
-                FileFormat.pickle: DataFrameToPickle(),
-                FileFormat.json: DataFrameToJson(),
-            },
-        )
-        register_marshallers(
-            np.ndarray,
-            {
-                FileFormat.numpy: NumpyArrayMarshaller(),
-                FileFormat.pickle: NumpyArrayPickleMarshaler(),
-            },
-        )
-        register_marshallers(
-            typing.Dict[str, pd.DataFrame], {FileFormat.hdf5: DataFrameDictToHdf5()}
-        )
-    except ImportError:
-        pass
-
-    try:
-        from matplotlib import figure
-        from targets.marshalling.matplotlib import MatplotlibFigureMarshaller
-
-        register_marshallers(
-            figure.Figure,
-            {
-                FileFormat.png: MatplotlibFigureMarshaller(),
-                FileFormat.pdf: MatplotlibFigureMarshaller(),
-                FileFormat.pickle: ObjPickleMarshaller(),
-            },
-        )
-    except ImportError:
-        pass
+
+def _register_pandas_marshallers():
+    import pandas as pd
+
+    from targets.marshalling.pandas import (
+        DataFrameDictToHdf5,
+        DataFrameToCsv,
+        DataFrameToFeather,
+        DataFrameToHdf5,
+        DataFrameToJson,
+        DataFrameToParquet,
+        DataFrameToPickle,
+        DataFrameToTable,
+        DataFrameToTsv,
+        DataFrameToExcel,
+    )
+
+    _register_default_marshallers(
+        pd.DataFrame,
+        {
+            FileFormat.txt: DataFrameToCsv(),
+            FileFormat.csv: DataFrameToCsv(),
+            FileFormat.table: DataFrameToTable(),
+            FileFormat.parquet: DataFrameToParquet(),
+            FileFormat.feather: DataFrameToFeather(),
+            FileFormat.hdf5: DataFrameToHdf5(),
+            FileFormat.pickle: DataFrameToPickle(),
+            FileFormat.json: DataFrameToJson(),
+            FileFormat.tsv: DataFrameToTsv(),
+            FileFormat.excel: DataFrameToExcel(),
+        },
+    )
+    _register_default_marshallers(
+        pd.Series,
+        {
+            FileFormat.csv: DataFrameToCsv(series=True),
+            FileFormat.table: DataFrameToTable(),
+            FileFormat.parquet: DataFrameToParquet(),
+            FileFormat.feather: DataFrameToFeather(),
+            FileFormat.hdf5: DataFrameToHdf5(),
+            FileFormat.pickle: DataFrameToPickle(),
+            FileFormat.json: DataFrameToJson(),
+        },
+    )
+    _register_default_marshallers(
+        typing.Dict[str, pd.DataFrame], {FileFormat.hdf5: DataFrameDictToHdf5()}
+    )
+
+
+def _register_numpy_marshallers():
+    import numpy as np
+
+    from targets.marshalling.numpy import (
+        NumpyArrayMarshaller,
+        NumpyArrayPickleMarshaler,
+    )
+
+    _register_default_marshallers(
+        np.ndarray,
+        {
+            FileFormat.numpy: NumpyArrayMarshaller(),
+            FileFormat.pickle: NumpyArrayPickleMarshaler(),
+        },
+    )
+
+
+def _register_matplotlib_marshallers():
+    from matplotlib import figure
+    from targets.marshalling.matplotlib import MatplotlibFigureMarshaller
+
+    _register_default_marshallers(
+        figure.Figure,
+        {
+            FileFormat.png: MatplotlibFigureMarshaller(),
+            FileFormat.pdf: MatplotlibFigureMarshaller(),
+            FileFormat.pickle: ObjPickleMarshaller(),
+        },
+    )
+
+
+# library -> registration of its marshallers,
+# done once the library is imported, so we don't import it at `import dbnd`
+_PENDING_LIBRARIES = OrderedDict(
+    [
+        ("pandas", _register_pandas_marshallers),
+        ("numpy", _register_numpy_marshallers),
+        ("matplotlib", _register_matplotlib_marshallers),
+    ]
+)
+
+
+def register_imported_libraries_marshallers():
+    for library in list(_PENDING_LIBRARIES):
+        if library not in sys.modules:
+            continue
+        register = _PENDING_LIBRARIES.pop(library)
+        try:
+            register()
+        except ImportError as ex:
+            logger.debug("Failed to register %s marshallers: %s", library, ex)
 
 
 def _marshaller_options_message(value_type, value_options, object_options):
@@ -151,6 +204,7 @@ def _marshaller_options_message(value_type, value_options, object_options):
 
 def get_marshaller_ctrl(target, value_type, config=None):
     config = config or target.config
+    register_imported_libraries_marshallers()
 
     value_type = get_value_type_of_type(value_type, inline_value_type=True)
     marshaller_options = MARSHALERS.get(value_type.type, {})
@@ -194,6 +248,13 @@ def register_marshaller(value_type, file_format, marshaller_cls):
     MARSHALERS.setdefault(value_type, {})[file_format] = marshaller_cls
 
 
+def _register_default_marshallers(value_type, marshaller_dict):
+    # marshallers registered before the library was imported win
+    marshaller_value_type = MARSHALERS.setdefault(value_type, {})
+    for file_format, marshaller_cls in six.iteritems(marshaller_dict):
+        marshaller_value_type.setdefault(file_format, marshaller_cls)
+
+
 def register_marshallers(value_type, marshaller_dict):
     marshaller_value_type = MARSHALERS.setdefault(value_type, {})
     for file_format, marshaller_cls in six.iteritems(marshaller_dict):
@@ -14,6 +14,9 @@ class Marshaller(object):
     support_directory_direct_read = False
     support_multi_target_direct_read = False
     support_directory_direct_write = False
+    # can read (target_to_chunks) and write (chunks_to_target) data chunk by chunk
+    support_chunked_read = False
+    support_chunked_write = False
 
     clears_types_to_str = False
 
@@ -25,5 +28,11 @@ class Marshaller(object):
     def value_to_target(self, value, target, **kwargs):
         pass
 
+    def target_to_chunks(self, target, chunksize, **kwargs):
+        raise NotImplementedError()
+
+    def chunks_to_target(self, chunks, target, **kwargs):
+        raise NotImplementedError()
+
     def support_direct_access(self, target):
         return target.fs.support_direct_access
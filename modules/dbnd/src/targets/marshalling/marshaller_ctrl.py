@@ -15,6 +15,9 @@ class MarshallerCtrl(object):
     value_type = attr.ib()  # type: ValueType
 
     def load(self, **kwargs):
+        if kwargs.get("chunksize"):
+            return self.load_chunks(**kwargs)
+
         value = self._load(**kwargs)
         if isinstance(self.marshaller, StrMarshaller):
             value = self.value_type.parse_from_str(value)
@@ -75,7 +78,12 @@ class MarshallerCtrl(object):
 
         if isinstance(value, types.GeneratorType):
             if not isinstance(target, DirTarget):
-                raise friendly_error.targets.dump_generator_to_file(self)
+                if not m.support_chunked_write:
+                    raise friendly_error.targets.dump_generator_to_file(self)
+                # write all chunks into the same file
+                m.chunks_to_target(value, target=target, **kwargs)
+                target.mark_success()
+                return
             for value_partition in value:
                 m.value_to_target(
                     target=target.partition(), value=value_partition, **kwargs
@@ -91,6 +99,31 @@ class MarshallerCtrl(object):
         m.value_to_target(target=selected_target, value=value, **kwargs)
         target.mark_success()
 
+    def load_chunks(self, chunksize, **kwargs):
+        """
+        Lazy iterator over the data, one chunk (of up to `chunksize` rows) at a time,
+        partitions of the directory are read one after another
+        """
+        if not self.marshaller.support_chunked_read:
+            raise friendly_error.targets.chunked_read_not_supported(
+                self.marshaller, self.target
+            )
+        return self._iter_chunks(chunksize, **kwargs)
+
+    def _iter_chunks(self, chunksize, **kwargs):
+        from targets.dir_target import DirTarget
+        from targets.file_target import FileTarget
+
+        target = self.target
+        if isinstance(target, FileTarget) and not isinstance(target, DirTarget):
+            partitions = [target]
+        else:
+            partitions = target.list_partitions()
+
+        for t in partitions:
+            for chunk in self.marshaller.target_to_chunks(t, chunksize, **kwargs):
+                yield chunk
+
     def load_partitioned(self, **kwargs):
         for t in self.target.list_partitions():
             yield self.marshaller.target_to_value(t, **kwargs)
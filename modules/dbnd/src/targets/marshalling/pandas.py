@@ -13,7 +13,7 @@ from dbnd._core.errors import friendly_error
 from dbnd._core.utils.structures import combine_mappings
 from targets.fs import FileSystems
 from targets.marshalling.marshaller import Marshaller
-from targets.target_config import FileCompressions, FileFormat
+from targets.target_config import FileCompressions, FileFormat, get_compression_pipeline
 from targets.utils.performance import target_timeit
 
 
@@ -42,6 +42,13 @@ def _get_compression_args(target, compression_arg_name):
     return {compression_arg_name: compression}
 
 
+def _is_compressed_by_pipe(target):
+    # target.open() (de)compresses the files of the registered compressions itself
+    return not target.io_pipe and bool(
+        get_compression_pipeline(target.config.compression)
+    )
+
+
 def _data_frame_set_index(df, set_index):
     # our frame already has index equal to the one requested by user
     if df.index.name == set_index:
@@ -71,6 +78,9 @@ class _PandasMarshaller(Marshaller):
     support_cache = False
     disable_default_index = False
 
+    _chunks_read_mode = "r"
+    _chunks_write_mode = "w"
+
     def __init__(self, series=False):
         self.pandas_series = series
 
@@ -93,6 +103,56 @@ class _PandasMarshaller(Marshaller):
     def _pd_to(self, *args, **kwargs):
         pass
 
+    def _pd_read_chunks(self, path_or_buf, chunksize, **kwargs):
+        pass
+
+    def _pd_to_chunks(self, chunks, path_or_buf, **kwargs):
+        pass
+
+    def target_to_chunks(
+        self, target, chunksize, cache=True, no_copy_on_read=False, **kwargs
+    ):
+        set_index = kwargs.pop("set_index", None)
+        read_kwargs = _get_compression_args(target, self._compression_read_arg).copy()
+        read_kwargs.update(kwargs)
+        read_kwargs.pop("chunksize", None)
+
+        logger.info(
+            "Loading data frame from target='%s' by chunks of %s rows",
+            target,
+            chunksize,
+        )
+        if self.support_direct_access(target):
+            chunks = self._pd_read_chunks(target.path, chunksize, **read_kwargs)
+            for df in chunks:
+                yield _data_frame_set_index(df, set_index) if set_index else df
+        else:
+            with target.open(self._chunks_read_mode) as fp:
+                read_kwargs.pop(self._compression_read_arg, None)
+                chunks = self._pd_read_chunks(fp, chunksize, **read_kwargs)
+                for df in chunks:
+                    yield _data_frame_set_index(df, set_index) if set_index else df
+
+    def chunks_to_target(self, chunks, target, **kwargs):
+        target.mkdir_parent()
+        kwargs.pop("cache", None)
+        logger.info("Saving data frame chunks to '%s'", target)
+
+        def _validated_chunks():
+            for value in chunks:
+                if not isinstance(value, NDFrame):
+                    raise friendly_error.targets.failed_to_save_value__wrong_type(
+                        value, target, expected_type=NDFrame
+                    )
+                yield value
+
+        try:
+            # compression is done by the target pipe
+            with target.open(self._chunks_write_mode) as fp:
+                self._pd_to_chunks(_validated_chunks(), fp, **kwargs)
+        except Exception as ex:
+            raise friendly_error.failed_to_write_pandas(ex, target)
+
     @target_timeit
     def target_to_value(
         self, target, cache=True, no_copy_on_read=False, set_index=None, **kwargs
@@ -112,6 +172,8 @@ class _PandasMarshaller(Marshaller):
                 if self.support_direct_read(target):
                     df = self._pd_read(target.path, **read_kwargs)
                 else:
+                    if _is_compressed_by_pipe(target):
+                        read_kwargs.pop(self._compression_read_arg, None)
                     with target.open("r") as fp:
                         df = self._pd_read(fp, **read_kwargs)
 
@@ -175,6 +237,8 @@ class _PandasMarshaller(Marshaller):
             if self.support_direct_write(target):
                 return self._pd_to(value, target.path, **to_kwargs)
             else:
+                if _is_compressed_by_pipe(target):
+                    to_kwargs.pop(self._compression_write_arg, None)
                 with target.open("w") as fp:
                     return self._pd_to(value, fp, **to_kwargs)
         except Exception as ex:
@@ -183,6 +247,8 @@ class _PandasMarshaller(Marshaller):
 
 class DataFrameToCsv(_PandasMarshaller):
     file_format = FileFormat.csv
+    support_chunked_read = True
+    support_chunked_write = True
 
     disable_default_index = True
 
@@ -198,6 +264,24 @@ class DataFrameToCsv(_PandasMarshaller):
     def _pd_to(self, value, *args, **kwargs):
         return value.to_csv(*args, **kwargs)
 
+    def _pd_read_chunks(self, path_or_buf, chunksize, **kwargs):
+        reader = self._pd_read(path_or_buf, chunksize=chunksize, **kwargs)
+        try:
+            for df in reader:
+                yield df
+        finally:
+            reader.close()
+
+    def _pd_to_chunks(self, chunks, path_or_buf, **kwargs):
+        header = kwargs.pop("header", True)
+        for value in chunks:
+            to_kwargs = dict(kwargs)
+            if self.disable_default_index and _is_default_index(value):
+                to_kwargs.setdefault("index", False)
+            self._pd_to(value, path_or_buf, header=header, **to_kwargs)
+            # header is written only once, with the first chunk
+            header = False
+
 
 class DataFrameToJson(_PandasMarshaller):
     file_format = FileFormat.json
@@ -257,6 +341,59 @@ class DataFrameToParquet(_PandasMarshaller):
     def _pd_to(self, value, *args, **kwargs):
         value.to_parquet(*args, **kwargs)
 
+    support_chunked_read = True
+    support_chunked_write = True
+    _chunks_read_mode = "rb"
+    _chunks_write_mode = "wb"
+
+    def _pd_read_chunks(self, path_or_buf, chunksize, columns=None, **kwargs):
+        offset = 0
+        for df in self._read_parquet_chunks(path_or_buf, chunksize, columns=columns):
+            if isinstance(df.index, RangeIndex):
+                # continue the default index, like read_csv does
+                df.index = RangeIndex(offset, offset + len(df))
+            offset += len(df)
+            yield df
+
+    def _read_parquet_chunks(self, path_or_buf, chunksize, columns=None):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path_or_buf)
+        if hasattr(parquet_file, "iter_batches"):
+            for batch in parquet_file.iter_batches(
+                batch_size=chunksize, columns=columns
+            ):
+                yield pa.Table.from_batches([batch]).to_pandas()
+            return
+
+        # old pyarrow, we can read only by row groups
+        for i in six.moves.range(parquet_file.num_row_groups):
+            df = parquet_file.read_row_group(i, columns=columns).to_pandas()
+            for start in six.moves.range(0, len(df), chunksize):
+                yield df.iloc[start : start + chunksize]
+
+    def _pd_to_chunks(self, chunks, path_or_buf, index=None, **kwargs):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        kwargs.setdefault("compression", "snappy")
+        writer = None
+        try:
+            # every chunk is written as a row group
+            for value in chunks:
+                if writer is None:
+                    table = pa.Table.from_pandas(value, preserve_index=index)
+                    writer = pq.ParquetWriter(path_or_buf, table.schema, **kwargs)
+                else:
+                    table = pa.Table.from_pandas(
+                        value, schema=writer.schema, preserve_index=index
+                    )
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
     def support_direct_write(self, target):
         # TODO: decide based on pandas version and s3fs availability
         return (
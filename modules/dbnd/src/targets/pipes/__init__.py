@@ -4,8 +4,10 @@ import six
 
 from targets.pipes.base import IOPipeline, NopPipeline
 from targets.pipes.bzip2 import Bzip2Pipeline
+from targets.pipes.compression import Lz4Pipeline, XzPipeline, ZstdPipeline
 from targets.pipes.gzip import GzipPipeline
 from targets.pipes.text import MixedUnicodeBytesFormat, NewlinePipeline, TextPipeline
+from targets.target_config import FileCompressions, register_compression
 
 
 Nop = NopPipeline()
@@ -14,10 +16,24 @@ UTF8 = TextPipeline(encoding="utf8")
 SysNewLine = NewlinePipeline()
 Gzip = GzipPipeline()
 Bzip2 = Bzip2Pipeline()
+Xz = XzPipeline()
+Zstd = ZstdPipeline()
+Lz4 = Lz4Pipeline()
 MixedUnicodeBytes = MixedUnicodeBytesFormat()
 
 SeamlessFilters = [Nop, Text]
 
+register_compression(FileCompressions.gzip, pipeline=Gzip)
+register_compression(FileCompressions.bzip, pipeline=Bzip2)
+if XzPipeline.codec.available:
+    # without lzma (python 2) .xz files are read and written as is
+    register_compression(FileCompressions.xz, pipeline=Xz)
+# zstd and lz4 require optional packages
+if ZstdPipeline.codec.available:
+    register_compression(FileCompressions.zstd, pipeline=Zstd)
+if Lz4Pipeline.codec.available:
+    register_compression(FileCompressions.lz4, pipeline=Lz4)
+
 
 def is_seamless_pipe(target_filter):
     return not target_filter or target_filter in SeamlessFilters
@@ -1,17 +1,32 @@
-from targets.pipes.base import (
-    InputPipeProcessWrapper,
-    IOPipeline,
-    OutputPipeProcessWrapper,
-)
+from targets.pipes.base import InputPipeProcessWrapper, OutputPipeProcessWrapper
+from targets.pipes.compression import Bzip2Codec, CompressionPipeline
 
 
-class Bzip2Pipeline(IOPipeline):
+class Bzip2Pipeline(CompressionPipeline):
+    """
+    In-process bzip2, `use_subprocess=True` runs bzip2/bzcat commands instead
+    """
 
-    input = "bytes"
-    output = "bytes"
+    codec = Bzip2Codec()
+
+    def __init__(
+        self,
+        compression_level=None,
+        threads=None,
+        block_size=None,
+        use_subprocess=False,
+    ):
+        super(Bzip2Pipeline, self).__init__(
+            compression_level=compression_level, threads=threads, block_size=block_size
+        )
+        self.use_subprocess = use_subprocess
 
     def pipe_reader(self, input_pipe):
-        return InputPipeProcessWrapper(["bzcat"], input_pipe)
+        if self.use_subprocess:
+            return InputPipeProcessWrapper(["bzcat"], input_pipe)
+        return super(Bzip2Pipeline, self).pipe_reader(input_pipe)
 
     def pipe_writer(self, output_pipe):
-        return OutputPipeProcessWrapper(["bzip2"], output_pipe)
+        if self.use_subprocess:
+            return OutputPipeProcessWrapper(["bzip2"], output_pipe)
+        return super(Bzip2Pipeline, self).pipe_writer(output_pipe)
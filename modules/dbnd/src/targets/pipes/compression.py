@@ -0,0 +1,360 @@
+import bz2
+import io
+import zlib
+
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+from targets.pipes.base import IOPipeline
+
+
+try:
+    import lzma
+except ImportError:
+    # python 2
+    lzma = None
+
+# compressed bytes we read from the underlying file at once
+READ_BUFFER_SIZE = 1024 * 1024
+# uncompressed bytes we compress at once (multi-threaded writes)
+BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def _is_importable(module_name):
+    try:
+        __import__(module_name)
+        return True
+    except ImportError:
+        return False
+
+
+class CompressionCodec(object):
+    """
+    Streaming compression objects of one compression format.
+    `multi_stream` formats can be concatenated, so independent blocks
+    can be compressed in parallel.
+    """
+
+    name = None
+    multi_stream = True
+    available = True
+
+    def compressor(self, level=None, threads=None):
+        raise NotImplementedError()
+
+    def decompressor(self):
+        raise NotImplementedError()
+
+    def compress_block(self, data, level=None):
+        compressor = self.compressor(level)
+        return compressor.compress(data) + compressor.flush()
+
+
+class GzipCodec(CompressionCodec):
+    name = "gzip"
+
+    def compressor(self, level=None, threads=None):
+        if level is None:
+            level = zlib.Z_DEFAULT_COMPRESSION
+        # wbits=16+ writes gzip header and trailer
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def decompressor(self):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+
+class Bzip2Codec(CompressionCodec):
+    name = "bzip2"
+
+    def compressor(self, level=None, threads=None):
+        return bz2.BZ2Compressor(9 if level is None else level)
+
+    def decompressor(self):
+        return bz2.BZ2Decompressor()
+
+
+class XzCodec(CompressionCodec):
+    name = "xz"
+    available = lzma is not None
+
+    def compressor(self, level=None, threads=None):
+        return lzma.LZMACompressor(preset=level)
+
+    def decompressor(self):
+        return lzma.LZMADecompressor()
+
+
+class ZstdCodec(CompressionCodec):
+    """requires `zstandard` package"""
+
+    name = "zstd"
+    available = _is_importable("zstandard")
+    # zstandard compresses with its own threads
+    multi_stream = False
+
+    def compressor(self, level=None, threads=None):
+        import zstandard
+
+        return zstandard.ZstdCompressor(
+            level=3 if level is None else level, threads=threads or 0
+        ).compressobj()
+
+    def decompressor(self):
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj()
+
+
+class Lz4Codec(CompressionCodec):
+    """requires `lz4` package"""
+
+    name = "lz4"
+    available = _is_importable("lz4.frame")
+
+    def compressor(self, level=None, threads=None):
+        import lz4.frame
+
+        compressor = lz4.frame.LZ4FrameCompressor(compression_level=level or 0)
+        return _Lz4Compressor(compressor)
+
+    def decompressor(self):
+        import lz4.frame
+
+        return lz4.frame.LZ4FrameDecompressor()
+
+
+class _Lz4Compressor(object):
+    # lz4 frame compressor requires explicit begin()
+    def __init__(self, compressor):
+        self._compressor = compressor
+        self._header = compressor.begin()
+
+    def compress(self, data):
+        header, self._header = self._header, b""
+        return header + self._compressor.compress(data)
+
+    def flush(self):
+        header, self._header = self._header, b""
+        return header + self._compressor.flush()
+
+
+def _is_end_of_stream(decompressor):
+    eof = getattr(decompressor, "eof", None)
+    if eof is None:
+        # python2 zlib/bz2 objects don't have eof
+        return bool(getattr(decompressor, "unused_data", b""))
+    return eof
+
+
+class _DecompressingReader(io.RawIOBase):
+    """
+    Decompresses input_pipe in the current process, concatenated streams
+    (i.e. multi member gzip) are read one after another.
+    """
+
+    def __init__(self, codec, input_pipe, read_size=READ_BUFFER_SIZE):
+        super(_DecompressingReader, self).__init__()
+        self._codec = codec
+        self._input_pipe = input_pipe
+        self._read_size = read_size
+
+        self._decompressor = None
+        self._unused = b""
+        self._pending = b""
+        self._pos = 0
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while self._pos >= len(self._pending):
+            if self._eof:
+                return 0
+            self._fill()
+
+        size = min(len(b), len(self._pending) - self._pos)
+        b[:size] = self._pending[self._pos : self._pos + size]
+        self._pos += size
+        return size
+
+    def _fill(self):
+        data, self._unused = self._unused, b""
+        if not data:
+            data = self._input_pipe.read(self._read_size)
+        if not data:
+            if self._decompressor is not None and hasattr(self._decompressor, "eof"):
+                raise EOFError(
+                    "Compressed file ended before the end-of-stream marker was reached"
+                )
+            self._eof = True
+            return
+
+        if self._decompressor is None:
+            self._decompressor = self._codec.decompressor()
+        self._pending = self._decompressor.decompress(data)
+        self._pos = 0
+        if _is_end_of_stream(self._decompressor):
+            self._unused = getattr(self._decompressor, "unused_data", b"")
+            self._decompressor = None
+
+    def close(self):
+        if not self.closed:
+            self._input_pipe.close()
+        super(_DecompressingReader, self).close()
+
+
+class CompressedOutputWrapper(object):
+    """
+    Compresses the written data in the current process.
+    With `threads` > 1, blocks of `block_size` bytes are compressed in parallel
+    as independent streams (gzip members, bzip2/xz streams).
+    The output pipe is closed (committed) only on successful close.
+    """
+
+    def __init__(
+        self, codec, output_pipe, compression_level=None, threads=None, block_size=None
+    ):
+        self.closed = False
+        self._codec = codec
+        self._output_pipe = output_pipe
+        self._compression_level = compression_level
+        self._block_size = block_size or BLOCK_SIZE
+
+        self._pool = None
+        self._compressor = None
+        if threads and threads > 1 and codec.multi_stream:
+            self._pool = ThreadPool(threads)
+            self._max_in_flight = threads * 2
+            self._in_flight = deque()
+            self._block = bytearray()
+        else:
+            self._compressor = codec.compressor(compression_level, threads=threads)
+
+    def write(self, b):
+        if self._pool is None:
+            compressed = self._compressor.compress(b)
+            if compressed:
+                self._output_pipe.write(compressed)
+            return len(b)
+
+        self._block.extend(b)
+        if len(self._block) >= self._block_size:
+            self._submit_block()
+        return len(b)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def _submit_block(self):
+        block, self._block = bytes(self._block), bytearray()
+        self._in_flight.append(
+            self._pool.apply_async(
+                self._codec.compress_block, (block, self._compression_level)
+            )
+        )
+        while len(self._in_flight) >= self._max_in_flight:
+            self._output_pipe.write(self._in_flight.popleft().get())
+
+    def flush(self):
+        self._output_pipe.flush()
+
+    def _finish(self):
+        if self._pool is None:
+            self._output_pipe.write(self._compressor.flush())
+            return
+
+        try:
+            if self._block or not self._in_flight:
+                self._submit_block()
+            while self._in_flight:
+                self._output_pipe.write(self._in_flight.popleft().get())
+        finally:
+            self._pool.terminate()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self._finish()
+        self._output_pipe.close()
+
+    def abort(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self._pool is not None:
+            self._pool.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __del__(self):
+        if not self.closed:
+            self.abort()
+
+    def __getattr__(self, name):
+        if name == "_output_pipe":
+            raise AttributeError(name)
+        return getattr(self._output_pipe, name)
+
+    def readable(self):
+        return False
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+
+class CompressionPipeline(IOPipeline):
+    """
+    Compresses/decompresses the stream in the current process.
+
+    :param compression_level: codec specific level, codec default if None
+    :param threads: compress big writes with this number of threads
+    """
+
+    input = "bytes"
+    output = "bytes"
+
+    codec = None  # type: CompressionCodec
+
+    def __init__(self, compression_level=None, threads=None, block_size=None):
+        self.compression_level = compression_level
+        self.threads = threads
+        self.block_size = block_size
+
+    def pipe_reader(self, input_pipe):
+        return io.BufferedReader(
+            _DecompressingReader(self.codec, input_pipe), READ_BUFFER_SIZE
+        )
+
+    def pipe_writer(self, output_pipe):
+        return CompressedOutputWrapper(
+            self.codec,
+            output_pipe,
+            compression_level=self.compression_level,
+            threads=self.threads,
+            block_size=self.block_size,
+        )
+
+
+class XzPipeline(CompressionPipeline):
+    codec = XzCodec()
+
+
+class ZstdPipeline(CompressionPipeline):
+    codec = ZstdCodec()
+
+
+class Lz4Pipeline(CompressionPipeline):
+    codec = Lz4Codec()
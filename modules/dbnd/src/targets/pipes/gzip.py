@@ -1,23 +1,35 @@
-from targets.pipes.base import (
-    InputPipeProcessWrapper,
-    IOPipeline,
-    OutputPipeProcessWrapper,
-)
+from targets.pipes.base import InputPipeProcessWrapper, OutputPipeProcessWrapper
+from targets.pipes.compression import CompressionPipeline, GzipCodec
 
 
-class GzipPipeline(IOPipeline):
+class GzipPipeline(CompressionPipeline):
+    """
+    In-process gzip, `use_subprocess=True` runs gzip/gunzip commands instead
+    """
 
-    input = "bytes"
-    output = "bytes"
+    codec = GzipCodec()
 
-    def __init__(self, compression_level=None):
-        self.compression_level = compression_level
+    def __init__(
+        self,
+        compression_level=None,
+        threads=None,
+        block_size=None,
+        use_subprocess=False,
+    ):
+        super(GzipPipeline, self).__init__(
+            compression_level=compression_level, threads=threads, block_size=block_size
+        )
+        self.use_subprocess = use_subprocess
 
     def pipe_reader(self, input_pipe):
-        return InputPipeProcessWrapper(["gunzip"], input_pipe)
+        if self.use_subprocess:
+            return InputPipeProcessWrapper(["gunzip"], input_pipe)
+        return super(GzipPipeline, self).pipe_reader(input_pipe)
 
     def pipe_writer(self, output_pipe):
-        args = ["gzip"]
-        if self.compression_level is not None:
-            args.append("-" + str(int(self.compression_level)))
-        return OutputPipeProcessWrapper(args, output_pipe)
+        if self.use_subprocess:
+            args = ["gzip"]
+            if self.compression_level is not None:
+                args.append("-" + str(int(self.compression_level)))
+            return OutputPipeProcessWrapper(args, output_pipe)
+        return super(GzipPipeline, self).pipe_writer(output_pipe)
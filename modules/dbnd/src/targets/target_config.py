@@ -17,6 +17,8 @@ class FileCompressions(object):
     zip = "zip"
     xz = "xz"
     snappy = "snappy"
+    zstd = "zstd"
+    lz4 = "lz4"
 
 
 class FileFormat(object):
@@ -62,6 +64,9 @@ class _FileExtensionMap(object):
         # default fallback
         return ".%s" % name
 
+    def known_name(self, name):
+        return name in self._name_to_ext
+
     def known_ext(self, name):
         return name in self._ext_to_name
 
@@ -78,8 +83,21 @@ def register_file_extension(name, extra_extensions=None):
     return name
 
 
-def register_compression(name, ext=None):
-    KNOWN_COMPRESSIONS.register_extension(name, ext)
+_COMPRESSION_PIPELINES = {}
+
+
+def register_compression(name, ext=None, pipeline=None):
+    """
+    :param pipeline: IOPipeline used by FileTarget to (de)compress files of this compression
+    """
+    if ext or not KNOWN_COMPRESSIONS.known_name(name):
+        KNOWN_COMPRESSIONS.register_extension(name, ext)
+    if pipeline is not None:
+        _COMPRESSION_PIPELINES[name] = pipeline
+
+
+def get_compression_pipeline(name):
+    return _COMPRESSION_PIPELINES.get(name)
 
 
 register_compression(FileCompressions.gzip, "gz")
@@ -87,6 +105,8 @@ register_compression(FileCompressions.bzip, "bz2")
 register_compression(FileCompressions.zip)
 register_compression(FileCompressions.xz)
 register_compression(FileCompressions.snappy)
+register_compression(FileCompressions.zstd, ["zst", "zstd"])
+register_compression(FileCompressions.lz4)
 
 register_file_extension(FileFormat.csv)
 register_file_extension(FileFormat.txt, ["txt", "py"])
@@ -1,4 +1,3 @@
-from targets.values import numpy_values, pandas_values
 from targets.values.builtins_values import (
     BoolValueType,
     CallableValueType,
@@ -10,7 +9,7 @@ from targets.values.builtins_values import (
     ValueType,
 )
 from targets.values.datetime_value import DateTimeValueType, DateValueType
-from targets.values.registry import ValueTypeRegistry
+from targets.values.registry import LibraryValueTypes, ValueTypeRegistry
 from targets.values.structure import (
     DictValueType,
     ListValueType,
@@ -28,6 +27,28 @@ from targets.values.value_type import InlineValueType
 from targets.values.version_value import VersionValueType
 
 
+def _pandas_value_types():
+    from targets.values import pandas_values
+
+    return [
+        pandas_values.DataFrameValueType(),
+        pandas_values.PandasSeriesValueType(),
+        pandas_values.DataFramesDictValueType(),
+    ]
+
+
+def _numpy_value_types():
+    from targets.values.numpy_values import NumpyArrayValueType
+
+    return [NumpyArrayValueType()]
+
+
+def _matplotlib_value_types():
+    from targets.values.matplotlib_values import MatplotlibFigureValueType
+
+    return [MatplotlibFigureValueType()]
+
+
 # Note: order matters. Examples:
 # isinstance(True, int) == True, so it's important to have bool check before int
 # isinstance(datetime.datetime.utc(), date) == True
@@ -37,11 +58,9 @@ known_values = [
     BoolValueType(),
     IntValueType(),
     FloatValueType(),
-    # data
-    pandas_values.DataFrameValueType(),
-    pandas_values.PandasSeriesValueType(),
-    pandas_values.DataFramesDictValueType(),
-    numpy_values.NumpyArrayValueType(),
+    # data, registered once the library is imported
+    LibraryValueTypes("pandas", _pandas_value_types),
+    LibraryValueTypes("numpy", _numpy_value_types),
     # date/time
     DateValueType(),
     DateTimeValueType(),
@@ -62,14 +81,8 @@ known_values = [
     VersionValueType(),
     StrValueType(),
     NullableStrValueType(),
+    LibraryValueTypes("matplotlib", _matplotlib_value_types),
 ]
-try:
-    import matplotlib
-    from targets.values.matplotlib_values import MatplotlibFigureValueType
-
-    known_values.append(MatplotlibFigureValueType())
-except ImportError:
-    pass
 
 # OBJECT VALUE is always the last
 known_values.append(ObjectValueType())
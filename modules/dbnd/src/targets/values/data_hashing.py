@@ -0,0 +1,342 @@
+"""
+Hashing of data values (data frames, arrays) for value meta and signatures.
+
+Contiguous buffers are hashed in place (no pickling, no copies). The hash
+algorithm is fixed (md5), so all the processes of a run get the same hash of
+the same data. Big values can be hashed by a fingerprint:
+shape, dtypes and a fixed number of row blocks spread over the value.
+"""
+import hashlib
+import logging
+import sys
+import threading
+import weakref
+
+from collections import OrderedDict
+
+from dbnd._vendor import fast_hasher
+
+
+logger = logging.getLogger(__name__)
+
+
+class HashMode(object):
+    full = "full"
+    fingerprint = "fingerprint"
+    # full for small values, fingerprint for values above the size threshold
+    auto = "auto"
+
+    @classmethod
+    def all(cls):
+        return [cls.full, cls.fingerprint, cls.auto]
+
+
+# fingerprint: number of row blocks and rows in block
+FINGERPRINT_BLOCKS = 16
+FINGERPRINT_BLOCK_ROWS = 1024
+# cheap fingerprint used to validate memoized hashes
+_VERSION_BLOCKS = 4
+_VERSION_BLOCK_ROWS = 8
+
+
+def _new_hash():
+    # don't depend on optional libraries, the hash is a part of task signatures
+    return hashlib.md5()
+
+
+def _update_header(h, *args):
+    h.update(repr(args).encode("utf-8"))
+
+
+def _update_objects(h, series_or_index):
+    from pandas.core.util.hashing import hash_pandas_object
+
+    try:
+        hashed = hash_pandas_object(series_or_index, index=False).values
+    except TypeError:
+        # unhashable python objects (lists, dicts) are hashed by pickle,
+        # fast_hasher.hash() memoizes by id, that's wrong for a temporary list
+        _update_header(h, "pickle", len(series_or_index))
+        hasher = fast_hasher.NumpyHasher(hash_name="md5")
+        h.update(hasher.hash(series_or_index.tolist()).encode("utf-8"))
+        return
+    _update_ndarray(h, hashed)
+
+
+def _update_ndarray(h, arr):
+    import numpy as np
+
+    if arr.dtype.hasobject:
+        import pandas as pd
+
+        _update_header(h, arr.dtype.str, arr.shape)
+        _update_objects(h, pd.Series(arr.ravel()))
+        return
+    _update_header(h, arr.dtype.str, arr.shape)
+    # copies only non contiguous arrays
+    h.update(np.ascontiguousarray(arr).reshape(-1).view(np.uint8))
+
+
+def _row_blocks(rows, blocks, block_rows):
+    if rows <= blocks * block_rows:
+        return [(0, rows)]
+    step = (rows - block_rows) // (blocks - 1)
+    return [(i * step, i * step + block_rows) for i in range(blocks)]
+
+
+class DataHasher(object):
+    """
+    Hashes values of one type, registered with `register_data_hasher`
+    """
+
+    def size_of(self, value):
+        # type: (...) -> int
+        return 0
+
+    def rows(self, value):
+        return len(value)
+
+    def update(self, h, value):
+        raise NotImplementedError()
+
+    def update_fingerprint(self, h, value, blocks, block_rows):
+        rows = self.rows(value)
+        _update_header(h, "fingerprint", rows, blocks, block_rows)
+        for start, end in _row_blocks(rows, blocks, block_rows):
+            self.update(h, value[start:end])
+
+    # full hash of immutable values can be memoized by object id
+    immutable = False
+
+    def version(self, value):
+        """Cheap value to validate memoized fingerprint of the same object"""
+        h = _new_hash()
+        self.update_fingerprint(h, value, _VERSION_BLOCKS, _VERSION_BLOCK_ROWS)
+        return h.hexdigest()
+
+
+class NumpyArrayHasher(DataHasher):
+    def size_of(self, value):
+        return value.nbytes
+
+    def rows(self, value):
+        return value.shape[0] if value.ndim else 1
+
+    def update(self, h, value):
+        _update_ndarray(h, value)
+
+    def update_fingerprint(self, h, value, blocks, block_rows):
+        if not value.ndim:
+            return self.update(h, value)
+        _update_header(h, value.dtype.str, value.shape)
+        super(NumpyArrayHasher, self).update_fingerprint(h, value, blocks, block_rows)
+
+
+class PandasHasher(DataHasher):
+    def size_of(self, value):
+        usage = value.memory_usage(index=True, deep=False)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+
+    def _update_index(self, h, index):
+        import pandas as pd
+
+        if isinstance(index, pd.RangeIndex):
+            step = index[1] - index[0] if len(index) > 1 else 1
+            _update_header(h, "range", index[0] if len(index) else 0, len(index), step)
+        else:
+            self._update_values(h, index)
+
+    def _update_values(self, h, series_or_index):
+        import numpy as np
+
+        values = series_or_index.values
+        if isinstance(values, np.ndarray) and not values.dtype.hasobject:
+            _update_ndarray(h, values)
+        else:
+            # categorical, extension arrays, python objects
+            _update_header(h, str(series_or_index.dtype))
+            _update_objects(h, series_or_index)
+
+    def update(self, h, value):
+        import pandas as pd
+
+        self._update_index(h, value.index)
+        if isinstance(value, pd.Series):
+            _update_header(h, value.name)
+            self._update_values(h, value)
+            return
+
+        _update_header(h, [str(c) for c in value.columns])
+        for i in range(value.shape[1]):
+            self._update_values(h, value.iloc[:, i])
+
+    def update_fingerprint(self, h, value, blocks, block_rows):
+        rows = len(value)
+        _update_header(h, "fingerprint", rows, blocks, block_rows)
+        for start, end in _row_blocks(rows, blocks, block_rows):
+            self.update(h, value.iloc[start:end])
+
+
+class ArrowHasher(DataHasher):
+    """pyarrow Array, ChunkedArray, RecordBatch and Table"""
+
+    immutable = True
+
+    def size_of(self, value):
+        return value.nbytes
+
+    def update(self, h, value):
+        schema = value.schema if hasattr(value, "schema") else value.type
+        _update_header(h, str(schema), len(value))
+        columns = value.columns if hasattr(value, "columns") else [value]
+        for column in columns:
+            chunks = getattr(column, "chunks", [column])
+            for chunk in chunks:
+                _update_header(h, chunk.offset, len(chunk))
+                for buf in chunk.buffers():
+                    if buf is not None:
+                        h.update(buf)
+
+    def version(self, value):
+        # arrow data is immutable
+        return None
+
+
+_DATA_HASHERS = []  # type: list of (type, DataHasher)
+# library -> registration of its hashers, done once the library is imported
+_PENDING_LIBRARIES = OrderedDict()
+
+
+def register_data_hasher(type_, hasher):
+    """Hashers registered later take precedence"""
+    _DATA_HASHERS.insert(0, (type_, hasher))
+
+
+def _register_numpy():
+    import numpy as np
+
+    register_data_hasher(np.ndarray, NumpyArrayHasher())
+
+
+def _register_pandas():
+    import pandas as pd
+
+    register_data_hasher((pd.DataFrame, pd.Series), PandasHasher())
+
+
+def _register_arrow():
+    import pyarrow as pa
+
+    arrow_types = tuple(
+        getattr(pa, name)
+        for name in ("Array", "ChunkedArray", "RecordBatch", "Table")
+        if hasattr(pa, name)
+    )
+    register_data_hasher(arrow_types, ArrowHasher())
+
+
+_PENDING_LIBRARIES["numpy"] = _register_numpy
+_PENDING_LIBRARIES["pandas"] = _register_pandas
+_PENDING_LIBRARIES["pyarrow"] = _register_arrow
+
+
+def _find_data_hasher(value):
+    # we don't import libraries just to check the type of the value
+    for library in list(_PENDING_LIBRARIES):
+        if library in sys.modules:
+            register = _PENDING_LIBRARIES.pop(library)
+            try:
+                register()
+            except Exception as ex:
+                logger.debug("Failed to register %s data hasher: %s", library, ex)
+
+    for type_, hasher in _DATA_HASHERS:
+        if isinstance(value, type_):
+            return hasher
+    return None
+
+
+class _HashMemo(object):
+    """
+    Memoized hashes by object id, an entry is valid while the object is alive
+    and its version (cheap fingerprint) is the same.
+    The version can't catch every in place change, so full hashes
+    are memoized only for immutable values.
+    """
+
+    def __init__(self, max_size=1000):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (id, mode) -> (ref, version, hash)
+
+    def get(self, value, mode, version):
+        key = (id(value), mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            ref, entry_version, value_hash = entry
+            if ref() is not value or entry_version != version:
+                del self._entries[key]
+                return None
+            return value_hash
+
+    def put(self, value, mode, version, value_hash):
+        key = (id(value), mode)
+        try:
+            ref = weakref.ref(value, lambda _: self._remove(key))
+        except TypeError:
+            # can't track objects without weak references
+            return
+        with self._lock:
+            self._entries[key] = (ref, version, value_hash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _remove(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_HASH_MEMO = _HashMemo()
+
+
+def data_hash(value, mode=HashMode.full, fingerprint_above_bytes=None):
+    # type: (...) -> str
+    """
+    Hash of data value. Values without registered hasher are hashed by pickle.
+
+    :param mode: HashMode, fingerprint is not a content hash, don't use it for signatures
+    :param fingerprint_above_bytes: size threshold for HashMode.auto
+    """
+    hasher = _find_data_hasher(value)
+    if hasher is None:
+        return fast_hasher.hash(value)
+
+    if mode == HashMode.auto:
+        if fingerprint_above_bytes and hasher.size_of(value) > fingerprint_above_bytes:
+            mode = HashMode.fingerprint
+        else:
+            mode = HashMode.full
+
+    memoize = mode == HashMode.fingerprint or hasher.immutable
+    if memoize:
+        version = hasher.version(value)
+        value_hash = _HASH_MEMO.get(value, mode, version)
+        if value_hash is not None:
+            return value_hash
+
+    h = _new_hash()
+    _update_header(h, type(value).__name__)
+    if mode == HashMode.fingerprint:
+        hasher.update_fingerprint(h, value, FINGERPRINT_BLOCKS, FINGERPRINT_BLOCK_ROWS)
+    else:
+        hasher.update(h, value)
+    value_hash = h.hexdigest()
+    if memoize:
+        _HASH_MEMO.put(value, mode, version, value_hash)
+    return value_hash
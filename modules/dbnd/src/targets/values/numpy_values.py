@@ -2,8 +2,8 @@ from __future__ import absolute_import
 
 import numpy
 
-from dbnd._vendor import fast_hasher
 from targets.values.builtins_values import DataValueType
+from targets.values.data_hashing import data_hash
 
 
 class NumpyArrayValueType(DataValueType):
@@ -12,7 +12,7 @@ class NumpyArrayValueType(DataValueType):
     support_merge = True
 
     def to_signature(self, x):
-        return fast_hasher.hash(x)
+        return data_hash(x)
 
     def merge_values(self, *values, **kwargs):
         import numpy as np
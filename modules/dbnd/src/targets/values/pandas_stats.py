@@ -0,0 +1,168 @@
+from __future__ import absolute_import
+
+import logging
+import math
+import random
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+from pandas.core.util.hashing import hash_pandas_object
+
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (25, 50, 75)
+
+# HyperLogLog precision: 2**14 registers, ~0.8% standard error
+_HLL_PRECISION = 14
+
+
+def hll_distinct_count(hashes, precision=_HLL_PRECISION):
+    """
+    HyperLogLog estimate of the number of distinct 64bit hashes
+    """
+    if not len(hashes):
+        return 0
+
+    hashes = np.asarray(hashes, dtype=np.uint64)
+    m = 1 << precision
+    register = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    # rank = position of the first set bit of the remaining bits,
+    # 32 bits are enough for any realistic cardinality and are exact in float64
+    rest = ((hashes << np.uint64(precision)) >> np.uint64(32)).astype(np.float64)
+    rank = np.where(rest > 0, 33 - np.frexp(rest)[1], 33)
+
+    registers = np.zeros(m, dtype=np.int64)
+    ranks = pd.Series(rank).groupby(register).max()
+    registers[ranks.index.values] = ranks.values
+
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.power(2.0, -registers))
+    zeros = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and zeros:
+        # small cardinality correction (linear counting)
+        estimate = m * math.log(float(m) / zeros)
+    return int(round(estimate))
+
+
+def _sample_rows(df, max_rows):
+    if not max_rows or len(df) <= max_rows:
+        return df
+    rows = sorted(random.Random(0).sample(range(len(df)), max_rows))
+    return df.take(rows)
+
+
+def _to_float(value):
+    value = float(value)
+    if math.isnan(value) or math.isinf(value):
+        return None
+    return value
+
+
+def _numeric_stats(df, positions, bins):
+    """
+    Stats of all numeric columns, in one pass over 2d array
+    """
+    columns = df.columns[positions]
+    values = df.iloc[:, positions].values.astype(np.float64)
+    finite = np.isfinite(values)
+
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        # all-nan columns produce warnings and nan results
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        mins = np.nanmin(values, axis=0)
+        maxs = np.nanmax(values, axis=0)
+        means = np.nanmean(values, axis=0)
+        stds = np.nanstd(values, axis=0, ddof=1)
+        quantiles = np.nanpercentile(values, QUANTILES, axis=0)
+
+        # fixed-bin histograms of all the columns with a single bincount
+        hist_min = np.nanmin(np.where(finite, values, np.nan), axis=0)
+        hist_max = np.nanmax(np.where(finite, values, np.nan), axis=0)
+        width = hist_max - hist_min
+        width[~(width > 0)] = 1.0
+        bin_index = np.floor((values - hist_min) / width * bins)
+    bin_index = np.clip(np.nan_to_num(bin_index), 0, bins - 1).astype(np.int64)
+    bin_index += np.arange(len(columns), dtype=np.int64) * bins
+    counts = np.bincount(bin_index[finite], minlength=len(columns) * bins).reshape(
+        len(columns), bins
+    )
+    edges = hist_min[:, None] + width[:, None] * np.arange(bins + 1) / float(bins)
+
+    stats = {}
+    for i, column in enumerate(columns):
+        column_stats = {
+            "min": _to_float(mins[i]),
+            "max": _to_float(maxs[i]),
+            "mean": _to_float(means[i]),
+            "std": _to_float(stds[i]),
+            "quantiles": {
+                "%s%%" % q: _to_float(quantiles[j, i]) for j, q in enumerate(QUANTILES)
+            },
+        }
+        if np.any(finite[:, i]):
+            column_stats["histogram"] = {
+                "bin_edges": [float(e) for e in edges[i]],
+                "counts": [int(c) for c in counts[i]],
+            }
+        stats[column] = column_stats
+    return stats
+
+
+def calc_data_frame_stats(df, max_rows=None, bins=20):
+    # type: (pd.DataFrame, int, int) -> dict
+    """
+    Per column stats: null count, approximate distinct count,
+    and for numeric columns min/max/mean/std, quantiles and a histogram.
+    Frames bigger than `max_rows` rows are profiled by a sample of `max_rows` rows.
+    """
+    if isinstance(df, pd.Series):
+        df = df.to_frame()
+
+    rows = len(df)
+    sample = _sample_rows(df, max_rows)
+    sample_rows = len(sample)
+    if sample_rows < rows:
+        logger.info(
+            "Calculating stats of %s rows sample out of %s rows", sample_rows, rows
+        )
+
+    null_counts = sample.isnull().sum()
+    columns_stats = {}
+    numeric_positions = []
+    for i, column in enumerate(sample.columns):
+        series = sample.iloc[:, i]
+        nulls = int(null_counts.iloc[i])
+        columns_stats[column] = {
+            "type": str(series.dtype),
+            "count": sample_rows - nulls,
+            "null_count": nulls,
+        }
+        try:
+            columns_stats[column]["distinct_count"] = hll_distinct_count(
+                hash_pandas_object(series.dropna(), index=False).values
+            )
+        except TypeError:
+            # unhashable values (lists, dicts) in an object column
+            logger.debug("Can't calculate distinct count of column %s", column)
+        if is_bool_dtype(series.dtype):
+            continue
+        if is_numeric_dtype(series.dtype):
+            numeric_positions.append(i)
+        elif is_datetime64_any_dtype(series.dtype) and sample_rows > nulls:
+            columns_stats[column].update(
+                {"min": str(series.min()), "max": str(series.max())}
+            )
+
+    if numeric_positions and sample_rows:
+        for column, stats in _numeric_stats(sample, numeric_positions, bins).items():
+            columns_stats[column].update(stats)
+
+    return {
+        "rows": rows,
+        "sampled_rows": sample_rows if sample_rows < rows else None,
+        "columns": columns_stats,
+    }
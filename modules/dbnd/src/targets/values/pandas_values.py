@@ -7,13 +7,13 @@ from typing import Dict, Optional
 import pandas as pd
 import six
 
-from pandas.core.util.hashing import hash_pandas_object
-
 from dbnd._core.errors import friendly_error
-from dbnd._vendor import fast_hasher
+from targets.config import get_value_hash_config, get_value_stats_config
 from targets.target_config import FileFormat
 from targets.value_meta import ValueMeta, ValueMetaConf
 from targets.values.builtins_values import DataValueType
+from targets.values.data_hashing import data_hash
+from targets.values.pandas_stats import calc_data_frame_stats
 from targets.values.structure import DictValueType
 from targets.values.value_type import _isinstances
 
@@ -27,7 +27,7 @@ class DataFrameValueType(DataValueType):
 
     def to_signature(self, x):
         shape = "[%s]" % (",".join(map(str, x.shape)))
-        return "%s:%s" % (shape, fast_hasher.hash(x))
+        return "%s:%s" % (shape, data_hash(x))
 
     def to_preview(self, df, preview_size):  # type: (pd.DataFrame, int) -> str
         return df.to_string(index=False, max_rows=20, max_cols=1000)[:preview_size]
@@ -48,20 +48,26 @@ class DataFrameValueType(DataValueType):
         if meta_conf.log_size:
             data_schema["size"] = int(value.size)
 
+        if meta_conf.log_stats:
+            max_rows, bins = get_value_stats_config()
+            data_schema["stats"] = calc_data_frame_stats(
+                value, max_rows=max_rows, bins=bins
+            )
+
         if meta_conf.log_preview:
             value_preview = self.to_preview(
                 value, preview_size=meta_conf.get_preview_size()
             )
-            data_hash = fast_hasher.hash(hash_pandas_object(value, index=True).values)
+            value_hash = data_hash(value, *get_value_hash_config())
         else:
             value_preview = None
-            data_hash = None
+            value_hash = None
 
         return ValueMeta(
             value_preview=value_preview,
             data_dimensions=value.shape,
             data_schema=data_schema,
-            data_hash=data_hash,
+            data_hash=value_hash,
         )
 
     def merge_values(self, *values, **kwargs):
@@ -2,6 +2,8 @@ import inspect
 import itertools
 import logging
 import re
+import sys
+import threading
 import typing
 
 from typing import Optional
@@ -20,25 +22,91 @@ def f_name(f):
 logger = logging.getLogger(__name__)
 
 
+class LibraryValueTypes(object):
+    """
+    Value types of an optional library (pandas, numpy, ..).
+    They are registered once the library is imported (by user code or by dbnd),
+    so `import dbnd` doesn't import the library.
+    """
+
+    def __init__(self, library, load_value_types):
+        self.library = library
+        # () -> List[ValueType], imports the library
+        self.load_value_types = load_value_types
+        self.value_types = None
+
+    def load(self):
+        try:
+            self.value_types = list(self.load_value_types())
+        except ImportError:
+            self.value_types = []
+        return self.value_types
+
+
 class ValueTypeRegistry(object):
     def __init__(self, known_value_types):
         self.value_types = []
         self.discoverable_value_types = []
         self.default = DefaultObjectValueType()
 
+        # value types and LibraryValueTypes in the order of resolution
+        self._known_value_types = []
+        self._pending_libraries = []
+        self._lock = threading.RLock()
+
         # now for every parameter we also have text representation of the type
         # will be used for annotations
         self.type_str_to_parameter = {}
         for value_type in known_value_types:
-            self.register_value_type(value_type)
+            if isinstance(value_type, LibraryValueTypes):
+                self._known_value_types.append(value_type)
+                self._pending_libraries.append(value_type)
+            else:
+                self.register_value_type(value_type)
 
         self._type_handler_from_type = TypeHandlerFromType(self)
         self._type_handler_from_type_str = TypeHandlerFromDocAnnotation(self)
 
+    def load_imported_libraries(self, force=False):
+        """
+        Registers value types of libraries that are imported already,
+        with `force` imports all the libraries.
+        """
+        if not self._pending_libraries:
+            return False
+        with self._lock:
+            loaded = [
+                lib
+                for lib in self._pending_libraries
+                if force or lib.library in sys.modules
+            ]
+            if not loaded:
+                return False
+            for lib in loaded:
+                self._pending_libraries.remove(lib)
+                for value_type in lib.load():
+                    self._register_value_type_str(value_type)
+
+            # library types keep their position, i.e. before ObjectValueType
+            value_types = []
+            for known in self._known_value_types:
+                if isinstance(known, LibraryValueTypes):
+                    value_types.extend(known.value_types or [])
+                else:
+                    value_types.append(known)
+            self.value_types = value_types
+            self.discoverable_value_types = [v for v in value_types if v.discoverable]
+        return True
+
     def register_value_type(self, value_type):
+        self._known_value_types.append(value_type)
         self.value_types.append(value_type)
         if value_type.discoverable:
             self.discoverable_value_types.append(value_type)
+        self._register_value_type_str(value_type)
+        return value_type
+
+    def _register_value_type_str(self, value_type):
         try:
             # for t in [value_type.type]:
 
@@ -56,12 +124,12 @@ class ValueTypeRegistry(object):
                     self.type_str_to_parameter[t] = value_type
         except Exception as ex:
             raise Exception("Failed to process %s: %s" % (value_type, ex))
-        return value_type
 
     def get_value_type_of_obj(self, value, default=None):
         # do we want to automatically parse str_list?
         # right now we do that, but as for obj_list
         # we can keep deterministic conversion only
+        self.load_imported_libraries()
 
         for item in self.discoverable_value_types:
             if item.is_type_of(value):
@@ -73,15 +141,26 @@ class ValueTypeRegistry(object):
             return type_
         elif isinstance(type_, type) and issubclass(type_, ValueType):
             return type_()
+        self.load_imported_libraries()
         return self._type_handler_from_type.get_value_type_of_type(
             type_=type_, inline_value_type=inline_value_type
         )
 
     def get_value_type_of_type_str(self, type_str):
         # type: (str) -> Optional[ValueType]
-        return self._type_handler_from_type_str.get_value_type_of_type_str(type_str)
+        self.load_imported_libraries()
+        value_type = self._type_handler_from_type_str.get_value_type_of_type_str(
+            type_str
+        )
+        # the type can be of a library that is not imported yet
+        if value_type is None and self.load_imported_libraries(force=True):
+            value_type = self._type_handler_from_type_str.get_value_type_of_type_str(
+                type_str
+            )
+        return value_type
 
     def list_known_types(self):
+        self.load_imported_libraries(force=True)
         return list(self.type_str_to_parameter.keys())
 
 
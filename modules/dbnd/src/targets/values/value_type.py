@@ -10,8 +10,9 @@ import six
 
 from dbnd._core.errors import friendly_error
 from dbnd._core.utils.basics.load_python_module import run_user_func
-from dbnd._vendor import fast_hasher
+from targets.config import get_value_hash_config
 from targets.value_meta import ValueMeta, ValueMetaConf
+from targets.values.data_hashing import data_hash
 
 
 if typing.TYPE_CHECKING:
@@ -317,7 +318,7 @@ class ValueType(object):
 
 def _safe_hash(value):
     try:
-        return fast_hasher.hash(value)
+        return data_hash(value, *get_value_hash_config())
     except:
         logger.info("Failed to hash value of type %s", type(value))
         return None
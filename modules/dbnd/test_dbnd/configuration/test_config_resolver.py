@@ -0,0 +1,62 @@
+from dbnd import config, parameter
+from dbnd._core.configuration.config_readers import override
+from dbnd._core.configuration.config_resolver import (
+    ConfigResolutionIndex,
+    get_config_resolution_index,
+)
+from dbnd.tasks import Task
+
+
+class ResolvedTask(Task):
+    p = parameter.value("default")
+
+
+class TestConfigResolutionIndex(object):
+    def test_first_override_wins(self):
+        index = ConfigResolutionIndex()
+        with config(
+            {
+                "a": {"x": "a.x", "y": "a.y"},
+                "b": {"x": override("b.x"), "z": "b.z"},
+                "c": {"y": override("c.y"), "z": override("c.z")},
+            }
+        ):
+            layer = config.config_layer
+            values = {
+                key: index.get_config_value(layer, ["a", "b", "c"], key).value
+                for key in ("x", "Y", "z")
+            }
+            assert index.get_config_value(layer, ["a", "b", "c"], "w") is None
+        assert values == {"x": "b.x", "Y": "c.y", "z": "c.z"}
+
+    def test_hits_and_new_layers(self):
+        index = ConfigResolutionIndex()
+        with config({"a": {"x": "1"}}):
+            first = config.config_layer
+            for _ in range(10):
+                assert index.get_config_value(first, ["a"], "x").value == "1"
+            with config({"a": {"x": "2"}}):
+                # the new layer doesn't see the values resolved for the previous one
+                assert (
+                    index.get_config_value(config.config_layer, ["a"], "x").value == "2"
+                )
+        assert index.stats()["hits"] == 9
+        assert index.stats()["misses"] == 2
+
+    def test_lru(self):
+        index = ConfigResolutionIndex(max_size=2)
+        layer = config.config_layer
+        for sections in (["a"], ["b"], ["c"]):
+            index.get_config_values(layer, sections)
+        assert index.stats()["size"] == 2
+
+    def test_task_build(self):
+        index = get_config_resolution_index()
+        with config({"ResolvedTask": {"p": "from_config"}, "other": {"p": "other"}}):
+            assert ResolvedTask().p == "from_config"
+            hits = index.hits
+            assert ResolvedTask(task_name="other").p == "other"
+            assert ResolvedTask().p == "from_config"
+            assert index.hits > hits
+        with config({"task": {"p": override("task_override")}}):
+            assert ResolvedTask().p == "task_override"
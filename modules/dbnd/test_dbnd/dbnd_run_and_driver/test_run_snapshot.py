@@ -0,0 +1,136 @@
+from __future__ import absolute_import
+
+import os
+
+import pytest
+
+from dbnd import new_dbnd_context, override, pipeline, task
+from dbnd._core.constants import TaskExecutorType
+from dbnd._core.run.databand_run import DatabandRun
+from dbnd._core.run.run_snapshot import get_snapshot_root
+from dbnd._core.settings import CoreConfig, RunConfig
+from dbnd._vendor.cloudpickle import cloudpickle
+
+
+@task
+def ttask_snapshot(tparam="1", tidx=0):
+    # type:(str, int)->str
+    return "result %s" % tparam
+
+
+@pipeline
+def tpipeline_snapshot(num_of_tasks=5):
+    cur_t = "start"
+    for i in range(num_of_tasks):
+        cur_t = ttask_snapshot(tparam=cur_t, tidx=i)
+    return cur_t
+
+
+def _run(conf=None):
+    conf = dict(conf or {})
+    conf.update(
+        {
+            RunConfig.task_executor_type: override(TaskExecutorType.local),
+            CoreConfig.tracker: override(["console"]),
+        }
+    )
+    with new_dbnd_context(conf=conf) as dc:
+        return dc.dbnd_run_task(task_or_task_name=tpipeline_snapshot.task())
+
+
+@pytest.fixture(scope="module")
+def saved_run():
+    run = _run()
+    run.save_run()
+    return run
+
+
+def _task_ids(run):
+    return [
+        tr.task.task_id
+        for tr in run.task_runs
+        if tr.task.task_name.startswith("ttask_snapshot")
+    ]
+
+
+class TestRunSnapshot(object):
+    def test_load_single_task(self, saved_run):
+        task_id = _task_ids(saved_run)[2]
+
+        run = DatabandRun.load_run(saved_run.driver_dump, False)
+        assert run._snapshot.loaded_task_ids == [
+            saved_run.driver_task_run.task.task_id,
+            saved_run.root_task.task_id,
+        ]
+        assert run.root_task.task_id == saved_run.root_task.task_id
+
+        task_run = run.get_task_run_by_id(task_id)
+        assert task_run.task.task_id == task_id
+        assert len(run.task_runs) == 3
+
+        # loaded task run references the loaded run and its shared objects
+        assert task_run.run is run
+        assert task_run.task.task_meta.dbnd_context is run.context
+        assert run._get_task_by_id(task_id) is task_run.task
+        assert run.get_task_run_by_af_id(task_run.task_af_id) is task_run
+
+    def test_lazy_task_instances(self, saved_run):
+        task_id = _task_ids(saved_run)[0]
+
+        run = DatabandRun.load_run(saved_run.driver_dump, False)
+        task = run.context.task_instance_cache.get_task_by_id(task_id)
+        assert task.task_id == task_id
+        assert run.get_task_run_by_id(task_id).task is task
+        assert run.context.task_instance_cache.get_task_by_id("unknown") is None
+
+    def test_load_all(self, saved_run):
+        run = DatabandRun.load_run(saved_run.driver_dump, False)
+        run._snapshot.load_all()
+        assert [tr.task.task_id for tr in run.task_runs] == [
+            tr.task.task_id for tr in saved_run.task_runs
+        ]
+
+    def test_deduplicated_slices(self, saved_run):
+        snapshot_root = get_snapshot_root(saved_run.driver_dump)
+        slices = sorted(os.listdir(snapshot_root))
+        assert len(slices) == len(saved_run.task_runs)
+
+        # the same content is saved into the same slices
+        saved_run.save_run()
+        assert sorted(os.listdir(snapshot_root)) == slices
+
+    def test_legacy_dump(self, saved_run, tmpdir):
+        dump_file = saved_run.driver_dump
+        with dump_file.open("wb") as fp:
+            cloudpickle.dump(obj=saved_run, file=fp)
+        try:
+            run = DatabandRun.load_run(dump_file, False)
+            assert run._snapshot is None
+            assert len(run.task_runs) == len(saved_run.task_runs)
+        finally:
+            saved_run.save_run()
+
+    def test_disabled(self):
+        run = _run(conf={CoreConfig.sharded_run_snapshot: override(False)})
+        run.save_run()
+        assert not os.path.exists(get_snapshot_root(run.driver_dump))
+
+        loaded = DatabandRun.load_run(run.driver_dump, False)
+        assert loaded._snapshot is None
+        assert len(loaded.task_runs) == len(run.task_runs)
+
+    def test_stale_slices_are_removed(self, saved_run):
+        snapshot_root = get_snapshot_root(saved_run.driver_dump)
+        slices = sorted(os.listdir(snapshot_root))
+        with open(os.path.join(snapshot_root, "stale.pickle"), "wb") as fp:
+            fp.write(b"stale")
+
+        saved_run.save_run()
+        assert sorted(os.listdir(snapshot_root)) == slices
+
+        # a whole run dump doesn't need the slices
+        try:
+            saved_run.save_run(sharded=False)
+            assert not os.listdir(snapshot_root)
+        finally:
+            saved_run.save_run()
@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+
+
+# seconds, CI machines can set their own budget
+IMPORT_TIME_THRESHOLD = float(os.environ.get("DBND_TEST_IMPORT_TIME_THRESHOLD", "0.5"))
+
+_MEASURE_IMPORT = """
+import json, sys, time
+start = time.time()
+import dbnd
+took = time.time() - start
+print(json.dumps({"took": took, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_dbnd():
+    output = subprocess.check_output([sys.executable, "-c", _MEASURE_IMPORT])
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+class TestImportTime(object):
+    def test_import_time(self):
+        # the best of few runs, the first one can be slow because of cold disk cache
+        took = min(_import_dbnd()["took"] for _ in range(3))
+        assert (
+            took < IMPORT_TIME_THRESHOLD
+        ), "`import dbnd` took %.3fs, budget is %.3fs" % (took, IMPORT_TIME_THRESHOLD)
+
+    def test_no_heavy_imports(self):
+        modules = _import_dbnd()["modules"]
+        for heavy in ("pandas", "numpy", "matplotlib", "requests", "pygments"):
+            assert heavy not in modules
+
+    def test_public_api(self):
+        import dbnd
+
+        for name in dbnd.__all__:
+            assert hasattr(dbnd, name)
+        assert "task" in dir(dbnd)
+
+    def test_pandas_patched_on_import(self):
+        for imports in ("dbnd, pandas", "pandas, dbnd"):
+            output = subprocess.check_output(
+                [
+                    sys.executable,
+                    "-c",
+                    "import %s; print(hasattr(pandas.DataFrame, 'to_target'))"
+                    % imports,
+                ]
+            )
+            assert output.decode("utf-8").strip().splitlines()[-1] == "True"
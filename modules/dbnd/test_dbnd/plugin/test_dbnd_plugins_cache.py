@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from dbnd import hookimpl
+from dbnd._core.configuration.environ_config import ENV_DBND_SYSTEM
+from dbnd._core.plugin import dbnd_plugin_spec, dbnd_plugins_cache
+from dbnd._core.plugin.dbnd_plugins import DbndPluginManager
+
+
+@pytest.fixture
+def dbnd_system(tmpdir, monkeypatch):
+    monkeypatch.setenv(ENV_DBND_SYSTEM, str(tmpdir))
+    return tmpdir
+
+
+def _scan(entry_points, calls):
+    def scan_entry_points(group):
+        calls.append(group)
+        return entry_points
+
+    return scan_entry_points
+
+
+class TestDbndPluginsCache(object):
+    def test_warm_start(self, dbnd_system, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            dbnd_plugins_cache,
+            "scan_entry_points",
+            _scan([("dbnd-foo", "foo_plugin.plugin")], calls),
+        )
+        for _ in range(3):
+            entry_points = dbnd_plugins_cache.get_entry_points("dbnd")
+            assert entry_points == [("dbnd-foo", "foo_plugin.plugin")]
+        assert calls == ["dbnd"]
+        assert dbnd_system.join("plugins_entry_points.json").exists()
+
+    def test_invalidated_by_sys_path(self, dbnd_system, monkeypatch):
+        calls = []
+        monkeypatch.setattr(dbnd_plugins_cache, "scan_entry_points", _scan([], calls))
+        dbnd_plugins_cache.get_entry_points("dbnd")
+
+        # i.e. new package installed
+        os.utime(str(dbnd_system), None)
+        monkeypatch.syspath_prepend(str(dbnd_system.mkdir("site-packages")))
+        dbnd_plugins_cache.get_entry_points("dbnd")
+        assert calls == ["dbnd", "dbnd"]
+
+
+class _FooPlugin(object):
+    calls = 0
+
+    @staticmethod
+    @hookimpl
+    def dbnd_setup_plugin():
+        _FooPlugin.calls += 1
+
+
+class TestDbndPluginManager(object):
+    def test_lazy_plugin(self):
+        pm = DbndPluginManager("dbnd")
+        pm.add_hookspecs(dbnd_plugin_spec)
+        loaded = []
+
+        def load_plugin():
+            loaded.append(True)
+            return _FooPlugin
+
+        pm.register_lazy("dbnd-foo", load_plugin)
+        assert pm.has_plugin("dbnd-foo")
+        assert not loaded
+
+        pm.hook.dbnd_setup_plugin()
+        pm.hook.dbnd_setup_plugin()
+        assert loaded == [True]
+        assert _FooPlugin.calls == 2
+        assert pm.get_plugin("dbnd-foo") is _FooPlugin
+
+    def test_blocked_plugin(self):
+        pm = DbndPluginManager("dbnd")
+        pm.register_lazy("dbnd-foo", lambda: pytest.fail("blocked plugin is loaded"))
+        pm.set_blocked("dbnd-foo")
+        assert not pm.has_plugin("dbnd-foo")
+        pm.load_lazy_plugins()
+
+    def test_lazy_plugins_are_registered_first(self):
+        calls = []
+
+        def _plugin(name):
+            class _Plugin(object):
+                @staticmethod
+                @hookimpl
+                def dbnd_setup_plugin():
+                    calls.append(name)
+
+            return _Plugin
+
+        pm = DbndPluginManager("dbnd")
+        pm.add_hookspecs(dbnd_plugin_spec)
+        pm.register_lazy("dbnd-entry-point", lambda: _plugin("entry_point"))
+        user_plugin = _plugin("user")
+        pm.register(user_plugin, name="user-plugin")
+
+        # same order as with eager registration: the last registered is called first
+        pm.hook.dbnd_setup_plugin()
+        assert calls == ["user", "entry_point"]
+
+    def test_get_plugins_loads_lazy_plugins(self):
+        def _pm():
+            pm = DbndPluginManager("dbnd")
+            pm.add_hookspecs(dbnd_plugin_spec)
+            pm.register_lazy("dbnd-foo", lambda: _FooPlugin)
+            return pm
+
+        assert _pm().get_plugins() == {_FooPlugin}
+        assert _pm().list_name_plugin() == [("dbnd-foo", _FooPlugin)]
@@ -0,0 +1,46 @@
+import os
+import threading
+
+from dbnd._core.task_executor.heartbeat_sender import HeartbeatService
+
+
+class HeartbeatRecorder(object):
+    def __init__(self, expected):
+        self.run_uids = []
+        self.expected = expected
+        self.done = threading.Event()
+
+    def heartbeat(self, run_uid):
+        self.run_uids.append(run_uid)
+        if len(self.run_uids) >= self.expected:
+            self.done.set()
+
+
+class TestHeartbeatService(object):
+    def test_heartbeats_of_all_runs(self):
+        store = HeartbeatRecorder(expected=6)
+        service = HeartbeatService()
+        for run_uid in ("a", "b"):
+            service.register(
+                run_uid=run_uid, tracking_store=store, heartbeat_interval_s=0.05
+            )
+        assert store.done.wait(5)
+        assert {"a", "b"} == set(store.run_uids)
+
+        service.unregister("a")
+        service.unregister("b")
+        assert not service.active_runs
+
+    def test_runs_of_parent_process(self):
+        store = HeartbeatRecorder(expected=1)
+        service = HeartbeatService()
+        service.register(
+            run_uid="parent", tracking_store=store, heartbeat_interval_s=60
+        )
+        assert store.done.wait(5)
+
+        # that's what the service sees in a forked child
+        service._pid = -1
+        service.register(run_uid="child", tracking_store=store, heartbeat_interval_s=60)
+        assert service.active_runs == ["child"]
+        service.unregister("child")
@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from dbnd import PipelineTask, new_dbnd_context, output, task
+from dbnd._core.constants import TaskRunState
+from dbnd._core.errors import DatabandRunError
+
+
+@task
+def t_pid(i):
+    # type: (int) -> int
+    return os.getpid()
+
+
+@task
+def t_sum(values):
+    # type: (list) -> int
+    return len(values)
+
+
+@task
+def t_fail(i):
+    # type: (int) -> int
+    raise TypeError("Some user error")
+
+
+class TParallelPipeline(PipelineTask):
+    count = output
+
+    def band(self):
+        pids = [t_pid(i=i, task_name="pid_%s" % i) for i in range(3)]
+        self.count = t_sum(values=pids)
+
+
+class TParallelFailingPipeline(PipelineTask):
+    result = output
+
+    def band(self):
+        failed = t_fail(i=1)
+        self.result = [
+            t_sum(values=[failed], task_name="after_failed"),
+            t_pid(i=2, task_name="independent"),
+        ]
+
+
+def _local_parallel(**run_config):
+    run_config.update({"task_executor_type": "local_parallel"})
+    return new_dbnd_context(conf={"run": run_config})
+
+
+class TestLocalParallelExecutor(object):
+    def test_run(self):
+        with _local_parallel(local_parallel_max_workers=2):
+            run = TParallelPipeline().dbnd_run()
+
+        assert run.root_task.count.load(int) == 3
+        pid_task_runs = [
+            tr for tr in run.task_runs if tr.task.task_name.startswith("pid_")
+        ]
+        assert len(pid_task_runs) == 3
+        for tr in pid_task_runs:
+            assert tr.task_run_state == TaskRunState.SUCCESS
+            # every task is executed at its own process
+            assert tr.task.result.load(int) != os.getpid()
+
+    def test_upstream_failed(self):
+        with _local_parallel(fail_fast=False):
+            with pytest.raises(DatabandRunError) as ex:
+                TParallelFailingPipeline().dbnd_run()
+
+        upstream_failed, failed = str(ex.value).split("Failed tasks are:")
+        assert "after_failed" in upstream_failed
+        assert "independent" not in upstream_failed
+        assert failed.split() == ["t_fail"]
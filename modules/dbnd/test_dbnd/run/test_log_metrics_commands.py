@@ -3,9 +3,12 @@ import os
 from typing import Dict
 
 from dbnd import as_task, band, task
-from dbnd._core.commands import log_artifact, log_metric
+from dbnd._core.commands import log_artifact, log_metric, log_metrics
 from dbnd._core.current import get_databand_run
-from dbnd._core.tracking.tracking_store_file import read_task_metrics
+from dbnd._core.tracking.tracking_store_file import (
+    TaskRunMetricsFileStoreReader,
+    read_task_metrics,
+)
 from dbnd.testing.helpers_pytest import assert_run_task
 from test_dbnd.targets_tests import TargetTestBase
 
@@ -22,6 +25,20 @@ class TestTaskMetricsCommands(TargetTestBase):
             == "5"
         )
 
+    def test_log_metrics_in_loop(self):
+        @task
+        def t_f_metrics_loop(steps=1000):
+            for i in range(steps):
+                log_metrics({"loss": 1.0 / (i + 1), "step": i})
+            log_metrics({"phase": "done"})
+
+        t = assert_run_task(t_f_metrics_loop.t())
+        reader = TaskRunMetricsFileStoreReader(t.ctrl.last_task_run.attempt_folder)
+        assert reader.get_last_metric("step").value == 999
+        assert reader.get_last_metric("step.count").value == 1000
+        assert reader.get_last_metric("phase").value == "done"
+        assert len(reader.get_metric_history("loss")) < 1000
+
     def test_log_artifact(self, tmpdir):
         lorem = "Lorem ipsum dolor sit amet, consectetuer adipiscing elit, sed diam nonummy nibh euismod tincidunt\n"
         f = tmpdir.join("abcd")
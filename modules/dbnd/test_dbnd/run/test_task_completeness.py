@@ -0,0 +1,65 @@
+from dbnd import output, parameter
+from dbnd._core.run.task_completeness import TaskCompletenessChecker
+from dbnd._core.run.task_runs_builder import find_tasks_to_skip_complete
+from dbnd._core.utils.traversing import flatten
+from dbnd.tasks import PipelineTask
+from test_dbnd.factories import TTask, TTaskWithInput
+
+
+def _mark_completed(task):
+    for o in flatten(task.task_outputs):
+        o.write("done")
+
+
+class TTaskCustomComplete(TTask):
+    completed = parameter.value(False)
+
+    def _complete(self):
+        return self.completed
+
+
+class TPipeline(PipelineTask):
+    some_output = output
+
+    def band(self):
+        a = TTask(task_name="A", t_param="a")
+        b = TTaskWithInput(task_name="B", t_param="b", t_input=a.t_output)
+        self.some_output = TTaskWithInput(
+            task_name="C", t_param="c", t_input=b.t_output
+        )
+
+
+class TestTaskCompleteness(object):
+    def test_check_tasks(self):
+        done = TTask(t_param="done")
+        _mark_completed(done)
+        not_done = TTask(t_param="not_done")
+        custom = TTaskCustomComplete(completed=True)
+
+        checker = TaskCompletenessChecker(parallelism=2)
+        assert checker.check_tasks([done, not_done, custom]) == {
+            done.task_id: True,
+            not_done.task_id: False,
+            custom.task_id: True,
+        }
+
+    def test_is_complete_uses_memo_once(self):
+        t = TTask(t_param="memo")
+        checker = TaskCompletenessChecker()
+        assert checker.check_tasks([t]) == {t.task_id: False}
+
+        _mark_completed(t)
+        # first call returns the result calculated before
+        assert not checker.is_complete(t)
+        assert checker.is_complete(t)
+
+    def test_find_tasks_to_skip_complete(self):
+        pipeline = TPipeline()
+        all_tasks = pipeline.ctrl.task_dag.subdag_tasks()
+        tasks = {t.task_name: t for t in all_tasks}
+        # B is completed, so A is not required
+        _mark_completed(tasks["B"])
+
+        completed, skipped = find_tasks_to_skip_complete([pipeline], all_tasks)
+        assert {t.task_name for t in completed} == {"B"}
+        assert {t.task_name for t in skipped} == {"A"}
@@ -0,0 +1,138 @@
+from mock import patch
+
+from targets.fs.listing_cache import (
+    PrefixListing,
+    PrefixListingCache,
+    get_run_listing_cache,
+    stat_many_by_listing,
+)
+from targets.utils.path import path_to_bucket_and_key
+
+
+OBJECTS = {
+    "data/a/part-0000": (10, None),
+    "data/a/_SUCCESS": (0, None),
+    "data/b_$folder$": (0, None),
+    "data/c.csv": (5, None),
+}
+
+
+class FakeStorage(object):
+    def __init__(self, objects):
+        self.objects = objects
+        self.listed = []
+        self.fallback_paths = []
+
+    def list_prefix(self, bucket, prefix):
+        self.listed.append((bucket, prefix))
+        return PrefixListing(
+            prefix, {k: v for k, v in self.objects.items() if k.startswith(prefix)}
+        )
+
+    def fallback(self, paths):
+        self.fallback_paths.extend(paths)
+        return {p: None for p in paths}
+
+
+class TestPrefixListing(object):
+    def test_stat(self):
+        listing = PrefixListing("data/", OBJECTS)
+        assert listing.stat("s3://b/data/c.csv", "data/c.csv").size == 5
+        assert listing.stat("s3://b/data/a", "data/a").is_dir
+        assert listing.stat("s3://b/data/a/", "data/a/").is_dir
+        assert listing.stat("s3://b/data/b", "data/b").is_dir
+        assert listing.stat("s3://b/data/d", "data/d") is None
+        # "data/a" is a prefix of "data/a/..." only as a directory
+        assert listing.stat("s3://b/data/a/part", "data/a/part") is None
+
+    def test_iter_keys(self):
+        listing = PrefixListing("data/", OBJECTS)
+        assert list(listing.iter_keys("data/a/")) == [
+            "data/a/_SUCCESS",
+            "data/a/part-0000",
+        ]
+
+
+class TestPrefixListingCache(object):
+    def test_longest_prefix_and_invalidate(self):
+        cache = PrefixListingCache(ttl=60)
+        cache.put("b", PrefixListing("data/", OBJECTS))
+        cache.put("b", PrefixListing("data/a/", {}))
+        assert cache.get("b", "data/a/x").prefix == "data/a/"
+        assert cache.get("b", "data/c.csv").prefix == "data/"
+        assert cache.get("b", "other/x") is None
+        assert cache.get("other_bucket", "data/c.csv") is None
+
+        cache.invalidate("b", "data/a/x")
+        assert cache.get("b", "data/a/x") is None
+        assert cache.get("b", "other/x") is None
+
+    def test_disabled(self):
+        cache = PrefixListingCache(ttl=0)
+        cache.put("b", PrefixListing("data/", OBJECTS))
+        assert cache.get("b", "data/c.csv") is None
+
+    def test_run_listing_cache(self):
+        class FakeRun(object):
+            pass
+
+        run_a, run_b = FakeRun(), FakeRun()
+        with patch("dbnd._core.current.try_get_databand_run", return_value=run_a):
+            cache_a = get_run_listing_cache("s3")
+            assert get_run_listing_cache("s3") is cache_a
+            assert get_run_listing_cache("gs") is not cache_a
+        with patch("dbnd._core.current.try_get_databand_run", return_value=run_b):
+            assert get_run_listing_cache("s3") is not cache_a
+
+
+class TestStatManyByListing(object):
+    def test_one_listing(self):
+        storage = FakeStorage(OBJECTS)
+        cache = PrefixListingCache(ttl=60)
+
+        def _stat_many(paths):
+            return stat_many_by_listing(
+                paths,
+                path_to_bucket_and_key=path_to_bucket_and_key,
+                list_prefix=storage.list_prefix,
+                cache=cache,
+                fallback=storage.fallback,
+            )
+
+        paths = ["s3://b/data/a/_SUCCESS", "s3://b/data/c.csv", "s3://b/data/d.csv"]
+        result = _stat_many(paths)
+        assert storage.listed == [("b", "data/")]
+        assert result["s3://b/data/a/_SUCCESS"].size == 0
+        assert result["s3://b/data/c.csv"].size == 5
+        assert result["s3://b/data/d.csv"] is None
+
+        # answered from the cache
+        assert _stat_many(["s3://b/data/c.csv"])["s3://b/data/c.csv"].size == 5
+        assert len(storage.listed) == 1
+        assert not storage.fallback_paths
+
+    def test_single_path_is_not_listed(self):
+        storage = FakeStorage(OBJECTS)
+        stat_many_by_listing(
+            ["s3://b/data/c.csv"],
+            path_to_bucket_and_key=path_to_bucket_and_key,
+            list_prefix=storage.list_prefix,
+            cache=PrefixListingCache(ttl=60),
+            fallback=storage.fallback,
+        )
+        assert not storage.listed
+        assert storage.fallback_paths == ["s3://b/data/c.csv"]
+
+    def test_bucket_root_is_not_listed(self):
+        storage = FakeStorage(OBJECTS)
+        paths = ["s3://b/data/c.csv", "s3://b/other.csv"]
+        result = stat_many_by_listing(
+            paths,
+            path_to_bucket_and_key=path_to_bucket_and_key,
+            list_prefix=storage.list_prefix,
+            cache=PrefixListingCache(ttl=60),
+            fallback=storage.fallback,
+        )
+        assert not storage.listed
+        assert storage.fallback_paths == paths
+        assert set(result) == set(paths)
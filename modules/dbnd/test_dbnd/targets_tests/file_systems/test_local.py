@@ -54,3 +54,28 @@ class TestLocalFileSystem(unittest.TestCase):
         target(src).open("w").close()
         self.fs.move(src, dest)
         assert os.path.exists(dest)
+
+    def test_exists_many(self):
+        existing = os.path.join(self.path, "file")
+        target(existing).open("w").close()
+        missing = os.path.join(self.path, "missing")
+
+        assert self.fs.exists_many([existing, missing, self.path]) == {
+            existing: True,
+            missing: False,
+            self.path: True,
+        }
+
+        stats = self.fs.stat_many([existing, missing, self.path])
+        assert stats[existing].size == 0
+        assert not stats[existing].is_dir
+        assert stats[missing] is None
+        assert stats[self.path].is_dir
+
+    def test_append_bytes(self):
+        path = os.path.join(self.path, "newdir", "log.txt")
+
+        assert self.fs.support_append
+        self.fs.append_bytes(path, b"first\n")
+        self.fs.append_bytes(path, b"second\n")
+        assert target(path).read() == "first\nsecond\n"
@@ -0,0 +1,48 @@
+from __future__ import absolute_import
+
+import types
+
+import pandas as pd
+import pytest
+
+from pandas.util.testing import assert_frame_equal
+
+from dbnd._core.errors import DatabandRuntimeError
+from targets import target
+from test_dbnd.targets_tests import TargetTestBase
+
+
+def _chunks(df, chunksize):
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start : start + chunksize]
+
+
+class TestPandasChunks(TargetTestBase):
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame({"a": list(range(10)), "b": ["x%s" % i for i in range(10)]})
+
+    @pytest.mark.parametrize("name", ["df.csv", "df.csv.gz", "df.parquet"])
+    def test_dump_and_load_chunks(self, df, name):
+        t = self.target(name)
+        t.dump(_chunks(df, 3), value_type=pd.DataFrame)
+        assert_frame_equal(t.load(pd.DataFrame), df)
+
+        chunks = t.load(pd.DataFrame, chunksize=4)
+        assert isinstance(chunks, types.GeneratorType)
+        chunks = list(chunks)
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        assert_frame_equal(pd.concat(chunks), df)
+
+    def test_load_dir_chunks(self, s1_dir_with_csv, simple_df):
+        s1_root_dir, _, _ = s1_dir_with_csv
+        chunks = list(target(s1_root_dir).load(pd.DataFrame, chunksize=10))
+        # every partition is read separately
+        assert len(chunks) == 2
+        assert_frame_equal(pd.concat(chunks, ignore_index=True), simple_df)
+
+    def test_chunked_read_not_supported(self, df):
+        t = self.target("df.json")
+        t.dump(df, value_type=pd.DataFrame)
+        with pytest.raises(DatabandRuntimeError, match="by chunks"):
+            t.load(pd.DataFrame, chunksize=4)
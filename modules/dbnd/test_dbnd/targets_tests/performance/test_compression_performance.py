@@ -0,0 +1,65 @@
+import logging
+import time
+
+import pytest
+
+from targets import target
+from targets.pipes.bzip2 import Bzip2Pipeline
+from targets.pipes.gzip import GzipPipeline
+
+
+logger = logging.getLogger(__name__)
+
+SMALL_FILES = 200
+SMALL_DATA = b"".join(b"%d,some value,%d\n" % (i, i * 2) for i in range(1000))
+BIG_DATA = SMALL_DATA * 500
+
+
+def _write_and_read(paths, pipe, data):
+    start = time.time()
+    for path in paths:
+        with target(path, io_pipe=pipe).open("wb") as f:
+            f.write(data)
+    written = time.time()
+    for path in paths:
+        with target(path, io_pipe=pipe).open("rb") as f:
+            assert f.read() == data
+    return written - start, time.time() - written
+
+
+@pytest.mark.skip("performance tests")
+class TestCompressionPerformance(object):
+    @pytest.mark.parametrize("pipe_cls", [GzipPipeline, Bzip2Pipeline])
+    def test_many_small_files(self, tmpdir, pipe_cls):
+        paths = [str(tmpdir.join("part-%04d" % i)) for i in range(SMALL_FILES)]
+        for name, pipe in [
+            ("subprocess", pipe_cls(use_subprocess=True)),
+            ("in-process", pipe_cls()),
+        ]:
+            write, read = _write_and_read(paths, pipe, SMALL_DATA)
+            logger.info(
+                "%s %s: %s files, write %.2fs read %.2fs",
+                pipe_cls.__name__,
+                name,
+                SMALL_FILES,
+                write,
+                read,
+            )
+
+    @pytest.mark.parametrize("pipe_cls", [GzipPipeline, Bzip2Pipeline])
+    def test_big_file(self, tmpdir, pipe_cls):
+        paths = [str(tmpdir.join("big"))]
+        for name, pipe in [
+            ("subprocess", pipe_cls(use_subprocess=True)),
+            ("in-process", pipe_cls()),
+            ("in-process 4 threads", pipe_cls(threads=4)),
+        ]:
+            write, read = _write_and_read(paths, pipe, BIG_DATA)
+            logger.info(
+                "%s %s: %sMB, write %.2fs read %.2fs",
+                pipe_cls.__name__,
+                name,
+                len(BIG_DATA) // (1024 * 1024),
+                write,
+                read,
+            )
@@ -0,0 +1,111 @@
+import bz2
+import gzip
+import os
+
+import pytest
+
+import targets.pipes
+
+from dbnd.testing.helpers_pytest import skip_on_windows
+from targets import target
+from targets.pipes.bzip2 import Bzip2Pipeline
+from targets.pipes.gzip import GzipPipeline
+
+DATA = b"".join(b"line %d of the compressed file\n" % i for i in range(50000))
+
+
+class TestCompressionPipes(object):
+    @pytest.fixture(autouse=True)
+    def set_path(self, tmpdir):
+        self.path = str(tmpdir.join("data"))
+
+    def _write(self, pipe, data=DATA):
+        with target(self.path, io_pipe=pipe).open("wb") as f:
+            f.write(data)
+
+    def _read(self, pipe):
+        with target(self.path, io_pipe=pipe).open("rb") as f:
+            return f.read()
+
+    @pytest.mark.parametrize("threads", [None, 3])
+    @pytest.mark.parametrize(
+        "pipe_cls, open_func", [(GzipPipeline, gzip.open), (Bzip2Pipeline, bz2.BZ2File)]
+    )
+    def test_compatible_with_python_modules(self, pipe_cls, open_func, threads):
+        self._write(pipe_cls(threads=threads, block_size=64 * 1024))
+        f = open_func(self.path, "rb")
+        assert f.read() == DATA
+        f.close()
+        assert self._read(pipe_cls()) == DATA
+
+    @pytest.mark.parametrize("threads", [None, 4])
+    def test_xz(self, threads):
+        lzma = pytest.importorskip("lzma")
+        self._write(targets.pipes.XzPipeline(threads=threads, block_size=64 * 1024))
+        assert lzma.open(self.path).read() == DATA
+        assert self._read(targets.pipes.Xz) == DATA
+
+    def test_multi_member_gzip(self):
+        with gzip.open(self.path, "wb") as f:
+            f.write(b"first\n")
+        with open(self.path, "ab") as f:
+            f.write(gzip.compress(b"second\n"))
+
+        with target(self.path, io_pipe=targets.pipes.Gzip).open("rb") as f:
+            assert list(f) == [b"first\n", b"second\n"]
+
+    def test_text_lines(self):
+        t = target(self.path, io_pipe=targets.pipes.UTF8 >> targets.pipes.Gzip)
+        with t.open("w") as f:
+            f.write(u"a\nb\n")
+        with t.open("r") as f:
+            assert list(f) == ["a\n", "b\n"]
+
+    def test_truncated(self):
+        with open(self.path, "wb") as f:
+            f.write(gzip.compress(DATA)[:-100])
+        with pytest.raises(EOFError):
+            self._read(targets.pipes.Gzip)
+
+    def test_failed_write_is_not_committed(self):
+        with pytest.raises(ValueError):
+            with target(self.path, io_pipe=targets.pipes.Gzip).open("wb") as f:
+                f.write(DATA)
+                raise ValueError()
+        assert not os.path.exists(self.path)
+
+    def test_compression_by_extension(self):
+        lzma = pytest.importorskip("lzma")
+        t = target(self.path + ".csv.xz")
+        t.write(u"a,b\n1,2\n")
+        assert lzma.open(t.path).read() == b"a,b\n1,2\n"
+        assert t.read() == u"a,b\n1,2\n"
+
+    @skip_on_windows
+    def test_subprocess_pipeline(self):
+        self._write(GzipPipeline(use_subprocess=True))
+        assert self._read(GzipPipeline()) == DATA
+
+    def test_zstd(self):
+        pytest.importorskip("zstandard")
+        t = target(self.path + ".zst")
+        t.write(u"zstd")
+        assert t.read() == u"zstd"
+
+    def test_lz4(self):
+        pytest.importorskip("lz4.frame")
+        t = target(self.path + ".lz4")
+        t.write(u"lz4")
+        assert t.read() == u"lz4"
+
+    @pytest.mark.parametrize("ext", ["gz", "xz"])
+    def test_pandas_through_pipe(self, ext, monkeypatch):
+        pd = pytest.importorskip("pandas")
+        if ext == "xz":
+            pytest.importorskip("lzma")
+        t = target(self.path + ".csv." + ext)
+        # the way remote targets are read and written: through target.open()
+        monkeypatch.setattr(t.fs, "support_direct_access", False)
+        df = pd.DataFrame({"a": [1, 2]})
+        t.write_df(df)
+        assert t.read_df().equals(df)
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+from targets import target
+from targets.caching import LruCache, TargetCache, TargetCacheKey, estimate_value_size
+
+
+def _key(path, value_type="object"):
+    return TargetCacheKey(target=target(path), value_type=value_type)
+
+
+class TestTargetCache(object):
+    def test_estimate_value_size(self):
+        df = pd.DataFrame({"a": ["x" * 100] * 100})
+        assert estimate_value_size(df) == df.memory_usage(deep=True).sum()
+        arr = np.zeros(1000)
+        assert estimate_value_size(arr) == arr.nbytes
+        assert estimate_value_size(["x" * 1000]) > 1000
+
+    def test_lru_eviction(self):
+        cache = TargetCache(max_bytes=2500)
+        a, b, c = _key("/tmp/a"), _key("/tmp/b"), _key("/tmp/c")
+        cache[a] = np.zeros(100)  # 800 bytes
+        cache[b] = np.zeros(100)
+        assert a in cache
+        assert cache[a] is not None
+        # b is the least recently used now
+        cache[c] = np.zeros(150)
+
+        assert b not in cache
+        assert a in cache and c in cache
+        assert cache.evictions == 1
+        assert cache.size_bytes == 2000
+
+        # too big to be cached
+        cache[b] = np.zeros(1000)
+        assert b not in cache
+        assert cache.size_bytes == 2000
+
+    def test_clear_for_targets(self):
+        cache = TargetCache(max_bytes=0)
+        t = target("/tmp/a")
+        cache[TargetCacheKey(target=t, value_type="object")] = 1
+        cache[TargetCacheKey(target=t, value_type="str")] = "1"
+        cache[_key("/tmp/b")] = 2
+
+        cache.clear_for_targets({t})
+        assert cache.stats()["items"] == 1
+        assert _key("/tmp/b") in cache
+
+    def test_stats(self):
+        cache = TargetCache(max_bytes=0)
+        a = _key("/tmp/a")
+        assert a not in cache
+        cache[a] = 1
+        assert a in cache
+        assert cache[a] == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["items"] == 1
+
+        # counters of a period, e.g. of one run
+        assert cache[a] == 1
+        since_stats = cache.stats(since=stats)
+        assert since_stats["hits"] == 1
+        assert since_stats["misses"] == 0
+        assert since_stats["hit_rate"] == 1.0
+        assert since_stats["items"] == 1
+
+
+class TestLruCache(object):
+    def test_max_items(self):
+        cache = LruCache(max_items=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        # "b" is the least recently used one
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats() == {
+            "hits": 3,
+            "misses": 1,
+            "hit_rate": 0.75,
+            "evictions": 1,
+            "size_bytes": cache.size_bytes,
+            "items": 2,
+        }
+
+    def test_max_bytes(self):
+        cache = LruCache(max_items=10, max_bytes=100)
+        cache.put("a", 1, size=60)
+        cache.put("b", 2, size=30)
+        cache.put("c", 3, size=30)
+        assert cache.get("a") is None
+        assert cache.size_bytes == 60
+
+        # bigger than the whole cache
+        cache.put("d", 4, size=101)
+        assert cache.get("d") is None
+        assert len(cache) == 2
+
+    def test_disabled(self):
+        cache = LruCache(max_items=0)
+        cache.put("a", 1)
+        assert cache.get("a") is None
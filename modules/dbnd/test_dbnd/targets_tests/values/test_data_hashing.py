@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from targets.values.data_hashing import (
+    FINGERPRINT_BLOCK_ROWS,
+    FINGERPRINT_BLOCKS,
+    HashMode,
+    _HASH_MEMO,
+    data_hash,
+)
+
+
+def _df(rows):
+    return pd.DataFrame(
+        {"a": np.arange(rows), "b": np.arange(rows) * 0.5, "s": ["x"] * rows}
+    )
+
+
+class TestDataHashing(object):
+    def test_same_content_same_hash(self):
+        assert data_hash(_df(100)) == data_hash(_df(100))
+        assert data_hash(np.arange(10)) == data_hash(np.arange(10))
+        # non contiguous array
+        arr = np.arange(20).reshape(4, 5)
+        assert data_hash(arr.T) == data_hash(np.ascontiguousarray(arr.T))
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda df: df.assign(s=["y"] * len(df)),
+            lambda df: df.rename(columns={"a": "c"}),
+            lambda df: df.astype({"a": "float64"}),
+            lambda df: df.set_index("a"),
+        ],
+    )
+    def test_different_content(self, change):
+        df = _df(10)
+        assert data_hash(df) != data_hash(change(df))
+
+    def test_fingerprint(self):
+        rows = FINGERPRINT_BLOCKS * FINGERPRINT_BLOCK_ROWS * 10
+        df = _df(rows)
+        fingerprint = data_hash(df, HashMode.fingerprint)
+        assert fingerprint != data_hash(df)
+
+        # a row between the sampled blocks is not part of the fingerprint
+        changed = df.copy()
+        changed.iloc[FINGERPRINT_BLOCK_ROWS + 1, 0] = -1
+        assert data_hash(changed, HashMode.fingerprint) == fingerprint
+        assert data_hash(changed) != data_hash(df)
+
+        assert data_hash(df, HashMode.auto, fingerprint_above_bytes=1000) == fingerprint
+        assert data_hash(df, HashMode.auto, fingerprint_above_bytes=None) == data_hash(
+            df
+        )
+
+    def test_memoization(self):
+        _HASH_MEMO.clear()
+        df = _df(10)
+        value_hash = data_hash(df, HashMode.fingerprint)
+        assert _HASH_MEMO.get(df, HashMode.fingerprint, None) is None  # wrong version
+        assert data_hash(df, HashMode.fingerprint) == value_hash
+
+        # the memo is validated by the version of the value
+        df.iloc[0, 0] = 100
+        assert data_hash(df, HashMode.fingerprint) != value_hash
+
+        del df
+        assert not _HASH_MEMO._entries
+
+    def test_full_hash_is_not_memoized(self):
+        _HASH_MEMO.clear()
+        df = pd.DataFrame({"a": np.arange(100000)})
+        value_hash = data_hash(df)
+        assert not _HASH_MEMO._entries
+
+        # a change outside of the version blocks
+        df.loc[500, "a"] = -1
+        assert data_hash(df) != value_hash
+
+        arr = np.arange(100000)
+        value_hash = data_hash(arr)
+        arr[500] = -1
+        assert data_hash(arr) != value_hash
+
+    def test_not_registered_type(self):
+        assert data_hash({"a": 1}) == data_hash({"a": 1})
+
+    def test_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.Table.from_pandas(_df(10))
+        assert data_hash(table) == data_hash(pa.Table.from_pandas(_df(10)))
+        assert data_hash(table) != data_hash(pa.Table.from_pandas(_df(11)))
+
+    def test_unhashable_objects(self):
+        df = pd.DataFrame({"l": [[1, 2], [3]], "d": [{"a": 1}, {"b": 2}]})
+        assert data_hash(df) == data_hash(df.copy())
+        changed = pd.DataFrame({"l": [[1, 2], [4]], "d": [{"a": 1}, {"b": 2}]})
+        assert data_hash(changed) != data_hash(df)
+
+        arr = np.empty(2, dtype=object)
+        arr[:] = [[1], [2]]
+        assert data_hash(arr) == data_hash(arr.copy())
+
+    def test_range_index_step(self):
+        df = pd.DataFrame({"a": [1, 2]})
+        assert data_hash(df.set_index(pd.RangeIndex(0, 4, 2))) != data_hash(df)
+        assert data_hash(df.set_index(pd.RangeIndex(0, 2, 1))) == data_hash(df)
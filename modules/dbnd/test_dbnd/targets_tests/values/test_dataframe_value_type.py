@@ -1,8 +1,8 @@
-from pandas.core.util.hashing import hash_pandas_object
+import pandas as pd
 
 from dbnd._core.utils import json_utils
-from dbnd._vendor import fast_hasher
 from targets.value_meta import ValueMeta, ValueMetaConf
+from targets.values.data_hashing import data_hash
 from targets.values.pandas_values import DataFrameValueType
 
 
@@ -25,9 +25,7 @@ class TestDataFrameValueType(object):
             ),
             data_dimensions=pandas_data_frame.shape,
             data_schema=expected_data_schema,
-            data_hash=fast_hasher.hash(
-                hash_pandas_object(pandas_data_frame, index=True).values
-            ),
+            data_hash=data_hash(pandas_data_frame),
         )
 
         df_value_meta = DataFrameValueType().get_value_meta(
@@ -41,3 +39,19 @@ class TestDataFrameValueType(object):
         )
         assert df_value_meta.data_dimensions == expected_value_meta.data_dimensions
         assert df_value_meta == expected_value_meta
+
+    def test_df_value_meta_stats(self, pandas_data_frame):
+        meta_conf = ValueMetaConf(log_stats=True)
+        df_value_meta = DataFrameValueType().get_value_meta(
+            pandas_data_frame, meta_conf=meta_conf
+        )
+        stats = df_value_meta.data_schema["stats"]
+        assert stats["rows"] == len(pandas_data_frame)
+        assert set(stats["columns"]) == set(pandas_data_frame.columns)
+        # the stats are logged as json
+        json_utils.dumps(df_value_meta.data_schema)
+
+    def test_df_signature_with_unhashable_objects(self):
+        df = pd.DataFrame({"l": [[1, 2], [3]], "d": [{"a": 1}, {"b": 2}]})
+        value_type = DataFrameValueType()
+        assert value_type.to_signature(df) == value_type.to_signature(df.copy())
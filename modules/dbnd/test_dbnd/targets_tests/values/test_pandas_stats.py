@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from pandas.core.util.hashing import hash_pandas_object
+
+from targets.values.pandas_stats import calc_data_frame_stats, hll_distinct_count
+
+
+class TestPandasStats(object):
+    def test_numeric_column(self):
+        df = pd.DataFrame({"a": [1.0, 2.0, None, 4.0, np.inf]})
+        stats = calc_data_frame_stats(df, bins=3)["columns"]["a"]
+        assert stats["count"] == 4
+        assert stats["null_count"] == 1
+        assert stats["distinct_count"] == 4
+        assert stats["min"] == 1.0
+        assert stats["max"] is None  # inf is not json friendly
+        assert stats["quantiles"]["50%"] == 3.0
+        # inf is not counted by histogram
+        assert stats["histogram"] == {
+            "bin_edges": [1.0, 2.0, 3.0, 4.0],
+            "counts": [1, 1, 1],
+        }
+
+    def test_mixed_columns(self):
+        df = pd.DataFrame(
+            {
+                "s": ["x", "y", "x", None],
+                "b": [True, False, True, True],
+                "d": pd.to_datetime(["2020-01-02", "2020-01-01", None, None]),
+                "n": [None, None, None, None],
+            }
+        )
+        stats = calc_data_frame_stats(df)["columns"]
+        assert stats["s"]["distinct_count"] == 2
+        assert stats["s"]["null_count"] == 1
+        assert "mean" not in stats["b"]
+        assert stats["d"]["min"] == "2020-01-01 00:00:00"
+        assert stats["n"]["count"] == 0
+
+    def test_unhashable_values(self):
+        df = pd.DataFrame({"l": [[1, 2], None, [3]], "a": [1, 2, 2]})
+        stats = calc_data_frame_stats(df)["columns"]
+        assert "distinct_count" not in stats["l"]
+        assert stats["l"]["null_count"] == 1
+        assert stats["a"]["distinct_count"] == 2
+
+    def test_sampling(self):
+        df = pd.DataFrame({"a": np.arange(10000), "b": np.ones(10000)})
+        stats = calc_data_frame_stats(df, max_rows=1000)
+        assert stats["rows"] == 10000
+        assert stats["sampled_rows"] == 1000
+        assert stats["columns"]["a"]["count"] == 1000
+        assert stats["columns"]["b"]["histogram"]["counts"][0] == 1000
+        # sample is the same every time
+        assert calc_data_frame_stats(df, max_rows=1000) == stats
+
+    def test_hll_distinct_count(self):
+        for n in [0, 1, 100, 200000]:
+            hashes = hash_pandas_object(pd.Series(np.arange(n) % (n or 1)), index=False)
+            assert abs(hll_distinct_count(hashes.values) - n) <= n * 0.03
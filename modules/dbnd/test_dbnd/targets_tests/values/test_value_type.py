@@ -1,10 +1,19 @@
+import sys
+import types
+
 import pytest
 
 from dbnd._core.errors import DatabandRuntimeError
 from dbnd._core.utils import json_utils
 from dbnd._vendor import fast_hasher
 from targets.value_meta import ValueMeta, ValueMetaConf
-from targets.values import InlineValueType, StrValueType, register_value_type
+from targets.values import (
+    InlineValueType,
+    ObjectValueType,
+    StrValueType,
+    register_value_type,
+)
+from targets.values.registry import LibraryValueTypes, ValueTypeRegistry
 
 
 class TestValueType(object):
@@ -34,3 +43,26 @@ class TestValueType(object):
             data_hash=fast_hasher.hash("foo"),
         )
         assert str_value_meta == expected_value_meta
+
+    def test_library_value_types(self):
+        class MyLibObj(object):
+            pass
+
+        library = "test_dbnd_value_type_library"
+        registry = ValueTypeRegistry(
+            known_value_types=[
+                LibraryValueTypes(library, lambda: [InlineValueType(MyLibObj)]),
+                ObjectValueType(),
+            ]
+        )
+        # the library is not imported yet
+        assert not registry.load_imported_libraries()
+        assert len(registry.value_types) == 1
+
+        sys.modules[library] = types.ModuleType(library)
+        try:
+            assert registry.get_value_type_of_obj(MyLibObj()).type == MyLibObj
+        finally:
+            del sys.modules[library]
+        # library types keep their position, before the object type
+        assert [v.type for v in registry.value_types] == [MyLibObj, object]
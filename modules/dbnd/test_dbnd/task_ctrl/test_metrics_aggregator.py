@@ -0,0 +1,191 @@
+import datetime
+import time
+import uuid
+
+from mock import Mock
+
+from dbnd._core.errors.base import DatabandApiError
+from dbnd._core.task_run.task_run_meta_files import TaskRunMetaFiles
+from dbnd._core.task_run.task_run_tracker import TaskRunTracker
+from dbnd._core.tracking.metrics_aggregator import (
+    MetricsAggregator,
+    MetricsFlusher,
+    is_aggregated_value,
+)
+from dbnd._core.tracking.tracking_store import TrackingStore
+from dbnd._core.tracking.metrics import Metric
+from dbnd._core.tracking.tracking_store_api import TrackingStoreApi
+from dbnd.api.tracking_api import TrackingAPI
+from dbnd._core.tracking.tracking_store_file import (
+    FileTrackingStore,
+    TaskRunMetricsFileStoreReader,
+)
+from targets import target
+
+
+_START = datetime.datetime(2020, 1, 1)
+
+
+def _ts(i):
+    return _START + datetime.timedelta(seconds=i)
+
+
+class RecordingStore(TrackingStore):
+    def __init__(self):
+        self.calls = []
+
+    def log_metric(self, task_run, metric, source=None):
+        self.calls.append([(metric.key, metric.value)])
+
+    def log_metrics(self, task_run, metrics, source=None):
+        self.calls.append([(m.key, m.value) for m in metrics])
+
+
+class TestMetricsAggregator(object):
+    def test_is_aggregated_value(self):
+        assert is_aggregated_value(1)
+        assert is_aggregated_value(0.5)
+        assert not is_aggregated_value(True)
+        assert not is_aggregated_value("1")
+        assert not is_aggregated_value([1, 2])
+
+    def test_stride(self):
+        aggregator = MetricsAggregator(flush_interval=1000, flush_stride=10)
+        sent = []
+        for i in range(25):
+            sent.append(aggregator.add("loss", i, _ts(i)))
+
+        assert [len(s) for s in sent if s] == [10, 10]
+        assert [m.value for _, m in sent[9]] == list(range(10))
+        assert [m.value for _, m in aggregator.flush()] == list(range(20, 25))
+
+    def test_sample(self):
+        aggregator = MetricsAggregator(flush_interval=1000, sample_size=20)
+        for i in range(10000):
+            assert not aggregator.add("loss", i, _ts(i), source="user")
+
+        sent = aggregator.flush(final=True)
+        assert all(source == "user" for source, _ in sent)
+        series = [(m.key, m.value) for _, m in sent if m.key == "loss"]
+        assert len(series) == 20
+        # sorted by the original order, the last value is always sent
+        values = [v for _, v in series]
+        assert values == sorted(values)
+        assert values[-1] == 9999
+
+        summary = {m.key: m.value for _, m in sent if m.key != "loss"}
+        assert summary == {
+            "loss.count": 10000,
+            "loss.min": 0.0,
+            "loss.max": 9999.0,
+            "loss.mean": 4999.5,
+        }
+        assert aggregator.flush(final=True) == []
+
+    def test_no_summary_without_dropped_values(self):
+        aggregator = MetricsAggregator(flush_interval=1000, sample_size=20)
+        aggregator.add("a", 1, _ts(0))
+        aggregator.add("a", 2, _ts(1))
+        assert [(m.key, m.value) for _, m in aggregator.flush(final=True)] == [
+            ("a", 1),
+            ("a", 2),
+        ]
+
+    def test_interval(self):
+        aggregator = MetricsAggregator(flush_interval=0)
+        assert [m.value for _, m in aggregator.add("a", 1, _ts(0))] == [1]
+        assert [m.value for _, m in aggregator.add("a", 2, _ts(1))] == [2]
+
+    def test_flush_due(self):
+        aggregator = MetricsAggregator(flush_interval=0.1)
+        assert not aggregator.add("a", 1, _ts(0))
+        assert not aggregator.flush_due()
+        time.sleep(0.1)
+        assert [m.value for _, m in aggregator.flush_due()] == [1]
+
+    def test_flusher(self):
+        aggregator = MetricsAggregator(flush_interval=0.1)
+        sent = []
+        flusher = MetricsFlusher(tick_s=0.05)
+        flusher.register(aggregator, sent.extend)
+        aggregator.add("a", 1, _ts(0))
+        for _ in range(50):
+            if sent:
+                break
+            time.sleep(0.1)
+        assert [m.value for _, m in sent] == [1]
+
+        flusher.unregister(aggregator)
+        aggregator.add("a", 2, _ts(1))
+        time.sleep(0.2)
+        assert len(sent) == 1
+
+
+class TestTrackerMetricsAggregation(object):
+    def _tracker(self, store, **kwargs):
+        kwargs.setdefault("flush_interval", 1000)
+        return TaskRunTracker(
+            task_run=Mock(),
+            tracking_store=store,
+            metrics_aggregator=MetricsAggregator(**kwargs),
+        )
+
+    def test_log_metrics(self):
+        store = RecordingStore()
+        tracker = self._tracker(store)
+
+        tracker.log_metrics({"loss": 0.5, "acc": 0.1, "phase": "train"})
+        # not numeric values are sent in place
+        assert store.calls == [[("phase", "train")]]
+
+        tracker.log_metrics({"loss": 0.4, "acc": 0.2})
+        tracker.flush_metrics()
+        assert store.calls[1] == [
+            ("loss", 0.5),
+            ("loss", 0.4),
+            ("acc", 0.1),
+            ("acc", 0.2),
+        ]
+
+    def test_file_store_history(self, tmpdir):
+        metrics_folder = target(str(tmpdir))
+        task_run = Mock()
+        task_run.meta_files = TaskRunMetaFiles(metrics_folder)
+        tracker = TaskRunTracker(
+            task_run=task_run,
+            tracking_store=FileTrackingStore(),
+            metrics_aggregator=MetricsAggregator(flush_interval=1000, sample_size=10),
+        )
+        for i in range(1000):
+            tracker.log_metric("a", i)
+        tracker.flush_metrics()
+
+        reader = TaskRunMetricsFileStoreReader(metrics_folder)
+        assert len(reader.get_metric_history("a")) == 10
+        assert reader.get_last_metric("a").value == 999
+        assert reader.get_last_metric("a.count").value == 1000
+
+    def test_api_store_without_log_metrics_endpoint(self):
+        class OldServerChannel(TrackingAPI):
+            def __init__(self):
+                self.calls = []
+
+            def _handle(self, name, data):
+                self.calls.append(name)
+                if name == "log_metrics":
+                    raise DatabandApiError("POST", name, 404, "not found")
+
+        channel = OldServerChannel()
+        store = TrackingStoreApi(channel=channel)
+        task_run = Mock(task_run_attempt_uid=uuid.uuid4())
+        metrics = [
+            Metric(key="a", value=1, timestamp=_ts(0)),
+            Metric(key="b", value=2, timestamp=_ts(0)),
+        ]
+
+        store.log_metrics(task_run=task_run, metrics=metrics)
+        assert channel.calls == ["log_metrics", "log_metric", "log_metric"]
+
+        # the endpoint is not called again
+        store.log_metrics(task_run=task_run, metrics=metrics)
+        assert channel.calls[3:] == ["log_metric", "log_metric"]
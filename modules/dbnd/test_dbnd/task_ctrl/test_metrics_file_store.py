@@ -5,6 +5,7 @@ from dbnd._core.task_run.task_run_tracker import TaskRunTracker
 from dbnd._core.tracking.tracking_store_file import (
     FileTrackingStore,
     TaskRunMetricsFileStoreReader,
+    TaskRunMetricsFileWriter,
 )
 from targets import target
 from targets.value_meta import ValueMetaConf
@@ -41,3 +42,34 @@ class TestFileMetricsStore(object):
             "df.shape_0_": 5.0,
             "df.shape_1_": 2.0,
         }
+
+    def test_task_metrics_history(self, tmpdir):
+        metrics_folder = target(str(tmpdir))
+
+        task_run = Mock()
+        task_run.meta_files = TaskRunMetaFiles(metrics_folder)
+        t = FileTrackingStore()
+        tr_tracker = TaskRunTracker(task_run=task_run, tracking_store=t)
+        for i in range(100):
+            tr_tracker.log_metric("a", i)
+
+        reader = TaskRunMetricsFileStoreReader(metrics_folder)
+        assert reader.get_metric("a").value == 0
+        assert reader.get_last_metric("a").value == 99
+        assert [m.value for m in reader.get_metric_history("a")] == list(range(100))
+
+    def test_task_metrics_remote_buffer(self):
+        # remote file systems don't support append
+        metric_target = Mock()
+        metric_target.fs.support_direct_access = False
+        metric_target.path = "s3://bucket/metrics/user/a"
+        metric_target.exists.return_value = True
+        metric_target.read.return_value = "0 0\n"
+
+        writer = TaskRunMetricsFileWriter(flush_interval=1000)
+        writer.write(metric_target, "1 1\n")
+        writer.write(metric_target, "2 2\n")
+        assert not metric_target.write.called
+
+        writer.close()
+        metric_target.write.assert_called_once_with("0 0\n1 1\n2 2\n")
@@ -0,0 +1,83 @@
+import os
+import time
+
+from dbnd._core.log.remote_log_shipper import RemoteLogShipper, read_file_preview
+from targets import target
+from targets.fs.mock import MockFileSystem, mock_target
+
+
+def _write(path, data, mode="a"):
+    with open(path, mode) as f:
+        f.write(data)
+
+
+class TestReadFilePreview(object):
+    def test_small_file(self, tmpdir):
+        path = str(tmpdir.join("log.txt"))
+        _write(path, "line 1\nline 2\n")
+        assert read_file_preview(path, 1000) == "line 1\nline 2\n"
+        assert read_file_preview(path, -1000) == "line 1\nline 2\n"
+
+    def test_tail_and_head(self, tmpdir):
+        path = str(tmpdir.join("log.txt"))
+        body = "".join("line %04d\n" % i for i in range(1000))
+        _write(path, body)
+
+        tail = read_file_preview(path, 100)
+        assert len(tail) <= 100
+        assert tail == "(80 of 10000) ...%s" % body[-80:]
+
+        head = read_file_preview(path, -100)
+        assert len(head) <= 100
+        assert head == "%s... (80 of 10000)" % body[:80]
+
+
+class TestRemoteLogShipper(object):
+    def test_incremental(self, tmpdir):
+        local_path = str(tmpdir.join("local.log"))
+        remote = target(str(tmpdir.join("remote", "task.log")))
+        _write(local_path, "")
+        remote.write("previous try")
+
+        shipper = RemoteLogShipper(local_path, remote, interval=0).start()
+        assert shipper.is_incremental
+        assert not remote.exists()
+
+        _write(local_path, "first\n")
+        shipper.ship()
+        assert remote.read() == "first\n"
+
+        _write(local_path, "second\n")
+        shipper.stop()
+        assert remote.read() == "first\nsecond\n"
+
+    def test_background_shipping(self, tmpdir):
+        local_path = str(tmpdir.join("local.log"))
+        remote = target(str(tmpdir.join("task.log")))
+        _write(local_path, "first\n")
+
+        shipper = RemoteLogShipper(local_path, remote, interval=0.01).start()
+        try:
+            for _ in range(500):
+                if remote.exists():
+                    break
+                time.sleep(0.01)
+            assert remote.read() == "first\n"
+        finally:
+            shipper.stop()
+        assert remote.read() == "first\n"
+
+    def test_upload_at_stop(self, tmpdir):
+        MockFileSystem.instance.clear()
+        local_path = str(tmpdir.join("local.log"))
+        remote = mock_target("task.log")
+        _write(local_path, "first\n")
+
+        shipper = RemoteLogShipper(local_path, remote, interval=0.01).start()
+        assert not shipper.is_incremental
+        assert shipper._thread is None
+
+        _write(local_path, "second\n")
+        shipper.stop()
+        assert MockFileSystem.instance.get_data("task.log") == b"first\nsecond\n"
+        assert os.path.exists(local_path)
@@ -0,0 +1,67 @@
+import pytest
+
+from dbnd._core.errors import DatabandBuildError
+from dbnd._core.task_ctrl.task_dag import _TaskDagIndex, all_subdags, topological_sort
+from test_dbnd.factories import TTask
+
+
+class _FakeTask(object):
+    # enough of the Task api for _TaskDagIndex
+    def __init__(self, task_id, upstream_task_ids):
+        self.task_id = task_id
+        self.ctrl = self
+        self.task_dag = self
+        self.upstream_task_ids = upstream_task_ids
+
+
+def _tasks(*names):
+    return [TTask(task_name=name, t_param=name) for name in names]
+
+
+class TestTaskDag(object):
+    def test_topological_sort(self):
+        a, b, c, d = _tasks("a", "b", "c", "d")
+        # diamond: a -> b, c -> d
+        d.task_dag.set_upstream([b, c])
+        b.task_dag.set_upstream(a)
+        c.task_dag.set_upstream(a)
+
+        assert set(d.task_dag.subdag_tasks()) == {a, b, c, d}
+        assert all_subdags([b, c]) == {a, b, c}
+
+        order = topological_sort([d, c, b, a])
+        assert order[0] == a
+        assert order[-1] == d
+        # upstream tasks out of the list are ignored
+        assert topological_sort([d, c]) == (c, d)
+
+    def test_cycle(self):
+        a, b, c = _tasks("cycle_a", "cycle_b", "cycle_c")
+        b.task_dag.set_upstream(a)
+        c.task_dag.set_upstream(b)
+        a.task_dag.set_upstream(b)
+
+        with pytest.raises(DatabandBuildError, match="A cyclic dependency occurred"):
+            topological_sort([a, b, c])
+
+    def test_large_chain(self):
+        size = 50000
+        tasks = [_FakeTask(str(i), {str(i - 1)} if i else set()) for i in range(size)]
+        index = _TaskDagIndex(reversed(tasks))
+        order = [index.tasks[node].task_id for node in index.topological_order()]
+        assert order == [str(i) for i in range(size)]
+
+    def test_find_cycle(self):
+        tasks = [
+            _FakeTask("a", set()),
+            _FakeTask("b", {"a", "d"}),
+            _FakeTask("c", {"b"}),
+            _FakeTask("d", {"c"}),
+            _FakeTask("e", {"d"}),
+        ]
+        index = _TaskDagIndex(tasks)
+        order = index.topological_order()
+        assert [index.tasks[node].task_id for node in order] == ["a"]
+
+        cycle = index.find_cycle(set(range(len(tasks))) - set(order))
+        assert {index.tasks[node].task_id for node in cycle} == {"b", "c", "d"}
@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+
+from dbnd._core.errors.base import DatabandApiError
+from dbnd._core.tracking.channels import tracking_async_channel
+from dbnd._core.tracking.channels.tracking_async_channel import (
+    AsyncTrackingWorker,
+    TrackingAsyncChannel,
+    get_async_tracking_worker,
+)
+from dbnd.api.tracking_api import TrackingAPI
+
+
+class RecordingChannel(TrackingAPI):
+    def __init__(self, supported=None, blocker=None):
+        self.calls = []
+        self.supported = supported
+        self.blocker = blocker
+
+    def _handle(self, name, data):
+        if self.blocker:
+            self.blocker.wait()
+        if self.supported is not None and name not in self.supported:
+            raise DatabandApiError("POST", name, 404, "")
+        self.calls.append((name, data))
+        if name == "heartbeat":
+            return "RUNNING"
+
+
+def _metric(key):
+    return {"task_run_attempt_uid": "uid", "metric": {"key": key}, "source": None}
+
+
+class TestTrackingAsyncChannel(object):
+    def test_coalesce_consecutive_calls(self):
+        channel = RecordingChannel()
+        async_channel = TrackingAsyncChannel(
+            channel, AsyncTrackingWorker(flush_interval=60)
+        )
+        async_channel.update_task_run_attempts({"task_run_attempt_updates": [1]})
+        async_channel.log_metric(_metric("a"))
+        async_channel.log_metric(_metric("b"))
+        async_channel.log_targets({"targets_info": [1, 2]})
+        async_channel.log_targets({"targets_info": [3]})
+        assert not channel.calls
+
+        async_channel.set_run_state({"state": "SUCCESS"})
+        assert channel.calls == [
+            ("update_task_run_attempts", {"task_run_attempt_updates": [1]}),
+            ("log_metrics", {"metrics_info": [_metric("a"), _metric("b")]}),
+            ("log_targets", {"targets_info": [1, 2, 3]}),
+            ("set_run_state", {"state": "SUCCESS"}),
+        ]
+
+    def test_sync_calls_keep_order(self):
+        channel = RecordingChannel()
+        async_channel = TrackingAsyncChannel(
+            channel, AsyncTrackingWorker(flush_interval=60)
+        )
+        async_channel.log_metric(_metric("a"))
+        assert async_channel.heartbeat({"run_uid": "r"}) == "RUNNING"
+        assert [name for name, _ in channel.calls] == ["log_metric", "heartbeat"]
+
+    def test_bulk_fallback(self):
+        channel = RecordingChannel(supported={"log_metric"})
+        worker = AsyncTrackingWorker(flush_interval=60)
+        async_channel = TrackingAsyncChannel(channel, worker)
+        async_channel.log_metric(_metric("a"))
+        async_channel.log_metric(_metric("b"))
+        async_channel.flush()
+
+        assert channel.calls == [
+            ("log_metric", _metric("a")),
+            ("log_metric", _metric("b")),
+        ]
+        assert worker.sent_calls == 2
+        assert worker.failed_calls == 0
+
+    def test_full_queue_drops(self):
+        blocker = threading.Event()
+        channel = RecordingChannel(blocker=blocker)
+        worker = AsyncTrackingWorker(max_queue_size=1, batch_size=1, put_timeout=0.01)
+        async_channel = TrackingAsyncChannel(channel, worker)
+        for i in range(10):
+            async_channel.log_metric(_metric(str(i)))
+        assert worker.dropped_calls > 0
+
+        blocker.set()
+        async_channel.flush()
+        assert len(channel.calls) + worker.dropped_calls == 10
+
+    def test_channel_without_bulk_call(self):
+        class SingleMetricChannel(object):
+            def __init__(self):
+                self.calls = []
+
+            def log_metric(self, data):
+                self.calls.append(data)
+
+        channel = SingleMetricChannel()
+        async_channel = TrackingAsyncChannel(
+            channel, AsyncTrackingWorker(flush_interval=60)
+        )
+        async_channel.log_metric(_metric("a"))
+        async_channel.log_metric(_metric("b"))
+        async_channel.flush()
+        assert channel.calls == [_metric("a"), _metric("b")]
+
+    def test_raise_on_error(self):
+        channel = RecordingChannel(supported={"log_targets"})
+        worker = AsyncTrackingWorker(flush_interval=60, raise_on_error=True)
+        async_channel = TrackingAsyncChannel(channel, worker)
+        async_channel.log_artifact({"name": "a"})
+        with pytest.raises(DatabandApiError):
+            async_channel.flush()
+        # raised once
+        async_channel.flush()
+
+        worker.configure(raise_on_error=False)
+        async_channel.log_artifact({"name": "a"})
+        async_channel.flush()
+        assert worker.failed_calls == 2
+
+    def test_worker_settings_are_updated(self, monkeypatch):
+        monkeypatch.setattr(tracking_async_channel, "_async_tracking_worker", None)
+        worker = get_async_tracking_worker(max_queue_size=10, batch_size=5)
+        worker.enqueue(RecordingChannel(), "log_artifact", {})
+        assert worker._queue.maxsize == 10
+
+        assert get_async_tracking_worker(max_queue_size=20, batch_size=7) is worker
+        assert worker.batch_size == 7
+        assert worker._queue.maxsize == 20
+        worker.flush()
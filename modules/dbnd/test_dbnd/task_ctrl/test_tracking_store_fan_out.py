@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from dbnd import config
+from dbnd._core.errors.base import DatabandConnectionException
+from dbnd._core.settings import CoreConfig
+from dbnd._core.tracking.tracking_store import CompositeTrackingStore, TrackingStore
+from dbnd._core.tracking.tracking_store_worker import TrackingStoreWorker
+
+
+class RecordingStore(TrackingStore):
+    def __init__(self, blocker=None, fail=False):
+        self.calls = []
+        self.blocker = blocker
+        self.fail = fail
+
+    def heartbeat(self, run_uid):
+        if self.blocker:
+            self.blocker.wait()
+        if self.fail:
+            raise DatabandConnectionException("store is down")
+        self.calls.append(("heartbeat", run_uid))
+        return "RUNNING"
+
+    def set_run_state(self, run, state, error=None, timestamp=None):
+        self.calls.append(("set_run_state", state))
+
+
+def _fan_out(stores_and_workers, raise_on_error=False):
+    return CompositeTrackingStore(
+        stores=[store for store, _ in stores_and_workers],
+        raise_on_error=raise_on_error,
+        workers={store: worker for store, worker in stores_and_workers},
+    )
+
+
+class TestTrackingStoreFanOut(object):
+    def test_waits_only_for_critical(self):
+        blocker = threading.Event()
+        slow = RecordingStore(blocker=blocker)
+        critical = RecordingStore()
+        composite = _fan_out(
+            [
+                (slow, TrackingStoreWorker("slow")),
+                (critical, TrackingStoreWorker("critical", critical=True)),
+            ]
+        )
+
+        assert composite.heartbeat(run_uid="r") == "RUNNING"
+        assert critical.calls == [("heartbeat", "r")]
+        assert not slow.calls
+
+        # the end of the run waits for everything queued before
+        blocker.set()
+        composite.set_run_state(run=None, state="SUCCESS")
+        assert slow.calls == [("heartbeat", "r"), ("set_run_state", "SUCCESS")]
+
+    def test_critical_timeout(self):
+        blocker = threading.Event()
+        worker = TrackingStoreWorker("api", critical=True, timeout=0.1)
+        composite = _fan_out([(RecordingStore(blocker=blocker), worker)], True)
+        try:
+            with pytest.raises(DatabandConnectionException):
+                composite.heartbeat(run_uid="r")
+            assert worker.timeouts == 1
+        finally:
+            blocker.set()
+
+    def test_circuit_breaker(self):
+        store = RecordingStore(fail=True)
+        worker = TrackingStoreWorker(
+            "api", critical=True, failure_threshold=2, reset_timeout=60
+        )
+        composite = _fan_out([(store, worker)])
+
+        assert composite.heartbeat(run_uid="1") is None
+        assert not worker.is_circuit_open
+        assert composite.heartbeat(run_uid="2") is None
+        assert worker.is_circuit_open
+
+        # the store is not called till reset timeout
+        store.fail = False
+        assert composite.heartbeat(run_uid="3") is None
+        assert worker.skipped_calls == 1
+        assert not store.calls
+
+        worker.reset_timeout = 0
+        worker._open_until = 0
+        assert composite.heartbeat(run_uid="4") == "RUNNING"
+        assert worker.consecutive_failures == 0
+        assert worker.stats()["failures"] == 2
+
+    def test_core_config_fan_out(self):
+        with config(
+            {
+                CoreConfig.tracker: ["console", "file"],
+                CoreConfig.tracker_fan_out: True,
+                CoreConfig.tracker_critical: ["file"],
+                CoreConfig.tracker_store_timeouts: {"file": 5},
+            }
+        ):
+            store = CoreConfig().get_tracking_store()
+        workers = sorted(store._workers.values(), key=lambda w: w.name)
+        assert [(w.name, w.critical, w.timeout) for w in workers] == [
+            ("console", False, 30.0),
+            ("file", True, 5.0),
+        ]
@@ -0,0 +1,41 @@
+import threading
+
+from dbnd._core.utils.daemon_worker import DaemonWorker
+
+
+class _Worker(DaemonWorker):
+    def __init__(self):
+        super(_Worker, self).__init__(thread_name="test-daemon-worker")
+        self.starts = 0
+        self._stop = threading.Event()
+
+    def _on_start(self):
+        self.starts += 1
+
+    def _run(self):
+        self._stop.wait(10)
+
+
+class TestDaemonWorker(object):
+    def test_started_once(self):
+        worker = _Worker()
+        assert not worker.is_started
+        worker._ensure_started()
+        worker._ensure_started()
+        assert worker.is_started
+        assert worker.starts == 1
+        assert worker._thread.daemon
+        worker._stop.set()
+
+    def test_restarted_in_another_process(self):
+        worker = _Worker()
+        worker._ensure_started()
+        parent_thread = worker._thread
+
+        # that's what the worker sees in a forked child
+        worker._pid = -1
+        assert not worker.is_started
+        worker._ensure_started()
+        assert worker.starts == 2
+        assert worker._thread is not parent_thread
+        worker._stop.set()
@@ -0,0 +1,84 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from mock import Mock
+
+from dbnd._core.utils.http.endpoint import Endpoint
+from dbnd._core.utils.http.reliable_http_client import (
+    HttpClientException,
+    ReliableHttpClient,
+)
+from dbnd._core.utils.http.retry_policy import LinearRetryPolicy
+
+
+def _response(status_code):
+    r = Mock()
+    r.status_code = status_code
+    r.text = ""
+    return r
+
+
+class TestReliableHttpClient(object):
+    def _client(self, responses, **kwargs):
+        client = ReliableHttpClient(
+            Endpoint("http://localhost:8998"),
+            {"Content-Type": "application/json"},
+            LinearRetryPolicy(seconds_to_sleep=0, max_retries=2),
+            **kwargs
+        )
+        client._session = Mock()
+        client._session.request.side_effect = responses
+        return client
+
+    def test_retry_reuses_body(self):
+        client = self._client([_response(500), _response(201)])
+        client.post("/batches", [201], {"file": "a.jar"})
+
+        calls = client._session.request.call_args_list
+        assert len(calls) == 2
+        first_body = calls[0][1]["data"]
+        assert first_body is calls[1][1]["data"]
+        assert json.loads(first_body.decode("utf-8")) == {"file": "a.jar"}
+
+    def test_max_retries(self):
+        client = self._client([_response(500)] * 4)
+        with pytest.raises(HttpClientException):
+            client.get("/batches", [200])
+        assert client._session.request.call_count == 4
+
+    def test_compress_requests(self):
+        client = self._client([_response(201)], compress_requests=True)
+        client.post("/batches", [201], {"file": "a.jar"})
+
+        kwargs = client._session.request.call_args[1]
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        with gzip.GzipFile(fileobj=io.BytesIO(kwargs["data"])) as f:
+            assert json.loads(f.read().decode("utf-8")) == {"file": "a.jar"}
+        # original headers are not changed
+        assert "Content-Encoding" not in client.get_headers()
+
+    def test_session_pool(self):
+        client = ReliableHttpClient(
+            Endpoint("http://localhost:8998"),
+            {},
+            LinearRetryPolicy(seconds_to_sleep=0, max_retries=0),
+            pool_maxsize=3,
+        )
+        adapter = client.session.get_adapter("http://localhost:8998")
+        assert adapter._pool_maxsize == 3
+        assert client.session is client.session
+
+
+class TestRetryPolicyJitter(object):
+    def test_jitter_bounds(self):
+        policy = LinearRetryPolicy(seconds_to_sleep=10, max_retries=5, jitter=0.5)
+        sleeps = [policy.seconds_to_sleep(1) for _ in range(100)]
+        assert all(5 <= s <= 15 for s in sleeps)
+        assert len(set(sleeps)) > 1
+
+    def test_no_jitter(self):
+        policy = LinearRetryPolicy(seconds_to_sleep=10, max_retries=5)
+        assert policy.seconds_to_sleep(1) == 10
@@ -6,6 +6,7 @@ from dbnd._core.errors import DatabandRuntimeError
 from dbnd._core.errors.friendly_error.task_execution import failed_to_run_emr_step
 from dbnd_aws.credentials import get_boto_emr_client
 from dbnd_spark._core.spark_error_parser import parse_spark_log
+from dbnd_spark._core.spark_jobs_poller import SparkJobHandle, track_spark_job
 from targets import target
 
 
@@ -126,8 +127,8 @@ class EmrCluster(object):
 
     def wait_for_step_completion(self, step_id, status_reporter=None):
         status_reporter = status_reporter or self._default_status_reporter
-        while True:
-            step = self.get_step_info(step_id)
+        # the step state is polled by the shared poller
+        for step, _ in track_spark_job(EmrStepHandle(self, step_id)):
             if "FAILED" == step["Step"]["Status"]["State"]:
                 logger.error("Emr step %s has errors", step_id)
                 logger.error(step["Step"]["Status"]["FailureDetails"])
@@ -148,7 +149,10 @@ class EmrCluster(object):
             logger.debug(
                 "Emr step %s is %s", step, str(step["Step"]["Status"]["State"])
             )
-            time.sleep(10)
+
+        # the step has ended with some other final state (INTERRUPTED)
+        logger.warning("Emr step %s is %s", step_id, step["Step"]["Status"]["State"])
+        return False
 
     def _raise_error(self, step):
         if "FAILED" == step["Step"]["Status"]["State"]:
@@ -184,3 +188,42 @@ class EmrCluster(object):
 
             time.sleep(eventual_consistency_sleep_interval)
         raise failed_to_run_emr_step("Failed to read log file at %s" % path, None, None)
+
+
+EMR_STEP_DONE_STATES = ["COMPLETED", "CANCELLED", "FAILED", "INTERRUPTED"]
+# max number of step ids in one ListSteps call
+EMR_LIST_STEPS_MAX_IDS = 10
+
+
+class EmrStepHandle(SparkJobHandle):
+    def __init__(self, emr_cluster, step_id):
+        # type: (EmrCluster, str) -> None
+        super(EmrStepHandle, self).__init__(
+            name="emr step %s" % step_id, max_poll_interval=10
+        )
+        self.emr_cluster = emr_cluster
+        self.step_id = step_id
+        # all the steps of the same cluster are polled with one call
+        self.batch_key = emr_cluster.cluster_id
+
+    def get_status(self):
+        return self.emr_cluster.get_step_info(self.step_id)
+
+    @classmethod
+    def get_statuses(cls, handles):
+        emr_cluster = handles[0].emr_cluster
+        steps = {}
+        for i in range(0, len(handles), EMR_LIST_STEPS_MAX_IDS):
+            step_ids = [h.step_id for h in handles[i : i + EMR_LIST_STEPS_MAX_IDS]]
+            response = emr_cluster.emr_conn.list_steps(
+                ClusterId=emr_cluster.cluster_id, StepIds=step_ids
+            )
+            # the same structure as DescribeStep response
+            steps.update({s["Id"]: {"Step": s} for s in response["Steps"]})
+        return {handle: steps.get(handle.step_id) for handle in handles}
+
+    def is_done(self, status):
+        return status["Step"]["Status"]["State"] in EMR_STEP_DONE_STATES
+
+    def status_key(self, status):
+        return status["Step"]["Status"]["State"]
@@ -42,6 +42,12 @@ from targets import (
 from targets.config import get_config_section_values
 from targets.errors import FileNotFoundException, TargetError
 from targets.fs import FileSystems
+from targets.fs.listing_cache import (
+    DEFAULT_LISTING_CACHE_TTL,
+    PrefixListing,
+    get_run_listing_cache,
+    stat_many_by_listing,
+)
 from targets.utils.path import path_to_bucket_and_key
 
 
@@ -93,6 +99,11 @@ class S3Client(FileSystem):
     _exist_after_write_consistent = False
     _s3 = None
 
+    # seconds to keep prefix listings of the run, used by exists_many/stat_many/listdir
+    listing_cache_ttl = DEFAULT_LISTING_CACHE_TTL
+    # don't answer from listing if there are more objects under the prefix
+    max_listing_keys = 10000
+
     @classmethod
     def from_boto_resource(cls, resource):
         client = cls()
@@ -109,6 +120,10 @@ class S3Client(FileSystem):
 
         self._options = options
 
+    @property
+    def _listing_cache(self):
+        return get_run_listing_cache(self.name, ttl=self.listing_cache_ttl)
+
     @property
     def s3(self):
         # only import boto3 when needed to allow top-lvl s3 module import
@@ -203,6 +218,35 @@ class S3Client(FileSystem):
         logger.debug("Path %s does not exist", path)
         return False
 
+    def exists_many(self, paths):
+        return {path: stat is not None for path, stat in self.stat_many(paths).items()}
+
+    def stat_many(self, paths):
+        """
+        Answers from one listing of the common prefix of the paths (per bucket)
+        """
+        return stat_many_by_listing(
+            paths,
+            path_to_bucket_and_key=self._path_to_bucket_and_key,
+            list_prefix=self._list_prefix,
+            cache=self._listing_cache,
+            fallback=self._stat_many_in_threads,
+        )
+
+    def _list_prefix(self, bucket, prefix):
+        objects = {}
+        try:
+            paginator = self.s3.meta.client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    objects[obj["Key"]] = (obj["Size"], obj["LastModified"])
+                if len(objects) > self.max_listing_keys:
+                    return None
+        except botocore.exceptions.ClientError as e:
+            logger.debug("Failed to list s3://%s/%s: %s", bucket, prefix, e)
+            return None
+        return PrefixListing(prefix, objects)
+
     def remove(self, path, recursive=True):
         """
         Remove a file or directory from S3.
@@ -218,6 +262,7 @@ class S3Client(FileSystem):
             raise InvalidDeleteException(
                 "Cannot delete root of bucket at path %s" % path
             )
+        self._listing_cache.invalidate(bucket, key)
 
         # file
         if self._exists(bucket, key):
@@ -295,6 +340,7 @@ class S3Client(FileSystem):
         self._validate_bucket(bucket)
 
         # put the file
+        self._listing_cache.invalidate(bucket, key)
         self.s3.meta.client.put_object(Key=key, Bucket=bucket, Body=content, **kwargs)
 
     def put_multipart(
@@ -324,6 +370,7 @@ class S3Client(FileSystem):
         # logger.debug("Uploading %s --> %s, %s" , destination_s3_path , bucket,key)
         # validate the bucket
         self._validate_bucket(bucket)
+        self._listing_cache.invalidate(bucket, key)
 
         self.s3.meta.client.upload_fileobj(
             Fileobj=open(local_path, "rb"),
@@ -372,6 +419,7 @@ class S3Client(FileSystem):
             max_concurrency=threads, multipart_chunksize=part_size
         )
         total_keys = 0
+        self._listing_cache.invalidate(dst_bucket, dst_key)
 
         if self.isdir(source_path):
             (bucket, key) = self._path_to_bucket_and_key(source_path)
@@ -501,8 +549,23 @@ class S3Client(FileSystem):
 
         key_path = self._add_path_delimiter(key)
         key_path_len = len(key_path)
+
+        use_listing_cache = not (start_time or end_time or return_key)
+        if use_listing_cache:
+            listing = self._listing_cache.get(bucket, key_path)
+            if listing is not None:
+                for item_key in listing.iter_keys(key_path):
+                    yield self._add_path_delimiter(path) + item_key[key_path_len:]
+                return
+
+        # we cache the listing if it's not too big
+        objects = {} if use_listing_cache else None
         for item in s3_bucket.objects.filter(Prefix=key_path):
             last_modified_date = item.last_modified
+            if objects is not None:
+                objects[item.key] = (item.size, last_modified_date)
+                if len(objects) > self.max_listing_keys:
+                    objects = None
             if (
                 # neither are defined, list all
                 (not start_time and not end_time)
@@ -523,6 +586,9 @@ class S3Client(FileSystem):
                 else:
                     yield self._add_path_delimiter(path) + item.key[key_path_len:]
 
+        if objects is not None:
+            self._listing_cache.put(bucket, PrefixListing(key_path, objects))
+
     def list(
         self, path, start_time=None, end_time=None, return_key=False
     ):  # backwards compat
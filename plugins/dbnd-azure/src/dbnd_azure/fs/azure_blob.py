@@ -6,6 +6,7 @@ import time
 
 from six.moves import xrange
 
+from azure.common import AzureException
 from azure.storage.blob import BlockBlobService
 from dbnd_azure.fs import AZURE_BLOB_FS_NAME
 from targets import AtomicLocalFile
@@ -16,6 +17,12 @@ from targets.errors import (
     MissingParentDirectory,
 )
 from targets.fs.file_system import FileSystem
+from targets.fs.listing_cache import (
+    DEFAULT_LISTING_CACHE_TTL,
+    PrefixListing,
+    get_run_listing_cache,
+    stat_many_by_listing,
+)
 from targets.utils.atomic import _DeleteOnCloseFile
 
 
@@ -59,11 +66,20 @@ class AzureBlobStorageClient(FileSystem):
 
     name = AZURE_BLOB_FS_NAME
 
+    # seconds to keep prefix listings of the run, used by exists_many/stat_many
+    listing_cache_ttl = DEFAULT_LISTING_CACHE_TTL
+    # don't answer from listing if there are more blobs under the prefix
+    max_listing_keys = 10000
+
     def __init__(self, **kwargs):
         self._options = kwargs
         self.account = self._options.get("account_name")
         self.conn = self._create_connection()
 
+    @property
+    def _listing_cache(self):
+        return get_run_listing_cache(self.name, ttl=self.listing_cache_ttl)
+
     def _create_connection(self):
         return BlockBlobService(
             account_name=self._options.get("account_name"),
@@ -108,6 +124,45 @@ class AzureBlobStorageClient(FileSystem):
 
         return self.conn.exists(container_name, blob_name)
 
+    def exists_many(self, paths):
+        return {path: stat is not None for path, stat in self.stat_many(paths).items()}
+
+    def stat_many(self, paths):
+        """
+        Answers from one listing of the common prefix of the paths (per container)
+        """
+        return stat_many_by_listing(
+            paths,
+            path_to_bucket_and_key=self._path_to_container_and_blob,
+            list_prefix=self._list_prefix,
+            cache=self._listing_cache,
+            fallback=self._stat_many_in_threads,
+        )
+
+    def _path_to_container_and_blob(self, path):
+        storage_account, container_name, blob_name = self._path_to_account_container_and_blob(
+            path
+        )
+        assert self.account == storage_account
+        return container_name, blob_name
+
+    def _list_prefix(self, container, prefix):
+        objects = {}
+        try:
+            # list_blobs follows the continuation markers
+            for blob in self.conn.list_blobs(container, prefix=prefix):
+                objects[blob.name] = (
+                    blob.properties.content_length,
+                    blob.properties.last_modified,
+                )
+                if len(objects) > self.max_listing_keys:
+                    return None
+        except AzureException as ex:
+            # the container doesn't exist, paths are checked one by one
+            logger.debug("Failed to list %s/%s: %s", container, prefix, ex)
+            return None
+        return PrefixListing(prefix, objects)
+
     def isdir(self, path):
         storage_account, container_name, blob_name = self._path_to_account_container_and_blob(
             path
@@ -128,6 +183,7 @@ class AzureBlobStorageClient(FileSystem):
             path
         )
         assert self.account == storage_account
+        self._listing_cache.invalidate(container_name, prefix)
 
         if self._is_container(prefix):
             self.conn.delete_container(container_name)
@@ -179,6 +235,7 @@ class AzureBlobStorageClient(FileSystem):
             destination_path
         )
         assert self.account == dest_account
+        self._listing_cache.invalidate(dest_container, dest_prefix)
 
         if self.isdir(source_path):
             blobs = self.conn.list_blobs(
@@ -223,6 +280,7 @@ class AzureBlobStorageClient(FileSystem):
                 path=path, container=container, blob=blob
             )
         )
+        self._listing_cache.invalidate(container, blob)
         self.conn.create_container(container)
         self.conn.create_blob_from_path(container, blob, path)
         _wait_for_consistency(lambda: self.conn.exists(container, blob))
@@ -233,6 +291,7 @@ class AzureBlobStorageClient(FileSystem):
                 content=content, container=container, blob=blob
             )
         )
+        self._listing_cache.invalidate(container, blob)
         self.conn.create_container(container)
         self.conn.create_blob_from_text(container, blob, content)
         _wait_for_consistency(lambda: self.conn.exists(container, blob))
@@ -1,6 +1,5 @@
 import logging
 import os
-import time
 
 from airflow import AirflowException
 
@@ -18,6 +17,7 @@ from dbnd_databricks.errors import (
     failed_to_run_databricks_job,
     failed_to_submit_databricks_job,
 )
+from dbnd_spark._core.spark_jobs_poller import SparkJobHandle, track_spark_job
 from dbnd_spark.spark import SparkTask
 from dbnd_spark.spark_ctrl import SparkCtrl
 
@@ -25,6 +25,24 @@ from dbnd_spark.spark_ctrl import SparkCtrl
 logger = logging.getLogger(__name__)
 
 
+class DatabricksRunHandle(SparkJobHandle):
+    def __init__(self, hook, run_id, max_poll_interval):
+        super(DatabricksRunHandle, self).__init__(
+            name="databricks run %s" % run_id, max_poll_interval=max_poll_interval
+        )
+        self.hook = hook
+        self.run_id = run_id
+
+    def get_status(self):
+        return self.hook.get_run_state(self.run_id)
+
+    def is_done(self, status):
+        return status.is_terminal
+
+    def status_key(self, status):
+        return status.life_cycle_state
+
+
 class DatabricksCtrl(SparkCtrl):
     def __init__(self, task_run):
         super(DatabricksCtrl, self).__init__(task_run=task_run)
@@ -73,13 +91,19 @@ class DatabricksCtrl(SparkCtrl):
         self.task_run.set_external_resource_urls({"databricks url": url})
         b.column("URL", url)
         logger.info(b.get_banner_str())
-        while True:
+
+        # the run state is polled by the shared poller
+        run_handle = DatabricksRunHandle(
+            hook,
+            run_id,
+            max_poll_interval=self.databricks_config.status_polling_interval_seconds,
+        )
+        for run_state, _ in track_spark_job(run_handle):
             b = TextBanner(
                 "Spark task %s is submitted to Databricks cluster:" % task_id,
                 color="cyan",
             )
             b.column("URL", url)
-            run_state = hook.get_run_state(run_id)
             if run_state.is_terminal:
                 if run_state.is_successful:
                     b.column("Task completed successfully", task_id)
@@ -96,7 +120,6 @@ class DatabricksCtrl(SparkCtrl):
             else:
                 b.column("State:", run_state.life_cycle_state)
                 b.column("Message:", run_state.state_message)
-                time.sleep(self.databricks_config.status_polling_interval_seconds)
             logger.info(b.get_banner_str())
 
     def _create_spark_submit_json(self, spark_submit_parameters):
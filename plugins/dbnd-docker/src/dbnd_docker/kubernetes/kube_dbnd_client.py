@@ -21,6 +21,10 @@ from dbnd_airflow.airflow_extensions.dal import (
 from dbnd_airflow_contrib.airflow_task_instance_retry_controller import (
     AirflowTaskInstanceRetryController,
 )
+from dbnd_docker.kubernetes.kube_pod_state_watcher import (
+    KubePodStateWatcher,
+    get_pod_state_watcher,
+)
 from dbnd_docker.kubernetes.kube_resources_checker import DbndKubeResourcesChecker
 from dbnd_docker.kubernetes.kubernetes_engine_config import (
     KubernetesEngineConfig,
@@ -45,18 +49,25 @@ class DbndKubernetesClient(object):
         self.kube_client = kube_client
         self.engine_config = engine_config
 
-    def get_pod_ctrl(self, name, namespace=None):
-        # type: (str, Optional[str])-> DbndPodCtrl
+    def get_pod_ctrl(self, name, namespace=None, label_selector=None):
+        # type: (str, Optional[str], Optional[str])-> DbndPodCtrl
         return DbndPodCtrl(
             pod_name=name,
             pod_namespace=namespace or self.engine_config.namespace,
             kube_client=self.kube_client,
             kube_config=self.engine_config,
+            label_selector=label_selector,
         )
 
     def get_pod_ctrl_for_pod(self, pod):
         # type: (Pod)-> DbndPodCtrl
-        return self.get_pod_ctrl(pod.name, pod.namespace)
+        # all the pods of the run are tracked by the same watch
+        run_uid = (pod.labels or {}).get("dbnd_run_uid")
+        return self.get_pod_ctrl(
+            pod.name,
+            pod.namespace,
+            label_selector="dbnd_run_uid=%s" % run_uid if run_uid else None,
+        )
 
     def delete_pod(self, name, namespace):
         self.get_pod_ctrl(name=name, namespace=namespace).delete_pod()
@@ -240,11 +251,16 @@ class DbndKubernetesClient(object):
 
 
 class DbndPodCtrl(object):
-    def __init__(self, pod_name, pod_namespace, kube_config, kube_client):
+    def __init__(
+        self, pod_name, pod_namespace, kube_config, kube_client, label_selector=None
+    ):
         self.kube_config = kube_config
         self.name = pod_name
         self.namespace = pod_namespace
         self.kube_client = kube_client
+        # the pod state is tracked by the shared watch of this selector (if defined)
+        self.label_selector = label_selector
+        self._watched_resource_version = None
 
     def delete_pod(self):
         if self.kube_config.keep_finished_pods:
@@ -271,6 +287,7 @@ class DbndPodCtrl(object):
                 self.name, self.namespace, body=client.V1DeleteOptions()
             )
             logger.info("Pod '%s' has been deleted", self.name)
+            self._forget_pod()
         except ApiException as e:
             logger.info(
                 "Failed to delete pod '%s': %s",
@@ -293,10 +310,64 @@ class DbndPodCtrl(object):
                 )
             )
 
+    def _get_pod_state_watcher(self, create=True):
+        # type: (bool) -> Optional[KubePodStateWatcher]
+        if not (self.kube_config.watch_pods and self.label_selector):
+            return None
+        watcher = get_pod_state_watcher(
+            self.kube_client, self.namespace, self.label_selector, create=create
+        )
+        if watcher is None or watcher.disabled:
+            return None
+        return watcher
+
+    def _forget_pod(self):
+        # the watcher is stopped once all the pods of the run are forgotten
+        watcher = self._get_pod_state_watcher(create=False)
+        if watcher:
+            watcher.forget_pod(self.name)
+
+    def _read_pod_status(self):
+        # doesn't start a watch just to read the state
+        watcher = self._get_pod_state_watcher(create=False)
+        pod_status = watcher.get_pod(self.name) if watcher else None
+        return pod_status or self.get_pod_status_v1()
+
+    def _next_pod_status(self, pod_status, poll_interval, timeout):
+        """
+        Returns the next state of the pod: the waiter blocks on the events of the pod from the shared watch,
+        or polls the API every `poll_interval` seconds if there is no watch.
+        The API is polled as well while the watch is broken (no events or reconnects for a while),
+        otherwise the same `pod_status` is returned if the pod didn't change till the timeout.
+        """
+        watcher = self._get_pod_state_watcher()
+        healthy_for = watcher.healthy_for() if watcher else 0
+        if healthy_for > 0:
+            # compared to the last state we got from the watch, not from the API
+            new_pod_status = watcher.wait_for_pod_change(
+                self.name,
+                resource_version=self._watched_resource_version,
+                timeout=min(healthy_for, timeout),
+            )
+            if new_pod_status is not None:
+                self._watched_resource_version = (
+                    new_pod_status.metadata.resource_version
+                )
+                return new_pod_status
+            if watcher.healthy_for() > 0:
+                return pod_status
+        elif pod_status is not None:
+            time.sleep(max(0, min(poll_interval, timeout)))
+        try:
+            return self.get_pod_status_v1()
+        except Exception as e:
+            logger.warning("failed to read pod state for %s: %s", self.name, e)
+            return pod_status
+
     def get_airflow_state(self):
         """Process phase infomration for the JOB"""
         try:
-            pod_resp = self.get_pod_status_v1()
+            pod_resp = self._read_pod_status()
             return self._phase_to_airflow_state(pod_resp.status.phase)
         except Exception as e:
             logger.warning("failed to read pod state for %s: %s", self.name, e)
@@ -307,19 +378,29 @@ class DbndPodCtrl(object):
         will try to raise an exception if the pod fails to start (see DbndPodLauncher.check_deploy_errors)
         """
         start_time = datetime.now()
+        pod_status = None
         while True:
-            pod_status = self.get_pod_status_v1()
-            # PATCH:  validate deploy errors
+            startup_delta = datetime.now() - start_time
+            if startup_delta >= self.kube_config.startup_timeout:
+                raise DatabandError("Pod is still not running after %s" % startup_delta)
+
+            previous_pod_status = pod_status
+            pod_status = self._next_pod_status(
+                pod_status,
+                poll_interval=1,
+                timeout=(
+                    self.kube_config.startup_timeout - startup_delta
+                ).total_seconds(),
+            )
+            if pod_status is None or pod_status is previous_pod_status:
+                continue
+
+            # PATCH:  validate deploy errors (on every new state of the pod)
             self.check_deploy_errors(pod_status)
 
             pod_phase = pod_status.status.phase
             if pod_phase.lower() != PodStatus.PENDING:
                 return
-
-            startup_delta = datetime.now() - start_time
-            if startup_delta >= self.kube_config.startup_timeout:
-                raise DatabandError("Pod is still not running after %s" % startup_delta)
-            time.sleep(1)
             _logger.debug("Pod not yet started: %s", pod_status.status)
 
     def stream_pod_logs(self, print_func=logger.info, follow=False, tail_lines=None):
@@ -414,11 +495,22 @@ class DbndPodCtrl(object):
             logger.info("Event: Invalid state %s on job %s", phase, self.name)
             return State.FAILED
 
+    def _pod_status_to_airflow_state(self, pod_status):
+        if pod_status is None:
+            return None
+        return self._phase_to_airflow_state(pod_status.status.phase)
+
     def wait(self):
         """
         Waits for pod completion
         :return:
         """
+        try:
+            return self._wait()
+        finally:
+            self._forget_pod()
+
+    def _wait(self):
         self._wait_for_pod_started()
         logger.info("Pod '%s' is running, reading logs..", self.name)
         self.stream_pod_logs(follow=True)
@@ -426,25 +518,33 @@ class DbndPodCtrl(object):
 
         from airflow.utils.state import State
 
-        final_state = self.get_airflow_state()
+        try:
+            pod_status = self._read_pod_status()
+        except Exception as e:
+            logger.warning("failed to read pod state for %s: %s", self.name, e)
+            pod_status = None
+        final_state = self._pod_status_to_airflow_state(pod_status)
         wait_start = utcnow()
+        grace_period = self.kube_config.submit_termination_grace_period
         while final_state not in {State.SUCCESS, State.FAILED}:
             logger.debug(
                 "Pod '%s' is not completed with state %s, waiting..",
                 self.name,
                 final_state,
             )
-            if (
-                utcnow() - wait_start
-            ) > self.kube_config.submit_termination_grace_period:
+            wait_delta = utcnow() - wait_start
+            if wait_delta > grace_period:
                 raise DatabandRuntimeError(
                     "Pod is not in a final state after {grace_period}: {state}".format(
-                        grace_period=self.kube_config.submit_termination_grace_period,
-                        state=final_state,
+                        grace_period=grace_period, state=final_state
                     )
                 )
-            time.sleep(5)
-            final_state = self.get_airflow_state()
+            pod_status = self._next_pod_status(
+                pod_status,
+                poll_interval=5,
+                timeout=(grace_period - wait_delta).total_seconds(),
+            )
+            final_state = self._pod_status_to_airflow_state(pod_status)
 
         if final_state != State.SUCCESS:
             raise DatabandRuntimeError(
@@ -0,0 +1,263 @@
+import logging
+import threading
+import time
+import typing
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+
+if typing.TYPE_CHECKING:
+    from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# the server closes the watch after this time, we reconnect from the last resource version
+WATCH_TIMEOUT_SECONDS = 60
+# client side timeout (connect, read), so a half open connection doesn't hang the watch
+WATCH_REQUEST_TIMEOUT = (30, WATCH_TIMEOUT_SECONDS + 30)
+RECONNECT_DELAY_SECONDS = 1
+# the watch is broken if there was no event or reconnect for this time
+WATCH_HEALTH_TIMEOUT_SECONDS = WATCH_REQUEST_TIMEOUT[1]
+# the watcher is stopped after this time without waiters (all the pods of the run are done)
+IDLE_TIMEOUT_SECONDS = 60
+
+
+class KubePodStateWatcher(object):
+    """
+    One watch of the pods of the namespace (filtered by the label selector),
+    shared by all the waiters of this process.
+    Keeps the latest state of every pod and wakes up only the waiters of the changed pod.
+    """
+
+    def __init__(self, kube_client, namespace, label_selector):
+        self.kube_client = kube_client
+        self.namespace = namespace
+        self.label_selector = label_selector
+
+        # pod name -> latest V1Pod
+        self._pods = {}
+        self._lock = threading.Lock()
+        # pod name -> Condition (created by waiters), all share the same lock
+        self._pod_conditions = {}
+
+        self.resource_version = None
+        # watch is not permitted, waiters should fall back to polling
+        self.disabled = False
+        self._stopped = False
+        self._thread = None
+        self._last_used = time.time()
+        # the last event or reconnect of the watch
+        self._last_activity = None
+
+    def start(self):
+        self._last_activity = time.time()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="KubePodStateWatcher-%s-%s" % (self.namespace, self.label_selector),
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped = True
+        self._notify_all()
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    def healthy_for(self):
+        """Seconds the watch is considered alive without new events, 0 if it's broken"""
+        if self.disabled or self._stopped or self._last_activity is None:
+            return 0
+        return max(0, self._last_activity + WATCH_HEALTH_TIMEOUT_SECONDS - time.time())
+
+    def touch(self):
+        self._last_used = time.time()
+
+    def is_idle(self):
+        with self._lock:
+            return (
+                not self._pod_conditions
+                and time.time() - self._last_used > IDLE_TIMEOUT_SECONDS
+            )
+
+    def _run(self):
+        while not self._stopped:
+            if _stop_if_idle(self):
+                return
+            try:
+                if self.resource_version is None:
+                    self._list_pods()
+                self._watch_pods()
+            except ApiException as ex:
+                if ex.status in (401, 403):
+                    logger.warning(
+                        "Can't watch pods at %s (%s), falling back to polling: %s",
+                        self.namespace,
+                        self.label_selector,
+                        ex.reason,
+                    )
+                    self.disabled = True
+                    self._notify_all()
+                    return
+                if ex.status == 410:
+                    # our resource version is too old
+                    self.resource_version = None
+                else:
+                    logger.warning(
+                        "Pods watch at %s has failed: %s", self.namespace, ex
+                    )
+                time.sleep(RECONNECT_DELAY_SECONDS)
+            except Exception as ex:
+                # we can't be sure the events are not lost, so we start with a fresh list
+                logger.warning("Pods watch at %s has failed: %s", self.namespace, ex)
+                self.resource_version = None
+                time.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _list_pods(self):
+        pods = self.kube_client.list_namespaced_pod(
+            self.namespace, label_selector=self.label_selector
+        )
+        for pod in pods.items:
+            self._on_pod_event("ADDED", pod)
+        self.resource_version = pods.metadata.resource_version
+        self._last_activity = time.time()
+
+    def _watch_pods(self):
+        kwargs = {
+            "label_selector": self.label_selector,
+            "timeout_seconds": WATCH_TIMEOUT_SECONDS,
+            "_request_timeout": WATCH_REQUEST_TIMEOUT,
+        }
+        if self.resource_version:
+            kwargs["resource_version"] = self.resource_version
+
+        pods_watch = watch.Watch()
+        for event in pods_watch.stream(
+            self.kube_client.list_namespaced_pod, self.namespace, **kwargs
+        ):
+            self._last_activity = time.time()
+            if self._stopped or _stop_if_idle(self):
+                pods_watch.stop()
+                return
+            if event["type"] == "ERROR":
+                raw_object = event["raw_object"]
+                logger.info("Pods watch error event: %s", raw_object)
+                if raw_object.get("code") == 410:
+                    # resource version is too old, we'll re-list the pods
+                    self.resource_version = None
+                return
+            pod = event["object"]
+            self._on_pod_event(event["type"], pod)
+            self.resource_version = pod.metadata.resource_version
+        # closed by the server after WATCH_TIMEOUT_SECONDS, the connection was alive
+        self._last_activity = time.time()
+
+    def _on_pod_event(self, event_type, pod):
+        name = pod.metadata.name
+        logger.debug("Pod %s event: %s %s", name, event_type, pod.status.phase)
+        with self._lock:
+            condition = self._pod_conditions.get(name)
+            if event_type == "DELETED" and condition is None:
+                # nobody waits for this pod any more
+                self._pods.pop(name, None)
+                return
+            self._pods[name] = pod
+            if condition is not None:
+                condition.notify_all()
+
+    def _notify_all(self):
+        with self._lock:
+            for condition in self._pod_conditions.values():
+                condition.notify_all()
+
+    def get_pod(self, name):
+        with self._lock:
+            return self._pods.get(name)
+
+    def wait_for_pod_change(self, name, resource_version=None, timeout=None):
+        """
+        Blocks till we have a state of the pod different from `resource_version`.
+        Returns the new state or None on timeout (or if the watcher is disabled or stopped).
+        The pod is watched till `forget_pod` is called.
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._lock:
+            self._last_used = time.time()
+            condition = self._pod_conditions.get(name)
+            if condition is None:
+                condition = self._pod_conditions[name] = threading.Condition(self._lock)
+            while not (self.disabled or self._stopped):
+                pod = self._pods.get(name)
+                if pod is not None and (
+                    resource_version is None
+                    or pod.metadata.resource_version != resource_version
+                ):
+                    return pod
+
+                if deadline is None:
+                    condition.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return None
+                    condition.wait(remaining)
+            return None
+
+    def forget_pod(self, name):
+        with self._lock:
+            self._last_used = time.time()
+            self._pods.pop(name, None)
+            self._pod_conditions.pop(name, None)
+
+
+_watchers = {}
+_watchers_lock = threading.Lock()
+
+
+def _watcher_key(kube_client, namespace, label_selector):
+    return kube_client.api_client.configuration.host, namespace, label_selector
+
+
+def get_pod_state_watcher(kube_client, namespace, label_selector, create=True):
+    # type: (...) -> Optional[KubePodStateWatcher]
+    """
+    returns the running watcher of the namespace and the label selector,
+    the watcher is stopped and removed once it's idle
+    """
+    key = _watcher_key(kube_client, namespace, label_selector)
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None or watcher.stopped:
+            if not create:
+                return None
+            watcher = KubePodStateWatcher(
+                kube_client=kube_client,
+                namespace=namespace,
+                label_selector=label_selector,
+            ).start()
+            _watchers[key] = watcher
+        watcher.touch()
+        return watcher
+
+
+def _stop_if_idle(watcher):
+    # under the registry lock, so nobody gets the watcher while we stop it
+    with _watchers_lock:
+        if not watcher.is_idle():
+            return False
+        logger.debug(
+            "Stopping idle pods watch at %s (%s)",
+            watcher.namespace,
+            watcher.label_selector,
+        )
+        watcher.stop()
+        key = _watcher_key(
+            watcher.kube_client, watcher.namespace, watcher.label_selector
+        )
+        if _watchers.get(key) is watcher:
+            del _watchers[key]
+        return True
@@ -118,6 +118,11 @@ class KubernetesEngineConfig(ContainerEngineConfig):
         "When a pod can't be scheduled due to cpu or memory constraints, check if the constraints are possible to satisfy in the cluster"
     )
 
+    watch_pods = parameter(default=True).help(
+        "Track the state of the submitted pods with one shared watch per namespace and run, "
+        "instead of polling every pod"
+    )[bool]
+
     startup_timeout = parameter(default="10m").help(
         "Time to wait for pod getting into Running state"
     )[datetime.timedelta]
@@ -0,0 +1,110 @@
+import threading
+
+from mock import MagicMock, patch
+
+from dbnd_docker.kubernetes import kube_pod_state_watcher
+from dbnd_docker.kubernetes.kube_pod_state_watcher import (
+    KubePodStateWatcher,
+    get_pod_state_watcher,
+)
+
+
+def _pod(name, resource_version, phase="Pending"):
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.metadata.resource_version = resource_version
+    pod.status.phase = phase
+    return pod
+
+
+def _watcher():
+    return KubePodStateWatcher(
+        kube_client=MagicMock(), namespace="ns", label_selector="dbnd_run_uid=1"
+    )
+
+
+class TestKubePodStateWatcher(object):
+    def test_wait_for_pod_change(self):
+        watcher = _watcher()
+        assert watcher.wait_for_pod_change("p1", timeout=0.01) is None
+
+        watcher._on_pod_event("ADDED", _pod("p1", "1"))
+        assert watcher.wait_for_pod_change("p1").metadata.resource_version == "1"
+        assert watcher.wait_for_pod_change("p1", "1", timeout=0.01) is None
+
+        result = []
+        waiter = threading.Thread(
+            target=lambda: result.append(
+                watcher.wait_for_pod_change("p1", "1", timeout=10)
+            )
+        )
+        waiter.start()
+        watcher._on_pod_event("MODIFIED", _pod("p2", "2"))
+        watcher._on_pod_event("MODIFIED", _pod("p1", "3", phase="Running"))
+        waiter.join()
+        assert result[0].status.phase == "Running"
+
+    def test_watch_resume(self):
+        watcher = _watcher()
+        pods = MagicMock()
+        pods.items = [_pod("p1", "1")]
+        pods.metadata.resource_version = "5"
+        watcher.kube_client.list_namespaced_pod.return_value = pods
+
+        events = [
+            {"type": "MODIFIED", "object": _pod("p1", "6", phase="Running")},
+            {"type": "ERROR", "object": None, "raw_object": {"code": 410}},
+        ]
+        with patch(
+            "dbnd_docker.kubernetes.kube_pod_state_watcher.watch.Watch"
+        ) as watch_cls:
+            watch_cls.return_value.stream.return_value = iter(events)
+
+            watcher._list_pods()
+            assert watcher.resource_version == "5"
+            watcher._watch_pods()
+
+        _, kwargs = watch_cls.return_value.stream.call_args
+        assert kwargs["resource_version"] == "5"
+        assert kwargs["_request_timeout"]
+        assert watcher.get_pod("p1").status.phase == "Running"
+        # resource version is too old, the next watch starts with a new list
+        assert watcher.resource_version is None
+
+    def test_idle_watcher_is_stopped(self, monkeypatch):
+        monkeypatch.setattr(kube_pod_state_watcher, "IDLE_TIMEOUT_SECONDS", 0)
+        monkeypatch.setattr(KubePodStateWatcher, "start", lambda self: self)
+        kube_client = MagicMock()
+
+        watcher = get_pod_state_watcher(kube_client, "ns", "dbnd_run_uid=2")
+        watcher.wait_for_pod_change("p1", timeout=0.01)
+        # the pod is still watched
+        assert not kube_pod_state_watcher._stop_if_idle(watcher)
+
+        watcher.forget_pod("p1")
+        assert kube_pod_state_watcher._stop_if_idle(watcher)
+        assert watcher.stopped
+        assert (
+            get_pod_state_watcher(kube_client, "ns", "dbnd_run_uid=2", create=False)
+            is None
+        )
+        assert get_pod_state_watcher(kube_client, "ns", "dbnd_run_uid=2") is not watcher
+
+    def test_healthy_for(self):
+        watcher = _watcher()
+        assert not watcher.healthy_for()
+
+        # no events or reconnects for a long time
+        watcher._last_activity = 0
+        assert not watcher.healthy_for()
+
+        # the server closed the watch without events
+        with patch(
+            "dbnd_docker.kubernetes.kube_pod_state_watcher.watch.Watch"
+        ) as watch_cls:
+            watch_cls.return_value.stream.return_value = iter([])
+            watcher._watch_pods()
+        assert watcher.healthy_for() > 0
+
+        watcher.disabled = True
+        assert not watcher.healthy_for()
@@ -22,6 +22,7 @@ import logging
 import mimetypes
 import os
 import time
+import uuid
 
 import six
 
@@ -37,6 +38,12 @@ from targets.config import get_local_tempfile
 from targets.errors import InvalidDeleteException
 from targets.fs import FileSystems
 from targets.fs.file_system import FileSystem
+from targets.fs.listing_cache import (
+    DEFAULT_LISTING_CACHE_TTL,
+    PrefixListing,
+    get_run_listing_cache,
+    stat_many_by_listing,
+)
 from targets.utils.atomic import _DeleteOnCloseFile
 from targets.utils.path import path_to_bucket_and_key
 
@@ -68,6 +75,9 @@ CHUNKSIZE = 10 * 1024 * 1024
 # Mimetype to use if one can't be guessed from the file extension.
 DEFAULT_MIMETYPE = "application/octet-stream"
 
+# GCS doesn't compose objects of more than 1024 components
+MAX_COMPOSE_COMPONENTS = 1024
+
 # Time to sleep while waiting for eventual consistency to finish.
 EVENTUAL_CONSISTENCY_SLEEP_INTERVAL = 0.1
 
@@ -145,6 +155,13 @@ class GCSClient(FileSystem):
 
     name = FileSystems.gcs
     _exist_after_write_consistent = False
+    # appended data is uploaded as a temporary object and composed with the existing one
+    support_append = True
+
+    # seconds to keep prefix listings of the run, used by exists_many/stat_many
+    listing_cache_ttl = DEFAULT_LISTING_CACHE_TTL
+    # don't answer from listing if there are more objects under the prefix
+    max_listing_keys = 10000
 
     def __init__(
         self,
@@ -166,6 +183,10 @@ class GCSClient(FileSystem):
             build_kwargs.setdefault("cache_discovery", False)
             self.client = discovery.build("storage", "v1", **build_kwargs)
 
+    @property
+    def _listing_cache(self):
+        return get_run_listing_cache(self.name, ttl=self.listing_cache_ttl)
+
     def _path_to_bucket_and_key(self, path):
         return path_to_bucket_and_key(path)
 
@@ -199,8 +220,21 @@ class GCSClient(FileSystem):
 
             response = request.execute()
 
+    def _list_prefix(self, bucket, prefix):
+        objects = {}
+        try:
+            for it in self._list_iter(bucket, prefix):
+                objects[it["name"]] = (int(it.get("size", 0)), it.get("updated"))
+                if len(objects) > self.max_listing_keys:
+                    return None
+        except errors.HttpError as ex:
+            logger.debug("Failed to list gs://%s/%s: %s", bucket, prefix, ex)
+            return None
+        return PrefixListing(prefix, objects)
+
     def _do_put(self, media, dest_path):
         bucket, obj = self._path_to_bucket_and_key(dest_path)
+        self._listing_cache.invalidate(bucket, obj)
 
         request = self.client.objects().insert(
             bucket=bucket, name=obj, media_body=media
@@ -242,6 +276,21 @@ class GCSClient(FileSystem):
 
         return self.isdir(path)
 
+    def exists_many(self, paths):
+        return {path: stat is not None for path, stat in self.stat_many(paths).items()}
+
+    def stat_many(self, paths):
+        """
+        Answers from one listing of the common prefix of the paths (per bucket)
+        """
+        return stat_many_by_listing(
+            paths,
+            path_to_bucket_and_key=self._path_to_bucket_and_key,
+            list_prefix=self._list_prefix,
+            cache=self._listing_cache,
+            fallback=self._stat_many_in_threads,
+        )
+
     def isdir(self, path):
         bucket, obj = self._path_to_bucket_and_key(path)
         if self._is_root(obj):
@@ -267,6 +316,7 @@ class GCSClient(FileSystem):
 
     def remove(self, path, recursive=True):
         (bucket, obj) = self._path_to_bucket_and_key(path)
+        self._listing_cache.invalidate(bucket, obj)
 
         if self._is_root(obj):
             raise InvalidDeleteException(
@@ -368,6 +418,7 @@ class GCSClient(FileSystem):
     def copy(self, source_path, destination_path):
         src_bucket, src_obj = self._path_to_bucket_and_key(source_path)
         dest_bucket, dest_obj = self._path_to_bucket_and_key(destination_path)
+        self._listing_cache.invalidate(dest_bucket, dest_obj)
 
         if self.isdir(source_path):
             src_prefix = self._add_path_delimiter(src_obj)
@@ -505,5 +556,53 @@ class GCSClient(FileSystem):
     def copy_from_local(self, local_path, dest):
         self.put(local_path, dest)
 
+    def _get_obj_metadata(self, bucket, obj):
+        try:
+            return self.client.objects().get(bucket=bucket, object=obj).execute()
+        except errors.HttpError as ex:
+            if ex.resp["status"] == "404":
+                return None
+            raise
+
+    def append_bytes(self, path, data):
+        """
+        Appends by composing the object with a new part,
+        a composite object is uploaded again as a simple one when it reaches the components limit
+        """
+        bucket, obj = self._path_to_bucket_and_key(path)
+        metadata = self._get_obj_metadata(bucket, obj)
+        if metadata is None:
+            return self.put_string(data, path)
+
+        if int(metadata.get("componentCount", 1)) >= MAX_COMPOSE_COMPONENTS:
+            logger.debug("%s has too many components, uploading it again", path)
+            with self.download(path) as current:
+                with open(current.name, "ab") as f:
+                    f.write(data)
+                self.put(current.name, path)
+            return
+
+        part_obj = "%s.append-%s" % (obj, uuid.uuid4().hex)
+        self.put_string(data, "gs://%s/%s" % (bucket, part_obj))
+        try:
+            self.client.objects().compose(
+                destinationBucket=bucket,
+                destinationObject=obj,
+                body={
+                    "sourceObjects": [{"name": obj}, {"name": part_obj}],
+                    "destination": {
+                        "contentType": mimetypes.guess_type(path)[0] or DEFAULT_MIMETYPE
+                    },
+                },
+            ).execute()
+        finally:
+            self._listing_cache.invalidate(bucket, obj)
+            try:
+                self.client.objects().delete(bucket=bucket, object=part_obj).execute()
+            except Exception as ex:
+                # the data is already appended (or the compose error is raised),
+                # a failure to delete the part shouldn't fail the append
+                logger.warning("Failed to delete gs://%s/%s: %s", bucket, part_obj, ex)
+
     def open_read(self, path, mode="r"):
         return self.download(path)
@@ -1,5 +1,4 @@
 import logging
-import time
 import typing
 
 from dbnd._core.plugin.dbnd_plugins import assert_plugin_enabled
@@ -8,6 +7,7 @@ from dbnd._core.utils.basics.text_banner import TextBanner
 from dbnd._core.utils.structures import list_of_strings
 from dbnd_qubole import QuboleConfig
 from dbnd_qubole.errors import failed_to_run_qubole_job
+from dbnd_spark._core.spark_jobs_poller import SparkJobHandle, track_spark_job
 from dbnd_spark.spark_ctrl import SparkCtrl
 from qds_sdk.commands import SparkCommand
 from qds_sdk.qubole import Qubole
@@ -23,6 +23,31 @@ def get_cloud_sync(config, task, job):
     assert_plugin_enabled("dbnd-aws", "qubole on aws requires dbnd-aws module.")
 
 
+class QuboleCommandHandle(SparkJobHandle):
+    def __init__(self, cmd_id, read_partial_log, max_poll_interval):
+        super(QuboleCommandHandle, self).__init__(
+            name="qubole command %s" % cmd_id, max_poll_interval=max_poll_interval
+        )
+        self.cmd_id = cmd_id
+        self._read_partial_log = read_partial_log
+        self.log_ptr, self.err_ptr = 0, 0
+
+    def get_status(self):
+        return SparkCommand.find(self.cmd_id)
+
+    def is_done(self, status):
+        return SparkCommand.is_done(status.status)
+
+    def status_key(self, status):
+        return status.status
+
+    def get_new_logs(self, status):
+        log, self.err_ptr, self.log_ptr, received_log = self._read_partial_log(
+            status, self.err_ptr, self.log_ptr
+        )
+        return log if received_log > 0 else None
+
+
 class QuboleCtrl(SparkCtrl):
     def __init__(self, task_run):
         super(QuboleCtrl, self).__init__(task_run=task_run)
@@ -83,17 +108,17 @@ class QuboleCtrl(SparkCtrl):
 
         self._qubole_banner(cmd.status)
 
-        log_ptr, err_ptr = 0, 0
-
-        while True:
-            cmd = SparkCommand.find(cmd_id)
+        # the command status is polled by the shared poller
+        cmd_handle = QuboleCommandHandle(
+            cmd_id,
+            self._print_partial_log,
+            max_poll_interval=self.qubole_config.status_polling_interval_seconds,
+        )
+        for cmd, log in track_spark_job(cmd_handle):
             status = cmd.status
             self._qubole_banner(status)
 
-            log, err_ptr, log_ptr, received_log = self._print_partial_log(
-                cmd, err_ptr, log_ptr
-            )
-            if received_log > 0 and self.qubole_config.show_spark_log:
+            if log and self.qubole_config.show_spark_log:
                 logger.info("Spark LOG:")
                 logger.info(log)
             if SparkCommand.is_done(status):
@@ -101,10 +126,8 @@ class QuboleCtrl(SparkCtrl):
                     return True
                 else:  # failed
                     raise failed_to_run_qubole_job(
-                        status, self.qubole_job_url, log[-15:]
+                        status, self.qubole_job_url, (log or "")[-15:]
                     )
-            else:
-                time.sleep(self.qubole_config.status_polling_interval_seconds)
 
     def _qubole_banner(self, status):
         b = TextBanner(
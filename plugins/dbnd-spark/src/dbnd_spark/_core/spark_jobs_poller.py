@@ -0,0 +1,201 @@
+"""
+One polling thread for all the jobs submitted to remote spark backends (Livy, EMR, Databricks, Qubole).
+
+The submitting thread registers a SparkJobHandle and iterates over its status updates,
+the poller thread is the only one that calls the backend API:
+    * the poll interval of every job starts small and backs off while the status doesn't change
+    * jobs with the same `batch_key` are polled with one `get_statuses` call
+    * new logs are fetched incrementally together with the status
+"""
+import logging
+import sys
+import threading
+import time
+
+from collections import OrderedDict
+
+import six
+
+from six.moves import queue
+
+from dbnd._core.utils.daemon_worker import DaemonWorker
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_POLL_INTERVAL = 1
+DEFAULT_MAX_POLL_INTERVAL = 10
+POLL_INTERVAL_BACKOFF = 2
+
+
+class SparkJobHandle(object):
+    """
+    A job submitted to a remote backend.
+    Implement `get_status` and `is_done`, and optionally `get_new_logs`,
+    `batch_key` + `get_statuses` if the backend can return the status of several jobs in one call.
+    """
+
+    # jobs with the same (not None) batch_key are polled together with `get_statuses`
+    batch_key = None
+
+    def __init__(
+        self,
+        name,
+        min_poll_interval=DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval=DEFAULT_MAX_POLL_INTERVAL,
+    ):
+        self.name = name
+        self.min_poll_interval = min(min_poll_interval, max_poll_interval)
+        self.max_poll_interval = max_poll_interval
+
+        self.poll_interval = self.min_poll_interval
+        self.next_poll_time = 0
+        self.done = False
+        self._last_status_key = None
+        self._updates = queue.Queue()
+
+    def get_status(self):
+        raise NotImplementedError()
+
+    @classmethod
+    def get_statuses(cls, handles):
+        """returns {handle: status} for the handles of the same batch_key"""
+        return {handle: handle.get_status() for handle in handles}
+
+    def is_done(self, status):
+        raise NotImplementedError()
+
+    def status_key(self, status):
+        """the part of the status that shows a progress of the job"""
+        return status
+
+    def get_new_logs(self, status):
+        """returns the logs added since the previous call (called from the poller thread)"""
+        return None
+
+    def _on_status(self, status):
+        done = self.is_done(status)
+        logs = self.get_new_logs(status)
+        self.done = done
+        self._updates.put((status, logs, done, None))
+        if done:
+            return
+
+        status_key = self.status_key(status)
+        if status_key != self._last_status_key:
+            self.poll_interval = self.min_poll_interval
+        else:
+            self.poll_interval = min(
+                self.poll_interval * POLL_INTERVAL_BACKOFF, self.max_poll_interval
+            )
+        self._last_status_key = status_key
+        self.next_poll_time = time.time() + self.poll_interval
+
+    def _on_error(self, exc_info):
+        self.done = True
+        self._updates.put((None, None, True, exc_info))
+
+    def updates(self):
+        """
+        Yields (status, new logs) of every poll till the job is done (runs in the submitting thread),
+        re-raises the errors of the poller
+        """
+        try:
+            while True:
+                try:
+                    # with timeout, so the waiting thread can be interrupted
+                    status, logs, done, exc_info = self._updates.get(timeout=1)
+                except queue.Empty:
+                    continue
+                if exc_info:
+                    six.reraise(*exc_info)
+                yield status, logs
+                if done:
+                    return
+        finally:
+            # nobody listens anymore
+            self.done = True
+
+
+class SparkJobsPoller(DaemonWorker):
+    def __init__(self):
+        super(SparkJobsPoller, self).__init__(thread_name="SparkJobsPoller")
+        self._handles = []
+        self._condition = threading.Condition()
+
+    def track(self, handle):
+        # type: (SparkJobHandle) -> SparkJobHandle
+        with self._condition:
+            self._ensure_started()
+            self._handles.append(handle)
+            self._condition.notify()
+        return handle
+
+    def _run(self):
+        while True:
+            try:
+                self._run_once()
+            except Exception:
+                logger.exception("Spark jobs poller has failed")
+                time.sleep(DEFAULT_MIN_POLL_INTERVAL)
+
+    def _run_once(self):
+        with self._condition:
+            self._handles = [h for h in self._handles if not h.done]
+            if not self._handles:
+                self._condition.wait()
+                return
+            now = time.time()
+            due = [h for h in self._handles if h.next_poll_time <= now]
+            if not due:
+                next_poll_time = min(h.next_poll_time for h in self._handles)
+                self._condition.wait(next_poll_time - now)
+                return
+        self._poll(due)
+
+    def _poll(self, handles):
+        groups = OrderedDict()
+        for handle in handles:
+            key = (type(handle), handle.batch_key)
+            if handle.batch_key is None:
+                key = id(handle)
+            groups.setdefault(key, []).append(handle)
+
+        for group in groups.values():
+            statuses = {}
+            if len(group) > 1:
+                try:
+                    statuses = type(group[0]).get_statuses(group)
+                except Exception as ex:
+                    logger.warning(
+                        "Failed to get the status of %s jobs, polling one by one: %s",
+                        len(group),
+                        ex,
+                    )
+
+            for handle in group:
+                try:
+                    status = statuses.get(handle)
+                    if status is None:
+                        status = handle.get_status()
+                    handle._on_status(status)
+                except Exception:
+                    handle._on_error(sys.exc_info())
+
+
+_poller = None
+_poller_lock = threading.Lock()
+
+
+def get_spark_jobs_poller():
+    # type: () -> SparkJobsPoller
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = SparkJobsPoller()
+        return _poller
+
+
+def track_spark_job(handle):
+    """registers the job at the shared poller, returns an iterator of (status, new logs)"""
+    return get_spark_jobs_poller().track(handle).updates()
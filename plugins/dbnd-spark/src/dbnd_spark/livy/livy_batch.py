@@ -3,17 +3,19 @@
 # Distributed under the terms of the Modified BSD License.
 import json
 import logging
-import time
 
+from dbnd._core.current import get_settings
 from dbnd._core.errors import DatabandError
 from dbnd._core.utils.http.reliable_http_client import ReliableHttpClient
 from dbnd._core.utils.http.retry_policy import get_retry_policy
+from dbnd_spark._core.spark_jobs_poller import SparkJobHandle, track_spark_job
 
 
 logger = logging.getLogger(__name__)
 
 BATCH_RUNNING_STATES = ["starting", "not_started", "running", "recovering"]
 BATCH_ERROR_STATES = ["error", "dead"]
+BATCHES_PAGE_SIZE = 100
 
 
 class LivyBatchClient(object):
@@ -31,9 +33,13 @@ class LivyBatchClient(object):
 
         headers.update(custom_headers)
         retry_policy = LivyBatchClient._get_retry_policy()
-        return LivyBatchClient(
-            ReliableHttpClient(endpoint, headers, retry_policy), endpoint
+        http_client = ReliableHttpClient(
+            endpoint,
+            headers,
+            retry_policy,
+            **get_settings().http_client.get_client_kwargs()
         )
+        return LivyBatchClient(http_client, endpoint)
 
     def post_batch(self, properties):
         return self._http_client.post("/batches", [201], properties).json()
@@ -49,8 +55,14 @@ class LivyBatchClient(object):
             self._batch_url(batch_id) + "/log?from=%s" % from_line, [200]
         ).json()
 
-    def get_batches(self):
-        return self._http_client.get("/batches", [200]).json()
+    def get_batches(self, from_=None, size=None):
+        params = []
+        if from_ is not None:
+            params.append("from=%s" % from_)
+        if size is not None:
+            params.append("size=%s" % size)
+        url = "/batches?" + "&".join(params) if params else "/batches"
+        return self._http_client.get(url, [200]).json()
 
     def delete_batch(self, batch_id):
         self._http_client.delete(self._batch_url(batch_id), [200, 404])
@@ -79,25 +91,74 @@ class LivyBatchClient(object):
     def track_batch_progress(self, batch_id, status_reporter=None):
         status_reporter = status_reporter or self._default_status_reporter
 
-        # Poll the status of the submitted scala code
-
-        current_line = 0
-        while True:
-            batch_response = self.get_batch(batch_id)
-            batch_status = batch_response["state"]
+        # the status of the submitted code is polled by the shared poller
+        batch_response = None
+        for batch_response, lines in track_spark_job(LivyBatchHandle(self, batch_id)):
             status_reporter(batch_response)
 
             # logging the logs
-            lines = self.get_all_batch_logs(batch_id, from_line=current_line)["log"]
             for line in lines:
                 logger.info(line)
-            current_line += len(lines)
-            if batch_status.lower() not in BATCH_RUNNING_STATES:
-                break
-            time.sleep(10)
 
+        batch_status = batch_response["state"]
         status_reporter(batch_response)
         if batch_status.lower() in BATCH_ERROR_STATES:
             logger.info("Batch exception: see logs")
             raise DatabandError("Batch Status: " + batch_status)
         logger.info("Batch Status: " + batch_status)
+
+
+class LivyBatchHandle(SparkJobHandle):
+    def __init__(self, livy, batch_id):
+        # type: (LivyBatchClient, int) -> None
+        super(LivyBatchHandle, self).__init__(
+            name="livy batch %s" % batch_id, max_poll_interval=10
+        )
+        self.livy = livy
+        self.batch_id = batch_id
+        # all the batches of the same livy server are polled with one call
+        self.batch_key = livy.endpoint
+        self.current_line = 0
+
+    def get_status(self):
+        return self.livy.get_batch(self.batch_id)
+
+    @classmethod
+    def get_statuses(cls, handles):
+        livy = handles[0].livy
+        batch_ids = set(handle.batch_id for handle in handles)
+        oldest_id = min(batch_ids)
+
+        # livy pages the batches by their position, oldest first,
+        # so we read the pages from the newest one till we reach our oldest batch
+        batches_by_id = {}
+        end = livy.get_batches(size=0).get("total") or 0
+        while end > 0 and not batch_ids.issubset(batches_by_id):
+            start = max(0, end - BATCHES_PAGE_SIZE)
+            batches = livy.get_batches(from_=start, size=end - start).get("sessions")
+            if not batches:
+                break
+            batches_by_id.update((batch["id"], batch) for batch in batches)
+            if min(batch["id"] for batch in batches) <= oldest_id:
+                break
+            end = start
+        # batches missing in the response are polled one by one
+        return {handle: batches_by_id.get(handle.batch_id) for handle in handles}
+
+    def is_done(self, status):
+        return status["state"].lower() not in BATCH_RUNNING_STATES
+
+    def status_key(self, status):
+        return status["state"]
+
+    def get_new_logs(self, status):
+        lines = []
+        while True:
+            new_lines = self.livy.get_all_batch_logs(
+                self.batch_id, from_line=self.current_line
+            )["log"]
+            lines.extend(new_lines)
+            self.current_line += len(new_lines)
+            # livy returns the log by pages, the rest of the log is read when the batch is done
+            if not new_lines or not self.is_done(status):
+                return lines
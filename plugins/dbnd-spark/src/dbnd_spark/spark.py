@@ -18,6 +18,7 @@ from dbnd._core.utils.project.project_fs import databand_lib_path
 from dbnd._core.utils.structures import list_of_strings
 from dbnd_spark.local.local_spark_config import SparkLocalEngineConfig
 from dbnd_spark.spark_config import SparkConfig, SparkEngineConfig
+from targets.fs import FileSystems
 
 
 if typing.TYPE_CHECKING:
@@ -130,12 +131,11 @@ class _InlineSparkTask(_BaseSparkTask, _DecoratedTask):
             raise DatabandConfigError(
                 "Please configure your cloud to always_save_pipeline=True, we need to pickle pipeline first"
             )
-        driver_dump = self.current_task_run.run.driver_task.driver_dump
         self._application_args = [
             "execute",
             "--disable-tracking-api",
             "--dbnd-run",
-            spark_ctrl.sync(driver_dump),
+            spark_ctrl.sync(self._get_driver_dump_to_sync(dr)),
             "task",
             "--task-id",
             self.task_id,
@@ -145,6 +145,20 @@ class _InlineSparkTask(_BaseSparkTask, _DecoratedTask):
             pyspark_script=databand_lib_path("_core", "cli", "main.py")
         )
 
+    def _get_driver_dump_to_sync(self, dr):
+        driver_task = dr.driver_task
+        if driver_task.driver_dump.fs.name != FileSystems.local:
+            # spark reads the dump and the task slices next to it
+            return driver_task.driver_dump
+
+        # only the dump file is synced, so the task slices of a sharded dump would be lost
+        full_dump = driver_task.remote_driver_root.file(
+            "%s.full.pickle" % driver_task.task_name
+        )
+        if not full_dump.exists():
+            dr.save_run(target_file=full_dump, sharded=False)
+        return full_dump
+
     def _task_run(self):
         super(_InlineSparkTask, self)._task_run()
 
@@ -0,0 +1,99 @@
+import pytest
+
+from mock import MagicMock
+
+from dbnd_spark._core.spark_jobs_poller import (
+    SparkJobHandle,
+    SparkJobsPoller,
+    track_spark_job,
+)
+from dbnd_spark.livy.livy_batch import LivyBatchClient
+
+
+class FakeJobHandle(SparkJobHandle):
+    batch_key = "cluster"
+    batch_calls = 0
+
+    def __init__(self, name, statuses):
+        super(FakeJobHandle, self).__init__(
+            name, min_poll_interval=0.01, max_poll_interval=0.05
+        )
+        self.statuses = list(statuses)
+
+    def get_status(self):
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+    @classmethod
+    def get_statuses(cls, handles):
+        cls.batch_calls += 1
+        return {h: h.get_status() for h in handles}
+
+    def is_done(self, status):
+        return status == "done"
+
+
+class TestSparkJobsPoller(object):
+    def test_track_jobs(self):
+        poller = SparkJobsPoller()
+        first = poller.track(FakeJobHandle("a", ["running", "running", "done"]))
+        second = poller.track(FakeJobHandle("b", ["running", "done"]))
+
+        assert [status for status, _ in first.updates()] == [
+            "running",
+            "running",
+            "done",
+        ]
+        assert [status for status, _ in second.updates()] == ["running", "done"]
+
+    def test_batch_poll(self):
+        FakeJobHandle.batch_calls = 0
+        first = FakeJobHandle("a", ["running"])
+        second = FakeJobHandle("b", ["done"])
+        SparkJobsPoller()._poll([first, second])
+
+        assert FakeJobHandle.batch_calls == 1
+        assert not first.done
+        assert second.done
+
+    def test_backoff(self):
+        handle = FakeJobHandle("a", [])
+        handle._on_status("running")
+        handle._on_status("running")
+        handle._on_status("running")
+        assert handle.poll_interval == 0.04
+        handle._on_status("starting")
+        assert handle.poll_interval == 0.01
+
+    def test_error(self):
+        handle = FakeJobHandle("a", ["running", ValueError("api is down")])
+        updates = track_spark_job(handle)
+        assert next(updates)[0] == "running"
+        with pytest.raises(ValueError):
+            next(updates)
+
+
+class TestLivyBatchProgress(object):
+    def test_logs_are_read_once(self):
+        livy = LivyBatchClient(http_client=MagicMock(), endpoint="http://livy")
+        states = ["starting", "running", "success"]
+        livy.get_batch = MagicMock(side_effect=lambda _: {"state": states.pop(0)})
+        log = ["line %s" % i for i in range(250)]
+        read_from = []
+
+        def get_all_batch_logs(batch_id, from_line=0):
+            read_from.append(from_line)
+            # livy returns up to 100 lines
+            return {"log": log[from_line : from_line + 100]}
+
+        livy.get_all_batch_logs = get_all_batch_logs
+        reported = []
+        livy.track_batch_progress(
+            1, status_reporter=lambda b: reported.append(b["state"])
+        )
+
+        assert reported == ["starting", "running", "success", "success"]
+        # the rest of the log is read when the batch is done
+        assert read_from == [0, 100, 200, 250]
@@ -0,0 +1,44 @@
+from dbnd import config, new_dbnd_context
+from dbnd._core.utils.http.endpoint import Endpoint
+from dbnd_spark.livy.livy_batch import LivyBatchClient, LivyBatchHandle
+
+
+class FakeLivy(object):
+    endpoint = "http://livy:8998"
+
+    def __init__(self, batch_ids):
+        self.batches = [{"id": i, "state": "running"} for i in batch_ids]
+        self.calls = []
+
+    def get_batches(self, from_=0, size=100):
+        self.calls.append((from_, size))
+        return {
+            "from": from_,
+            "total": len(self.batches),
+            "sessions": self.batches[from_ : from_ + size],
+        }
+
+
+class TestLivyBatchClient(object):
+    def test_http_client_config(self):
+        with config(
+            {"http_client": {"pool_maxsize": "3", "compress_requests": "True"}}
+        ), new_dbnd_context():
+            livy = LivyBatchClient.from_endpoint(Endpoint("http://livy:8998"))
+
+        http_client = livy._http_client
+        assert http_client.pool_maxsize == 3
+        assert http_client.keep_alive
+        assert http_client.compress_requests
+
+    def test_get_statuses_of_paged_batches(self):
+        # the oldest batches were removed, ids don't match the positions
+        livy = FakeLivy(range(50, 400))
+        handles = [LivyBatchHandle(livy, batch_id) for batch_id in (390, 230, 7)]
+
+        statuses = LivyBatchHandle.get_statuses(handles)
+        assert statuses[handles[0]]["id"] == 390
+        assert statuses[handles[1]]["id"] == 230
+        # unknown to the server, polled one by one
+        assert statuses[handles[2]] is None
+        assert livy.calls == [(0, 0), (250, 100), (150, 100), (50, 100), (0, 50)]